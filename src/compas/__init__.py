@@ -137,6 +137,7 @@ __all__ = [
 __all_plugins__ = [
     "compas.geometry.booleans.booleans_shapely",
     "compas.geometry.curves.nurbs_",
+    "compas.geometry.intersections.intersections_bvh",
     "compas.geometry.surfaces.nurbs_",
 ]
 
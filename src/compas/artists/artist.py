@@ -3,12 +3,16 @@ from __future__ import division
 from __future__ import print_function
 
 import inspect
+from array import array
 from abc import abstractmethod
 from collections import defaultdict
 
 import compas
 from compas.artists.exceptions import DataArtistNotRegistered
 from compas.artists.exceptions import NoArtistContextError
+from compas.geometry import Transformation
+from compas.geometry import multiply_matrices
+from compas.geometry import transform_coordinates
 from compas.plugins import PluginValidator
 from compas.plugins import pluggable
 
@@ -161,6 +165,37 @@ class Artist(object):
     def transformation(self, transformation):
         self._transformation = transformation
 
+    def transformed_coordinates(self, item):
+        """Compute the view coordinates of a data structure or geometry with a pending transformation.
+
+        Parameters
+        ----------
+        item : :class:`~compas.datastructures.Datastructure` | :class:`~compas.geometry.Pointcloud`
+            An item with lazy transformations.
+
+        Returns
+        -------
+        list[list[float]]
+            The coordinates of the vertices, nodes or points of the item,
+            transformed by the pending transformation of the item and by the transformation of the artist.
+
+        Notes
+        -----
+        The pending transformation is composed with the transformation of the artist,
+        and both are applied to a copy of the coordinates at once.
+        The coordinates of the item itself are not modified.
+
+        """
+        xyz = array("d", item.__coordinates__())
+        transformation = item.pending_transformation
+        if self.transformation and transformation:
+            transformation = Transformation(multiply_matrices(self.transformation, transformation.matrix))
+        else:
+            transformation = self.transformation or transformation
+        if transformation:
+            transform_coordinates(xyz, transformation)
+        return [xyz[i : i + 3].tolist() for i in range(0, len(xyz), 3)]
+
     @staticmethod
     def build(item, **kwargs):
         """Build an artist corresponding to the item type.
@@ -25,6 +25,7 @@ class MeshArtist(Artist):
     vertex_xyz : dict[int, list[float]]
         View coordinates of the vertices.
         Defaults to the real coordinates.
+        If the mesh has a pending transformation, it is applied to the view coordinates only.
     color : :class:`~compas.colors.Color`
         The base RGB color of the mesh.
     vertex_color : :class:`~compas.colors.ColorDict`]
@@ -51,6 +52,7 @@ class MeshArtist(Artist):
         super(MeshArtist, self).__init__(item=mesh, **kwargs)
         self._mesh = None
         self._vertex_xyz = None
+        self._pending_transformation = None
         self.mesh = mesh
 
     @property
@@ -74,11 +76,16 @@ class MeshArtist(Artist):
 
     @property
     def vertex_xyz(self):
-        if self._vertex_xyz is None:
-            points = self.mesh.vertices_attributes("xyz")  # type: ignore
-            if self.transformation:
-                points = transform_points(points, self.transformation)
+        pending = self.mesh.pending_transformation  # type: ignore
+        if self._vertex_xyz is None or pending is not self._pending_transformation:
+            if pending is None:
+                points = self.mesh.vertices_attributes("xyz")  # type: ignore
+                if self.transformation:
+                    points = transform_points(points, self.transformation)
+            else:
+                points = self.transformed_coordinates(self.mesh)
             self._vertex_xyz = dict(zip(self.mesh.vertices(), points))  # type: ignore
+            self._pending_transformation = pending
         return self._vertex_xyz
 
     @vertex_xyz.setter
@@ -25,6 +25,7 @@ class NetworkArtist(Artist):
     node_xyz : dict[hashable, list[float]]
         Mapping between nodes and their view coordinates.
         The default view coordinates are the actual coordinates of the nodes of the network.
+        If the network has a pending transformation, it is applied to the view coordinates only.
     node_color : :class:`~compas.colors.ColorDict`
         Mapping between nodes and RGB color values.
     edge_color : :class:`~compas.colors.ColorDict`
@@ -44,6 +45,7 @@ class NetworkArtist(Artist):
         super(NetworkArtist, self).__init__(**kwargs)
         self._network = None
         self._node_xyz = None
+        self._pending_transformation = None
         self.network = network
 
     @property
@@ -67,11 +69,16 @@ class NetworkArtist(Artist):
 
     @property
     def node_xyz(self):
-        if self._node_xyz is None:
-            points = self.network.nodes_attributes("xyz")  # type: ignore
-            if self.transformation:
-                points = transform_points(points, self.transformation)
+        pending = self.network.pending_transformation  # type: ignore
+        if self._node_xyz is None or pending is not self._pending_transformation:
+            if pending is None:
+                points = self.network.nodes_attributes("xyz")  # type: ignore
+                if self.transformation:
+                    points = transform_points(points, self.transformation)
+            else:
+                points = self.transformed_coordinates(self.network)
             self._node_xyz = dict(zip(self.network.nodes(), points))  # type: ignore
+            self._pending_transformation = pending
         return self._node_xyz
 
     @node_xyz.setter
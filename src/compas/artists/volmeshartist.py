@@ -26,6 +26,7 @@ class VolMeshArtist(Artist):
     vertex_xyz : dict[int, list[float]]
         The view coordinates of the vertices.
         By default, the actual vertex coordinates are used.
+        If the volmesh has a pending transformation, it is applied to the view coordinates only.
     vertex_color : dict[int, :class:`~compas.colors.Color`]
         Mapping between vertices and colors.
         Missing vertices get the default vertex color: :attr:`default_vertexcolor`.
@@ -57,6 +58,7 @@ class VolMeshArtist(Artist):
         super(VolMeshArtist, self).__init__(item=volmesh, **kwargs)
         self._volmesh = None
         self._vertex_xyz = None
+        self._pending_transformation = None
         self.volmesh = volmesh
 
     @property
@@ -80,11 +82,16 @@ class VolMeshArtist(Artist):
 
     @property
     def vertex_xyz(self):
-        if self._vertex_xyz is None:
-            points = self.volmesh.vertices_attributes("xyz")  # type: ignore
-            if self.transformation:
-                points = transform_points(points, self.transformation)
+        pending = self.volmesh.pending_transformation  # type: ignore
+        if self._vertex_xyz is None or pending is not self._pending_transformation:
+            if pending is None:
+                points = self.volmesh.vertices_attributes("xyz")  # type: ignore
+                if self.transformation:
+                    points = transform_points(points, self.transformation)
+            else:
+                points = self.transformed_coordinates(self.volmesh)
             self._vertex_xyz = dict(zip(self.volmesh.vertices(), points))  # type: ignore
+            self._pending_transformation = pending
         return self._vertex_xyz
 
     @vertex_xyz.setter
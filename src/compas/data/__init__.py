@@ -10,8 +10,10 @@ from .validators import is_float4x4
 from .validators import is_item_iterable
 from .encoders import DataEncoder
 from .encoders import DataDecoder
+from .encoders import register_dtype
 from .data import Data
-from .json import json_load, json_loads, json_dump, json_dumps
+from .json import json_load, json_loads, json_dump, json_dumps, json_iterload
+from .binary import binary_load, binary_loads, binary_dump, binary_dumps
 from .schema import dataclass_dataschema, dataclass_typeschema, dataclass_jsonschema
 from .schema import compas_dataclasses
 
@@ -31,6 +33,12 @@ __all__ = [
     "json_loads",
     "json_dump",
     "json_dumps",
+    "json_iterload",
+    "binary_load",
+    "binary_loads",
+    "binary_dump",
+    "binary_dumps",
+    "register_dtype",
     "dataclass_dataschema",
     "dataclass_typeschema",
     "dataclass_jsonschema",
@@ -0,0 +1,611 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import io
+import json
+import os
+import struct
+from itertools import chain
+from uuid import UUID
+
+from compas import _iotools
+from .exceptions import DecoderError
+from .encoders import decoder_from_dtype
+
+try:
+    basestring  # type: ignore
+except NameError:
+    basestring = str
+
+try:
+    long  # type: ignore
+except NameError:
+    long = int
+
+try:
+    import numpy as np
+
+    numpy_support = True
+except (ImportError, SyntaxError):
+    numpy_support = False
+
+
+# The container consists of a header,
+# a structure section with the (COMPAS) objects, the dicts, the lists and the scalars,
+# and a section with the raw numeric buffers, aligned to 8 bytes.
+#
+# header: MAGIC | uint64 size of the structure | uint64 size of the buffers
+# structure: uint32 number of strings | strings | root item
+#
+# The strings of the structure section are the dict keys, the dtypes of the objects and the dtypes of the buffers.
+# They are referred to by their index.
+# Buffers are referred to by their dtype, their shape and their offset in the buffer section.
+
+MAGIC = b"COMPAS\x00\x01"
+
+HEADER = struct.Struct("<8sQQ")
+
+# lists with fewer items than this are not stored as buffers
+PACK_MIN = 16
+
+STRUCT_TYPES = {
+    "b1": "?",
+    "i1": "b",
+    "u1": "B",
+    "i2": "h",
+    "u2": "H",
+    "i4": "i",
+    "u4": "I",
+    "i8": "q",
+    "u8": "Q",
+    "f4": "f",
+    "f8": "d",
+}
+
+INT_TYPES = set([int, long])
+NUMBER_TYPES = set([int, long, float])
+SEQUENCE_TYPES = set([list, tuple])
+STRING_TYPES = set([str, type("")])
+
+
+def _align(size):
+    return size + (-size % 8)
+
+
+def _scalar_dtype(values):
+    # the dtype of a buffer that can store a list of scalars without loss
+    # or None if the list can't be stored in a buffer
+    types = set(map(type, values))
+    if not types:
+        return None
+    if types <= INT_TYPES:
+        low = min(values)
+        high = max(values)
+        if -(2**31) <= low and high < 2**31:
+            return "<i4"
+        if -(2**63) <= low and high < 2**63:
+            return "<i8"
+        return None
+    if types <= NUMBER_TYPES:
+        return "<f8"
+    return None
+
+
+def _key(key):
+    # dict keys are converted to strings in the same way as in JSON
+    if isinstance(key, basestring):
+        return key
+    if key is None or isinstance(key, (bool, int, long, float)):
+        return json.dumps(key)
+    raise TypeError("Keys must be str, int, float, bool or None, not {}".format(type(key).__name__))
+
+
+class _Encoder(object):
+    def __init__(self, minimal=False):
+        self.minimal = minimal
+        self.strings = []
+        self.indices = {}
+        self.parts = []
+        self.buffers = []
+        self.size = 0
+
+    def string(self, string):
+        index = self.indices.get(string)
+        if index is None:
+            index = self.indices[string] = len(self.strings)
+            self.strings.append(string)
+        return index
+
+    def reference(self, dtype, shape, data):
+        # data is a contiguous little-endian array or a bytes string
+        nbytes = data.nbytes if numpy_support and isinstance(data, np.ndarray) else len(data)
+        self.parts.append(struct.pack("<IB", self.string(dtype), len(shape)))
+        self.parts.append(struct.pack("<{}Q".format(len(shape) + 1), *(tuple(shape) + (self.size,))))
+        self.buffers.append(data)
+        if nbytes % 8:
+            self.buffers.append(b"\x00" * (-nbytes % 8))
+        self.size += _align(nbytes)
+
+    def numbers(self, dtype, shape, values):
+        if numpy_support:
+            data = np.array(values, dtype=dtype)
+        else:
+            data = struct.pack("<{}{}".format(len(values), STRUCT_TYPES[dtype[1:]]), *values)
+        self.reference(dtype, shape, data)
+
+    def encode(self, o):
+        parts = self.parts
+        if o is None:
+            parts.append(b"N")
+        elif o is True:
+            parts.append(b"T")
+        elif o is False:
+            parts.append(b"F")
+        elif type(o) in INT_TYPES:
+            if -(2**63) <= o < 2**63:
+                parts.append(struct.pack("<cq", b"i", o))
+            else:
+                parts.append(b"I")
+                self.text(str(o))
+        elif type(o) is float:
+            parts.append(struct.pack("<cd", b"d", o))
+        elif isinstance(o, basestring):
+            parts.append(b"s")
+            self.text(o)
+        elif isinstance(o, dict):
+            self.mapping(o)
+        elif isinstance(o, (list, tuple)):
+            self.sequence(o)
+        elif hasattr(o, "__jsondump__"):
+            self.envelope(o.__jsondump__(minimal=self.minimal))
+        elif hasattr(o, "__next__"):
+            self.sequence(list(o))
+        elif numpy_support and isinstance(o, np.ndarray):
+            self.array(o)
+        elif numpy_support and isinstance(o, np.void):
+            parts.append(b"N")
+        elif numpy_support and isinstance(o, np.generic):
+            self.encode(o.item())
+        else:
+            raise TypeError("Object of type {} is not serializable".format(type(o).__name__))
+
+    def text(self, text):
+        if not isinstance(text, bytes):
+            text = text.encode("utf-8")
+        self.parts.append(struct.pack("<I", len(text)))
+        self.parts.append(text)
+
+    def envelope(self, state):
+        dtype = self.string(state["dtype"])
+        guid = state.get("guid")
+        if guid is None:
+            self.parts.append(struct.pack("<cI", b"o", dtype))
+        else:
+            try:
+                self.parts.append(struct.pack("<cI16s", b"O", dtype, UUID(guid).bytes))
+            except ValueError:
+                self.parts.append(struct.pack("<cII", b"P", dtype, self.string(guid)))
+        self.encode(state["data"])
+
+    def mapping(self, o):
+        if len(o) < PACK_MIN:
+            self.parts.append(struct.pack("<cI", b"m", len(o)))
+            for key, value in o.items():
+                self.parts.append(struct.pack("<I", self.string(_key(key))))
+                self.encode(value)
+            return
+        values = list(o.values())
+        if set(map(type, values)) == set([dict]):
+            names = list(values[0])
+            try:
+                if set(map(len, values)) != set([len(names)]):
+                    raise KeyError
+                columns = [[value[name] for value in values] for name in names]
+            except KeyError:
+                pass
+            else:
+                # a table with a column per key of the dicts
+                self.parts.append(b"C")
+                self.keys(o)
+                self.parts.append(struct.pack("<I", len(names)))
+                for name, column in zip(names, columns):
+                    self.parts.append(struct.pack("<I", self.string(_key(name))))
+                    self.sequence(column)
+                return
+        self.parts.append(b"D")
+        self.keys(o)
+        self.sequence(values)
+
+    def keys(self, o):
+        keys = list(o)
+        if not set(map(type, keys)) <= STRING_TYPES:
+            keys = list(map(_key, keys))
+        try:
+            numbers = list(map(int, keys))
+        except ValueError:
+            numbers = None
+        if numbers is not None and list(map(str, numbers)) == keys:
+            dtype = _scalar_dtype(numbers)
+            if dtype is not None:
+                self.parts.append(b"n")
+                self.numbers(dtype, (len(numbers),), numbers)
+                return
+        self.parts.append(struct.pack("<cI", b"s", len(keys)))
+        self.parts.append(struct.pack("<{}I".format(len(keys)), *[self.string(key) for key in keys]))
+
+    def sequence(self, o):
+        if len(o) >= PACK_MIN:
+            types = set(map(type, o))
+            if types <= SEQUENCE_TYPES:
+                if self.nested(o):
+                    return
+            elif types <= NUMBER_TYPES:
+                dtype = _scalar_dtype(o)
+                if dtype is not None:
+                    self.parts.append(b"L")
+                    self.numbers(dtype, (len(o),), o)
+                    return
+        self.parts.append(struct.pack("<cI", b"l", len(o)))
+        for item in o:
+            self.encode(item)
+
+    def nested(self, o):
+        flat = list(chain.from_iterable(o))
+        dtype = _scalar_dtype(flat)
+        if dtype is None:
+            return False
+        lengths = list(map(len, o))
+        if len(set(lengths)) == 1:
+            self.parts.append(b"L")
+            self.numbers(dtype, (len(o), lengths[0]), flat)
+        else:
+            # a ragged list of lists is stored as a flat buffer with offsets
+            offsets = [0]
+            offsets.extend(lengths)
+            if numpy_support:
+                offsets = np.cumsum(offsets).tolist()
+            else:
+                for i in range(1, len(offsets)):
+                    offsets[i] += offsets[i - 1]
+            self.parts.append(b"R")
+            self.numbers(dtype, (len(flat),), flat)
+            self.numbers("<i8", (len(offsets),), offsets)
+        return True
+
+    def array(self, o):
+        if o.dtype.kind not in "biuf" or o.dtype.itemsize > 8:
+            self.encode(o.tolist())
+            return
+        o = o.astype(o.dtype.newbyteorder("<"), order="C", copy=False)
+        self.parts.append(b"A")
+        self.reference(o.dtype.str, o.shape, o.reshape(-1).view(np.uint8))
+
+    def dump(self, data, f):
+        self.encode(data)
+        root = b"".join(self.parts)
+        strings = [struct.pack("<I", len(self.strings))]
+        for string in self.strings:
+            string = string.encode("utf-8") if not isinstance(string, bytes) else string
+            strings.append(struct.pack("<I", len(string)))
+            strings.append(string)
+        structure = b"".join(strings) + root
+        f.write(HEADER.pack(MAGIC, len(structure), self.size))
+        f.write(structure)
+        f.write(b"\x00" * (_align(HEADER.size + len(structure)) - HEADER.size - len(structure)))
+        for buffer in self.buffers:
+            f.write(buffer)
+
+
+class _Decoder(object):
+    def __init__(self, structure, buffers, arrays=True):
+        self.structure = structure
+        self.buffers = buffers
+        self.arrays = arrays
+        self.position = 0
+        self.decoders = {}
+        (count,) = self.unpack("<I")
+        self.strings = []
+        for _ in range(count):
+            self.strings.append(self.text())
+
+    def unpack(self, fmt):
+        values = struct.unpack_from(fmt, self.structure, self.position)
+        self.position += struct.calcsize(fmt)
+        return values
+
+    def text(self):
+        (size,) = self.unpack("<I")
+        start = self.position
+        self.position += size
+        return self.structure[start : self.position].decode("utf-8")
+
+    def decode(self):
+        tag = self.structure[self.position : self.position + 1]
+        self.position += 1
+        if tag == b"N":
+            return None
+        if tag == b"T":
+            return True
+        if tag == b"F":
+            return False
+        if tag == b"i":
+            return self.unpack("<q")[0]
+        if tag == b"I":
+            return int(self.text())
+        if tag == b"d":
+            return self.unpack("<d")[0]
+        if tag == b"s":
+            return self.text()
+        if tag == b"l":
+            (count,) = self.unpack("<I")
+            return [self.decode() for _ in range(count)]
+        if tag == b"m":
+            (count,) = self.unpack("<I")
+            items = {}
+            for _ in range(count):
+                key = self.strings[self.unpack("<I")[0]]
+                items[key] = self.decode()
+            return items
+        if tag == b"L":
+            return self.tolist(*self.reference())
+        if tag == b"R":
+            flat = self.tolist(*self.reference())
+            offsets = self.tolist(*self.reference())
+            return [flat[start:end] for start, end in zip(offsets, offsets[1:])]
+        if tag == b"A":
+            if not self.arrays:
+                return self.tolist(*self.reference())
+            return self.array(*self.reference())
+        if tag == b"D":
+            keys = self.keys()
+            return dict(zip(keys, self.decode()))
+        if tag == b"C":
+            keys = self.keys()
+            (count,) = self.unpack("<I")
+            names = []
+            columns = []
+            for _ in range(count):
+                names.append(self.strings[self.unpack("<I")[0]])
+                columns.append(self.decode())
+            if not names:
+                return {key: {} for key in keys}
+            return dict(zip(keys, [dict(zip(names, row)) for row in zip(*columns)]))
+        if tag in (b"o", b"O", b"P"):
+            return self.envelope(tag)
+        raise DecoderError("Invalid item at position {} of the structure.".format(self.position - 1))
+
+    def keys(self):
+        tag = self.structure[self.position : self.position + 1]
+        self.position += 1
+        if tag == b"n":
+            return list(map(str, self.tolist(*self.reference())))
+        (count,) = self.unpack("<I")
+        return [self.strings[index] for index in self.unpack("<{}I".format(count))]
+
+    def reference(self):
+        index, ndim = self.unpack("<IB")
+        values = self.unpack("<{}Q".format(ndim + 1))
+        return self.strings[index], values[:-1], values[-1]
+
+    def array(self, dtype, shape, offset):
+        if not numpy_support:
+            return self.tolist(dtype, shape, offset)
+        count = 1
+        for size in shape:
+            count *= size
+        dtype = np.dtype(dtype)
+        return self.buffers[offset : offset + count * dtype.itemsize].view(dtype).reshape(shape)
+
+    def tolist(self, dtype, shape, offset):
+        if numpy_support:
+            return self.array(dtype, shape, offset).tolist()
+        count = 1
+        for size in shape:
+            count *= size
+        values = list(struct.unpack_from("<{}{}".format(count, STRUCT_TYPES[dtype[1:]]), self.buffers, offset))
+        if not shape:
+            return values[0]
+        for size in reversed(shape[1:]):
+            values = [values[i : i + size] for i in range(0, len(values), size)]
+        return values
+
+    def envelope(self, tag):
+        (index,) = self.unpack("<I")
+        guid = None
+        if tag == b"O":
+            guid = str(UUID(bytes=self.unpack("<16s")[0]))
+        elif tag == b"P":
+            guid = self.strings[self.unpack("<I")[0]]
+        decoder = self.decoders.get(index)
+        if decoder is None:
+            decoder = self.decoders[index] = self.decoder(self.strings[index])
+        return decoder(self.decode(), guid)
+
+    def decoder(self, dtype):
+        try:
+            return decoder_from_dtype(dtype)
+        except ValueError:
+            raise DecoderError("The data type of the object should be in the following format: 'package.module/Class'")
+        except ImportError:
+            raise DecoderError("The module of the data type can't be found: {}.".format(dtype))
+        except AttributeError:
+            raise DecoderError("The data type can't be found in the specified module: {}.".format(dtype))
+
+
+def _read_header(f):
+    header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise DecoderError("The data is not in the COMPAS binary format.")
+    magic, structure, buffers = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise DecoderError("The data is not in the COMPAS binary format.")
+    return structure, buffers
+
+
+def _load(f, filepath=None, arrays=True):
+    size, nbytes = _read_header(f)
+    structure = f.read(size)
+    start = _align(HEADER.size + size)
+    if filepath is not None and numpy_support and nbytes:
+        buffers = np.memmap(filepath, dtype=np.uint8, mode="r", offset=start, shape=(nbytes,))
+    else:
+        f.read(start - HEADER.size - size)
+        buffers = bytearray(nbytes)
+        if nbytes:
+            view = memoryview(buffers)
+            position = 0
+            while position < nbytes:
+                chunk = f.read(min(nbytes - position, 67108864))
+                if not chunk:
+                    raise DecoderError("The data is incomplete.")
+                view[position : position + len(chunk)] = chunk
+                position += len(chunk)
+        if numpy_support:
+            buffers = np.frombuffer(buffers, dtype=np.uint8)
+    return _Decoder(structure, buffers, arrays).decode()
+
+
+def binary_dump(data, fp, minimal=False):
+    """Write a collection of COMPAS object data to a file in the COMPAS binary format.
+
+    Parameters
+    ----------
+    data : object
+        Any JSON serializable object.
+        This includes any (combination of) COMPAS object(s), and NumPy arrays.
+    fp : path string or file-like object
+        A writeable file-like object, opened in binary mode, or the path to a file.
+    minimal : bool, optional
+        If True, exclude the GUIDs of the objects.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.binary_loads`
+
+    Notes
+    -----
+    The objects are stored in the same way as with :func:`compas.data.json_dump`,
+    as a data type, a GUID and the data of the object,
+    but the data type and the GUID are stored compactly,
+    and lists of numbers, lists of lists of numbers and NumPy arrays are stored as raw buffers of numbers.
+    Dicts of dicts with the same keys, such as the vertex attributes of a mesh,
+    are stored as tables with a column of values per key.
+
+    Integers in lists of integers and floats are stored, and loaded, as floats.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.data import binary_dump, binary_load
+    >>> from compas.datastructures import Mesh
+    >>> mesh1 = Mesh.from_obj(compas.get('faces.obj'))
+    >>> binary_dump(mesh1, 'mesh.bin')
+    >>> mesh2 = binary_load('mesh.bin')
+    >>> mesh1.to_vertices_and_faces() == mesh2.to_vertices_and_faces()
+    True
+
+    """
+    with _iotools.open_file(fp, "wb") as f:
+        _Encoder(minimal).dump(data, f)
+
+
+def binary_dumps(data, minimal=False):
+    """Write a collection of COMPAS objects to a bytes string in the COMPAS binary format.
+
+    Parameters
+    ----------
+    data : object
+        Any JSON serializable object.
+        This includes any (combination of) COMPAS object(s), and NumPy arrays.
+    minimal : bool, optional
+        If True, exclude the GUIDs of the objects.
+
+    Returns
+    -------
+    bytes
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.binary_loads`
+
+    Examples
+    --------
+    >>> from compas.data import binary_dumps, binary_loads
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> s = binary_dumps(data1)
+    >>> data2 = binary_loads(s)
+    >>> data1 == data2
+    True
+
+    """
+    f = io.BytesIO()
+    _Encoder(minimal).dump(data, f)
+    return f.getvalue()
+
+
+def binary_load(fp, mmap=False):
+    """Read COMPAS object data from a file in the COMPAS binary format.
+
+    Parameters
+    ----------
+    fp : path string | file-like object | URL string
+        A readable path, a file-like object opened in binary mode, or a URL pointing to a file.
+    mmap : bool, optional
+        If True, and the data is read from a local file,
+        the NumPy arrays in the data are loaded as read-only memory maps of the file,
+        instead of being read into memory.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the file.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_loads`
+
+    Notes
+    -----
+    Without NumPy, NumPy arrays in the data are loaded as (nested) lists.
+
+    """
+    filepath = None
+    if mmap and isinstance(fp, basestring) and not fp.startswith("http") and os.path.isfile(fp):
+        filepath = fp
+    with _iotools.open_file(fp, "rb") as f:
+        return _load(f, filepath)
+
+
+def binary_loads(s):
+    """Read COMPAS object data from a bytes string in the COMPAS binary format.
+
+    Parameters
+    ----------
+    s : bytes
+        The data.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the string.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+
+    """
+    return _load(io.BytesIO(s))
@@ -3,11 +3,13 @@ from __future__ import absolute_import
 from __future__ import division
 
 import hashlib
+import re
+from binascii import hexlify
 from uuid import uuid4
 from uuid import UUID
 from copy import deepcopy
 
-import compas
+from compas.data.encoders import DataEncoder
 
 
 # ==============================================================================
@@ -22,6 +24,78 @@ import compas
 # ==============================================================================
 
 
+class _HashEncoder(DataEncoder):
+    minimal = True
+
+
+_HASH_ENCODER = _HashEncoder(separators=(",", ":"))
+
+# dicts and lists with more items than this are fed to the hash function in batches
+_HASH_BATCH = 1024
+
+_FAST_COPY = {}
+
+# the canonical form of a GUID, as produced by str(uuid)
+_GUID_MATCH = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z").match
+
+
+def _decode_guid(guid):
+    # GUIDs in canonical form are only checked, and parsed on first use of Data.guid
+    # other forms are parsed immediately, such that malformed GUIDs raise a ValueError at decode time
+    if guid is None or isinstance(guid, UUID) or _GUID_MATCH(guid):
+        return guid
+    return UUID(guid)
+
+
+def _sha256_update(h, data):
+    # feed a JSON representation of the data to the hash function in parts,
+    # such that the data is never serialized as a whole
+    encode = _HASH_ENCODER.encode
+    if isinstance(data, dict):
+        if len(data) > _HASH_BATCH:
+            # the items of large dicts are encoded as lists of key-value pairs
+            items = list(data.items())
+            h.update(b"{")
+            for i in range(0, len(items), _HASH_BATCH):
+                h.update(encode(items[i : i + _HASH_BATCH]).encode("utf-8"))
+            h.update(b"}")
+        else:
+            h.update(b"{")
+            for key, value in data.items():
+                h.update(encode(key).encode("utf-8"))
+                h.update(b":")
+                _sha256_update(h, value)
+            h.update(b"}")
+    elif isinstance(data, (list, tuple)) and len(data) > _HASH_BATCH:
+        h.update(b"[")
+        for i in range(0, len(data), _HASH_BATCH):
+            h.update(encode(data[i : i + _HASH_BATCH]).encode("utf-8"))
+        h.update(b"]")
+    else:
+        h.update(encode(data).encode("utf-8"))
+
+
+def _has_fast_copy(cls):
+    # the fast copy protocol is used only if the class has the same data representation
+    # as the class that implements the protocol
+    try:
+        return _FAST_COPY[cls]
+    except KeyError:
+        pass
+    owner = None
+    for base in cls.__mro__:
+        if "__copy_fast__" in base.__dict__:
+            owner = base
+            break
+    result = (
+        owner is not None
+        and getattr(cls, "data") is getattr(owner, "data")
+        and cls.from_data.__func__ is owner.from_data.__func__
+    )
+    _FAST_COPY[cls] = result
+    return result
+
+
 class Data(object):
     """Abstract base class for all COMPAS data objects.
 
@@ -67,6 +141,12 @@ class Data(object):
     it is sufficient for the deriving class to define the "getter" and "setter"
     of the data property: :attr:`compas.data.Data.data`.
 
+    Objects can also be pickled, for example to send them to other processes.
+    The pickled state is the internal state of the object (its ``__dict__``) and its GUID,
+    without the data representation.
+    With pickle protocol 5, the arrays of array-backed data structures
+    are pickled as buffers that can be transferred out-of-band.
+
     Examples
     --------
     >>> from compas.data import Data
@@ -148,18 +228,30 @@ class Data(object):
         -------
         object
 
+        Raises
+        ------
+        ValueError
+            If the GUID is malformed.
+
         """
+        guid = _decode_guid(guid)
         obj = cls.from_data(data)
         if guid is not None:
-            obj._guid = UUID(guid)
+            obj._guid = guid
         return obj
 
     def __getstate__(self):
-        state = self.__jsondump__()
-        state["__dict__"] = self.__dict__
-        return state
+        # the pickled state is the internal state of the object,
+        # including the guid, but not the data representation
+        self.guid
+        return self.__dict__
 
     def __setstate__(self, state):
+        if "__dict__" not in state:
+            self.__dict__.update(state)
+            return
+        # the state of objects pickled with earlier versions
+        # also contains the data representation of the object
         self.__dict__.update(state["__dict__"])
         if "guid" in state:
             self._guid = UUID(state["guid"])
@@ -188,9 +280,12 @@ class Data(object):
 
     @property
     def guid(self):
-        if not self._guid:
-            self._guid = uuid4()
-        return self._guid
+        guid = self._guid
+        if not guid:
+            guid = self._guid = uuid4()
+        elif not isinstance(guid, UUID):
+            guid = self._guid = UUID(guid)
+        return guid
 
     @property
     def name(self):
@@ -244,11 +339,29 @@ class Data(object):
         :class:`~compas.data.Data`
             An independent copy of this object.
 
+        Notes
+        -----
+        If the type of the object implements the fast copy protocol,
+        i.e. a method ``__copy_fast__`` that clones the internal state of the object directly,
+        and the type of the copy is the type of the object,
+        the copy is made without converting the object to data and back.
+
         """
         if not cls:
             cls = type(self)
+        if cls is type(self) and _has_fast_copy(cls):
+            return self.__copy_fast__()
         return cls.from_data(deepcopy(self.data))
 
+    def _copy_shallow(self):
+        # a new object of the same type with the same (shallow) state,
+        # but without the GUID and name of this object
+        obj = object.__new__(type(self))
+        obj.__dict__.update(self.__dict__)
+        obj._guid = None
+        obj._name = None
+        return obj
+
     def sha256(self, as_string=False):
         """Compute a hash of the data for comparison during version control using the sha256 algorithm.
 
@@ -261,8 +374,20 @@ class Data(object):
         -------
         bytes | str
 
+        Notes
+        -----
+        The hash is computed from the data type and the data of the object.
+        The GUID of the object is not included.
+        The data is fed to the hash function in parts, without serializing the object as a whole.
+
+        Objects that track their own modifications can cache the digest until they are modified.
+        Caching is opt-in: objects do this by setting an attribute ``_cache_sha256`` to True,
+        and an attribute ``_sha256`` to None whenever they are modified.
+        Data structures, for example, cache the digest if :attr:`~compas.datastructures.Datastructure.cache_sha256` is True.
+
         Examples
         --------
+        >>> import compas
         >>> from compas.datastructures import Mesh
         >>> mesh = Mesh.from_obj(compas.get('faces.obj'))
         >>> v1 = mesh.sha256()
@@ -275,11 +400,18 @@ class Data(object):
         False
 
         """
-        h = hashlib.sha256()
-        h.update(compas.json_dumps(self).encode())
+        cache = getattr(self, "_cache_sha256", False)
+        digest = self.__dict__.get("_sha256") if cache else None
+        if digest is None:
+            h = hashlib.sha256()
+            h.update(self.dtype.encode("utf-8"))
+            _sha256_update(h, self.data)
+            digest = h.digest()
+            if cache:
+                self._sha256 = digest
         if as_string:
-            return h.hexdigest()
-        return h.digest()
+            return hexlify(digest).decode("ascii")
+        return digest
 
     @classmethod
     def validate_data(cls, data):
@@ -4,6 +4,7 @@ from __future__ import division
 
 import json
 import platform
+import sys
 
 from .exceptions import DecoderError
 
@@ -29,6 +30,69 @@ except (ImportError, SyntaxError):
     numpy_support = False
 
 
+_DTYPES = {}
+_DECODERS = {}
+_BUILTINS = []
+
+
+def _register_builtins():
+    # register all data classes of the core packages under their data type
+    # only the classes that can be found at the location described by their data type are registered
+    from compas.data.schema import compas_dataclasses
+
+    _BUILTINS.append(True)
+    for cls in compas_dataclasses():
+        package = ".".join(cls.__module__.split(".")[:2])
+        module = sys.modules.get(package)
+        if module is not None and getattr(module, cls.__name__, None) is cls:
+            _DTYPES.setdefault("{}/{}".format(package, cls.__name__), cls)
+
+
+def register_dtype(cls, dtype=None, decoder=None):
+    """Register a class for a COMPAS data type specification.
+
+    Parameters
+    ----------
+    cls : Type[:class:`~compas.data.Data`]
+        The data class.
+    dtype : str, optional
+        The data type specification.
+        Defaults to the data type of the objects of the class,
+        in the following format: '{}/{}'.format(cls.__module__, cls.__name__),
+        with the module path truncated to the name of the package and the first subpackage.
+    decoder : callable, optional
+        A function that reconstructs an object from its raw data and its GUID, with the signature of
+        :meth:`~compas.data.Data.__jsonload__`: ``decoder(data, guid=None)``.
+        Defaults to ``cls.__jsonload__``.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Registered classes are found without importing their module during decoding.
+    A data type can also be registered under an alternative specification,
+    for example to load data written by older versions of a class.
+
+    Examples
+    --------
+    >>> from compas.data import register_dtype
+    >>> from compas.geometry import Point
+    >>> register_dtype(Point, "compas.geometry/OldPoint")
+    >>> cls_from_dtype("compas.geometry/OldPoint") is Point
+    True
+
+    """
+    if dtype is None:
+        dtype = "{}/{}".format(".".join(cls.__module__.split(".")[:2]), cls.__name__)
+    _DTYPES[dtype] = cls
+    if decoder is None:
+        _DECODERS.pop(dtype, None)
+    else:
+        _DECODERS[dtype] = decoder
+
+
 def cls_from_dtype(dtype):
     """Get the class object corresponding to a COMPAS data type specification.
 
@@ -51,10 +115,56 @@ def cls_from_dtype(dtype):
     AttributeError
         If the module doesn't contain the specified data type.
 
+    Notes
+    -----
+    The classes are cached per data type.
+    The data classes of COMPAS are registered on first use.
+    Other classes are imported once, and registered afterwards.
+
     """
+    try:
+        return _DTYPES[dtype]
+    except KeyError:
+        pass
+    if not _BUILTINS and dtype.startswith("compas."):
+        _register_builtins()
+        if dtype in _DTYPES:
+            return _DTYPES[dtype]
     mod_name, attr_name = dtype.split("/")
     module = __import__(mod_name, fromlist=[attr_name])
-    return getattr(module, attr_name)
+    cls = _DTYPES[dtype] = getattr(module, attr_name)
+    return cls
+
+
+def decoder_from_dtype(dtype):
+    """Get the function that reconstructs objects of a COMPAS data type from their raw data.
+
+    Parameters
+    ----------
+    dtype : str
+        The data type of the COMPAS object.
+
+    Returns
+    -------
+    callable
+        The registered decoder of the data type, or the method ``__jsonload__`` of the corresponding class.
+
+    Raises
+    ------
+    ValueError
+        If the data type is not in the correct format.
+    ImportError
+        If the module can't be imported.
+    AttributeError
+        If the module doesn't contain the specified data type.
+
+    """
+    try:
+        return _DECODERS[dtype]
+    except KeyError:
+        pass
+    decoder = _DECODERS[dtype] = cls_from_dtype(dtype).__jsonload__
+    return decoder
 
 
 class DataEncoder(json.JSONEncoder):
@@ -113,7 +223,7 @@ class DataEncoder(json.JSONEncoder):
         """
 
         if hasattr(o, "__jsondump__"):
-            return o.__jsondump__(minimal=DataEncoder.minimal)
+            return o.__jsondump__(minimal=self.minimal)
 
         if hasattr(o, "__next__"):
             return list(o)
@@ -209,7 +319,7 @@ class DataDecoder(json.JSONDecoder):
             return o
 
         try:
-            cls = cls_from_dtype(o["dtype"])
+            decoder = decoder_from_dtype(o["dtype"])
 
         except ValueError:
             raise DecoderError(
@@ -232,6 +342,6 @@ class DataDecoder(json.JSONDecoder):
         if IDictionary and isinstance(o, IDictionary[str, object]):
             data = {key: data[key] for key in data.Keys}
 
-        obj = cls.__jsonload__(data, guid)
+        obj = decoder(data, guid)
 
         return obj
@@ -2,7 +2,9 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import codecs
 import json
+import re
 from compas import _iotools
 from compas.data import DataEncoder
 from compas.data import DataDecoder
@@ -170,3 +172,154 @@ def json_loads(s):
 
     """
     return json.loads(s, cls=DataDecoder)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = " \t\n\r,:]}"
+
+
+class _JSONStream(object):
+    # a buffer of text read from a file in chunks
+    # from which the items of the top-level array or object are read one by one
+
+    def __init__(self, file, chunksize, skip):
+        self.file = file
+        self.chunksize = chunksize
+        self.text = ""
+        self.position = 0
+        self.eof = False
+        self.textdecoder = codecs.getincrementaldecoder("utf-8")()
+        self.keydecoder = json.JSONDecoder()
+        if skip:
+            skip = set(skip)
+            object_hook = DataDecoder().object_hook
+
+            def object_pairs_hook(pairs):
+                return object_hook(dict((key, None if key in skip else value) for key, value in pairs))
+
+            self.decoder = json.JSONDecoder(object_pairs_hook=object_pairs_hook)
+        else:
+            self.decoder = DataDecoder()
+
+    def read(self):
+        # read at least as much text as is buffered already,
+        # such that rescanning a large item after reading more text is amortised
+        size = max(self.chunksize, len(self.text) - self.position)
+        chunks = []
+        while size > 0:
+            chunk = self.file.read(size)
+            if not chunk:
+                self.eof = True
+                break
+            if isinstance(chunk, bytes):
+                chunk = self.textdecoder.decode(chunk)
+            chunks.append(chunk)
+            size -= len(chunk)
+        self.text = self.text[self.position :] + "".join(chunks)
+        self.position = 0
+
+    def peek(self):
+        while True:
+            self.position = _WHITESPACE.match(self.text, self.position).end()
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if self.eof:
+                return ""
+            self.read()
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError("Expecting one of '{}' at position {} of the buffer.".format(chars, self.position))
+        self.position += 1
+        return char
+
+    def value(self, decoder):
+        # the value is complete if the decoder doesn't fail and stops at a delimiter,
+        # otherwise more text is read, unless the end of the file is reached
+        # numbers can be cut off anywhere, without making the decoder fail
+        while True:
+            self.peek()
+            try:
+                value, end = decoder.raw_decode(self.text, self.position)
+            except ValueError:
+                if self.eof:
+                    raise
+            else:
+                if self.eof or (end < len(self.text) and self.text[end] in _DELIMITERS):
+                    self.position = end
+                    return value
+            self.read()
+
+    def items(self):
+        container = self.expect("[{")
+        closing = "]" if container == "[" else "}"
+        if self.peek() == closing:
+            return
+        while True:
+            if container == "[":
+                yield self.value(self.decoder)
+            else:
+                key = self.value(self.keydecoder)
+                self.expect(":")
+                yield key, self.value(self.decoder)
+            if self.expect("," + closing) == closing:
+                return
+
+
+def json_iterload(fp, skip=None, chunksize=1048576):
+    """Iterate over the items of a JSON file with a collection of COMPAS object data, one item at a time.
+
+    Parameters
+    ----------
+    fp : path string | file-like object | URL string
+        A readable path, a file-like object or a URL pointing to a file.
+        The file should contain a JSON array or object.
+    skip : sequence[str], optional
+        Keys of nested objects of which the values should not be loaded.
+        The values of these keys are replaced by None
+        before the COMPAS objects are reconstructed from the data.
+    chunksize : int, optional
+        The number of characters that is read from the file at once.
+
+    Yields
+    ------
+    object | tuple[str, object]
+        The (COMPAS) data of the next item of the array,
+        or the key and the (COMPAS) data of the next item of the object.
+
+    Raises
+    ------
+    ValueError
+        If the file does not contain a JSON array or object,
+        or if the JSON data is invalid.
+
+    See Also
+    --------
+    :func:`compas.data.json_load`
+
+    Notes
+    -----
+    Only the text of the current item is kept in memory,
+    and the data of the current item is reconstructed before the next item is read.
+    This makes it possible to process files with many objects in bounded memory.
+
+    The values of the skipped keys are still parsed, but they are discarded immediately.
+    Skipping the values of keys that are required by the objects will make their reconstruction fail.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.datastructures import Mesh
+    >>> meshes = [Mesh.from_polyhedron(4), Mesh.from_polyhedron(6)]
+    >>> compas.json_dump(meshes, 'meshes.json')
+    >>> for mesh in compas.data.json_iterload('meshes.json', skip=['facedata', 'edgedata']):
+    ...     print(mesh.number_of_faces())
+    ...
+    4
+    6
+
+    """
+    with _iotools.open_file(fp, "r") as f:
+        for item in _JSONStream(f, chunksize, skip).items():
+            yield item
@@ -117,6 +117,13 @@ if not compas.IPY:
     from .mesh.contours_numpy import mesh_isolines_numpy, mesh_contours_numpy  # this needs to be moved to geometry
     from .mesh.descent_numpy import trimesh_descent  # this needs to be moved to geometry
     from .mesh.geodesics_numpy import mesh_geodesic_distances_numpy
+    from .mesh.geometry_numpy import (
+        mesh_edge_lengths_numpy,
+        mesh_face_areas_numpy,
+        mesh_face_centroids_numpy,
+        mesh_face_normals_numpy,
+        mesh_vertex_normals_numpy,
+    )
     from .mesh.pull_numpy import trimesh_pull_points_numpy  # this needs to be moved to geometry
     from .mesh.smoothing_numpy import trimesh_smooth_laplacian_cotangent
     from .mesh.transformations_numpy import (
@@ -296,7 +303,11 @@ if not compas.IPY:
         "mesh_connectivity_matrix",
         "mesh_contours_numpy",
         "mesh_degree_matrix",
+        "mesh_edge_lengths_numpy",
+        "mesh_face_areas_numpy",
+        "mesh_face_centroids_numpy",
         "mesh_face_matrix",
+        "mesh_face_normals_numpy",
         "mesh_geodesic_distances_numpy",
         "mesh_isolines_numpy",
         "mesh_laplacian_matrix",
@@ -304,6 +315,7 @@ if not compas.IPY:
         "mesh_oriented_bounding_box_xy_numpy",
         "mesh_transform_numpy",
         "mesh_transformed_numpy",
+        "mesh_vertex_normals_numpy",
         "trimesh_cotangent_laplacian_matrix",
         "trimesh_descent",
         "trimesh_pull_points_numpy",
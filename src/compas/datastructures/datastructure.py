@@ -2,11 +2,96 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from array import array
+from copy import deepcopy
+
 from compas.data import Data
+from compas.geometry import Transformation
+from compas.geometry import multiply_matrices
+from compas.geometry import transform_coordinates
+
+try:
+    _ATOMIC = set([int, long, float, bool, str, unicode, type(None)])  # type: ignore # noqa: F821
+except NameError:
+    _ATOMIC = set([int, float, bool, str, type(None)])
+
+
+def _copy_value(value):
+    # immutable values are shared by the copies of a data structure
+    if type(value) in _ATOMIC:
+        return value
+    return deepcopy(value)
+
+
+def _copy_attributes(attr):
+    return {name: value if type(value) in _ATOMIC else deepcopy(value) for name, value in attr.items()}
+
+
+def _coordinates(table, keys, defaults):
+    # the XYZ coordinates of the rows of an attribute table as a flat buffer of floats
+    # with the array storage, this is the buffer of the table itself if it contains the coordinates of all rows
+    floats = _contiguous_coordinates(table)
+    if floats is not None:
+        return floats
+    x, y, z = defaults.get("x"), defaults.get("y"), defaults.get("z")
+    rows = [table[key] for key in keys]
+    return array("d", [value for attr in rows for value in (attr.get("x", x), attr.get("y", y), attr.get("z", z))])
+
+
+def _set_coordinates(table, keys, values):
+    # the inverse of _coordinates
+    floats = _contiguous_coordinates(table)
+    if floats is not None:
+        if values is not floats:
+            floats[:] = values
+        return
+    for index, key in enumerate(keys):
+        attr = table[key]
+        start = 3 * index
+        attr["x"] = values[start]
+        attr["y"] = values[start + 1]
+        attr["z"] = values[start + 2]
+
+
+def _contiguous_coordinates(table):
+    floats = getattr(table, "floats", None)
+    if floats is not None and table.float_names == ("x", "y", "z") and len(floats) == 3 * len(table):
+        return floats
 
 
 class Datastructure(Data):
-    """Base class for all data structures."""
+    """Base class for all data structures.
+
+    Attributes
+    ----------
+    lazy_transform : bool
+        If True, :meth:`transform` composes the transformation with the pending transformation of the data structure,
+        instead of transforming the coordinates.
+        The pending transformation is applied when the coordinates are read, when the data structure is modified,
+        and when lazy transformations are turned off.
+        Default is False.
+    pending_transformation : :class:`~compas.geometry.Transformation` | None, read-only
+        The transformation that is not yet applied to the coordinates.
+    cache_sha256 : bool
+        If True, the digest returned by :meth:`sha256` is cached until the data structure is modified through its methods.
+        Default is False.
+
+    Notes
+    -----
+    Lazy transformations are supported by the data structures with vertex or node coordinates,
+    i.e. :class:`~compas.datastructures.Mesh`, :class:`~compas.datastructures.VolMesh`
+    and :class:`~compas.datastructures.Network`.
+    Code that reads or modifies the internal dictionaries directly should call :meth:`flush_transformation` first.
+
+    The methods of the data structures clear the cached digest, but writes to the internal dictionaries
+    and to the attribute dictionaries of vertices, edges, faces or nodes do not.
+    Code that does this while :attr:`cache_sha256` is True should set ``_sha256`` to None.
+
+    """
+
+    _lazy_transform = False
+    _pending_transformation = None
+    _cache_sha256 = False
 
     def __init__(self, name=None, **kwargs):
         super(Datastructure, self).__init__(**kwargs)
@@ -19,3 +104,65 @@ class Datastructure(Data):
     @name.setter
     def name(self, value):
         self.attributes["name"] = value
+        if "_sha256" in self.__dict__:
+            self._sha256 = None
+
+    @property
+    def lazy_transform(self):
+        return self._lazy_transform
+
+    @lazy_transform.setter
+    def lazy_transform(self, value):
+        if not value:
+            self.flush_transformation()
+        self._lazy_transform = bool(value)
+
+    @property
+    def cache_sha256(self):
+        return self._cache_sha256
+
+    @cache_sha256.setter
+    def cache_sha256(self, value):
+        self._cache_sha256 = bool(value)
+        self._sha256 = None
+
+    @property
+    def pending_transformation(self):
+        return self._pending_transformation
+
+    def defer_transformation(self, transformation):
+        """Compose a transformation with the pending transformation of the data structure.
+
+        Parameters
+        ----------
+        transformation : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        pending = self._pending_transformation
+        if pending is None:
+            matrix = [list(row) for row in transformation]
+        else:
+            matrix = multiply_matrices(transformation, pending.matrix)
+        self._pending_transformation = Transformation(matrix)
+        self._sha256 = None
+
+    def flush_transformation(self):
+        """Apply the pending transformation to the coordinates of the data structure.
+
+        Returns
+        -------
+        None
+
+        """
+        transformation = self._pending_transformation
+        if transformation is None:
+            return
+        self._pending_transformation = None
+        xyz = self.__coordinates__()
+        transform_coordinates(xyz, transformation)
+        self.__set_coordinates__(xyz)
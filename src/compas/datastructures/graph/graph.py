@@ -6,6 +6,7 @@ from random import sample
 from ast import literal_eval
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
 from compas.datastructures.attributes import NodeAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 
@@ -39,6 +40,12 @@ class Graph(Datastructure):
     --------
     :class:`compas.datastructures.Network`
 
+    Notes
+    -----
+    If :attr:`cache_sha256` is True, the digest returned by :meth:`sha256` is cached
+    until the graph is modified through its methods.
+    Code that modifies ``node``, ``edge`` or ``adjacency`` directly should then set ``graph._sha256 = None``.
+
     """
 
     DATASCHEMA = {
@@ -72,6 +79,7 @@ class Graph(Datastructure):
 
     def __init__(self, name=None, default_node_attributes=None, default_edge_attributes=None):
         super(Graph, self).__init__(name=name)
+        self._sha256 = None
         self._max_node = -1
         self.node = {}
         self.edge = {}
@@ -93,6 +101,8 @@ class Graph(Datastructure):
 
     @property
     def data(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         data = {
             "attributes": self.attributes,
             "dna": self.default_node_attributes,
@@ -135,6 +145,18 @@ class Graph(Datastructure):
 
         return graph
 
+    def __copy_fast__(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        other = self._copy_shallow()
+        other.attributes = _copy_attributes(self.attributes)
+        other.default_node_attributes = _copy_attributes(self.default_node_attributes)
+        other.default_edge_attributes = _copy_attributes(self.default_edge_attributes)
+        other.node = {key: _copy_attributes(attr) for key, attr in self.node.items()}
+        other.edge = {u: {v: _copy_attributes(attr) for v, attr in nbrs.items()} for u, nbrs in self.edge.items()}
+        other.adjacency = {u: nbrs.copy() for u, nbrs in self.adjacency.items()}
+        return other
+
     # --------------------------------------------------------------------------
     # Properties
     # --------------------------------------------------------------------------
@@ -237,6 +259,7 @@ class Graph(Datastructure):
         None
 
         """
+        self._sha256 = None
         del self.node
         del self.edge
         del self.adjacency
@@ -391,6 +414,9 @@ class Graph(Datastructure):
         0
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        self._sha256 = None
         if key is None:
             key = self._max_node = self._max_node + 1
         try:
@@ -437,6 +463,7 @@ class Graph(Datastructure):
         >>>
 
         """
+        self._sha256 = None
         attr = attr_dict or {}
         attr.update(kwattr)
         if u not in self.node:
@@ -478,6 +505,7 @@ class Graph(Datastructure):
         >>>
 
         """
+        self._sha256 = None
         if key in self.edge:
             del self.edge[key]
         if key in self.adjacency:
@@ -515,6 +543,7 @@ class Graph(Datastructure):
         >>>
 
         """
+        self._sha256 = None
         u, v = edge
 
         if u in self.edge and v in self.edge[u]:
@@ -871,6 +900,7 @@ class Graph(Datastructure):
         :meth:`update_default_edge_attributes`
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -895,6 +925,7 @@ class Graph(Datastructure):
         :meth:`update_default_node_attributes`
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -937,9 +968,12 @@ class Graph(Datastructure):
         :meth:`edge_attribute`, :meth:`edge_attributes`, :meth:`edges_attribute`, :meth:`edges_attributes`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if key not in self.node:
             raise KeyError(key)
         if value is not None:
+            self._sha256 = None
             self.node[key][name] = value
             return
         if name in self.node[key]:
@@ -973,6 +1007,9 @@ class Graph(Datastructure):
         stored in the default node attribute dict.
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        self._sha256 = None
         if name in self.node[key]:
             del self.node[key][name]
 
@@ -1008,16 +1045,20 @@ class Graph(Datastructure):
         :meth:`edge_attribute`, :meth:`edge_attributes`, :meth:`edges_attribute`, :meth:`edges_attributes`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if key not in self.node:
             raise KeyError(key)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 self.node[key][name] = value
             return
         # use it as a getter
         if not names:
             # return all node attributes as a dict
+            self._sha256 = None
             return NodeAttributeView(self.default_node_attributes, self.node[key])
         values = []
         for name in names:
@@ -1144,6 +1185,7 @@ class Graph(Datastructure):
             raise KeyError(key)
         attr = self.edge[u][v]
         if value is not None:
+            self._sha256 = None
             attr[name] = value
             return
         if name in attr:
@@ -1180,6 +1222,7 @@ class Graph(Datastructure):
         stored in the default edge attribute dict.
 
         """
+        self._sha256 = None
         u, v = key
         if u not in self.edge or v not in self.edge[u]:
             raise KeyError(key)
@@ -1228,6 +1271,7 @@ class Graph(Datastructure):
         # use it as a getter
         if not names:
             # get the entire attribute dict
+            self._sha256 = None
             return EdgeAttributeView(self.default_edge_attributes, self.edge[u][v])
         # get only the values of the named attributes
         values = []
@@ -0,0 +1,98 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+class TopologyCache(object):
+    """Memoized topological queries of a halfedge data structure.
+
+    Parameters
+    ----------
+    halfedge : :class:`~compas.datastructures.HalfEdge`
+        The data structure of which the topology is cached.
+
+    Attributes
+    ----------
+    edges : list[tuple[int, int]] | None
+        The edges of the data structure, in the order of :meth:`~compas.datastructures.HalfEdge.edges`.
+    boundaries : list[list[int]] | None
+        The vertices on the boundaries of the data structure.
+    vertex : dict[int, list[int]]
+        The ordered neighbors per vertex.
+    face : dict[int, list[int]]
+        The neighbors per face.
+
+    Notes
+    -----
+    The global items (edges and boundaries) are reset by every topological change.
+    The items per vertex and per face are only reset for the vertices and faces
+    affected by a change.
+
+    """
+
+    def __init__(self, halfedge):
+        self.halfedge = halfedge
+        self.clear()
+
+    def __getstate__(self):
+        # the cached items are not pickled
+        return {"halfedge": self.halfedge}
+
+    def __setstate__(self, state):
+        self.halfedge = state["halfedge"]
+        self.clear()
+
+    def clear(self):
+        """Remove all cached items.
+
+        Returns
+        -------
+        None
+
+        """
+        self.edges = None
+        self.boundaries = None
+        self.vertex = {}
+        self.face = {}
+
+    def invalidate(self, vertices=None, faces=None):
+        """Remove the cached items affected by a change of the topology around the given vertices and faces.
+
+        Parameters
+        ----------
+        vertices : list[int], optional
+            The vertices of which the neighborhood changes.
+        faces : list[int], optional
+            The faces that are about to be modified or deleted, or that were just added.
+            The vertices of these faces and the faces across their edges are invalidated as well.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Faces are identified with their neighbors using the current state of the halfedges.
+        Therefore, this method should be called *before* a face is modified or deleted,
+        and *after* a face is added.
+
+        """
+        self.edges = None
+        self.boundaries = None
+        if not self.vertex and not self.face:
+            return
+        for vertex in vertices or ():
+            self.vertex.pop(vertex, None)
+        if not faces:
+            return
+        halfedge = self.halfedge.halfedge
+        for face in faces:
+            self.face.pop(face, None)
+            if face not in self.halfedge.face:
+                continue
+            for u, v in self.halfedge.face_halfedges(face):
+                self.vertex.pop(u, None)
+                if v in halfedge:
+                    nbr = halfedge[v].get(u)
+                    if nbr is not None:
+                        self.face.pop(nbr, None)
@@ -5,9 +5,14 @@ from __future__ import print_function
 from random import sample
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
+from compas.datastructures.halfedge.storage import AttributeTable
+from compas.datastructures.halfedge.storage import HalfedgeTable
+from compas.datastructures.halfedge.storage import FaceTable
+from compas.datastructures.halfedge.cache import TopologyCache
 
 from compas.utilities import pairwise
 from compas.utilities import window
@@ -26,6 +31,11 @@ class HalfEdge(Datastructure):
         Default values for edge attributes.
     default_face_attributes: dict, optional
         Default values for face attributes.
+    storage: Literal['dict', 'array'], optional
+        The storage backend of the vertices, halfedges and faces.
+        The default storage uses nested dictionaries.
+        The array storage uses compact, column-based arrays,
+        which require a lot less memory for large meshes.
 
     Attributes
     ----------
@@ -43,11 +53,32 @@ class HalfEdge(Datastructure):
         Dictionary contnaining default values for the attributes of faces.
         It is recommended to add a default to this dictionary using :meth:`update_default_face_attributes`
         for every face attribute used in the data structure.
+    storage : str, read-only
+        The name of the storage backend.
+    cache_topology : bool
+        If True, the results of topological queries such as :meth:`edges`,
+        ordered :meth:`vertex_neighbors` and :meth:`face_neighbors` are cached
+        until the topology of the affected elements changes.
+        Default is False.
 
     See Also
     --------
     :class:`compas.datastructures.Mesh`
 
+    Notes
+    -----
+    With the array storage, vertex and face identifiers have to be non-negative integers,
+    and the vertex lists stored in ``face`` are copies.
+    To change the vertices of a face, assign a new list to ``face[fkey]``.
+
+    The topology cache is updated by :meth:`add_face`, :meth:`delete_face`, :meth:`delete_vertex`
+    and the mesh operations. Code that modifies ``halfedge`` or ``face`` directly
+    should call :meth:`invalidate_topology` before doing so.
+
+    If :attr:`cache_sha256` is True, the digest returned by :meth:`sha256` is cached until the data structure is modified.
+    The cached digest is cleared by all methods that modify the data structure, and by :meth:`invalidate_topology`.
+    Code that modifies the internal dictionaries directly should call :meth:`invalidate_topology`.
+
     """
 
     DATASCHEMA = {
@@ -106,14 +137,18 @@ class HalfEdge(Datastructure):
         default_vertex_attributes=None,
         default_edge_attributes=None,
         default_face_attributes=None,
+        storage=None,
     ):
         super(HalfEdge, self).__init__(name=name)
+        self._sha256 = None
+        storage = storage or "dict"
+        if storage not in ("dict", "array"):
+            raise ValueError("Unknown storage: {}. Use 'dict' or 'array'.".format(storage))
+        self._storage = storage
         self._max_vertex = -1
         self._max_face = -1
-        self.vertex = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
+        self._topology = None
+        self._create_storage()
         self.edgedata = {}
         self.default_vertex_attributes = {}
         self.default_edge_attributes = {}
@@ -135,14 +170,16 @@ class HalfEdge(Datastructure):
 
     @property
     def data(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         return {
             "attributes": self.attributes,
             "dva": self.default_vertex_attributes,
             "dea": self.default_edge_attributes,
             "dfa": self.default_face_attributes,
-            "vertex": {str(vertex): attr for vertex, attr in self.vertex.items()},
+            "vertex": {str(vertex): dict(attr) for vertex, attr in self.vertex.items()},
             "face": {str(face): vertices for face, vertices in self.face.items()},
-            "facedata": {str(face): attr for face, attr in self.facedata.items()},
+            "facedata": {str(face): dict(attr) for face, attr in self.facedata.items()},
             "edgedata": self.edgedata,
             "max_vertex": self._max_vertex,
             "max_face": self._max_face,
@@ -176,6 +213,29 @@ class HalfEdge(Datastructure):
 
         return halfedge
 
+    def __copy_fast__(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        other = self._copy_shallow()
+        other.attributes = _copy_attributes(self.attributes)
+        other.default_vertex_attributes = _copy_attributes(self.default_vertex_attributes)
+        other.default_edge_attributes = _copy_attributes(self.default_edge_attributes)
+        other.default_face_attributes = _copy_attributes(self.default_face_attributes)
+        if self._storage == "array":
+            other.vertex = self.vertex.copy()
+            other.halfedge = self.halfedge.copy()
+            other.face = self.face.copy()
+            other.facedata = self.facedata.copy()
+        else:
+            other.vertex = {key: _copy_attributes(attr) for key, attr in self.vertex.items()}
+            other.halfedge = {key: nbrs.copy() for key, nbrs in self.halfedge.items()}
+            other.face = {key: vertices[:] for key, vertices in self.face.items()}
+            other.facedata = {key: _copy_attributes(attr) for key, attr in self.facedata.items()}
+        other.edgedata = {key: _copy_attributes(attr) for key, attr in self.edgedata.items()}
+        other._topology = None
+        other.cache_topology = self.cache_topology
+        return other
+
     # --------------------------------------------------------------------------
     # Properties
     # --------------------------------------------------------------------------
@@ -184,10 +244,37 @@ class HalfEdge(Datastructure):
     def adjacency(self):
         return self.halfedge
 
+    @property
+    def storage(self):
+        return self._storage
+
+    @property
+    def cache_topology(self):
+        return self._topology is not None
+
+    @cache_topology.setter
+    def cache_topology(self, value):
+        if not value:
+            self._topology = None
+        elif self._topology is None:
+            self._topology = TopologyCache(self)
+
     # --------------------------------------------------------------------------
     # Helpers
     # --------------------------------------------------------------------------
 
+    def _create_storage(self):
+        if self._storage == "array":
+            self.vertex = AttributeTable(float_names=("x", "y", "z"))
+            self.halfedge = HalfedgeTable()
+            self.face = FaceTable()
+            self.facedata = AttributeTable()
+        else:
+            self.vertex = {}
+            self.halfedge = {}
+            self.face = {}
+            self.facedata = {}
+
     def clear(self):
         """Clear all the mesh data.
 
@@ -196,18 +283,47 @@ class HalfEdge(Datastructure):
         None
 
         """
+        self._sha256 = None
         del self.vertex
         del self.edgedata
         del self.halfedge
         del self.face
         del self.facedata
-        self.vertex = {}
+        self._create_storage()
         self.edgedata = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
         self._max_vertex = -1
         self._max_face = -1
+        if self._topology is not None:
+            self._topology.clear()
+
+    def invalidate_topology(self, vertices=None, faces=None):
+        """Invalidate the cached topology around vertices and faces.
+
+        Parameters
+        ----------
+        vertices : list[int], optional
+            The vertices of which the neighborhood will change.
+        faces : list[int], optional
+            The faces that will be modified or deleted.
+            The vertices of these faces and their neighbors are invalidated as well.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        If no vertices and no faces are provided, the entire cache is cleared.
+        The method has no effect if :attr:`cache_topology` is False.
+
+        """
+        self._sha256 = None
+        if self._topology is None:
+            return
+        if vertices is None and faces is None:
+            self._topology.clear()
+        else:
+            self._topology.invalidate(vertices, faces)
 
     def vertex_sample(self, size=1):
         """A random sample of the vertices.
@@ -350,6 +466,9 @@ class HalfEdge(Datastructure):
         0
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        self._sha256 = None
         if key is None:
             key = self._max_vertex = self._max_vertex + 1
         key = int(key)
@@ -400,6 +519,7 @@ class HalfEdge(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if vertices[-1] == vertices[0]:
             vertices = vertices[:-1]
         vertices = [int(key) for key in vertices]
@@ -413,12 +533,16 @@ class HalfEdge(Datastructure):
             self._max_face = fkey
         attr = attr_dict or {}
         attr.update(kwattr)
+        if self._topology is not None and fkey in self.face:
+            self._topology.invalidate(faces=[fkey])
         self.face[fkey] = vertices
         self.facedata.setdefault(fkey, attr)
         for u, v in pairwise(vertices + vertices[:1]):
             self.halfedge[u][v] = fkey
             if u not in self.halfedge[v]:
                 self.halfedge[v][u] = None
+        if self._topology is not None:
+            self._topology.invalidate(faces=[fkey])
         return fkey
 
     # --------------------------------------------------------------------------
@@ -449,7 +573,10 @@ class HalfEdge(Datastructure):
         culling (:meth:`cull_vertices`).
 
         """
+        self._sha256 = None
         nbrs = self.vertex_neighbors(key)
+        if self._topology is not None:
+            self._topology.invalidate(vertices=[key] + nbrs, faces=self.vertex_faces(key))
         for nbr in nbrs:
             fkey = self.halfedge[key][nbr]
             if fkey is None:
@@ -499,6 +626,9 @@ class HalfEdge(Datastructure):
         culling (:meth:`cull_vertices`).
 
         """
+        self._sha256 = None
+        if self._topology is not None:
+            self._topology.invalidate(faces=[fkey])
         for u, v in self.face_halfedges(fkey):
             if self.halfedge[u][v] == fkey:
                 # if the halfedge still points to the face
@@ -527,11 +657,13 @@ class HalfEdge(Datastructure):
         :meth:`delete_vertex`
 
         """
+        self._sha256 = None
         for u in list(self.vertices()):
             if u not in self.halfedge:
                 del self.vertex[u]
             else:
                 if not self.halfedge[u]:
+                    self.invalidate_topology(vertices=[u])
                     del self.vertex[u]
                     del self.halfedge[u]
 
@@ -625,6 +757,19 @@ class HalfEdge(Datastructure):
         unchanged, the order is consistent.
 
         """
+        if self._topology is None:
+            edges = self._edges()
+        else:
+            if self._topology.edges is None:
+                self._topology.edges = list(self._edges())
+            edges = self._topology.edges
+        for key in edges:
+            if not data:
+                yield key
+            else:
+                yield key, self.edge_attributes(key)
+
+    def _edges(self):
         seen = set()
         for u in self.halfedge:
             for v in self.halfedge[u]:
@@ -634,10 +779,7 @@ class HalfEdge(Datastructure):
                     continue
                 seen.add(key)
                 seen.add(ikey)
-                if not data:
-                    yield key
-                else:
-                    yield key, self.edge_attributes(key)
+                yield key
 
     def vertices_where(self, conditions=None, data=False, **kwargs):
         """Get vertices for which a certain condition or set of conditions is true.
@@ -973,6 +1115,7 @@ class HalfEdge(Datastructure):
         Named arguments overwrite corresponding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1009,9 +1152,12 @@ class HalfEdge(Datastructure):
         :meth:`face_attribute`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if key not in self.vertex:
             raise KeyError(key)
         if value is not None:
+            self._sha256 = None
             self.vertex[key][name] = value
             return None
         if name in self.vertex[key]:
@@ -1051,6 +1197,9 @@ class HalfEdge(Datastructure):
         stored in the default vertex attribute dict.
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        self._sha256 = None
         if name in self.vertex[key]:
             del self.vertex[key][name]
 
@@ -1087,16 +1236,20 @@ class HalfEdge(Datastructure):
         :meth:`face_attributes`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if key not in self.vertex:
             raise KeyError(key)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 self.vertex[key][name] = value
             return
         # use it as a getter
         if not names:
             # return all vertex attributes as a dict
+            self._sha256 = None
             return VertexAttributeView(self.default_vertex_attributes, self.vertex[key])
         values = []
         for name in names:
@@ -1212,6 +1365,7 @@ class HalfEdge(Datastructure):
         Named arguments overwrite corresponding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1250,6 +1404,7 @@ class HalfEdge(Datastructure):
         if key not in self.face:
             raise KeyError(key)
         if value is not None:
+            self._sha256 = None
             if key not in self.facedata:
                 self.facedata[key] = {}
             self.facedata[key][name] = value
@@ -1290,6 +1445,7 @@ class HalfEdge(Datastructure):
         stored in the default face attribute dict.
 
         """
+        self._sha256 = None
         if key not in self.face:
             raise KeyError(key)
         if key in self.facedata:
@@ -1333,6 +1489,7 @@ class HalfEdge(Datastructure):
             raise KeyError(key)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 if key not in self.facedata:
                     self.facedata[key] = {}
@@ -1340,6 +1497,7 @@ class HalfEdge(Datastructure):
             return
         # use it as a getter
         if not names:
+            self._sha256 = None
             return FaceAttributeView(self.default_face_attributes, self.facedata.setdefault(key, {}))
         values = []
         for name in names:
@@ -1453,6 +1611,7 @@ class HalfEdge(Datastructure):
         Named arguments overwrite corresponding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1494,6 +1653,7 @@ class HalfEdge(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if value is not None:
+            self._sha256 = None
             if key not in self.edgedata:
                 self.edgedata[key] = {}
             self.edgedata[key][name] = value
@@ -1534,6 +1694,7 @@ class HalfEdge(Datastructure):
         stored in the default edge attribute dict.
 
         """
+        self._sha256 = None
         u, v = edge
         if u not in self.halfedge or v not in self.halfedge[u]:
             raise KeyError(edge)
@@ -1579,11 +1740,13 @@ class HalfEdge(Datastructure):
             raise KeyError(edge)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 self.edge_attribute(edge, name, value)
             return
         # use it as a getter
         if not names:
+            self._sha256 = None
             key = str(tuple(sorted(edge)))
             # get the entire attribute dict
             return EdgeAttributeView(self.default_edge_attributes, self.edgedata.setdefault(key, {}))
@@ -2087,6 +2250,13 @@ class HalfEdge(Datastructure):
             return temp
         if len(temp) == 1:
             return temp
+        if self._topology is not None:
+            if key not in self._topology.vertex:
+                self._topology.vertex[key] = self._ordered_vertex_neighbors(key, temp)
+            return self._topology.vertex[key][:]
+        return self._ordered_vertex_neighbors(key, temp)
+
+    def _ordered_vertex_neighbors(self, key, temp):
         # if one of the neighbors points to the *outside* face
         # start there
         # otherwise the starting point can be random
@@ -2557,6 +2727,13 @@ class HalfEdge(Datastructure):
             The identifiers of the neighboring faces.
 
         """
+        if self._topology is not None:
+            if fkey not in self._topology.face:
+                self._topology.face[fkey] = self._face_neighbors(fkey)
+            return self._topology.face[fkey][:]
+        return self._face_neighbors(fkey)
+
+    def _face_neighbors(self, fkey):
         nbrs = []
         for u, v in self.face_halfedges(fkey):
             nbr = self.halfedge[v][u]
@@ -0,0 +1,811 @@
+"""
+Compact, array-backed storage for the half-edge data structure.
+
+The tables in this module implement the mapping interface of the dictionaries
+that :class:`compas.datastructures.HalfEdge` uses by default
+(``vertex``, ``halfedge``, ``face``, and ``facedata``),
+but store their contents in flat arrays of the standard library :mod:`array` module.
+
+* vertex and face attributes are stored column by column,
+  with the coordinates in a contiguous, interleaved ``float64`` array;
+* the halfedges are stored in a table of integer arrays,
+  with the outgoing halfedges of every vertex chained in a linked list;
+* the vertex lists of the faces are stored in a single integer buffer
+  with per-face offsets and sizes (CSR layout).
+
+Keys are used directly as row indices.
+Therefore, they have to be non-negative integers, and the tables are most compact
+if the keys are contiguous, which is the case for automatically generated keys.
+
+With pickle protocol 5, the arrays of the tables are pickled as buffers,
+which can be transferred out-of-band.
+
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+
+from compas.datastructures._mutablemapping import MutableMapping
+from compas.datastructures.datastructure import _copy_value
+
+try:
+    from pickle import PickleBuffer
+except ImportError:
+    PickleBuffer = None
+
+__all__ = [
+    "AttributeTable",
+    "HalfedgeTable",
+    "FaceTable",
+]
+
+
+NAN = float("nan")
+
+
+class _Missing(object):
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<missing>"
+
+    def __reduce__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def _has_row(flags, key):
+    try:
+        return key >= 0 and flags[key] == 1
+    except (TypeError, IndexError):
+        return False
+
+
+def _restore_table(cls, state, buffers):
+    table = cls.__new__(cls)
+    table.__dict__.update(state)
+    for name, (typecode, buffer) in buffers.items():
+        values = array(typecode)
+        values.frombytes(memoryview(buffer).cast("B"))
+        table.__dict__[name] = values
+    return table
+
+
+class _Table(MutableMapping):
+    """Base class of the tables, with support for pickling the arrays as out-of-band buffers."""
+
+    def __reduce_ex__(self, protocol):
+        if PickleBuffer is None or protocol < 5:
+            return super(_Table, self).__reduce_ex__(protocol)
+        state = {}
+        buffers = {}
+        for name, value in self.__dict__.items():
+            if isinstance(value, array):
+                buffers[name] = (value.typecode, PickleBuffer(value))
+            else:
+                state[name] = value
+        return _restore_table, (type(self), state, buffers)
+
+
+# ==============================================================================
+# Attributes
+# ==============================================================================
+
+
+class AttributeRow(MutableMapping):
+    """Read/write view of the attributes of one row of an attribute table."""
+
+    __slots__ = ("_table", "_key")
+
+    def __init__(self, table, key):
+        self._table = table
+        self._key = key
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getitem__(self, name):
+        return self._table._get(self._key, name)
+
+    def __setitem__(self, name, value):
+        self._table._set(self._key, name, value)
+
+    def __delitem__(self, name):
+        self._table._unset(self._key, name)
+
+    def __iter__(self):
+        return self._table._names(self._key)
+
+    def __len__(self):
+        return len(list(self._table._names(self._key)))
+
+    def __contains__(self, name):
+        try:
+            self._table._get(self._key, name)
+        except KeyError:
+            return False
+        return True
+
+    def get(self, name, default=None):
+        try:
+            return self._table._get(self._key, name)
+        except KeyError:
+            return default
+
+    def items(self):
+        return [(name, self._table._get(self._key, name)) for name in self._table._names(self._key)]
+
+    def copy(self):
+        return dict(self.items())
+
+
+class AttributeTable(_Table):
+    """Mapping of integer keys to attribute dicts, stored column by column.
+
+    Parameters
+    ----------
+    float_names : sequence[str], optional
+        Names of attributes that are stored as ``float64`` values.
+        All other attributes are stored in generic object columns.
+
+    Attributes
+    ----------
+    float_names : tuple[str, ...], read-only
+        The names of the float attributes.
+    floats : array.array, read-only
+        The values of the float attributes, interleaved per row.
+        Unset values are NaN.
+
+    Notes
+    -----
+    The float attributes of a row are stored next to each other in a single buffer,
+    such that, for example, the coordinates of all vertices form one contiguous block
+    that can be viewed as a ``(n, 3)`` array without copying.
+
+    """
+
+    def __init__(self, float_names=None):
+        super(AttributeTable, self).__init__()
+        self._float_names = tuple(float_names or ())
+        self._float_index = {name: index for index, name in enumerate(self._float_names)}
+        self._stride = len(self._float_names)
+        self.clear()
+
+    def __repr__(self):
+        return "{}({} rows)".format(type(self).__name__, self._count)
+
+    def __getitem__(self, key):
+        if not _has_row(self._alive, key):
+            raise KeyError(key)
+        return AttributeRow(self, key)
+
+    def __setitem__(self, key, attr):
+        items = list(attr.items()) if attr else []
+        if _has_row(self._alive, key):
+            self._clear_row(key)
+        else:
+            self._reserve(key)
+            self._alive[key] = 1
+            self._count += 1
+        for name, value in items:
+            self._set(key, name, value)
+
+    def __delitem__(self, key):
+        if not _has_row(self._alive, key):
+            raise KeyError(key)
+        self._clear_row(key)
+        self._alive[key] = 0
+        self._count -= 1
+
+    def __iter__(self):
+        for key, flag in enumerate(self._alive):
+            if flag:
+                yield key
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return _has_row(self._alive, key)
+
+    @property
+    def float_names(self):
+        return self._float_names
+
+    @property
+    def floats(self):
+        return self._floats
+
+    def get(self, key, default=None):
+        if _has_row(self._alive, key):
+            return AttributeRow(self, key)
+        return default
+
+    def setdefault(self, key, default=None):
+        if not _has_row(self._alive, key):
+            self[key] = default
+        return AttributeRow(self, key)
+
+    def clear(self):
+        self._alive = array("b")
+        self._count = 0
+        self._floats = array("d")
+        self._objects = {}
+
+    def copy(self):
+        """Make an independent copy of the table.
+
+        Returns
+        -------
+        :class:`AttributeTable`
+
+        """
+        other = type(self)(self._float_names)
+        other._alive = self._alive[:]
+        other._count = self._count
+        other._floats = self._floats[:]
+        other._objects = {
+            name: [value if value is MISSING else _copy_value(value) for value in column]
+            for name, column in self._objects.items()
+        }
+        return other
+
+    def load(self, count, floats=None):
+        """Replace the contents of the table by a number of consecutive rows.
+
+        Parameters
+        ----------
+        count : int
+            The number of rows.
+            The rows get the keys ``0`` to ``count - 1``.
+        floats : array.array, optional
+            The interleaved values of the float attributes of the rows.
+            If None, the float attributes of the rows are unset.
+
+        Returns
+        -------
+        None
+
+        """
+        self.clear()
+        self._alive = array("b", [1]) * count
+        self._count = count
+        if floats is None:
+            floats = array("d", [NAN]) * (count * self._stride)
+        if len(floats) != count * self._stride:
+            raise ValueError("Expected {} float values, got {}.".format(count * self._stride, len(floats)))
+        self._floats = floats
+
+    def _reserve(self, key):
+        size = len(self._alive)
+        if key < size:
+            return
+        if key < 0:
+            raise KeyError(key)
+        grow = key + 1 - size
+        self._alive.extend(array("b", [0]) * grow)
+        self._floats.extend(array("d", [NAN]) * (grow * self._stride))
+
+    def _clear_row(self, key):
+        if self._stride:
+            start = key * self._stride
+            self._floats[start : start + self._stride] = array("d", [NAN]) * self._stride
+        for column in self._objects.values():
+            if key < len(column):
+                column[key] = MISSING
+
+    def _get(self, key, name):
+        index = self._float_index.get(name)
+        if index is not None:
+            value = self._floats[key * self._stride + index]
+            if value != value:
+                raise KeyError(name)
+            return value
+        column = self._objects.get(name)
+        if column is None or key >= len(column):
+            raise KeyError(name)
+        value = column[key]
+        if value is MISSING:
+            raise KeyError(name)
+        return value
+
+    def _set(self, key, name, value):
+        index = self._float_index.get(name)
+        if index is not None:
+            self._floats[key * self._stride + index] = float(value)
+            return
+        column = self._objects.get(name)
+        if column is None:
+            column = self._objects[name] = []
+        if key >= len(column):
+            column.extend([MISSING] * (key + 1 - len(column)))
+        column[key] = value
+
+    def _unset(self, key, name):
+        self._get(key, name)
+        index = self._float_index.get(name)
+        if index is not None:
+            self._floats[key * self._stride + index] = NAN
+        else:
+            self._objects[name][key] = MISSING
+
+    def _names(self, key):
+        start = key * self._stride
+        for index, name in enumerate(self._float_names):
+            value = self._floats[start + index]
+            if value == value:
+                yield name
+        for name, column in self._objects.items():
+            if key < len(column) and column[key] is not MISSING:
+                yield name
+
+
+# ==============================================================================
+# Halfedges
+# ==============================================================================
+
+
+class HalfedgeRow(MutableMapping):
+    """Read/write view of the outgoing halfedges of a vertex.
+
+    The view maps the identifiers of the neighbors of the vertex
+    to the identifiers of the faces on the left of the corresponding halfedges,
+    or to None if there is no face.
+
+    """
+
+    __slots__ = ("_table", "_key")
+
+    def __init__(self, table, key):
+        self._table = table
+        self._key = key
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getitem__(self, v):
+        h = self._table._find(self._key, v)
+        if h == -1:
+            raise KeyError(v)
+        face = self._table._face[h]
+        return None if face == -1 else face
+
+    def __setitem__(self, v, face):
+        self._table._set(self._key, v, face)
+
+    def __delitem__(self, v):
+        self._table._unset(self._key, v)
+
+    def __iter__(self):
+        table = self._table
+        target = table._target
+        nxt = table._next
+        h = table._head[self._key]
+        while h != -1:
+            yield target[h]
+            h = nxt[h]
+
+    def __len__(self):
+        nxt = self._table._next
+        count = 0
+        h = self._table._head[self._key]
+        while h != -1:
+            count += 1
+            h = nxt[h]
+        return count
+
+    def __contains__(self, v):
+        return self._table._find(self._key, v) != -1
+
+    def get(self, v, default=None):
+        h = self._table._find(self._key, v)
+        if h == -1:
+            return default
+        face = self._table._face[h]
+        return None if face == -1 else face
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [face for _, face in self.items()]
+
+    def items(self):
+        table = self._table
+        target = table._target
+        faces = table._face
+        nxt = table._next
+        items = []
+        h = table._head[self._key]
+        while h != -1:
+            face = faces[h]
+            items.append((target[h], None if face == -1 else face))
+            h = nxt[h]
+        return items
+
+    def copy(self):
+        return dict(self.items())
+
+
+class HalfedgeTable(_Table):
+    """Mapping of vertex identifiers to their outgoing halfedges, stored in integer arrays.
+
+    Every halfedge is a row in three parallel arrays: the target vertex, the face (-1 for None),
+    and the next outgoing halfedge of the same source vertex.
+    The first and last outgoing halfedge of every vertex are stored per vertex,
+    such that the halfedges of a vertex are iterated in insertion order.
+    The rows of deleted halfedges are recycled.
+
+    """
+
+    def __init__(self):
+        super(HalfedgeTable, self).__init__()
+        self.clear()
+
+    def __repr__(self):
+        return "{}({} rows)".format(type(self).__name__, self._count)
+
+    def __getitem__(self, u):
+        if not _has_row(self._alive, u):
+            raise KeyError(u)
+        return HalfedgeRow(self, u)
+
+    def __setitem__(self, u, nbrs):
+        items = list(nbrs.items()) if nbrs else []
+        if _has_row(self._alive, u):
+            self._clear_row(u)
+        else:
+            self._reserve(u)
+            self._alive[u] = 1
+            self._count += 1
+        for v, face in items:
+            self._set(u, v, face)
+
+    def __delitem__(self, u):
+        if not _has_row(self._alive, u):
+            raise KeyError(u)
+        self._clear_row(u)
+        self._alive[u] = 0
+        self._count -= 1
+
+    def __iter__(self):
+        for key, flag in enumerate(self._alive):
+            if flag:
+                yield key
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, u):
+        return _has_row(self._alive, u)
+
+    def get(self, u, default=None):
+        if _has_row(self._alive, u):
+            return HalfedgeRow(self, u)
+        return default
+
+    def setdefault(self, u, default=None):
+        if not _has_row(self._alive, u):
+            self[u] = default
+        return HalfedgeRow(self, u)
+
+    def clear(self):
+        self._alive = array("b")
+        self._count = 0
+        self._head = array("i")
+        self._tail = array("i")
+        self._target = array("i")
+        self._face = array("i")
+        self._next = array("i")
+        self._free = -1
+
+    def copy(self):
+        """Make an independent copy of the table.
+
+        Returns
+        -------
+        :class:`HalfedgeTable`
+
+        """
+        other = type(self)()
+        other._alive = self._alive[:]
+        other._count = self._count
+        other._head = self._head[:]
+        other._tail = self._tail[:]
+        other._target = self._target[:]
+        other._face = self._face[:]
+        other._next = self._next[:]
+        other._free = self._free
+        return other
+
+    def load(self, head, tail, target, face, next):
+        """Replace the contents of the table by a complete set of halfedges.
+
+        Parameters
+        ----------
+        head : array.array
+            Per vertex, the index of its first outgoing halfedge, or -1.
+        tail : array.array
+            Per vertex, the index of its last outgoing halfedge, or -1.
+        target : array.array
+            Per halfedge, the target vertex.
+        face : array.array
+            Per halfedge, the face on its left, or -1.
+        next : array.array
+            Per halfedge, the index of the next outgoing halfedge of the same vertex, or -1.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The table gets one row for every vertex ``0`` to ``len(head) - 1``.
+
+        """
+        if len(head) != len(tail):
+            raise ValueError("The head and tail arrays should have the same length.")
+        if not len(target) == len(face) == len(next):
+            raise ValueError("The target, face, and next arrays should have the same length.")
+        self.clear()
+        self._alive = array("b", [1]) * len(head)
+        self._count = len(head)
+        self._head = head
+        self._tail = tail
+        self._target = target
+        self._face = face
+        self._next = next
+
+    def _reserve(self, u):
+        size = len(self._alive)
+        if u < size:
+            return
+        if u < 0:
+            raise KeyError(u)
+        grow = u + 1 - size
+        self._alive.extend(array("b", [0]) * grow)
+        self._head.extend(array("i", [-1]) * grow)
+        self._tail.extend(array("i", [-1]) * grow)
+
+    def _find(self, u, v):
+        target = self._target
+        nxt = self._next
+        h = self._head[u]
+        while h != -1:
+            if target[h] == v:
+                return h
+            h = nxt[h]
+        return -1
+
+    def _set(self, u, v, face):
+        face = -1 if face is None else face
+        h = self._find(u, v)
+        if h != -1:
+            self._face[h] = face
+            return
+        h = self._free
+        if h != -1:
+            self._free = self._next[h]
+            self._target[h] = v
+            self._face[h] = face
+            self._next[h] = -1
+        else:
+            h = len(self._target)
+            self._target.append(v)
+            self._face.append(face)
+            self._next.append(-1)
+        tail = self._tail[u]
+        if tail == -1:
+            self._head[u] = h
+        else:
+            self._next[tail] = h
+        self._tail[u] = h
+
+    def _unset(self, u, v):
+        target = self._target
+        nxt = self._next
+        prev = -1
+        h = self._head[u]
+        while h != -1:
+            if target[h] == v:
+                break
+            prev = h
+            h = nxt[h]
+        else:
+            raise KeyError(v)
+        if prev == -1:
+            self._head[u] = nxt[h]
+        else:
+            nxt[prev] = nxt[h]
+        if self._tail[u] == h:
+            self._tail[u] = prev
+        self._release(h)
+
+    def _release(self, h):
+        self._target[h] = -1
+        self._face[h] = -1
+        self._next[h] = self._free
+        self._free = h
+
+    def _clear_row(self, u):
+        nxt = self._next
+        h = self._head[u]
+        while h != -1:
+            n = nxt[h]
+            self._release(h)
+            h = n
+        self._head[u] = -1
+        self._tail[u] = -1
+
+
+# ==============================================================================
+# Faces
+# ==============================================================================
+
+
+class FaceTable(_Table):
+    """Mapping of face identifiers to vertex lists, stored in a single integer buffer.
+
+    The vertices of a face are a contiguous slice of the buffer,
+    identified by an offset and a size per face.
+
+    Notes
+    -----
+    The vertex lists returned by this table are copies.
+    To modify the vertices of a face, assign a new list to the face
+    (``table[fkey] = vertices``), instead of modifying the returned list in place.
+
+    The space of deleted or resized faces is reclaimed
+    when it exceeds the space used by the remaining faces.
+
+    """
+
+    def __init__(self):
+        super(FaceTable, self).__init__()
+        self.clear()
+
+    def __repr__(self):
+        return "{}({} rows)".format(type(self).__name__, self._count)
+
+    def __getitem__(self, key):
+        if not _has_row(self._alive, key):
+            raise KeyError(key)
+        offset = self._offset[key]
+        return self._indices[offset : offset + self._size[key]].tolist()
+
+    def __setitem__(self, key, vertices):
+        vertices = array("i", vertices)
+        size = len(vertices)
+        if _has_row(self._alive, key):
+            if self._size[key] == size:
+                offset = self._offset[key]
+                self._indices[offset : offset + size] = vertices
+                return
+            self._garbage += self._size[key]
+        else:
+            self._reserve(key)
+            self._alive[key] = 1
+            self._count += 1
+        self._offset[key] = len(self._indices)
+        self._size[key] = size
+        self._indices.extend(vertices)
+        self._collect()
+
+    def __delitem__(self, key):
+        if not _has_row(self._alive, key):
+            raise KeyError(key)
+        self._garbage += self._size[key]
+        self._alive[key] = 0
+        self._size[key] = 0
+        self._count -= 1
+        self._collect()
+
+    def __iter__(self):
+        for key, flag in enumerate(self._alive):
+            if flag:
+                yield key
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return _has_row(self._alive, key)
+
+    @property
+    def offsets(self):
+        return self._offset
+
+    @property
+    def sizes(self):
+        return self._size
+
+    @property
+    def indices(self):
+        return self._indices
+
+    def get(self, key, default=None):
+        if _has_row(self._alive, key):
+            return self[key]
+        return default
+
+    def clear(self):
+        self._alive = array("b")
+        self._count = 0
+        self._offset = array("i")
+        self._size = array("i")
+        self._indices = array("i")
+        self._garbage = 0
+
+    def copy(self):
+        """Make an independent copy of the table.
+
+        Returns
+        -------
+        :class:`FaceTable`
+
+        """
+        other = type(self)()
+        other._alive = self._alive[:]
+        other._count = self._count
+        other._offset = self._offset[:]
+        other._size = self._size[:]
+        other._indices = self._indices[:]
+        other._garbage = self._garbage
+        return other
+
+    def load(self, offsets, sizes, indices):
+        """Replace the contents of the table by a number of consecutive faces.
+
+        Parameters
+        ----------
+        offsets : array.array
+            Per face, the position of its first vertex in the index buffer.
+        sizes : array.array
+            Per face, the number of vertices.
+        indices : array.array
+            The index buffer with the vertices of all faces.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The faces get the keys ``0`` to ``len(offsets) - 1``.
+
+        """
+        if len(offsets) != len(sizes):
+            raise ValueError("The offsets and sizes arrays should have the same length.")
+        self.clear()
+        self._alive = array("b", [1]) * len(offsets)
+        self._count = len(offsets)
+        self._offset = offsets
+        self._size = sizes
+        self._indices = indices
+
+    def _reserve(self, key):
+        size = len(self._alive)
+        if key < size:
+            return
+        if key < 0:
+            raise KeyError(key)
+        grow = key + 1 - size
+        self._alive.extend(array("b", [0]) * grow)
+        self._offset.extend(array("i", [0]) * grow)
+        self._size.extend(array("i", [0]) * grow)
+
+    def _collect(self):
+        if self._garbage < 1024 or 2 * self._garbage < len(self._indices):
+            return
+        indices = array("i")
+        for key in self:
+            offset = self._offset[key]
+            size = self._size[key]
+            self._offset[key] = len(indices)
+            indices.extend(self._indices[offset : offset + size])
+        self._indices = indices
+        self._garbage = 0
@@ -5,6 +5,7 @@ from __future__ import print_function
 from random import sample
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
@@ -52,6 +53,12 @@ class HalfFace(Datastructure):
     --------
     :class:`compas.datastructures.VolMesh`
 
+    Notes
+    -----
+    If :attr:`cache_sha256` is True, the digest returned by :meth:`sha256` is cached
+    until the data structure is modified through its methods.
+    Code that modifies the internal dictionaries directly should then set ``halfface._sha256 = None``.
+
     """
 
     DATASCHEMA = {
@@ -127,6 +134,7 @@ class HalfFace(Datastructure):
         default_cell_attributes=None,
     ):
         super(HalfFace, self).__init__(name=name)
+        self._sha256 = None
         self._max_vertex = -1
         self._max_face = -1
         self._max_cell = -1
@@ -165,6 +173,8 @@ class HalfFace(Datastructure):
 
     @property
     def data(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         _cell = {}
         # this sometimes changes the cycle order of faces
         # for c in self.cells():
@@ -237,6 +247,24 @@ class HalfFace(Datastructure):
 
         return halfface
 
+    def __copy_fast__(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        other = self._copy_shallow()
+        other.attributes = _copy_attributes(self.attributes)
+        other.default_vertex_attributes = _copy_attributes(self.default_vertex_attributes)
+        other.default_edge_attributes = _copy_attributes(self.default_edge_attributes)
+        other.default_face_attributes = _copy_attributes(self.default_face_attributes)
+        other.default_cell_attributes = _copy_attributes(self.default_cell_attributes)
+        other._vertex = {key: _copy_attributes(attr) for key, attr in self._vertex.items()}
+        other._halfface = {key: vertices[:] for key, vertices in self._halfface.items()}
+        other._cell = {c: {u: nbrs.copy() for u, nbrs in cell.items()} for c, cell in self._cell.items()}
+        other._plane = {u: {v: nbrs.copy() for v, nbrs in plane.items()} for u, plane in self._plane.items()}
+        other._edge_data = {key: _copy_attributes(attr) for key, attr in self._edge_data.items()}
+        other._face_data = {key: _copy_attributes(attr) for key, attr in self._face_data.items()}
+        other._cell_data = {key: _copy_attributes(attr) for key, attr in self._cell_data.items()}
+        return other
+
     # --------------------------------------------------------------------------
     # Properties
     # --------------------------------------------------------------------------
@@ -253,6 +281,7 @@ class HalfFace(Datastructure):
         None
 
         """
+        self._sha256 = None
         del self._vertex
         del self._halfface
         del self._cell
@@ -418,6 +447,9 @@ class HalfFace(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        self._sha256 = None
         if key is None:
             key = self._max_vertex = self._max_vertex + 1
         key = int(key)
@@ -465,6 +497,7 @@ class HalfFace(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if len(vertices) < 3:
             return
         if vertices[-1] == vertices[0]:
@@ -528,6 +561,7 @@ class HalfFace(Datastructure):
         highest integer key value, then the highest integer value is updated accordingly.
 
         """
+        self._sha256 = None
         if ckey is None:
             ckey = self._max_cell = self._max_cell + 1
         ckey = int(ckey)
@@ -570,6 +604,7 @@ class HalfFace(Datastructure):
         :meth:`delete_halfface`, :meth:`delete_cell`
 
         """
+        self._sha256 = None
         for cell in self.vertex_cells(vertex):
             self.delete_cell(cell)
 
@@ -590,6 +625,7 @@ class HalfFace(Datastructure):
         :meth:`delete_vertex`, :meth:`delete_halfface`
 
         """
+        self._sha256 = None
         cell_vertices = self.cell_vertices(cell)
         cell_faces = self.cell_faces(cell)
         for face in cell_faces:
@@ -625,6 +661,7 @@ class HalfFace(Datastructure):
         None
 
         """
+        self._sha256 = None
         for vertex in list(self.vertices()):
             if vertex not in self._plane:
                 del self._vertex[vertex]
@@ -1211,6 +1248,7 @@ class HalfFace(Datastructure):
         Named arguments overwrite correpsonding name-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1246,9 +1284,12 @@ class HalfFace(Datastructure):
         :meth:`edge_attribute`, :meth:`face_attribute`, :meth:`cell_attribute`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if vertex not in self._vertex:
             raise KeyError(vertex)
         if value is not None:
+            self._sha256 = None
             self._vertex[vertex][name] = value
             return None
         if name in self._vertex[vertex]:
@@ -1286,6 +1327,9 @@ class HalfFace(Datastructure):
         stored in the default vertex attribute dict.
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
+        self._sha256 = None
         if name in self._vertex[vertex]:
             del self._vertex[vertex][name]
 
@@ -1321,16 +1365,20 @@ class HalfFace(Datastructure):
         :meth:`edge_attributes`, :meth:`face_attributes`, :meth:`cell_attributes`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if vertex not in self._vertex:
             raise KeyError(vertex)
         if names and values is not None:
             # use it as a setter
+            self._sha256 = None
             for name, value in zip(names, values):
                 self._vertex[vertex][name] = value
             return
         # use it as a getter
         if not names:
             # return all vertex attributes as a dict
+            self._sha256 = None
             return VertexAttributeView(self.default_vertex_attributes, self._vertex[vertex])
         values = []
         for name in names:
@@ -1447,6 +1495,7 @@ class HalfFace(Datastructure):
         Named arguments overwrite correpsonding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1486,6 +1535,7 @@ class HalfFace(Datastructure):
             raise KeyError(edge)
         key = str(tuple(sorted(edge)))
         if value is not None:
+            self._sha256 = None
             if key not in self._edge_data:
                 self._edge_data[key] = {}
             self._edge_data[key][name] = value
@@ -1524,6 +1574,7 @@ class HalfFace(Datastructure):
         stored in the default edge attribute dict.
 
         """
+        self._sha256 = None
         u, v = edge
         if u not in self._plane or v not in self._plane[u]:
             raise KeyError(edge)
@@ -1572,6 +1623,7 @@ class HalfFace(Datastructure):
                 self._edge_data[key][name] = value
             return
         if not names:
+            self._sha256 = None
             key = str(tuple(sorted(edge)))
             return EdgeAttributeView(self.default_edge_attributes, self._edge_data.setdefault(key, {}))
         values = []
@@ -1683,6 +1735,7 @@ class HalfFace(Datastructure):
         Named arguments overwrite correpsonding key-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1721,6 +1774,7 @@ class HalfFace(Datastructure):
             raise KeyError(face)
         key = str(tuple(sorted(self.halfface_vertices(face))))
         if value is not None:
+            self._sha256 = None
             if key not in self._face_data:
                 self._face_data[key] = {}
             self._face_data[key][name] = value
@@ -1759,6 +1813,7 @@ class HalfFace(Datastructure):
         stored in the default face attribute dict.
 
         """
+        self._sha256 = None
         if face not in self._halfface:
             raise KeyError(face)
         key = str(tuple(sorted(self.halfface_vertices(face))))
@@ -1805,6 +1860,7 @@ class HalfFace(Datastructure):
                 self._face_data[key][name] = value
             return
         if not names:
+            self._sha256 = None
             return FaceAttributeView(self.default_face_attributes, self._face_data.setdefault(key, {}))
         values = []
         for name in names:
@@ -1917,6 +1973,7 @@ class HalfFace(Datastructure):
         Named arguments overwrite corresponding cell-value pairs in the attribute dictionary.
 
         """
+        self._sha256 = None
         if not attr_dict:
             attr_dict = {}
         attr_dict.update(kwattr)
@@ -1954,6 +2011,7 @@ class HalfFace(Datastructure):
         if cell not in self._cell:
             raise KeyError(cell)
         if value is not None:
+            self._sha256 = None
             if cell not in self._cell_data:
                 self._cell_data[cell] = {}
             self._cell_data[cell][name] = value
@@ -1992,6 +2050,7 @@ class HalfFace(Datastructure):
         stored in the default cell attribute dict.
 
         """
+        self._sha256 = None
         if cell not in self._cell:
             raise KeyError(cell)
         if cell in self._cell_data:
@@ -2031,12 +2090,14 @@ class HalfFace(Datastructure):
         if cell not in self._cell:
             raise KeyError(cell)
         if names and values is not None:
+            self._sha256 = None
             for name, value in zip(names, values):
                 if cell not in self._cell_data:
                     self._cell_data[cell] = {}
                 self._cell_data[cell][name] = value
             return
         if not names:
+            self._sha256 = None
             return CellAttributeView(self.default_cell_attributes, self._cell_data.setdefault(cell, {}))
         values = []
         for name in names:
@@ -0,0 +1,353 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+
+from numpy import arange
+from numpy import asarray
+from numpy import ascontiguousarray
+from numpy import cumsum
+from numpy import diff
+from numpy import empty
+from numpy import float64
+from numpy import frombuffer
+from numpy import full
+from numpy import int32
+from numpy import int64
+from numpy import isnan
+from numpy import lexsort
+from numpy import nonzero
+from numpy import ones
+from numpy import repeat
+from numpy import zeros
+
+
+def face_arrays_numpy(faces, offsets=None):
+    """Convert faces to a flat index buffer with offsets.
+
+    Parameters
+    ----------
+    faces : array_like
+        A ``(F, k)`` array of vertex indices,
+        a list of lists of vertex indices,
+        or a flat buffer with the vertex indices of all faces if `offsets` is provided.
+    offsets : array_like, optional
+        The positions of the first vertex of every face in the flat buffer,
+        followed by the length of the buffer (``F + 1`` values).
+
+    Returns
+    -------
+    ndarray
+        The flat index buffer, as ``int32``.
+    ndarray
+        The ``F + 1`` offsets, as ``int64``.
+
+    Raises
+    ------
+    ValueError
+        If the offsets don't match the index buffer.
+
+    Examples
+    --------
+    >>> indices, offsets = face_arrays_numpy([[0, 1, 2], [0, 2, 3, 4]])
+    >>> indices.tolist()
+    [0, 1, 2, 0, 2, 3, 4]
+    >>> offsets.tolist()
+    [0, 3, 7]
+
+    """
+    if offsets is not None:
+        indices = asarray(faces, dtype=int32).reshape(-1)
+        offsets = asarray(offsets, dtype=int64).reshape(-1)
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(indices) or (diff(offsets) < 0).any():
+            raise ValueError("The offsets should increase from 0 to the length of the index buffer.")
+        return indices, offsets
+    try:
+        faces = asarray(faces, dtype=int32)
+    except ValueError:
+        faces = list(faces)
+        sizes = asarray([len(face) for face in faces], dtype=int64)
+        offsets = zeros(len(faces) + 1, dtype=int64)
+        cumsum(sizes, out=offsets[1:])
+        indices = asarray([vertex for face in faces for vertex in face], dtype=int32)
+        return indices, offsets
+    if faces.size == 0:
+        return faces.reshape(-1), zeros(1, dtype=int64)
+    if faces.ndim != 2:
+        raise ValueError("The faces should be a (F, k) array, or a flat buffer with offsets.")
+    count, degree = faces.shape
+    return faces.reshape(-1), arange(count + 1, dtype=int64) * degree
+
+
+def halfedge_arrays_numpy(indices, offsets, number_of_vertices):
+    """Compute the halfedge table of a set of faces in one vectorized pass.
+
+    Parameters
+    ----------
+    indices : ndarray
+        The flat index buffer of the faces.
+    offsets : ndarray
+        The ``F + 1`` offsets of the faces in the index buffer.
+    number_of_vertices : int
+        The number of vertices.
+
+    Returns
+    -------
+    head : ndarray
+        Per vertex, the index of its first outgoing halfedge, or -1.
+    tail : ndarray
+        Per vertex, the index of its last outgoing halfedge, or -1.
+    target : ndarray
+        Per halfedge, the target vertex.
+    face : ndarray
+        Per halfedge, the face on its left, or -1 if there is no face.
+    next : ndarray
+        Per halfedge, the next outgoing halfedge of the same vertex, or -1.
+
+    Notes
+    -----
+    The halfedges are the same as the ones created by adding the faces one by one with
+    :meth:`compas.datastructures.HalfEdge.add_face`, and the outgoing halfedges of every vertex
+    are in the same order.
+    If a halfedge is used by more than one face, the last face wins.
+
+    """
+    sizes = diff(offsets)
+    count = len(indices)
+    u = indices.astype(int64)
+    after = arange(1, count + 1, dtype=int64)
+    last = offsets[1:][sizes > 0] - 1
+    after[last] = offsets[:-1][sizes > 0]
+    v = u[after]
+
+    # every face halfedge (u, v) is followed by its opposite (v, u), without a face,
+    # which is only used if the opposite halfedge doesn't exist otherwise
+    source = empty(2 * count, dtype=int64)
+    source[0::2] = u
+    source[1::2] = v
+    target = empty(2 * count, dtype=int64)
+    target[0::2] = v
+    target[1::2] = u
+    face = full(2 * count, -1, dtype=int64)
+    face[0::2] = repeat(arange(len(sizes), dtype=int64), sizes)
+
+    key = source * number_of_vertices + target
+    order = key.argsort(kind="stable")
+    key = key[order]
+    face = face[order]
+    first = ones(len(key), dtype=bool)
+    first[1:] = key[1:] != key[:-1]
+    group = cumsum(first) - 1
+    time = order[first]
+
+    hface = full(int(first.sum()), -1, dtype=int64)
+    real = nonzero(face != -1)[0]
+    if len(real):
+        real_group = group[real]
+        latest = ones(len(real), dtype=bool)
+        latest[:-1] = real_group[1:] != real_group[:-1]
+        hface[real_group[latest]] = face[real[latest]]
+
+    hsource = key[first] // number_of_vertices
+    htarget = key[first] % number_of_vertices
+
+    order = lexsort((time, hsource))
+    hsource = hsource[order]
+    htarget = htarget[order]
+    hface = hface[order]
+
+    n = len(hsource)
+    start = ones(n, dtype=bool)
+    start[1:] = hsource[1:] != hsource[:-1]
+    end = ones(n, dtype=bool)
+    end[:-1] = start[1:]
+    hnext = arange(1, n + 1, dtype=int64)
+    hnext[end] = -1
+    head = full(number_of_vertices, -1, dtype=int64)
+    tail = full(number_of_vertices, -1, dtype=int64)
+    head[hsource[start]] = nonzero(start)[0]
+    tail[hsource[end]] = nonzero(end)[0]
+    return head, tail, htarget, hface, hnext
+
+
+def _to_array(typecode, values, dtype):
+    buffer = array(typecode)
+    buffer.frombytes(ascontiguousarray(values, dtype=dtype).tobytes())
+    return buffer
+
+
+def mesh_load_arrays_numpy(mesh, vertices, faces, offsets=None):
+    """Replace the vertices and faces of a mesh by the contents of vertex and face arrays.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        The mesh.
+    vertices : array_like
+        The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+    faces : array_like
+        A ``(F, k)`` array of vertex indices,
+        a list of lists of vertex indices,
+        or a flat buffer with the vertex indices of all faces if `offsets` is provided.
+    offsets : array_like, optional
+        The ``F + 1`` offsets of the faces in the flat buffer of vertex indices.
+
+    Returns
+    -------
+    None
+        The mesh is modified in-place.
+
+    Raises
+    ------
+    ValueError
+        If the vertices are not a ``(V, 3)`` array, or if the faces reference non-existing vertices.
+
+    Notes
+    -----
+    Faces with consecutive duplicate vertices, or with less than three vertices,
+    are cleaned up by :meth:`~compas.datastructures.HalfEdge.add_face`.
+    If the faces contain any of those, they are added one by one instead.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh(storage="array")
+    >>> mesh_load_arrays_numpy(mesh, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2, 3]])
+    >>> mesh.face_vertices(0)
+    [0, 1, 2, 3]
+    >>> mesh.vertex_neighbors(0)
+    [1, 3]
+
+    """
+    xyz = asarray(vertices, dtype=float64)
+    if xyz.size == 0:
+        xyz = xyz.reshape(0, 3)
+    if xyz.ndim != 2 or xyz.shape[1] != 3:
+        raise ValueError("The vertices should be a (V, 3) array.")
+    indices, offsets = face_arrays_numpy(faces, offsets)
+    number_of_vertices = len(xyz)
+    if len(indices) and (indices.min() < 0 or indices.max() >= number_of_vertices):
+        raise ValueError("The faces reference vertices that don't exist.")
+
+    mesh.clear()
+
+    sizes = diff(offsets)
+    position = arange(1, len(indices) + 1)
+    if len(indices):
+        position[offsets[1:][sizes > 0] - 1] = offsets[:-1][sizes > 0]
+    if (sizes < 3).any() or (indices == indices[position]).any():
+        for x, y, z in xyz.tolist():
+            mesh.add_vertex(x=x, y=y, z=z)
+        faces = indices.tolist()
+        for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist()):
+            mesh.add_face(faces[start:end])
+        return
+
+    head, tail, target, face, hnext = halfedge_arrays_numpy(indices, offsets, number_of_vertices)
+    number_of_faces = len(sizes)
+
+    if mesh.storage == "array":
+        mesh.vertex.load(number_of_vertices, _to_array("d", xyz, float64))
+        mesh.face.load(
+            _to_array("i", offsets[:-1], int32),
+            _to_array("i", sizes, int32),
+            _to_array("i", indices, int32),
+        )
+        mesh.facedata.load(number_of_faces)
+        mesh.halfedge.load(
+            _to_array("i", head, int32),
+            _to_array("i", tail, int32),
+            _to_array("i", target, int32),
+            _to_array("i", face, int32),
+            _to_array("i", hnext, int32),
+        )
+    else:
+        mesh.vertex = {key: {"x": x, "y": y, "z": z} for key, (x, y, z) in enumerate(xyz.tolist())}
+        faces = indices.tolist()
+        starts = offsets.tolist()
+        mesh.face = {key: faces[starts[key] : starts[key + 1]] for key in range(number_of_faces)}
+        mesh.facedata = {key: {} for key in range(number_of_faces)}
+        target = target.tolist()
+        face = face.tolist()
+        hnext = hnext.tolist()
+        halfedge = {}
+        for u, h in enumerate(head.tolist()):
+            nbrs = halfedge[u] = {}
+            while h != -1:
+                f = face[h]
+                nbrs[target[h]] = None if f == -1 else f
+                h = hnext[h]
+        mesh.halfedge = halfedge
+
+    mesh._max_vertex = number_of_vertices - 1
+    mesh._max_face = number_of_faces - 1
+
+
+def mesh_to_arrays_numpy(mesh):
+    """Convert the vertices and faces of a mesh to arrays.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        The mesh.
+
+    Returns
+    -------
+    vertices : ndarray
+        The XYZ coordinates of the vertices, as a ``(V, 3)`` array of ``float64``.
+    indices : ndarray
+        The vertex indices of all faces, as a flat ``int32`` buffer.
+    offsets : ndarray
+        The ``F + 1`` offsets of the faces in the index buffer.
+
+    Notes
+    -----
+    If the mesh uses the array storage, its vertices have consecutive keys starting from zero,
+    and its faces are stored back to back, the vertex coordinates and the index buffer
+    are returned as views on the storage of the mesh, without copying.
+    While such views exist, vertices and faces can't be added to the mesh.
+    After modifying the mesh through these views, call :meth:`~compas.datastructures.Mesh.invalidate_topology`
+    to clear the cached topology and digest of the mesh.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> vertices, indices, offsets = mesh_to_arrays_numpy(mesh)
+    >>> vertices.shape
+    (8, 3)
+    >>> indices.reshape(-1, 4).shape
+    (6, 4)
+
+    """
+    if mesh.pending_transformation is not None:
+        mesh.flush_transformation()
+
+    contiguous = mesh.storage == "array" and len(mesh.vertex) == len(mesh.vertex.floats) // 3
+
+    if contiguous and mesh.vertex.float_names == ("x", "y", "z"):
+        vertices = frombuffer(mesh.vertex.floats, dtype=float64).reshape(-1, 3)
+        unset = isnan(vertices)
+        if unset.any():
+            defaults = [mesh.default_vertex_attributes.get(name) for name in "xyz"]
+            vertices = vertices.copy()
+            vertices[unset] = asarray(defaults, dtype=float64)[nonzero(unset)[1]]
+    else:
+        vertices = asarray([mesh.vertex_coordinates(vertex) for vertex in mesh.vertices()], dtype=float64)
+        vertices = vertices.reshape(-1, 3)
+
+    if contiguous and len(mesh.face) == len(mesh.face.sizes):
+        # the faces are packed if they are stored back to back in the order of their keys
+        offsets = zeros(len(mesh.face) + 1, dtype=int64)
+        cumsum(frombuffer(mesh.face.sizes, dtype=int32), out=offsets[1:])
+        starts = frombuffer(mesh.face.offsets, dtype=int32)
+        if offsets[-1] == len(mesh.face.indices) and (starts == offsets[:-1]).all():
+            return vertices, frombuffer(mesh.face.indices, dtype=int32), offsets
+
+    vertex_index = mesh.vertex_index()
+    faces = [mesh.face_vertices(face) for face in mesh.faces()]
+    offsets = zeros(len(faces) + 1, dtype=int64)
+    cumsum([len(face) for face in faces], out=offsets[1:])
+    indices = asarray([vertex_index[vertex] for face in faces for vertex in face], dtype=int32)
+    return vertices, indices, offsets
@@ -44,6 +44,8 @@ def mesh_delete_duplicate_vertices(mesh, precision=None):
     36
 
     """
+    mesh.invalidate_topology()
+
     key_gkey = {key: geometric_key(mesh.vertex_attributes(key, "xyz"), precision=precision) for key in mesh.vertices()}
     gkey_key = {gkey: key for key, gkey in iter(key_gkey.items())}
 
@@ -0,0 +1,243 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import add
+from numpy import arange
+from numpy import arccos
+from numpy import asarray
+from numpy import bincount
+from numpy import clip
+from numpy import cross
+from numpy import diff
+from numpy import einsum
+from numpy import int64
+from numpy import repeat
+from numpy import stack
+from numpy import where
+from numpy import zeros
+
+from compas.numerical import normrow
+
+
+def _face_corners(mesh):
+    xyz, indices, offsets = mesh.to_arrays()
+    sizes = diff(offsets)
+    face = repeat(arange(len(sizes)), sizes)
+    before = arange(-1, len(indices) - 1)
+    before[offsets[:-1]] = offsets[1:] - 1
+    return xyz, indices.astype(int64), offsets, sizes, face, before
+
+
+def _face_centroids(points, offsets, sizes):
+    return add.reduceat(points, offsets[:-1], axis=0) / sizes[:, None]
+
+
+def _unitized(vectors):
+    lengths = normrow(vectors)
+    lengths[lengths == 0] = 1.0
+    return vectors / lengths
+
+
+def _corner_normals(mesh):
+    xyz, indices, offsets, sizes, face, before = _face_corners(mesh)
+    points = xyz[indices]
+    if not len(sizes):
+        return xyz, indices, offsets, face, before, zeros((0, 3))
+    o = _face_centroids(points, offsets, sizes)[face]
+    normals = cross(points[before] - o, points - o)
+    return xyz, indices, offsets, face, before, normals
+
+
+def mesh_face_normals_numpy(mesh, unitized=True):
+    """Compute the normals of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    unitized : bool, optional
+        If True, the normals are unitized.
+        Otherwise, the length of the normals is equal to the area of the faces, for planar faces.
+
+    Returns
+    -------
+    ndarray
+        The normals as a ``(F, 3)`` array, in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_normal`
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> normals = mesh_face_normals_numpy(mesh)
+    >>> normals.shape
+    (6, 3)
+
+    """
+    _, _, offsets, _, _, normals = _corner_normals(mesh)
+    if not len(normals):
+        return zeros((0, 3))
+    normals = 0.5 * add.reduceat(normals, offsets[:-1], axis=0)
+    if unitized:
+        return _unitized(normals)
+    return normals
+
+
+def mesh_face_areas_numpy(mesh):
+    """Compute the areas of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The areas as a ``(F,)`` array, in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_area`
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> areas = mesh_face_areas_numpy(mesh)
+    >>> round(float(areas.sum()), 6)
+    100.0
+
+    """
+    _, _, offsets, face, _, normals = _corner_normals(mesh)
+    if not len(normals):
+        return zeros(0)
+    first = normals[offsets[:-1]][face]
+    signs = where(einsum("ij,ij->i", normals, first) > 0, 1.0, -1.0)
+    signs[offsets[:-1]] = 1.0
+    return abs(0.5 * add.reduceat(signs * normrow(normals)[:, 0], offsets[:-1]))
+
+
+def mesh_face_centroids_numpy(mesh):
+    """Compute the centroids of the vertices of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The centroids as a ``(F, 3)`` array, in the order of :meth:`~compas.datastructures.Mesh.faces`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.face_centroid`
+
+    """
+    xyz, indices, offsets, sizes, _, _ = _face_corners(mesh)
+    if not len(sizes):
+        return zeros((0, 3))
+    return _face_centroids(xyz[indices], offsets, sizes)
+
+
+def mesh_vertex_normals_numpy(mesh, weighting="area"):
+    """Compute the normals of all vertices of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    weighting : Literal['area', 'uniform', 'angle'], optional
+        The weighting of the normals of the faces around a vertex.
+        With ``'area'``, the face normals are weighted by the area of the faces.
+        With ``'uniform'``, all face normals have the same weight.
+        With ``'angle'``, the face normals are weighted by the angle of the face corner at the vertex.
+
+    Returns
+    -------
+    ndarray
+        The unitized normals as a ``(V, 3)`` array, in the order of :meth:`~compas.datastructures.Mesh.vertices`.
+        The normals of vertices without faces are zero vectors.
+
+    Raises
+    ------
+    ValueError
+        If the weighting scheme is not supported.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.vertex_normal`
+
+    Notes
+    -----
+    The area-weighted normals are the same as the normals computed with
+    :meth:`compas.datastructures.Mesh.vertex_normal`.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> normals = mesh_vertex_normals_numpy(mesh, weighting="angle")
+    >>> normals.shape
+    (8, 3)
+
+    """
+    if weighting not in ("area", "uniform", "angle"):
+        raise ValueError("Weighting scheme not supported: {}".format(weighting))
+    xyz, indices, offsets, face, before, normals = _corner_normals(mesh)
+    if not len(normals):
+        return zeros((len(xyz), 3))
+    normals = 0.5 * add.reduceat(normals, offsets[:-1], axis=0)
+    if weighting == "area":
+        weighted = normals[face]
+    else:
+        weighted = _unitized(normals)[face]
+        if weighting == "angle":
+            after = arange(1, len(indices) + 1)
+            after[offsets[1:] - 1] = offsets[:-1]
+            points = xyz[indices]
+            a = _unitized(points[before] - points)
+            b = _unitized(points[after] - points)
+            angles = arccos(clip(einsum("ij,ij->i", a, b), -1.0, 1.0))
+            weighted = weighted * angles[:, None]
+    n = len(xyz)
+    result = stack([bincount(indices, weights=weighted[:, axis], minlength=n) for axis in range(3)], axis=1)
+    return _unitized(result)
+
+
+def mesh_edge_lengths_numpy(mesh):
+    """Compute the lengths of all edges of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    ndarray
+        The lengths as a ``(E,)`` array, in the order of :meth:`~compas.datastructures.Mesh.edges`.
+
+    See Also
+    --------
+    :meth:`compas.datastructures.Mesh.edge_length`
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    >>> lengths = mesh_edge_lengths_numpy(mesh)
+    >>> lengths.shape
+    (220,)
+
+    """
+    xyz = mesh.to_arrays()[0]
+    vertex_index = mesh.vertex_index()
+    edges = asarray([(vertex_index[u], vertex_index[v]) for u, v in mesh.edges()], dtype=int64).reshape(-1, 2)
+    return normrow(xyz[edges[:, 1]] - xyz[edges[:, 0]])[:, 0]
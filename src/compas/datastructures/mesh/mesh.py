@@ -51,6 +51,8 @@ from compas.utilities import pairwise
 from compas.utilities import window
 
 from compas.datastructures import HalfEdge
+from compas.datastructures.datastructure import _coordinates
+from compas.datastructures.datastructure import _set_coordinates
 
 from .operations.collapse import mesh_collapse_edge
 from .operations.split import mesh_split_edge
@@ -88,6 +90,9 @@ class Mesh(HalfEdge):
         Default values for edge attributes.
     default_face_attributes: dict[str, Any], optional
         Default values for face attributes.
+    storage: Literal['dict', 'array'], optional
+        The storage backend of the vertices, halfedges and faces.
+        Use the array storage to reduce the memory footprint of large meshes.
 
     Examples
     --------
@@ -99,6 +104,14 @@ class Mesh(HalfEdge):
     >>> mesh.euler() == V - E + F
     True
 
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> compact = Mesh(storage="array")
+    >>> compact.join(mesh)
+    >>> compact.storage
+    'array'
+    >>> compact.number_of_faces()
+    6
+
     """
 
     bounding_box = mesh_bounding_box
@@ -125,9 +138,19 @@ class Mesh(HalfEdge):
     if not compas.IPY:
         from .bbox_numpy import mesh_oriented_bounding_box_numpy
         from .bbox_numpy import mesh_oriented_bounding_box_xy_numpy
+        from .geometry_numpy import mesh_edge_lengths_numpy
+        from .geometry_numpy import mesh_face_areas_numpy
+        from .geometry_numpy import mesh_face_centroids_numpy
+        from .geometry_numpy import mesh_face_normals_numpy
+        from .geometry_numpy import mesh_vertex_normals_numpy
 
         obb_numpy = mesh_oriented_bounding_box_numpy
         obb_xy_numpy = mesh_oriented_bounding_box_xy_numpy
+        edge_lengths_array = mesh_edge_lengths_numpy
+        face_areas_array = mesh_face_areas_numpy
+        face_centroids_array = mesh_face_centroids_numpy
+        face_normals_array = mesh_face_normals_numpy
+        vertex_normals_array = mesh_vertex_normals_numpy
 
     def __init__(
         self,
@@ -135,6 +158,7 @@ class Mesh(HalfEdge):
         default_vertex_attributes=None,
         default_edge_attributes=None,
         default_face_attributes=None,
+        storage=None,
     ):
         _default_vertex_attributes = {"x": 0.0, "y": 0.0, "z": 0.0}
         _default_edge_attributes = {}
@@ -150,12 +174,22 @@ class Mesh(HalfEdge):
             default_vertex_attributes=_default_vertex_attributes,
             default_edge_attributes=_default_edge_attributes,
             default_face_attributes=_default_face_attributes,
+            storage=storage,
         )
 
     def __str__(self):
         tpl = "<Mesh with {} vertices, {} faces, {} edges>"
         return tpl.format(self.number_of_vertices(), self.number_of_faces(), self.number_of_edges())
 
+    def __coordinates__(self):
+        # the coordinates of the vertices as a flat buffer of floats,
+        # for the batched transformations of :func:`compas.geometry.transform_objects`
+        return _coordinates(self.vertex, list(self.vertices()), self.default_vertex_attributes)
+
+    def __set_coordinates__(self, values):
+        _set_coordinates(self.vertex, list(self.vertices()), values)
+        self._sha256 = None
+
     # --------------------------------------------------------------------------
     # customisation
     # --------------------------------------------------------------------------
@@ -169,7 +203,7 @@ class Mesh(HalfEdge):
     # --------------------------------------------------------------------------
 
     @classmethod
-    def from_obj(cls, filepath, precision=None):
+    def from_obj(cls, filepath, precision=None, engine=None):
         """Construct a mesh object from the data described in an OBJ file.
 
         Parameters
@@ -178,12 +212,21 @@ class Mesh(HalfEdge):
             The path to the file.
         precision: str, optional
             The precision of the geometric map that is used to connect the lines.
+        engine : Literal['fast'], optional
+            Use ``'fast'`` to read the file with :func:`compas.files.obj_read_numpy`,
+            and to weld the vertices with :func:`compas.files.obj_weld_numpy`.
+            Default is to read the file with :class:`compas.files.OBJ`.
 
         Returns
         -------
         :class:`~compas.datastructures.Mesh`
             A mesh object.
 
+        Raises
+        ------
+        ValueError
+            If the engine is not supported.
+
         Notes
         -----
         There are a few sample files available for testing and debugging:
@@ -195,7 +238,14 @@ class Mesh(HalfEdge):
         * mesh.obj
         * quadmesh.obj
 
+        The fast engine requires NumPy, and is meant for large files.
+        It produces the same mesh as the default engine.
+
         """
+        if engine == "fast":
+            return cls._from_obj_numpy(filepath, precision)
+        if engine is not None:
+            raise ValueError("Engine not supported: {}".format(engine))
         obj = OBJ(filepath, precision)
         obj.read()
         vertices = obj.vertices
@@ -209,6 +259,22 @@ class Mesh(HalfEdge):
             lines = [(vertices[u], vertices[v], 0) for u, v in edges]
             return cls.from_lines(lines)
 
+    @classmethod
+    def _from_obj_numpy(cls, filepath, precision=None):
+        from compas.files.obj_numpy import obj_read_numpy
+        from compas.files.obj_numpy import obj_weld_numpy
+
+        vertices, (faces, offsets), (lines, starts), _, _ = obj_read_numpy(filepath)
+        vertices, index = obj_weld_numpy(vertices, precision)
+        if not len(vertices):
+            return cls()
+        if len(offsets) > 1:
+            return cls.from_arrays(vertices, index[faces], offsets)
+        edges = [index[lines[a:b]].tolist() for a, b in zip(starts[:-1], starts[1:]) if b - a == 2]
+        if edges:
+            vertices = vertices.tolist()
+            return cls.from_lines([(vertices[u], vertices[v], 0) for u, v in edges])
+
     def to_obj(self, filepath, precision=None, unweld=False, **kwargs):
         """Write the mesh to an OBJ file.
 
@@ -251,6 +317,8 @@ class Mesh(HalfEdge):
 
         """
         ply = PLY(filepath)
+        if ply.parser.arrays is not None:  # type: ignore
+            return cls.from_arrays(*ply.parser.arrays)  # type: ignore
         vertices = ply.parser.vertices  # type: ignore
         faces = ply.parser.faces  # type: ignore
         mesh = cls.from_vertices_and_faces(vertices, faces)
@@ -263,6 +331,13 @@ class Mesh(HalfEdge):
         ----------
         filepath : str
             The path to the file.
+        binary : bool, optional
+            If True, write a binary little-endian file, otherwise an ASCII file.
+        normals : bool | str, optional
+            If True, include the vertex normals.
+            If the name of a vertex attribute, include the normals stored in that attribute.
+        color : str, optional
+            The name of a vertex attribute with the colors of the vertices.
 
         Returns
         -------
@@ -290,8 +365,11 @@ class Mesh(HalfEdge):
 
         """
         stl = STL(filepath, precision)
-        vertices = stl.parser.vertices  # type: ignore
-        faces = stl.parser.faces  # type: ignore
+        if stl.parser.arrays is not None:  # type: ignore
+            vertices, faces = stl.parser.arrays  # type: ignore
+        else:
+            vertices = stl.parser.vertices  # type: ignore
+            faces = stl.parser.faces  # type: ignore
         mesh = cls.from_vertices_and_faces(vertices, faces)
         return mesh
 
@@ -491,7 +569,14 @@ class Mesh(HalfEdge):
         :class:`~compas.datastructures.Mesh`
             A mesh object.
 
+        Notes
+        -----
+        If the vertices and faces are NumPy arrays, the mesh is constructed in bulk with :meth:`from_arrays`.
+
         """
+        if hasattr(vertices, "ndim") and hasattr(faces, "ndim"):
+            return cls.from_arrays(vertices, faces)
+
         mesh = cls()
 
         if isinstance(vertices, Mapping):
@@ -555,6 +640,95 @@ class Mesh(HalfEdge):
 
         return vertices, faces
 
+    @classmethod
+    def from_arrays(cls, vertices, faces, offsets=None, storage=None):
+        """Construct a mesh object from vertex and face arrays, in bulk.
+
+        Parameters
+        ----------
+        vertices : array_like
+            The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+        faces : array_like
+            A ``(F, k)`` array of vertex indices,
+            a list of lists of vertex indices,
+            or a flat buffer with the vertex indices of all faces if `offsets` is provided.
+        offsets : array_like, optional
+            The positions of the first vertex of every face in the flat buffer of vertex indices,
+            followed by the length of the buffer (``F + 1`` values).
+        storage : Literal['dict', 'array'], optional
+            The storage backend of the mesh.
+            If provided, it is passed to the constructor of the mesh class.
+            Otherwise, the mesh is created with the default storage of the class.
+
+        Returns
+        -------
+        :class:`~compas.datastructures.Mesh`
+            A mesh object.
+
+        See Also
+        --------
+        :meth:`to_arrays`, :meth:`from_vertices_and_faces`
+
+        Notes
+        -----
+        The halfedges of all faces are computed at once with NumPy,
+        instead of adding the faces one by one.
+        The result is the same as with :meth:`from_vertices_and_faces`.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+        >>> faces = np.array([[0, 1, 2], [0, 2, 3]])
+        >>> mesh = Mesh.from_arrays(vertices, faces, storage="array")
+        >>> mesh.number_of_faces()
+        2
+
+        """
+        from compas.datastructures.mesh.arrays_numpy import mesh_load_arrays_numpy
+
+        # subclasses may not accept a storage argument
+        mesh = cls() if storage is None else cls(storage=storage)
+        mesh_load_arrays_numpy(mesh, vertices, faces, offsets)
+        return mesh
+
+    def to_arrays(self):
+        """Return the vertices and faces of the mesh as arrays.
+
+        Returns
+        -------
+        vertices : ndarray
+            The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+        indices : ndarray
+            The vertex indices of all faces, as a flat buffer.
+        offsets : ndarray
+            The positions of the first vertex of every face in the index buffer,
+            followed by the length of the buffer (``F + 1`` values).
+
+        See Also
+        --------
+        :meth:`from_arrays`, :meth:`to_vertices_and_faces`
+
+        Notes
+        -----
+        With the array storage, the vertex coordinates and the index buffer are views
+        on the storage of the mesh, as long as the vertex identifiers are consecutive
+        and the faces are stored back to back.
+        While such views exist, vertices and faces can't be added to the mesh.
+
+        Examples
+        --------
+        >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+        >>> vertices, indices, offsets = mesh.to_arrays()
+        >>> faces = indices.reshape(-1, 4)
+        >>> faces.shape
+        (100, 4)
+
+        """
+        from compas.datastructures.mesh.arrays_numpy import mesh_to_arrays_numpy
+
+        return mesh_to_arrays_numpy(self)
+
     @classmethod
     def from_polyhedron(cls, f):
         """Construct a mesh from a platonic solid.
@@ -1626,6 +1800,13 @@ class Mesh(HalfEdge):
             A list of vertex keys per boundary.
 
         """
+        if self._topology is not None:
+            if self._topology.boundaries is None:
+                self._topology.boundaries = self._vertices_on_boundaries()
+            return [vertices[:] for vertices in self._topology.boundaries]
+        return self._vertices_on_boundaries()
+
+    def _vertices_on_boundaries(self):
         # all boundary vertices
         vertices_set = set()
         for key, nbrs in iter(self.halfedge.items()):
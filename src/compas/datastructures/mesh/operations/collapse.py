@@ -116,6 +116,11 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
     if v in fixed or u in fixed:
         return False
 
+    mesh.invalidate_topology(
+        vertices=[u, v] + mesh.vertex_neighbors(v),
+        faces=mesh.vertex_faces(u) + mesh.vertex_faces(v),
+    )
+
     # move U
     x, y, z = mesh.edge_point(edge, t)
     mesh.vertex[u]["x"] = x
@@ -147,6 +152,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
             # u > v > d => u > d
             d = mesh.face_vertex_descendant(fkey, v)
             face.remove(v)
+            mesh.face[fkey] = face
             del mesh.halfedge[u][v]
             del mesh.halfedge[v][d]
             mesh.halfedge[u][d] = fkey
@@ -176,6 +182,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
             # a > v > u => a > u
             a = mesh.face_vertex_ancestor(fkey, v)
             face.remove(v)
+            mesh.face[fkey] = face
             del mesh.halfedge[a][v]
             del mesh.halfedge[v][u]
             mesh.halfedge[a][u] = fkey
@@ -190,6 +197,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
             face = mesh.face[fkey]
             a = mesh.face_vertex_ancestor(fkey, v)
             face[face.index(v)] = u
+            mesh.face[fkey] = face
 
             if v in mesh.halfedge[a]:
                 del mesh.halfedge[a][v]
@@ -265,6 +273,11 @@ def trimesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
     if v in fixed or u in fixed:
         return False
 
+    mesh.invalidate_topology(
+        vertices=[u, v] + mesh.vertex_neighbors(v),
+        faces=mesh.vertex_faces(u) + mesh.vertex_faces(v),
+    )
+
     # move U
     x, y, z = mesh.edge_point(edge, t)
 
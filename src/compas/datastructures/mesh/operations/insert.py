@@ -48,10 +48,12 @@ def mesh_add_vertex_to_face_edge(mesh, key, fkey, v):
     2
 
     """
+    mesh.invalidate_topology(vertices=[key], faces=[fkey])
     vertices = mesh.face_vertices(fkey)
     i = vertices.index(v)
     u = vertices[i - 1]
     vertices.insert(key, i - 1)
+    mesh.face[fkey] = vertices
     mesh.halfedge[u][key] = fkey
     mesh.halfedge[key][v] = fkey
     if u not in mesh.halfedge[key]:
@@ -59,6 +59,7 @@ def mesh_merge_faces(mesh, faces):
     mesh.delete_face(faces[0])
     mesh.delete_face(faces[1])
     key = mesh.add_face(vertices)
+    mesh.invalidate_topology(faces=[key])
     # remove internal edges
     remove = []
     for edge in mesh.face_halfedges(key):
@@ -72,12 +73,16 @@ def mesh_merge_faces(mesh, faces):
         if v in mesh.halfedge and u in mesh.halfedge[v]:
             del mesh.halfedge[v][u]
     # remove unused vertices
-    for vertex in mesh.face_vertices(key):
+    vertices = mesh.face_vertices(key)
+    for vertex in vertices:
         if len(mesh.vertex_neighbors(vertex)) < 2:
             mesh.delete_vertex(vertex)
-            mesh.face[key].remove(vertex)
+            vertices.remove(vertex)
+            mesh.face[key] = vertices
     # remove degenerate edges
+    vertices = mesh.face_vertices(key)
     for u, v in mesh.face_halfedges(key):
         if u == v:
-            mesh.face[key].remove(v)
+            vertices.remove(v)
+            mesh.face[key] = vertices
     return key
@@ -52,6 +52,8 @@ def mesh_split_edge(mesh, edge, t=0.5, allow_boundary=False):
         if fkey_uv is None or fkey_vu is None:
             return
 
+    mesh.invalidate_topology(vertices=[u, v], faces=[fkey for fkey in (fkey_uv, fkey_vu) if fkey is not None])
+
     # coordinates
     x, y, z = mesh.edge_point(edge, t)
 
@@ -65,8 +67,10 @@ def mesh_split_edge(mesh, edge, t=0.5, allow_boundary=False):
 
     # update the UV face if it is not the `None` face
     if fkey_uv is not None:
-        j = mesh.face[fkey_uv].index(v)
-        mesh.face[fkey_uv].insert(j, w)
+        vertices = mesh.face[fkey_uv]
+        j = vertices.index(v)
+        vertices.insert(j, w)
+        mesh.face[fkey_uv] = vertices
 
     # split half-edge VU
     mesh.halfedge[v][w] = fkey_vu
@@ -75,8 +79,10 @@ def mesh_split_edge(mesh, edge, t=0.5, allow_boundary=False):
 
     # update the VU face if it is not the `None` face
     if fkey_vu is not None:
-        i = mesh.face[fkey_vu].index(u)
-        mesh.face[fkey_vu].insert(i, w)
+        vertices = mesh.face[fkey_vu]
+        i = vertices.index(u)
+        vertices.insert(i, w)
+        mesh.face[fkey_vu] = vertices
 
     return w
 
@@ -122,6 +128,8 @@ def trimesh_split_edge(mesh, edge, t=0.5, allow_boundary=False):
         if fkey_uv is None or fkey_vu is None:
             return
 
+    mesh.invalidate_topology(vertices=[u, v], faces=[fkey for fkey in (fkey_uv, fkey_vu) if fkey is not None])
+
     # coordinates
     x, y, z = mesh.edge_point(edge, t)
 
@@ -218,6 +226,8 @@ def mesh_split_face(mesh, fkey, u, v):
         f = face[i:] + face[: j + 1]
         g = face[j : i + 1]
 
+    mesh.invalidate_topology(faces=[fkey])
+
     f = mesh.add_face(f)
     g = mesh.add_face(g)
 
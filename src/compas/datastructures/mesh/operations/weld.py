@@ -29,6 +29,8 @@ def mesh_unweld_vertices(mesh, fkey, where=None):
         The vertices of the unwelded face.
 
     """
+    mesh.invalidate_topology(faces=[fkey])
+
     face = []
     vertices = mesh.face_vertices(fkey)
 
@@ -2,6 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from compas.geometry import KDTree
 from compas.topology import breadth_first_traverse
 
 
@@ -12,40 +13,8 @@ def _mesh_face_adjacency(mesh, nmax=10, radius=10.0):
 
     k = min(mesh.number_of_faces(), nmax)
 
-    try:
-        from scipy.spatial import cKDTree
-
-        tree = cKDTree(points)
-        _, closest = tree.query(points, k=k, n_jobs=-1)
-
-    except Exception:
-        # try:
-        #     from Rhino.Geometry import RTree
-        #     from Rhino.Geometry import Sphere
-        #     from Rhino.Geometry import Point3d
-
-        # except Exception:
-        from compas.geometry import KDTree
-
-        tree = KDTree(points)
-        closest = [tree.nearest_neighbors(point, k) for point in points]
-        closest = [[index for xyz, index, d in nnbrs] for nnbrs in closest]
-
-        # else:
-        #     tree = RTree()
-        #     for i, point in enumerate(points):
-        #         tree.Insert(Point3d(* point), i)
-
-        #     def callback(sender, e):
-        #         data = e.Tag
-        #         data.append(e.Id)
-
-        #     closest = []
-        #     for i, point in enumerate(points):
-        #         sphere = Sphere(Point3d(* point), radius)
-        #         data = []
-        #         tree.Search(sphere, callback, data)
-        #         closest.append(data)
+    tree = KDTree(points)
+    closest, _ = tree.nearest_neighbors_bulk(points, k)
 
     adjacency = {}
 
@@ -182,7 +151,7 @@ def mesh_unify_cycles(mesh, root=None):
                     # if the traversal of a neighboring halfedge
                     # is in the same direction
                     # flip the neighbor
-                    mesh.face[nbr][:] = mesh.face[nbr][::-1]
+                    mesh.face[nbr] = mesh.face[nbr][::-1]
                     return
 
     if root is None:
@@ -194,7 +163,10 @@ def mesh_unify_cycles(mesh, root=None):
 
     assert len(list(visited)) == mesh.number_of_faces(), "Not all faces were visited"
 
-    mesh.halfedge = {key: {} for key in mesh.vertices()}
+    mesh.invalidate_topology()
+    mesh.halfedge.clear()
+    for key in mesh.vertices():
+        mesh.halfedge[key] = {}
     for fkey in mesh.faces():
         for u, v in mesh.face_halfedges(fkey):
             mesh.halfedge[u][v] = fkey
@@ -221,9 +193,12 @@ def mesh_flip_cycles(mesh):
     just reverses whatever direction it finds.
 
     """
-    mesh.halfedge = {key: {} for key in mesh.vertices()}
+    mesh.invalidate_topology()
+    mesh.halfedge.clear()
+    for key in mesh.vertices():
+        mesh.halfedge[key] = {}
     for fkey in mesh.faces():
-        mesh.face[fkey][:] = mesh.face[fkey][::-1]
+        mesh.face[fkey] = mesh.face[fkey][::-1]
         for u, v in mesh.face_halfedges(fkey):
             mesh.halfedge[u][v] = fkey
             if u not in mesh.halfedge[v]:
@@ -2,7 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import transform_points
+from compas.geometry import transform_coordinates
 
 
 def mesh_transform(mesh, transformation):
@@ -20,6 +20,14 @@ def mesh_transform(mesh, transformation):
     None
         The mesh is modified in-place.
 
+    Notes
+    -----
+    The coordinates of the vertices are transformed together, in a flat buffer of floats,
+    with NumPy if it is available and the mesh is large enough.
+    With the array storage, the buffer of the vertex coordinates is transformed in place.
+    If :attr:`~compas.datastructures.Mesh.lazy_transform` is True,
+    the transformation is only composed with the pending transformation of the mesh.
+
     Examples
     --------
     >>> from compas.datastructures import Mesh
@@ -30,11 +38,12 @@ def mesh_transform(mesh, transformation):
     >>> mesh_transform(tmesh, T)
 
     """
-    vertices = list(mesh.vertices())
-    xyz = [mesh.vertex_coordinates(vertex) for vertex in vertices]
-    xyz[:] = transform_points(xyz, transformation)
-    for index, vertex in enumerate(vertices):
-        mesh.vertex_attributes(vertex, "xyz", xyz[index])
+    if mesh.lazy_transform:
+        mesh.defer_transformation(transformation)
+        return
+    xyz = mesh.__coordinates__()
+    transform_coordinates(xyz, transformation)
+    mesh.__set_coordinates__(xyz)
 
 
 def mesh_transformed(mesh, transformation):
@@ -2,7 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import transform_points_numpy
+from .transformations import mesh_transform
 
 
 def mesh_transform_numpy(mesh, transformation):
@@ -20,6 +20,11 @@ def mesh_transform_numpy(mesh, transformation):
     None
         The mesh is modified in-place.
 
+    Notes
+    -----
+    This is the same as :func:`mesh_transform`,
+    which transforms the vertex coordinates with NumPy if it is available.
+
     Examples
     --------
     >>> from compas.datastructures import Mesh
@@ -30,11 +35,7 @@ def mesh_transform_numpy(mesh, transformation):
     >>> mesh_transform_numpy(tmesh, T)
 
     """
-    vertices = list(mesh.vertices())
-    xyz = [mesh.vertex_coordinates(vertex) for vertex in vertices]
-    xyz[:] = transform_points_numpy(xyz, transformation)
-    for index, vertex in enumerate(vertices):
-        mesh.vertex_attributes(vertex, "xyz", xyz[index])
+    mesh_transform(mesh, transformation)
 
 
 def mesh_transformed_numpy(mesh, transformation):
@@ -24,6 +24,8 @@ from compas.geometry import add_vectors
 from compas.geometry import scale_vector
 
 from compas.datastructures import Graph
+from compas.datastructures.datastructure import _coordinates
+from compas.datastructures.datastructure import _set_coordinates
 
 from .operations.split import network_split_edge
 
@@ -104,6 +106,15 @@ class Network(Graph):
         tpl = "<Network with {} nodes, {} edges>"
         return tpl.format(self.number_of_nodes(), self.number_of_edges())
 
+    def __coordinates__(self):
+        # the coordinates of the nodes as a flat buffer of floats,
+        # for the batched transformations of :func:`compas.geometry.transform_objects`
+        return _coordinates(self.node, list(self.nodes()), self.default_node_attributes)
+
+    def __set_coordinates__(self, values):
+        _set_coordinates(self.node, list(self.nodes()), values)
+        self._sha256 = None
+
     # --------------------------------------------------------------------------
     # customisation
     # --------------------------------------------------------------------------
@@ -447,6 +458,8 @@ class Network(Graph):
         :meth:`node_point`, :meth:`node_laplacian`, :meth:`node_neighborhood_centroid`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         return [self.node[key][axis] for axis in axes]
 
     def node_point(self, node):
@@ -3,7 +3,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 
-from compas.geometry import transform_points
+from compas.geometry import transform_coordinates
 
 
 def network_transform(network, transformation):
@@ -23,14 +23,16 @@ def network_transform(network, transformation):
     Notes
     -----
     The network is modified in-place.
+    The coordinates of the nodes are transformed together, in a flat buffer of floats.
+    If ``network.lazy_transform`` is True, the transformation is only composed with the pending transformation.
 
     """
-    vertices = [network.node_coordinates(key) for key in network.nodes()]
-    xyz = transform_points(vertices, transformation)
-    for index, (key, attr) in enumerate(network.nodes(True)):
-        attr["x"] = xyz[index][0]
-        attr["y"] = xyz[index][1]
-        attr["z"] = xyz[index][2]
+    if network.lazy_transform:
+        network.defer_transformation(transformation)
+        return
+    xyz = network.__coordinates__()
+    transform_coordinates(xyz, transformation)
+    network.__set_coordinates__(xyz)
 
 
 def network_transformed(network, transformation):
@@ -2,7 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import transform_points
+from compas.geometry import transform_coordinates
 
 
 __all__ = [
@@ -28,6 +28,8 @@ def volmesh_transform(volmesh, transformation):
     Notes
     -----
     The volmesh is modified in-place.
+    The coordinates of the vertices are transformed together, in a flat buffer of floats.
+    If ``volmesh.lazy_transform`` is True, the transformation is only composed with the pending transformation.
 
     Examples
     --------
@@ -38,11 +40,12 @@ def volmesh_transform(volmesh, transformation):
     >>> volmesh_transform(volmesh, T)
 
     """
-    vertices = list(volmesh.vertices())
-    xyz = [volmesh.vertex_coordinates(vertex) for vertex in vertices]
-    xyz[:] = transform_points(xyz, transformation)
-    for index, vertex in enumerate(vertices):
-        volmesh.vertex_attributes(vertex, "xyz", xyz[index])
+    if volmesh.lazy_transform:
+        volmesh.defer_transformation(transformation)
+        return
+    xyz = volmesh.__coordinates__()
+    transform_coordinates(xyz, transformation)
+    volmesh.__set_coordinates__(xyz)
 
 
 def volmesh_transformed(volmesh, transformation):
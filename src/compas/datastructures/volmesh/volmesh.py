@@ -6,6 +6,8 @@ from itertools import product
 
 from compas.datastructures import HalfFace
 from compas.datastructures import Mesh
+from compas.datastructures.datastructure import _coordinates
+from compas.datastructures.datastructure import _set_coordinates
 
 from compas.files import OBJ
 
@@ -94,6 +96,15 @@ class VolMesh(HalfFace):
             self.number_of_edges(),
         )
 
+    def __coordinates__(self):
+        # the coordinates of the vertices as a flat buffer of floats,
+        # for the batched transformations of :func:`compas.geometry.transform_objects`
+        return _coordinates(self._vertex, list(self.vertices()), self.default_vertex_attributes)
+
+    def __set_coordinates__(self, values):
+        _set_coordinates(self._vertex, list(self.vertices()), values)
+        self._sha256 = None
+
     # --------------------------------------------------------------------------
     # customisation
     # --------------------------------------------------------------------------
@@ -441,6 +452,8 @@ class VolMesh(HalfFace):
         :meth:`vertex_point`, :meth:`vertex_laplacian`, :meth:`vertex_neighborhood_centroid`
 
         """
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         return [self._vertex[vertex][axis] for axis in axes]
 
     def vertex_point(self, vertex):
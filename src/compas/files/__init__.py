@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import compas
+
 from .dxf import DXF, DXFParser, DXFReader
 from .gltf.gltf import GLTF
 from .gltf.gltf_content import GLTFContent
@@ -15,6 +17,31 @@ from .stl import STL, STLParser, STLReader, STLWriter
 from .urdf import URDF, URDFElement, URDFGenericElement, URDFParser
 from .xml import XML, XMLElement, XMLReader, XMLWriter, prettify_string
 
+if not compas.IPY:
+    from .las_numpy import (
+        LAS_POINT_FORMATS,
+        las_filter_numpy,
+        las_iter_numpy,
+        las_point_dtype,
+        las_points_numpy,
+        las_read_numpy,
+    )
+    from .obj_numpy import obj_read_numpy, obj_weld_numpy
+    from .ply_numpy import (
+        PLY_TYPES,
+        PLYStreamWriter,
+        ply_read_binary_numpy,
+        ply_vertex_dtype,
+        ply_write_binary_numpy,
+    )
+    from .stl_numpy import (
+        STL_BINARY_DTYPE,
+        stl_iter_binary_numpy,
+        stl_read_binary_numpy,
+        stl_weld_numpy,
+        stl_write_binary_numpy,
+    )
+
 __all__ = [
     "DXF",
     "DXFReader",
@@ -53,3 +80,25 @@ __all__ = [
     "XMLWriter",
     "prettify_string",
 ]
+
+if not compas.IPY:
+    __all__ += [
+        "LAS_POINT_FORMATS",
+        "las_filter_numpy",
+        "las_iter_numpy",
+        "las_point_dtype",
+        "las_points_numpy",
+        "las_read_numpy",
+        "obj_read_numpy",
+        "obj_weld_numpy",
+        "PLY_TYPES",
+        "PLYStreamWriter",
+        "ply_read_binary_numpy",
+        "ply_vertex_dtype",
+        "ply_write_binary_numpy",
+        "STL_BINARY_DTYPE",
+        "stl_iter_binary_numpy",
+        "stl_read_binary_numpy",
+        "stl_weld_numpy",
+        "stl_write_binary_numpy",
+    ]
@@ -2,6 +2,11 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import struct
+
+import compas
+from compas import _iotools
+
 
 class LAS(object):
     """Class for working with files in LASer format.
@@ -60,15 +65,61 @@ class LASReader(object):
     filepath : path string | file-like object | URL string
         A path, a file-like object or a URL pointing to a file.
 
+    Attributes
+    ----------
+    header : dict
+        The public header block of the file,
+        with the version, the point data record format, the number of points,
+        and the scale, offset and bounds of the coordinates.
+    vlrs : list[dict]
+        The variable length records of the file.
+    records : ndarray | list[tuple[int, int, int]]
+        The point records of the file.
+
+    Notes
+    -----
+    Files of version 1.2 to 1.4 with uncompressed point data record formats 0 to 10 are supported.
+    Outside of IronPython, the point records are a structured NumPy array (see :func:`compas.files.las_read_numpy`),
+    which is memory-mapped for local files.
+    In IronPython, the records are tuples of the integer coordinates of the points.
+
     """
 
     def __init__(self, filepath):
         self.filepath = filepath
+        self.header = None
+        self.vlrs = []
+        self.records = []
         self.read()
 
     def read(self):
-        """Read the contents of the file."""
-        pass
+        """Read the contents of the file.
+
+        Returns
+        -------
+        None
+
+        """
+        with _iotools.open_file(self.filepath, "rb") as file:
+            self.header = _read_header(file)
+            self.vlrs = _read_vlrs(file, self.header)
+            if compas.IPY:
+                self.records = self._read_records(file)
+                return
+        from .las_numpy import las_read_numpy
+
+        _, self.records = las_read_numpy(self.filepath)
+
+    def _read_records(self, file):
+        records = []
+        length = self.header["point_record_length"]
+        file.seek(self.header["point_offset"])
+        for i in range(self.header["number_of_points"]):
+            data = file.read(length)
+            if len(data) < length:
+                raise ValueError("The file contains fewer point records than specified in its header.")
+            records.append(struct.unpack_from("<3i", data))
+        return records
 
 
 class LASParser(object):
@@ -84,13 +135,106 @@ class LASParser(object):
     precision : str
         COMPAS precision specification for parsing geometric data.
 
+    Attributes
+    ----------
+    xyz : ndarray | None
+        The coordinates of the points as an ``(n, 3)`` array, if the records were read with NumPy.
+    points : list[list[float]]
+        The coordinates of the points.
+
+    Notes
+    -----
+    The coordinates are computed from the point records on first access.
+    For large files, use :attr:`xyz` rather than :attr:`points`,
+    or use :func:`compas.files.las_iter_numpy` to process the points in chunks.
+
     """
 
     def __init__(self, reader, precision):
         self.reader = reader
         self.precision = precision
+        self._xyz = None
+        self._points = None
         self.parse()
 
+    @property
+    def xyz(self):
+        if self._xyz is None and not compas.IPY:
+            from .las_numpy import las_points_numpy
+
+            self._xyz = las_points_numpy(self.reader.records, self.reader.header)
+        return self._xyz
+
+    @property
+    def points(self):
+        if self._points is None:
+            if self.xyz is not None:
+                self._points = self.xyz.tolist()
+            else:
+                scale = self.reader.header["scale"]
+                offset = self.reader.header["offset"]
+                self._points = [[c * s + o for c, s, o in zip(record, scale, offset)] for record in self.reader.records]
+        return self._points
+
     def parse(self):
         """Parse the the data found by the reader."""
-        pass
+        self._xyz = None
+        self._points = None
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _read_header(file):
+    # the public header block of LAS 1.2, 1.3 and 1.4
+    file.seek(0)
+    data = file.read(227)
+    if len(data) < 227 or data[:4] != b"LASF":
+        raise ValueError("The file is not a LAS file.")
+    major, minor = struct.unpack_from("<BB", data, 24)
+    system, software = struct.unpack_from("<32s32s", data, 26)
+    size, offset, vlrs, point_format, length, count = struct.unpack_from("<HIIBHI", data, 94)
+    scale = struct.unpack_from("<3d", data, 131)
+    shift = struct.unpack_from("<3d", data, 155)
+    xmax, xmin, ymax, ymin, zmax, zmin = struct.unpack_from("<6d", data, 179)
+    if (major, minor) >= (1, 4) and size >= 375:
+        data = file.read(375 - 227)
+        count = struct.unpack_from("<Q", data, 20)[0] or count
+    if point_format & 0xC0:
+        raise ValueError("Compressed point data records are not supported.")
+    return {
+        "version": (major, minor),
+        "system_identifier": system.rstrip(b"\0").decode("ascii", "replace"),
+        "generating_software": software.rstrip(b"\0").decode("ascii", "replace"),
+        "header_size": size,
+        "point_offset": offset,
+        "number_of_vlrs": vlrs,
+        "point_format": point_format,
+        "point_record_length": length,
+        "number_of_points": count,
+        "scale": scale,
+        "offset": shift,
+        "min": (xmin, ymin, zmin),
+        "max": (xmax, ymax, zmax),
+    }
+
+
+def _read_vlrs(file, header):
+    vlrs = []
+    file.seek(header["header_size"])
+    for i in range(header["number_of_vlrs"]):
+        data = file.read(54)
+        if len(data) < 54:
+            break
+        user, record, length, description = struct.unpack_from("<16sHH32s", data, 2)
+        vlrs.append(
+            {
+                "user_id": user.rstrip(b"\0").decode("ascii", "replace"),
+                "record_id": record,
+                "description": description.rstrip(b"\0").decode("ascii", "replace"),
+                "data": file.read(length),
+            }
+        )
+    return vlrs
@@ -0,0 +1,320 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+
+from numpy import asarray
+from numpy import bitwise_and
+from numpy import ceil
+from numpy import dtype
+from numpy import empty
+from numpy import float64
+from numpy import floor
+from numpy import frombuffer
+from numpy import isin
+from numpy import memmap
+from numpy import ones
+from numpy import zeros
+
+from compas import _iotools
+
+from .las import _read_header
+from .stl_numpy import _is_local_file
+
+
+WAVE_PACKET = [
+    ("wave_packet_descriptor_index", "u1"),
+    ("byte_offset_to_waveform_data", "<u8"),
+    ("waveform_packet_size", "<u4"),
+    ("return_point_waveform_location", "<f4"),
+    ("x_t", "<f4"),
+    ("y_t", "<f4"),
+    ("z_t", "<f4"),
+]
+
+LEGACY_POINT = [
+    ("X", "<i4"),
+    ("Y", "<i4"),
+    ("Z", "<i4"),
+    ("intensity", "<u2"),
+    ("return_flags", "u1"),
+    ("classification", "u1"),
+    ("scan_angle_rank", "i1"),
+    ("user_data", "u1"),
+    ("point_source_id", "<u2"),
+]
+
+POINT = [
+    ("X", "<i4"),
+    ("Y", "<i4"),
+    ("Z", "<i4"),
+    ("intensity", "<u2"),
+    ("return_flags", "u1"),
+    ("classification_flags", "u1"),
+    ("classification", "u1"),
+    ("user_data", "u1"),
+    ("scan_angle", "<i2"),
+    ("point_source_id", "<u2"),
+    ("gps_time", "<f8"),
+]
+
+GPS_TIME = [("gps_time", "<f8")]
+RGB = [("red", "<u2"), ("green", "<u2"), ("blue", "<u2")]
+NIR = [("nir", "<u2")]
+
+LAS_POINT_FORMATS = {
+    0: LEGACY_POINT,
+    1: LEGACY_POINT + GPS_TIME,
+    2: LEGACY_POINT + RGB,
+    3: LEGACY_POINT + GPS_TIME + RGB,
+    4: LEGACY_POINT + GPS_TIME + WAVE_PACKET,
+    5: LEGACY_POINT + GPS_TIME + RGB + WAVE_PACKET,
+    6: POINT,
+    7: POINT + RGB,
+    8: POINT + RGB + NIR,
+    9: POINT + WAVE_PACKET,
+    10: POINT + RGB + NIR + WAVE_PACKET,
+}
+"""The fields of the uncompressed point data record formats 0 to 10."""
+
+
+def las_point_dtype(point_format, record_length=None):
+    """Construct the structured data type of the point records of a LAS file.
+
+    Parameters
+    ----------
+    point_format : int
+        The point data record format.
+    record_length : int, optional
+        The length of a point record in bytes, including extra bytes after the standard fields.
+        Default is the length of the standard fields.
+
+    Returns
+    -------
+    numpy.dtype
+
+    Raises
+    ------
+    ValueError
+        If the point data record format is not supported.
+
+    Examples
+    --------
+    >>> las_point_dtype(3).itemsize
+    34
+    >>> las_point_dtype(6, 40).itemsize
+    40
+
+    """
+    if point_format not in LAS_POINT_FORMATS:
+        raise ValueError("Point data record format not supported: {}".format(point_format))
+    fields = dtype(LAS_POINT_FORMATS[point_format])
+    if not record_length or record_length == fields.itemsize:
+        return fields
+    if record_length < fields.itemsize:
+        raise ValueError("The point records are shorter than their format: {}".format(record_length))
+    names = list(fields.names)
+    return dtype(
+        {
+            "names": names,
+            "formats": [fields.fields[name][0] for name in names],
+            "offsets": [fields.fields[name][1] for name in names],
+            "itemsize": record_length,
+        }
+    )
+
+
+def las_read_numpy(filepath):
+    """Read the header and the point records of a LAS file.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+
+    Returns
+    -------
+    dict
+        The public header block of the file.
+    ndarray
+        The point records as a structured array, with the fields of the point data record format.
+        For paths to local files, the array is memory-mapped,
+        such that only the records that are accessed are read from disk.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a LAS file, if the point data record format is not supported,
+        or if the file contains fewer point records than specified in its header.
+
+    """
+    with _iotools.open_file(filepath, "rb") as file:
+        header = _read_header(file)
+        records = las_point_dtype(header["point_format"], header["point_record_length"])
+        size = header["number_of_points"] * records.itemsize
+        if not _is_local_file(filepath):
+            file.seek(header["point_offset"])
+            data = file.read(size)
+            if len(data) < size:
+                raise ValueError("The file contains fewer point records than specified in its header.")
+            return header, frombuffer(data, dtype=records)
+    if os.path.getsize(filepath) < header["point_offset"] + size:
+        raise ValueError("The file contains fewer point records than specified in its header.")
+    if not size:
+        return header, zeros(0, dtype=records)
+    return header, memmap(
+        filepath,
+        dtype=records,
+        mode="r",
+        offset=header["point_offset"],
+        shape=(header["number_of_points"],),
+    )
+
+
+def las_iter_numpy(filepath, chunksize=1048576, box=None, classification=None, where=None):
+    """Iterate over the points of a LAS file in chunks, optionally filtered by location and attributes.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+    chunksize : int, optional
+        The maximum number of point records per chunk.
+    box : tuple[[float, float, float], [float, float, float]], optional
+        The minimum and maximum corners of an axis-aligned box.
+        Only the points inside the box are included.
+    classification : int | sequence[int], optional
+        Only the points of the given classes are included.
+    where : callable, optional
+        A function that selects point records by their attributes.
+        It receives the records of a chunk and returns a boolean array.
+
+    Yields
+    ------
+    tuple[ndarray, ndarray]
+        The XYZ coordinates of the included points of a chunk, as an ``(n, 3)`` array,
+        and their point records.
+
+    Notes
+    -----
+    The file is read sequentially, one chunk at a time, and only one chunk is kept in memory.
+    Points are compared to the box in the integer coordinates of the file,
+    such that only the coordinates of included points are scaled.
+    No chunks are read if the box does not overlap the bounds of the file.
+
+    """
+    with _iotools.open_file(filepath, "rb") as file:
+        header = _read_header(file)
+        if box is not None and not _overlaps(header, box):
+            return
+        records = las_point_dtype(header["point_format"], header["point_record_length"])
+        file.seek(header["point_offset"])
+        count = header["number_of_points"]
+        while count > 0:
+            n = min(count, chunksize)
+            data = file.read(n * records.itemsize)
+            n = len(data) // records.itemsize
+            if not n:
+                break
+            chunk = frombuffer(data[: n * records.itemsize], dtype=records)
+            mask = las_filter_numpy(chunk, header, box=box, classification=classification, where=where)
+            if mask is not None:
+                chunk = chunk[mask]
+            yield las_points_numpy(chunk, header), chunk
+            count -= n
+
+
+def las_points_numpy(records, header):
+    """Compute the coordinates of point records.
+
+    Parameters
+    ----------
+    records : ndarray
+        Point records with integer coordinate fields ``X``, ``Y`` and ``Z``.
+    header : dict
+        The public header block of the file, with the ``scale`` and ``offset`` of the coordinates.
+
+    Returns
+    -------
+    ndarray
+        The XYZ coordinates of the points, as an ``(n, 3)`` array.
+
+    """
+    xyz = empty((len(records), 3), dtype=float64)
+    for axis, name in enumerate("XYZ"):
+        xyz[:, axis] = records[name]
+    xyz *= asarray(header["scale"], dtype=float64)
+    xyz += asarray(header["offset"], dtype=float64)
+    return xyz
+
+
+def las_filter_numpy(records, header, box=None, classification=None, where=None):
+    """Select point records by location and attributes.
+
+    Parameters
+    ----------
+    records : ndarray
+        The point records.
+    header : dict
+        The public header block of the file.
+    box : tuple[[float, float, float], [float, float, float]], optional
+        The minimum and maximum corners of an axis-aligned box.
+    classification : int | sequence[int], optional
+        One or more classes.
+    where : callable, optional
+        A function that receives the records and returns a boolean array.
+
+    Returns
+    -------
+    ndarray[bool] | None
+        For every record, True if it is inside the box, has one of the classes, and is selected by `where`.
+        None if no filter is given.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> records = np.zeros(3, dtype=las_point_dtype(6))
+    >>> records["X"] = [0, 500, 1000]
+    >>> records["intensity"] = [10, 20, 30]
+    >>> header = {"point_format": 6, "scale": (0.01, 0.01, 0.01), "offset": (0, 0, 0)}
+    >>> las_filter_numpy(records, header, box=([0, 0, 0], [5, 1, 1]), where=lambda r: r["intensity"] > 10).tolist()
+    [False, True, False]
+
+    Notes
+    -----
+    The corners of the box are converted to the integer coordinates of the file,
+    which are compared to the records directly.
+    For the point data record formats 0 to 5, the class is stored in the lower five bits of the classification field.
+
+    """
+    if box is None and classification is None and where is None:
+        return None
+    mask = ones(len(records), dtype=bool)
+    if box is not None:
+        for axis, name in enumerate("XYZ"):
+            scale = header["scale"][axis]
+            offset = header["offset"][axis]
+            values = records[name]
+            mask &= values >= ceil((box[0][axis] - offset) / scale)
+            mask &= values <= floor((box[1][axis] - offset) / scale)
+    if classification is not None:
+        classes = records["classification"]
+        if header["point_format"] < 6:
+            classes = bitwise_and(classes, 31)
+        if isinstance(classification, int):
+            mask &= classes == classification
+        else:
+            mask &= isin(classes, list(classification))
+    if where is not None:
+        mask &= asarray(where(records), dtype=bool)
+    return mask
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _overlaps(header, box):
+    return all(box[0][i] <= header["max"][i] and box[1][i] >= header["min"][i] for i in range(3))
@@ -0,0 +1,352 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import re
+import warnings
+
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import float64
+from numpy import frombuffer
+from numpy import fromstring
+from numpy import int64
+from numpy import maximum
+from numpy import minimum
+from numpy import repeat
+from numpy import rint
+from numpy import trunc
+from numpy import uint8
+from numpy import uint64
+from numpy import where
+from numpy import zeros
+
+import compas
+from compas import _iotools
+
+from .stl_numpy import _unique_rows
+
+
+SPACE = ord(" ")
+TAB = ord("\t")
+NEWLINE = ord("\n")
+RETURN = ord("\r")
+SLASH = ord("/")
+
+
+def obj_read_numpy(filepath, chunksize=67108864):
+    """Read the polygonal geometry of an OBJ file into arrays.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+    chunksize : int, optional
+        The number of bytes that is read and parsed at once.
+
+    Returns
+    -------
+    ndarray
+        The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+    tuple[ndarray, ndarray]
+        The vertex indices of all faces as a flat array,
+        and the positions of the first vertex of every face in that array, followed by its length.
+    tuple[ndarray, ndarray]
+        The vertex indices of all lines as a flat array,
+        and the positions of the first vertex of every line in that array, followed by its length.
+    dict[str, ndarray]
+        The indices of the faces of every named object.
+        Faces before the first object statement belong to the object ``None``.
+    dict[str, ndarray]
+        The indices of the faces of every named group.
+        Faces before the first group statement belong to the group ``None``.
+
+    Notes
+    -----
+    The file is processed in chunks of lines, without a Python function call per line.
+    The lines of every chunk are classified by their first characters,
+    and the numbers of all vertex, face and line statements of the chunk are converted at once.
+
+    Only vertex (``v``), face (``f``), line (``l``), object (``o``) and group (``g``) statements are read.
+    Texture and normal references of face vertices (``f v/vt/vn``) are ignored,
+    and negative (relative) vertex references are resolved.
+    The weights of vertices are ignored.
+
+    Examples
+    --------
+    >>> import compas
+    >>> vertices, (faces, offsets), lines, objects, groups = obj_read_numpy(compas.get("faces.obj"))
+    >>> vertices.shape
+    (36, 3)
+    >>> len(offsets) - 1
+    25
+
+    """
+    reader = _Reader()
+    with _iotools.open_file(filepath, "rb") as file:
+        rest = b""
+        while True:
+            data = file.read(chunksize)
+            if not isinstance(data, bytes):
+                data = data.encode("utf-8")
+            if not data:
+                break
+            data = rest + data
+            end = _last_line_end(data)
+            rest = data[end:]
+            reader.parse(data[:end])
+        if rest:
+            reader.parse(rest + b"\n")
+    return reader.result()
+
+
+def obj_weld_numpy(vertices, precision=None):
+    """Identify vertices with the same coordinates up to a given precision.
+
+    Parameters
+    ----------
+    vertices : array_like[float]
+        The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+    precision : str, optional
+        A COMPAS precision specification: a number of decimals (e.g. ``'3f'``), or ``'d'`` for integers.
+        Default is :attr:`compas.PRECISION`.
+
+    Returns
+    -------
+    ndarray
+        The XYZ coordinates of the unique vertices, as a ``(U, 3)`` array.
+    ndarray
+        The index of every vertex in the unique vertices.
+
+    Raises
+    ------
+    ValueError
+        If the precision specification is not supported.
+
+    Notes
+    -----
+    The coordinates are quantized to integers, by rounding them to the number of decimals of the precision,
+    or by truncating them for ``'d'``, consistent with :func:`compas.utilities.geometric_key`.
+    The unique vertices are ordered by first appearance,
+    and have the coordinates of the last vertex with the same key, as in :class:`compas.files.OBJParser`.
+
+    Examples
+    --------
+    >>> vertices, index = obj_weld_numpy([[0, 0, 0], [1, 0, 0], [0.0001, 0, 0]], "3f")
+    >>> index.tolist()
+    [0, 1, 0]
+
+    """
+    vertices = asarray(vertices, dtype=float64).reshape((-1, 3))
+    precision = precision or compas.PRECISION
+    if precision == "d":
+        keys = trunc(vertices)
+    elif precision[-1] == "f" and precision[:-1].isdigit():
+        keys = rint(vertices * 10 ** int(precision[:-1]))
+    else:
+        raise ValueError("Precision specification not supported: {}".format(precision))
+    # adding zero turns negative zeros into positive zeros
+    # the quantized values are compared through their bits
+    keys = (keys + 0.0).view(uint64)
+    first, inverse = _unique_rows(keys)
+    last = zeros(len(first), dtype=int64)
+    maximum.at(last, inverse, arange(len(vertices)))
+    return vertices[last], inverse
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _last_line_end(data):
+    # the position after the last newline that is not a line continuation
+    end = data.rfind(b"\n") + 1
+    while end and (data[: end - 1].endswith(b"\\") or data[: end - 1].endswith(b"\\\r")):
+        end = data.rfind(b"\n", 0, end - 1) + 1
+    return end
+
+
+class _Reader(object):
+    # accumulates the parsed statements of the chunks of a file
+
+    def __init__(self):
+        self.vertices = []
+        self.faces = []
+        self.face_sizes = []
+        self.lines = []
+        self.line_sizes = []
+        self.objects = []
+        self.groups = []
+        self.v = 0
+        self.f = 0
+        self.linear = False
+
+    def parse(self, data):
+        if not data:
+            return
+        # join continued lines and remove leading whitespace
+        data = data.replace(b"\\\r\n", b"   ").replace(b"\\\n", b"  ")
+        if b"\n " in data or b"\n\t" in data or data[:1] in (b" ", b"\t"):
+            data = re.sub(b"(^|\n)[ \t]+", b"\\1", data)
+        if not data.endswith(b"\n"):
+            data += b"\n"
+        buf = frombuffer(data + b" \n", dtype=uint8).copy()
+        newline = buf == NEWLINE
+        ends = newline.nonzero()[0]
+        starts = concatenate(([0], ends[:-1] + 1))
+        line = cumsum(newline) - newline
+
+        is_v = _statements(buf, starts, b"v")
+        is_f = _statements(buf, starts, b"f")
+        is_l = _statements(buf, starts, b"l")
+        is_o = _statements(buf, starts, b"o")
+        is_g = _statements(buf, starts, b"g")
+        is_deg = _statements(buf, starts, b"deg")
+        is_curv = _statements(buf, starts, b"curv")
+
+        # remove the statement heads and the texture and normal references of face vertices
+        for mask, size in ((is_v | is_f | is_l, 1), (is_deg, 3), (is_curv, 4)):
+            buf[starts[mask][:, None] + arange(size)] = SPACE
+        if b"/" in data:
+            whitespace = (buf == SPACE) | (buf == TAB) | newline | (buf == RETURN)
+            index = arange(len(buf))
+            after_space = maximum.accumulate(where(whitespace, index, -1))
+            after_slash = maximum.accumulate(where(buf == SLASH, index, -1))
+            buf[after_slash > after_space] = SPACE
+        whitespace = (buf == SPACE) | (buf == TAB) | newline | (buf == RETURN)
+        tokens = ~whitespace & concatenate(([True], whitespace[:-1]))
+
+        # curves of degree 1 are lines, after removing their parameter range
+        if is_curv.any():
+            linear = self._linear(buf, whitespace, tokens, line, is_deg)
+            is_curv &= linear
+            token = cumsum(tokens) - 1
+            # the head of the statement has been removed, such that the first token has rank 1
+            rank = token - token[starts][line]
+            buf[~whitespace & is_curv[line] & (rank <= 2)] = SPACE
+            whitespace = (buf == SPACE) | (buf == TAB) | newline | (buf == RETURN)
+            tokens = ~whitespace & concatenate(([True], whitespace[:-1]))
+        elif is_deg.any():
+            self._linear(buf, whitespace, tokens, line, is_deg)
+        is_l |= is_curv
+        counts = bincount(line[tokens], minlength=len(starts))
+
+        # vertices
+        if is_v.any():
+            sizes = counts[is_v]
+            values = _numbers(buf, is_v[line], float64, sizes.sum())
+            valid = (sizes == 3) | (sizes == 4)
+            first = (cumsum(sizes) - sizes)[valid]
+            xyz = values[first[:, None] + arange(3)]
+            self.vertices.append(xyz)
+            # the number of valid vertices before every line, to resolve relative references
+            valid_v = zeros(len(starts), dtype=bool)
+            valid_v[is_v.nonzero()[0][valid]] = True
+            before = self.v + cumsum(valid_v) - valid_v
+            self.v += len(xyz)
+        else:
+            before = zeros(len(starts), dtype=int64) + self.v
+
+        # faces
+        valid_f = zeros(len(starts), dtype=bool)
+        if is_f.any():
+            faces, sizes, valid = self._indices(buf, line, counts, is_f, before, 3)
+            self.faces.append(faces)
+            self.face_sizes.append(sizes)
+            valid_f[is_f.nonzero()[0][valid]] = True
+
+        # lines
+        if is_l.any():
+            lines, sizes, _ = self._indices(buf, line, counts, is_l, before, 2)
+            self.lines.append(lines)
+            self.line_sizes.append(sizes)
+
+        # objects and groups
+        if is_o.any() or is_g.any():
+            faces_before = self.f + cumsum(valid_f) - valid_f
+            for i in (is_o | is_g).nonzero()[0]:
+                name = " ".join(data[starts[i] + 1 : ends[i]].decode("utf-8").split())
+                if is_o[i]:
+                    self.objects.append((faces_before[i], name))
+                else:
+                    self.groups.append((faces_before[i], name))
+        self.f += int(valid_f.sum())
+
+    def _linear(self, buf, whitespace, tokens, line, is_deg):
+        # the lines that follow a degree statement with degree 1
+        # the degree of the last statement is carried over to the next chunk
+        number = len(line) and line[-1] + 1
+        first = zeros(number, dtype=int64)
+        first[line[tokens][::-1]] = tokens.nonzero()[0][::-1]
+        position = first[is_deg]
+        one = (buf[position] == ord("1")) & whitespace[position + 1]
+        last = maximum.accumulate(where(is_deg, arange(number), -1))
+        degree = zeros(number, dtype=bool)
+        degree[is_deg] = one
+        linear = where(last >= 0, degree[last], self.linear)
+        if is_deg.any():
+            self.linear = bool(one[-1])
+        return linear
+
+    def _indices(self, buf, line, counts, mask, before, minsize):
+        sizes = counts[mask]
+        values = _numbers(buf, mask[line], int64, sizes.sum())
+        base = repeat(before[mask], sizes)
+        values = where(values < 0, base + values, values - 1)
+        valid = sizes >= minsize
+        keep = repeat(valid, sizes)
+        return values[keep], sizes[valid], valid
+
+    def result(self):
+        vertices = concatenate(self.vertices) if self.vertices else zeros((0, 3))
+        faces = _flat(self.faces, self.face_sizes)
+        lines = _flat(self.lines, self.line_sizes)
+        return vertices, faces, lines, _ranges(self.objects, self.f), _ranges(self.groups, self.f)
+
+
+def _statements(buf, starts, name):
+    # the lines that start with a statement, followed by whitespace
+    mask = buf[minimum(starts + len(name), len(buf) - 1)] == SPACE
+    mask |= buf[minimum(starts + len(name), len(buf) - 1)] == TAB
+    for i, char in enumerate(bytearray(name)):
+        mask &= buf[minimum(starts + i, len(buf) - 1)] == char
+    return mask
+
+
+def _numbers(buf, mask, dtype, count):
+    # fromstring with a separator stops at the first invalid number, with a warning
+    text = buf[mask].tobytes()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            values = fromstring(text, dtype=dtype, sep=" ")
+        except (DeprecationWarning, ValueError):
+            values = None
+    if values is None or len(values) != count:
+        raise ValueError("The file contains invalid numbers.")
+    return values
+
+
+def _flat(values, sizes):
+    if not values:
+        return zeros(0, dtype=int64), zeros(1, dtype=int64)
+    sizes = concatenate(sizes)
+    return concatenate(values), concatenate(([0], cumsum(sizes)))
+
+
+def _ranges(markers, total):
+    # the faces of named ranges, with the faces before the first marker in the range None
+    ranges = {}
+    markers = [(0, None)] + list(markers)
+    for (start, name), (end, _) in zip(markers, markers[1:] + [(total, None)]):
+        if name is None and start == end:
+            continue
+        faces = arange(start, end, dtype=int64)
+        if name in ranges:
+            faces = concatenate((ranges[name], faces))
+        ranges[name] = faces
+    return ranges
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import re
 import struct
 
 import compas
@@ -143,6 +144,13 @@ class PLYReader(object):
     faces : list
         The faces found in the file.
         Each face is a dictionary of property names and property values.
+    arrays : dict[str, tuple[ndarray, dict[str, tuple[ndarray, ndarray]]]] | None
+        The elements of a binary file read with NumPy (see :func:`compas.files.ply_read_binary_numpy`).
+
+    Notes
+    -----
+    Outside of IronPython, binary files are read with NumPy, in one shot.
+    The lists of vertices, edges and faces are then only created on first access.
 
     """
 
@@ -206,6 +214,17 @@ class PLYReader(object):
         "double": "d",
     }
 
+    binary_type_names = {
+        "int8": "char",
+        "uint8": "uchar",
+        "int16": "short",
+        "uint16": "ushort",
+        "int32": "int",
+        "uint32": "uint",
+        "float32": "float",
+        "float64": "double",
+    }
+
     binary_byte_order = {"binary_big_endian": ">", "binary_little_endian": "<"}
 
     def __init__(self, filepath):
@@ -223,11 +242,42 @@ class PLYReader(object):
         self.edge_properties = []
         self.face_properties = []
         self.sections = []
+        self.arrays = None
         self.vertices = []
         self.edges = []
         self.faces = []
         self.read()
 
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            self._vertices = _items_from_arrays(*self.arrays["vertex"])
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = vertices
+
+    @property
+    def edges(self):
+        if self._edges is None:
+            self._edges = _items_from_arrays(*self.arrays["edge"]) if "edge" in self.arrays else []
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges):
+        self._edges = edges
+
+    @property
+    def faces(self):
+        if self._faces is None:
+            self._faces = _items_from_arrays(*self.arrays["face"]) if "face" in self.arrays else []
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        self._faces = faces
+
     def is_valid(self):
         """Verify that the file is valid by reading the header.
 
@@ -287,23 +337,27 @@ class PLYReader(object):
 
     def _read_header(self):
         # the header is always in ascii format
-        # read it as text
-        # otherwise file.tell() can't be used reliably
-        # to figure out where the header ends
-        with _iotools.open_file(self.filepath) as file:
+        # read it in binary mode and decode the lines
+        # such that the position in bytes where the header ends is known
+        # also if binary data follows the header
+        with _iotools.open_file(self.filepath, "rb") as file:
             file.seek(0)
+            lines = _header_lines(file)
 
-            line = file.readline().rstrip()
+            line, position = next(lines, ("", 0))
+            line = line.rstrip()
 
             if line.lower() != "ply":
                 raise Exception("not a valid ply file")
 
-            self.start_header = file.tell()
+            self.start_header = position
 
             element_type = None
 
             while True:
-                line = file.readline()
+                line, position = next(lines, (None, position))
+                if line is None:
+                    break
                 line = line.rstrip()
 
                 self.header.append(line)
@@ -359,7 +413,7 @@ class PLYReader(object):
 
                 elif line == "end_header":
                     element_type = None
-                    self.end_header = file.tell()
+                    self.end_header = position
                     break
 
                 else:
@@ -388,6 +442,9 @@ class PLYReader(object):
     def _read_data_binary(self):
         if not self.end_header:
             raise Exception("header has not been read, or the file is not valid")
+        if not compas.IPY:
+            self._read_data_binary_numpy()
+            return
         with _iotools.open_file(self.filepath, "rb") as self.file:
             self.file.seek(self.end_header)
             for section in self.sections:
@@ -401,6 +458,24 @@ class PLYReader(object):
                     print("user-defined elements are not supported: {0}".format(section))
                     pass
 
+    def _read_data_binary_numpy(self):
+        from .ply_numpy import ply_read_binary_numpy
+
+        elements = []
+        for section in self.sections:
+            if section == "vertex":
+                elements.append(("vertex", self.number_of_vertices, self.vertex_properties))
+            elif section == "edge":
+                elements.append(("edge", self.number_of_edges, self.edge_properties))
+            elif section == "face":
+                elements.append(("face", self.number_of_faces, self.face_properties))
+        with _iotools.open_file(self.filepath, "rb") as self.file:
+            self.file.seek(self.end_header)
+            self.arrays = ply_read_binary_numpy(self.file, elements, self.binary_byte_order[self.format])
+        self.vertices = None
+        self.edges = None
+        self.faces = None
+
     # ==========================================================================
     # read the individual section
     # ==========================================================================
@@ -457,38 +532,13 @@ class PLYReader(object):
     # see: http://stackoverflow.com/questions/4566498/python-file-iterator-over-a-binary-file-with-newer-idiom
     # see: http://stackoverflow.com/questions/27532738/python-iterate-through-binary-file-without-lines
 
-    def _numpy_vertex_ptypes(self):
-        ext = self.binary_byte_order[self.format]
-        dt = []
-        for prop in self.vertex_properties:
-            pname, ptype = prop
-            dt.append((pname, ext + self.binary_property_types[ptype]))
-        return dt
-
-    def _numpy_face_ptypes(self):
-        ext = self.binary_byte_order[self.format]
-        dt = []
-        for prop in self.face_properties:
-            if len(prop) == 2:
-                pname, ptype = prop
-                dt.append((pname, ext + self.binary_property_types[ptype]))
-            elif len(prop) == 3:
-                pname, ptype, plen = prop
-                dt.append(("size", ext + self.binary_property_types[plen]))
-                # this seems a nit of a hack
-                dt.append(("v1", ext + self.binary_property_types[ptype]))
-                dt.append(("v2", ext + self.binary_property_types[ptype]))
-                dt.append(("v3", ext + self.binary_property_types[ptype]))
-            else:
-                pass
-        return dt
-
     def _read_vertices_binary_wo_numpy(self):
         ext = self.binary_byte_order[self.format]
         fmt = ext
         chunk = 0
         for prop in self.vertex_properties:
             pname, ptype = prop
+            ptype = self.binary_type_names.get(ptype, ptype)
             chunk += self.number_of_bytes_per_type[ptype]
             fmt += self.struct_format_per_type[ptype]
         for i in range(self.number_of_vertices):
@@ -500,81 +550,27 @@ class PLYReader(object):
                 vertex[pname] = data[i]
             self.vertices.append(vertex)
 
-    def _read_vertices_binary(self):
-        # use pandas to read the data frames
-        import numpy as np
-
-        for line in np.fromfile(
-            self.file,
-            dtype=np.dtype(self._numpy_vertex_ptypes()),
-            count=self.number_of_vertices,
-        ):
-            vertex = {}
-            for i, prop in enumerate(self.vertex_properties):
-                pname, ptype = prop
-                vertex[pname] = line[i]
-            self.vertices.append(vertex)
-
     def _read_edges_binary_wo_numpy(self):
         pass
 
-    def _read_edges_binary(self):
-        pass
-
     def _read_faces_binary_wo_numpy(self):
         ext = self.binary_byte_order[self.format]
-        fmt = ext
-        chunk = 0
-        for prop in self.face_properties:
-            if len(prop) == 2:
-                pname, ptype = prop
-                chunk += self.number_of_bytes_per_type[ptype]
-                fmt += self.struct_format_per_type[ptype]
-            elif len(prop) == 3:
-                pname, ptype, plen = prop
-                chunk += self.number_of_bytes_per_type[plen]
-                chunk += self.number_of_bytes_per_type[ptype] * 3
-                fmt += self.struct_format_per_type[plen]
-                fmt += self.struct_format_per_type[ptype] * 3
-            else:
-                pass
         for i in range(self.number_of_faces):
-            data = self.file.read(chunk)
-            data = struct.unpack(fmt, data)
             face = {}
-            for i, prop in enumerate(self.face_properties):
+            for prop in self.face_properties:
                 if len(prop) == 2:
                     pname, ptype = prop
-                    face[pname] = data[i]
+                    face[pname] = self._read_binary_value(ext, ptype)
                 elif len(prop) == 3:
                     pname, ptype, plen = prop
-                    face[pname] = list(data[2:])
+                    n = self._read_binary_value(ext, plen)
+                    face[pname] = [self._read_binary_value(ext, ptype) for _ in range(n)]
             self.faces.append(face)
 
-    def _read_faces_binary(self):
-        # use pandas to read the data frames
-        # how to deal with faces of variable length?
-        import numpy as np
-
-        for line in np.fromfile(
-            self.file,
-            dtype=np.dtype(self._numpy_face_ptypes()),
-            count=self.number_of_faces,
-        ):
-            face = {}
-            for i, prop in enumerate(self.face_properties):
-                if len(prop) == 2:
-                    pname, ptype = prop
-                    face[pname] = line[i]
-                elif len(prop) == 3:
-                    pname, ptype, plen = prop
-                    # type(line) => numpy.void
-                    # convert the line to a list
-                    line = list(line)
-                    face[pname] = line[2:]
-                else:
-                    pass
-            self.faces.append(face)
+    def _read_binary_value(self, ext, ptype):
+        ptype = self.binary_type_names.get(ptype, ptype)
+        data = self.file.read(self.number_of_bytes_per_type[ptype])
+        return struct.unpack(ext + self.struct_format_per_type[ptype], data)[0]
 
 
 class PLYParser(object):
@@ -598,17 +594,48 @@ class PLYParser(object):
         Pairs of vertex indices defining the start and end points of edges.
     faces : list[list[int]]
         Lists of vertex indices defining faces.
+    arrays : tuple[ndarray, ndarray, ndarray] | None
+        The vertex coordinates as a ``(V, 3)`` array,
+        the vertex indices of all faces as a flat array,
+        and the positions of the first vertex of every face in that array, followed by its length,
+        if the file is a binary file read with NumPy.
+
+    Notes
+    -----
+    For binary files read with NumPy, the lists of vertices and faces are only created on first access.
 
     """
 
     def __init__(self, reader, precision=None):
         self.precision = precision
         self.reader = reader
+        self.arrays = None
         self.vertices = None
         self.edges = None
         self.faces = None
         self.parse()
 
+    @property
+    def vertices(self):
+        if self._vertices is None and self.arrays is not None:
+            self._vertices = [tuple(xyz) for xyz in self.arrays[0].tolist()]
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = vertices
+
+    @property
+    def faces(self):
+        if self._faces is None and self.arrays is not None:
+            indices, offsets = self.arrays[1].tolist(), self.arrays[2].tolist()
+            self._faces = [indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        self._faces = faces
+
     def parse(self):
         """Parse the contents found by a PLY file reader.
 
@@ -617,8 +644,28 @@ class PLYParser(object):
         None
 
         """
+        name = "vertex_indices"
+        for prop in self.reader.face_properties:
+            if len(prop) == 3:
+                name = prop[0]
+                break
+        if self.reader.arrays is not None:
+            from numpy import column_stack
+            from numpy import zeros
+
+            records, _ = self.reader.arrays["vertex"]
+            vertices = column_stack([records["x"], records["y"], records["z"]]).astype(float)
+            if "face" in self.reader.arrays:
+                _, lists = self.reader.arrays["face"]
+                indices, offsets = lists[name]
+            else:
+                indices, offsets = zeros(0, dtype=int), zeros(1, dtype=int)
+            self.arrays = vertices, indices, offsets
+            self.vertices = None
+            self.faces = None
+            return
         self.vertices = [(vertex["x"], vertex["y"], vertex["z"]) for vertex in self.reader.vertices]
-        self.faces = [face["vertex_indices"] for face in self.reader.faces]
+        self.faces = [face[name] for face in self.reader.faces]
 
 
 class PLYWriter(object):
@@ -638,22 +685,49 @@ class PLYWriter(object):
         The date to include in the header.
     precision : str, optional
         COMPAS precision specification for parsing geometric data.
+    binary : bool, optional
+        If True, write a binary little-endian file, otherwise an ASCII file.
+    normals : bool | str, optional
+        If True, include the normals of the vertices, computed from the faces.
+        If the name of a vertex attribute, include the normals stored in that attribute.
+    color : str, optional
+        The name of a vertex attribute with the colors of the vertices.
+        If provided, the colors are included as RGB values between 0 and 255.
+
+    Notes
+    -----
+    Outside of IronPython, binary files are written with NumPy,
+    converting all vertices and all faces to bytes at once.
+    To write meshes that are too large to be constructed at once, use :class:`compas.files.PLYStreamWriter`.
 
     """
 
-    def __init__(self, filepath, mesh, author=None, email=None, date=None, precision=None):
+    def __init__(
+        self,
+        filepath,
+        mesh,
+        author=None,
+        email=None,
+        date=None,
+        precision=None,
+        binary=False,
+        normals=False,
+        color=None,
+    ):
         self.filepath = filepath
         self.mesh = mesh
         self.author = author
         self.email = email
         self.date = date
         self.precision = precision or compas.PRECISION
+        self.binary = binary
+        self.normals = normals
+        self.color = color
         self.vertex_tpl = (
-            "{0:." + self.precision + "}" + " {1:." + self.precision + "}" + " {2:." + self.precision + "}\n"
+            "{0:." + self.precision + "}" + " {1:." + self.precision + "}" + " {2:." + self.precision + "}"
         )
         self.v = mesh.number_of_vertices()
         self.f = mesh.number_of_faces()
-        self.e = mesh.number_of_edges()
         self.file = None
 
     def write(self):
@@ -664,32 +738,62 @@ class PLYWriter(object):
         None
 
         """
+        if self.binary:
+            with _iotools.open_file(self.filepath, "wb") as self.file:
+                self.file.write(self._header().encode("ascii"))
+                if not compas.IPY:
+                    self._write_binary_numpy()
+                else:
+                    self._write_vertices_binary()
+                    self._write_faces_binary()
+            return
         with _iotools.open_file(self.filepath, "w") as self.file:
-            self._write_header()
+            self.file.write(self._header())
             self._write_vertices()
             self._write_faces()
 
-    def _write_header(self):
-        self.file.write("PLY\n")
-        self.file.write("format ascii 1.0\n")
+    def _header(self):
+        comments = []
         if self.author:
-            self.file.write("comment author: {}\n".format(self.author))
+            comments.append("author: {}".format(self.author))
         if self.email:
-            self.file.write("comment email: {}\n".format(self.email))
+            comments.append("email: {}".format(self.email))
         if self.date:
-            self.file.write("comment date: {}\n".format(self.date))
-        self.file.write("element vertex {}\n".format(self.v))
-        self.file.write("property float x\n")
-        self.file.write("property float y\n")
-        self.file.write("property float z\n")
-        self.file.write("element face {}\n".format(self.f))
-        self.file.write("property list uchar int vertex_indices\n")
-        self.file.write("end_header\n")
+            comments.append("date: {}".format(self.date))
+        return _ply_header(
+            self.v,
+            self.f,
+            normals=bool(self.normals),
+            colors=bool(self.color),
+            comments=comments,
+            binary=self.binary,
+        )
+
+    def _vertex_normals(self):
+        if isinstance(self.normals, str):
+            return self.mesh.vertices_attribute(self.normals)
+        return [self.mesh.vertex_normal(vertex) for vertex in self.mesh.vertices()]
+
+    def _vertex_colors(self):
+        from compas.colors import Color
+
+        colors = []
+        for color in self.mesh.vertices_attribute(self.color):
+            color = Color.coerce(color) if color is not None else None
+            colors.append(color.rgb255 if color else (0, 0, 0))
+        return colors
 
     def _write_vertices(self):
-        for key in self.mesh.vertices():
+        normals = self._vertex_normals() if self.normals else None
+        colors = self._vertex_colors() if self.color else None
+        for index, key in enumerate(self.mesh.vertices()):
             x, y, z = self.mesh.vertex_coordinates(key)
-            self.file.write(self.vertex_tpl.format(x, y, z))
+            line = self.vertex_tpl.format(x, y, z)
+            if normals:
+                line += " " + self.vertex_tpl.format(*normals[index])
+            if colors:
+                line += " {0} {1} {2}".format(*colors[index])
+            self.file.write(line + "\n")
 
     def _write_faces(self):
         vertex_index = self.mesh.vertex_index()
@@ -697,3 +801,93 @@ class PLYWriter(object):
             vertices = self.mesh.face_vertices(face)
             v = len(vertices)
             self.file.write("{0} {1}\n".format(v, " ".join([str(vertex_index[vertex]) for vertex in vertices])))
+
+    def _write_binary_numpy(self):
+        from .ply_numpy import _mesh_vertex_colors
+        from .ply_numpy import _mesh_vertex_normals
+        from .ply_numpy import ply_write_binary_numpy
+
+        vertices, indices, offsets = self.mesh.to_arrays()
+        normals = None
+        colors = None
+        if self.normals:
+            normals = _mesh_vertex_normals(self.mesh, self.normals if isinstance(self.normals, str) else None)
+        if self.color:
+            colors = _mesh_vertex_colors(self.mesh, self.color)
+        ply_write_binary_numpy(self.file, vertices, indices, offsets, normals=normals, colors=colors)
+
+    def _write_vertices_binary(self):
+        normals = self._vertex_normals() if self.normals else None
+        colors = self._vertex_colors() if self.color else None
+        for index, key in enumerate(self.mesh.vertices()):
+            data = struct.pack("<3f", *self.mesh.vertex_coordinates(key))
+            if normals:
+                data += struct.pack("<3f", *normals[index])
+            if colors:
+                data += struct.pack("<3B", *colors[index])
+            self.file.write(data)
+
+    def _write_faces_binary(self):
+        vertex_index = self.mesh.vertex_index()
+        for face in self.mesh.faces():
+            vertices = [vertex_index[vertex] for vertex in self.mesh.face_vertices(face)]
+            self.file.write(struct.pack("<B{}i".format(len(vertices)), len(vertices), *vertices))
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _ply_header(number_of_vertices, number_of_faces, normals=False, colors=False, comments=None, binary=True):
+    # the header of a file with vertices and faces
+    lines = ["ply", "format {} 1.0".format("binary_little_endian" if binary else "ascii")]
+    lines += ["comment {}".format(comment) for comment in comments or []]
+    lines.append("element vertex {}".format(number_of_vertices))
+    lines += ["property float {}".format(name) for name in ("x", "y", "z")]
+    if normals:
+        lines += ["property float {}".format(name) for name in ("nx", "ny", "nz")]
+    if colors:
+        lines += ["property uchar {}".format(name) for name in ("red", "green", "blue")]
+    lines.append("element face {}".format(number_of_faces))
+    lines.append("property list uchar int vertex_indices")
+    lines.append("end_header")
+    return "\n".join(lines) + "\n"
+
+
+def _header_lines(file, size=1024):
+    # the lines of the header as text, with the position in bytes after every line
+    # lines can end with a line feed, a carriage return, or both
+    data = b""
+    position = 0
+    while True:
+        chunk = file.read(size)
+        data += chunk
+        while True:
+            match = re.search(b"\r\n|\r|\n", data)
+            if not match or (match.end() == len(data) and data.endswith(b"\r") and chunk):
+                break
+            position += match.end()
+            line = data[: match.start()].decode("ascii", "replace")
+            data = data[match.end() :]
+            yield line, position
+            if line.strip() == "end_header":
+                return
+        if not chunk:
+            if data:
+                yield data.decode("ascii", "replace"), position + len(data)
+            return
+
+
+def _items_from_arrays(records, lists):
+    # the items of an element as dicts of property names and values
+    names = records.dtype.names or ()
+    items = [dict(zip(names, values)) for values in records.tolist()]
+    if not items and lists:
+        items = [{} for _ in range(len(next(iter(lists.values()))[1]) - 1)]
+    for name, (values, offsets) in lists.items():
+        values = values.tolist()
+        offsets = offsets.tolist()
+        for item, start, end in zip(items, offsets[:-1], offsets[1:]):
+            item[name] = values[start:end]
+    return items
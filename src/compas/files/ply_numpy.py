@@ -0,0 +1,494 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import shutil
+import struct
+import tempfile
+
+from numpy import arange
+from numpy import asarray
+from numpy import concatenate
+from numpy import cumsum
+from numpy import diff
+from numpy import dtype
+from numpy import empty
+from numpy import float32
+from numpy import frombuffer
+from numpy import int64
+from numpy import ones
+from numpy import repeat
+from numpy import uint8
+from numpy import zeros
+
+from .ply import _ply_header
+
+
+PLY_TYPES = {
+    "int8": "i1",
+    "char": "i1",
+    "uint8": "u1",
+    "uchar": "u1",
+    "int16": "i2",
+    "short": "i2",
+    "uint16": "u2",
+    "ushort": "u2",
+    "int32": "i4",
+    "int": "i4",
+    "uint32": "u4",
+    "uint": "u4",
+    "float32": "f4",
+    "float": "f4",
+    "float64": "f8",
+    "double": "f8",
+}
+"""The NumPy type codes of the property types of PLY files."""
+
+
+def ply_read_binary_numpy(file, elements, byte_order="<"):
+    """Read the elements of a binary PLY file.
+
+    Parameters
+    ----------
+    file : file-like object
+        A file opened in binary mode, positioned after the header.
+    elements : list[tuple[str, int, list[tuple]]]
+        The name, the number of items and the properties of every element, in the order of the file.
+        A property is a tuple of its name and type,
+        or, for lists, of its name, the type of the values and the type of the length.
+    byte_order : Literal['<', '>'], optional
+        The byte order of the file.
+
+    Returns
+    -------
+    dict[str, tuple[ndarray, dict[str, tuple[ndarray, ndarray]]]]
+        For every element, a structured array of the scalar properties,
+        and the values of every list property as a flat array,
+        with the positions of the first value of every item, followed by the number of values.
+
+    Raises
+    ------
+    ValueError
+        If the file contains fewer items than specified in its header.
+
+    Notes
+    -----
+    Elements without list properties are decoded at once.
+    Elements with list properties are decoded at once if all lists of a property have the same length,
+    for example if all faces are triangles.
+    Otherwise, the start of every item is found in a single pass over the lengths of the lists,
+    after which the values are again gathered at once.
+
+    Examples
+    --------
+    >>> import io
+    >>> import struct
+    >>> data = struct.pack("<B3iB3iB3i", 3, 0, 1, 2, 3, 0, 2, 3, 3, 2, 3, 4)
+    >>> elements = [("face", 3, [("vertex_indices", "int", "uchar")])]
+    >>> records, lists = ply_read_binary_numpy(io.BytesIO(data), elements)["face"]
+    >>> indices, offsets = lists["vertex_indices"]
+    >>> offsets.tolist()
+    [0, 3, 6, 9]
+
+    """
+    buf = frombuffer(file.read(), dtype=uint8)
+    result = {}
+    position = 0
+    for name, count, properties in elements:
+        if any(len(prop) == 3 for prop in properties):
+            records, lists, position = _read_lists(buf, position, count, properties, byte_order)
+        else:
+            records = _scalar_dtype(properties, byte_order)
+            size = count * records.itemsize
+            if len(buf) < position + size:
+                raise ValueError("The file contains fewer items than specified in its header: {}".format(name))
+            records = frombuffer(buf, dtype=records, count=count, offset=position)
+            lists = {}
+            position += size
+        result[name] = records, lists
+    return result
+
+
+def ply_vertex_dtype(normals=False, colors=False):
+    """Construct the structured data type of the vertices written to binary PLY files.
+
+    Parameters
+    ----------
+    normals : bool, optional
+        If True, include the properties ``nx``, ``ny`` and ``nz``.
+    colors : bool, optional
+        If True, include the properties ``red``, ``green`` and ``blue``.
+
+    Returns
+    -------
+    numpy.dtype
+
+    """
+    fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+    if normals:
+        fields += [("nx", "<f4"), ("ny", "<f4"), ("nz", "<f4")]
+    if colors:
+        fields += [("red", "u1"), ("green", "u1"), ("blue", "u1")]
+    return dtype(fields)
+
+
+def ply_write_binary_numpy(file, vertices, indices, offsets=None, normals=None, colors=None):
+    """Write the vertices and faces of a binary little-endian PLY file.
+
+    Parameters
+    ----------
+    file : file-like object
+        A file opened in binary mode, positioned after the header.
+    vertices : array_like[float]
+        The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+    indices : array_like[int]
+        The vertex indices of the faces as an ``(F, k)`` array,
+        or as a flat array if `offsets` is provided.
+    offsets : array_like[int], optional
+        The positions of the first vertex of every face in `indices`, followed by the length of `indices`.
+    normals : array_like[float], optional
+        The normals of the vertices, as a ``(V, 3)`` array.
+    colors : array_like[int], optional
+        The RGB colors of the vertices, as a ``(V, 3)`` array of integers between 0 and 255.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The properties of the vertices are those of :func:`ply_vertex_dtype`,
+    and the faces have the property ``list uchar int vertex_indices``.
+    Every element is converted to bytes and written at once.
+
+    """
+    file.write(_vertex_records(vertices, normals, colors).tobytes())
+    file.write(_face_bytes(indices, offsets))
+
+
+class PLYStreamWriter(object):
+    """Write meshes to a binary little-endian PLY file, in chunks of vertices and faces.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object
+        A path, or a file opened in binary mode that supports seeking.
+    normals : bool, optional
+        If True, the vertices have normals.
+    colors : bool, optional
+        If True, the vertices have RGB colors.
+    comments : list[str], optional
+        Comments to include in the header.
+
+    Attributes
+    ----------
+    number_of_vertices : int
+        The number of vertices written so far.
+    number_of_faces : int
+        The number of faces written so far.
+
+    Notes
+    -----
+    The vertices are written to the file immediately, and the faces to a temporary file.
+    When the writer is closed, the faces are appended to the file,
+    and the numbers of vertices and faces are filled in in the header.
+    The faces of every chunk refer to the vertices of the same chunk.
+
+    Examples
+    --------
+    >>> import io
+    >>> from compas.datastructures import Mesh
+    >>> file = io.BytesIO()
+    >>> with PLYStreamWriter(file) as writer:
+    ...     for i in range(3):
+    ...         mesh = Mesh.from_polyhedron(6)
+    ...         writer.append_mesh(mesh)
+    >>> writer.number_of_faces
+    18
+
+    """
+
+    def __init__(self, filepath, normals=False, colors=False, comments=None):
+        self.normals = normals
+        self.colors = colors
+        self.comments = comments or []
+        self.number_of_vertices = 0
+        self.number_of_faces = 0
+        self._close_file = not hasattr(filepath, "write")
+        self.file = open(filepath, "wb") if self._close_file else filepath
+        self._start = self.file.tell()
+        self._faces = tempfile.TemporaryFile()
+        self.file.write(self._header())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, vertices, indices, offsets=None, normals=None, colors=None):
+        """Append a chunk of vertices and faces.
+
+        Parameters
+        ----------
+        vertices : array_like[float]
+            The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+        indices : array_like[int]
+            The vertex indices of the faces as an ``(F, k)`` array,
+            or as a flat array if `offsets` is provided.
+            The indices refer to the vertices of the chunk.
+        offsets : array_like[int], optional
+            The positions of the first vertex of every face in `indices`, followed by the length of `indices`.
+        normals : array_like[float], optional
+            The normals of the vertices, if the writer has normals.
+        colors : array_like[int], optional
+            The RGB colors of the vertices between 0 and 255, if the writer has colors.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.normals and normals is None:
+            raise ValueError("The writer requires the normals of the vertices.")
+        if self.colors and colors is None:
+            raise ValueError("The writer requires the colors of the vertices.")
+        records = _vertex_records(
+            vertices, normals if self.normals else None, colors if self.colors else None, self.normals, self.colors
+        )
+        indices, offsets = _flat_faces(indices, offsets)
+        self.file.write(records.tobytes())
+        self._faces.write(_face_bytes(indices + self.number_of_vertices, offsets))
+        self.number_of_vertices += len(records)
+        self.number_of_faces += len(offsets) - 1
+
+    def append_mesh(self, mesh, normals=None, color=None):
+        """Append the vertices and faces of a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`~compas.datastructures.Mesh`
+            The mesh.
+        normals : str, optional
+            The name of a vertex attribute with the normals of the vertices.
+            Default is to compute the normals from the faces, if the writer has normals.
+        color : str, optional
+            The name of a vertex attribute with the colors of the vertices, if the writer has colors.
+
+        Returns
+        -------
+        None
+
+        """
+        vertices, indices, offsets = mesh.to_arrays()
+        self.append(
+            vertices,
+            indices,
+            offsets,
+            normals=_mesh_vertex_normals(mesh, normals) if self.normals else None,
+            colors=_mesh_vertex_colors(mesh, color) if self.colors else None,
+        )
+
+    def close(self):
+        """Append the faces to the file and complete the header.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._faces is None:
+            return
+        self._faces.seek(0)
+        shutil.copyfileobj(self._faces, self.file)
+        self._faces.close()
+        self._faces = None
+        end = self.file.tell()
+        self.file.seek(self._start)
+        self.file.write(self._header())
+        self.file.seek(end)
+        if self._close_file:
+            self.file.close()
+
+    def _header(self):
+        # the numbers of vertices and faces have a fixed width
+        # such that the header can be rewritten in place
+        return _ply_header(
+            "{:012d}".format(self.number_of_vertices),
+            "{:012d}".format(self.number_of_faces),
+            normals=self.normals,
+            colors=self.colors,
+            comments=self.comments,
+        ).encode("ascii")
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _mesh_vertex_normals(mesh, name=None):
+    # the normals of the vertices of a mesh, from a vertex attribute or computed from the faces
+    if name:
+        return asarray(mesh.vertices_attribute(name), dtype=float)
+    return mesh.vertex_normals_array()
+
+
+def _mesh_vertex_colors(mesh, name):
+    # the colors of the vertices of a mesh from a vertex attribute, as integers between 0 and 255
+    from compas.colors import Color
+
+    colors = []
+    for color in mesh.vertices_attribute(name):
+        color = Color.coerce(color) if color is not None else None
+        colors.append(color.rgb255 if color else (0, 0, 0))
+    return asarray(colors, dtype=int64).reshape((-1, 3))
+
+
+def _scalar_dtype(properties, byte_order):
+    return dtype([(prop[0], byte_order + PLY_TYPES[prop[1]]) for prop in properties if len(prop) == 2])
+
+
+def _read_lists(buf, position, count, properties, byte_order):
+    # read the items of an element with list properties
+    # try a fixed record layout, with the lengths of the lists of the first item
+    layout = _first_layout(buf, position, properties, byte_order) if count else None
+    if layout is not None:
+        records = dtype(layout)
+        size = count * records.itemsize
+        if len(buf) >= position + size:
+            items = frombuffer(buf, dtype=records, count=count, offset=position)
+            lengths = [items[prop[0] + "_length"] for prop in properties if len(prop) == 3]
+            if all((length == length[0]).all() for length in lengths):
+                scalar = _scalar_dtype(properties, byte_order)
+                records = empty(count, dtype=scalar)
+                for name in scalar.names:
+                    records[name] = items[name]
+                lists = {}
+                for prop, length in zip([prop for prop in properties if len(prop) == 3], lengths):
+                    lists[prop[0]] = items[prop[0]].reshape(-1).copy(), arange(count + 1) * int(length[0])
+                return records, lists, position + size
+    return _read_lists_variable(buf, position, count, properties, byte_order)
+
+
+def _first_layout(buf, position, properties, byte_order):
+    layout = []
+    for prop in properties:
+        if len(prop) == 2:
+            t = dtype(byte_order + PLY_TYPES[prop[1]])
+            layout.append((prop[0], t))
+            position += t.itemsize
+            continue
+        name, vtype, ltype = prop
+        lt = dtype(byte_order + PLY_TYPES[ltype])
+        vt = dtype(byte_order + PLY_TYPES[vtype])
+        if len(buf) < position + lt.itemsize:
+            return None
+        k = int(frombuffer(buf, dtype=lt, count=1, offset=position)[0])
+        layout.append((name + "_length", lt))
+        layout.append((name, vt, (k,)))
+        position += lt.itemsize + k * vt.itemsize
+    return layout
+
+
+def _read_lists_variable(buf, position, count, properties, byte_order):
+    # find the start of every item in one pass over the lengths of the lists
+    # and gather the values of all items at once
+    steps = []
+    for prop in properties:
+        if len(prop) == 2:
+            steps.append((dtype(byte_order + PLY_TYPES[prop[1]]).itemsize, None, None))
+        else:
+            lt = dtype(byte_order + PLY_TYPES[prop[2]])
+            vt = dtype(byte_order + PLY_TYPES[prop[1]])
+            steps.append((lt.itemsize, byte_order + lt.char, vt.itemsize))
+    starts = zeros(count, dtype=int64)
+    end = len(buf)
+    for i in range(count):
+        starts[i] = position
+        for size, fmt, itemsize in steps:
+            if position + size > end:
+                raise ValueError("The file contains fewer items than specified in its header.")
+            if fmt is None:
+                position += size
+            else:
+                position += size + struct.unpack_from(fmt, buf, position)[0] * itemsize
+        if position > end:
+            raise ValueError("The file contains fewer items than specified in its header.")
+    scalar = _scalar_dtype(properties, byte_order)
+    records = empty(count, dtype=scalar)
+    lists = {}
+    cursor = starts
+    for prop in properties:
+        if len(prop) == 2:
+            t = dtype(byte_order + PLY_TYPES[prop[1]])
+            records[prop[0]] = _gather(buf, cursor, t)
+            cursor = cursor + t.itemsize
+            continue
+        name, vtype, ltype = prop
+        lt = dtype(byte_order + PLY_TYPES[ltype])
+        vt = dtype(byte_order + PLY_TYPES[vtype])
+        lengths = _gather(buf, cursor, lt).astype(int64)
+        offsets = concatenate(([0], cumsum(lengths)))
+        first = repeat(cursor + lt.itemsize - offsets[:-1] * vt.itemsize, lengths)
+        values = _gather(buf, first + arange(offsets[-1]) * vt.itemsize, vt)
+        lists[name] = values, offsets
+        cursor = cursor + lt.itemsize + lengths * vt.itemsize
+    return records, lists, position
+
+
+def _gather(buf, positions, t):
+    # the values of a type at byte positions of a buffer
+    data = buf[positions[:, None] + arange(t.itemsize)]
+    return data.view(t).reshape(-1)
+
+
+def _flat_faces(indices, offsets):
+    indices = asarray(indices, dtype=int64)
+    if offsets is None:
+        if indices.ndim == 1 and not len(indices):
+            return indices, zeros(1, dtype=int64)
+        k = indices.shape[1]
+        return indices.reshape(-1), arange(0, indices.size + 1, k)
+    return indices.reshape(-1), asarray(offsets, dtype=int64)
+
+
+def _vertex_records(vertices, normals=None, colors=None, has_normals=None, has_colors=None):
+    vertices = asarray(vertices, dtype=float32).reshape((-1, 3))
+    has_normals = normals is not None if has_normals is None else has_normals
+    has_colors = colors is not None if has_colors is None else has_colors
+    records = empty(len(vertices), dtype=ply_vertex_dtype(normals=has_normals, colors=has_colors))
+    for axis, name in enumerate("xyz"):
+        records[name] = vertices[:, axis]
+    if has_normals:
+        normals = asarray(normals, dtype=float32).reshape((-1, 3))
+        for axis, name in enumerate(("nx", "ny", "nz")):
+            records[name] = normals[:, axis]
+    if has_colors:
+        colors = asarray(colors).reshape((-1, 3)).clip(0, 255)
+        for axis, name in enumerate(("red", "green", "blue")):
+            records[name] = colors[:, axis]
+    return records
+
+
+def _face_bytes(indices, offsets=None):
+    # the faces as a length byte followed by the indices as 32-bit integers
+    indices, offsets = _flat_faces(indices, offsets)
+    lengths = diff(offsets)
+    if not len(lengths):
+        return b""
+    if (lengths > 255).any():
+        raise ValueError("Faces with more than 255 vertices can't be written.")
+    if (lengths == lengths[0]).all():
+        k = int(lengths[0])
+        records = empty(len(lengths), dtype=dtype([("length", "u1"), ("indices", "<i4", (k,))]))
+        records["length"] = k
+        records["indices"] = indices.reshape((-1, k))
+        return records.tobytes()
+    data = empty(len(lengths) + 4 * len(indices), dtype=uint8)
+    heads = arange(len(lengths)) + 4 * offsets[:-1]
+    mask = ones(len(data), dtype=bool)
+    mask[heads] = False
+    data[heads] = lengths
+    data[mask] = indices.astype("<i4").view(uint8)
+    return data.tobytes()
@@ -93,6 +93,19 @@ class STLReader(object):
     filepath : path string | file-like object | URL string
         A path, a file-like object or a URL pointing to a file.
 
+    Attributes
+    ----------
+    header : bytes
+        The header of a binary file.
+    facets : list[dict]
+        The facets of the file, with their normal and vertices,
+        and for binary files, the bytes of the coordinates of the vertices as keys.
+
+    Notes
+    -----
+    Outside of IronPython, binary files are read with NumPy, in one shot.
+    The list of facets is then only created on first access.
+
     References
     ----------
     * http://paulbourke.net/dataformats/stl/
@@ -104,8 +117,19 @@ class STLReader(object):
         self.file = None
         self.header = None
         self.facets = []
+        self._array = None
         self.read()
 
+    @property
+    def facets(self):
+        if self._facets is None:
+            self._facets = _facets_from_array(self._array)
+        return self._facets
+
+    @facets.setter
+    def facets(self, facets):
+        self._facets = facets
+
     def read(self):
         """Read the data.
 
@@ -116,7 +140,7 @@ class STLReader(object):
         """
         is_binary = False
         with _iotools.open_file(self.filepath, "rb") as file:
-            line = file.readline().strip()
+            line = file.readline(80).strip()
             if b"solid" in line:
                 is_binary = False
             else:
@@ -231,6 +255,12 @@ class STLReader(object):
         return struct.unpack("<I", bytes_)[0]
 
     def _read_binary(self):
+        if not compas.IPY:
+            from .stl_numpy import stl_read_binary_numpy
+
+            self.header, self._array = stl_read_binary_numpy(self.filepath)
+            self.facets = None
+            return
         with _iotools.open_file(self.filepath, "rb") as file:
             self.file = file
             self.file.seek(0)
@@ -286,16 +316,45 @@ class STLParser(object):
         The vertex coordinates.
     faces : list[list[int]]
         The faces as lists of vertex indices.
+    arrays : tuple[ndarray, ndarray] | None
+        The vertex coordinates and the faces as NumPy arrays,
+        if the file is a binary file read with NumPy.
+
+    Notes
+    -----
+    For binary files read with NumPy, the vertices are welded with :func:`compas.files.stl_weld_numpy`,
+    and the lists of vertices and faces are only created on first access.
 
     """
 
     def __init__(self, reader, precision=None):
         self.precision = precision
         self.reader = reader
+        self.arrays = None
         self.vertices = None
         self.faces = None
         self.parse()
 
+    @property
+    def vertices(self):
+        if self._vertices is None and self.arrays is not None:
+            self._vertices = self.arrays[0].tolist()
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = vertices
+
+    @property
+    def faces(self):
+        if self._faces is None and self.arrays is not None:
+            self._faces = self.arrays[1].tolist()
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        self._faces = faces
+
     def parse(self):
         """Parse the the data found by the reader.
 
@@ -304,6 +363,13 @@ class STLParser(object):
         None
 
         """
+        if self.reader._array is not None:
+            from .stl_numpy import stl_weld_numpy
+
+            self.arrays = stl_weld_numpy(self.reader._array)
+            self.vertices = None
+            self.faces = None
+            return
         gkey_index = {}
         vertices = []
         faces = []
@@ -412,6 +478,12 @@ class STLWriter(object):
             raise ValueError("Mesh must have fewer than 4294967295 faces to be written to binary STL.")
 
     def _write_binary_faces(self):
+        if not compas.IPY:
+            from .stl_numpy import stl_write_binary_numpy
+
+            xyz, indices, _ = self.mesh.to_arrays()
+            stl_write_binary_numpy(self.file, xyz[indices.reshape((-1, 3))])
+            return
         vertex_xyz = self._vertex_xyz
         for face in self.mesh.faces():
             normal = list(self.mesh.face_normal(face))
@@ -419,3 +491,16 @@ class STLWriter(object):
             for vertex in self.mesh.face_vertices(face):
                 self.file.write(struct.pack("<3f", *vertex_xyz[vertex]))
             self.file.write(b"\0\0")
+
+
+def _facets_from_array(array):
+    if array is None:
+        return []
+    data = array.tobytes()
+    size = array.dtype.itemsize
+    facets = []
+    for i, (normal, vertices) in enumerate(zip(array["normal"].tolist(), array["vertices"].tolist())):
+        j = i * size
+        keys = (data[j + 12 : j + 24], data[j + 24 : j + 36], data[j + 36 : j + 48])
+        facets.append({"normal": tuple(normal), "vertices": tuple(tuple(xyz) for xyz in vertices), "keys": keys})
+    return facets
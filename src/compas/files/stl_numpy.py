@@ -0,0 +1,254 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import struct
+
+from numpy import any as npany
+from numpy import arange
+from numpy import argsort
+from numpy import ascontiguousarray
+from numpy import asarray
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import dtype
+from numpy import empty
+from numpy import flatnonzero
+from numpy import float64
+from numpy import frombuffer
+from numpy import int64
+from numpy import lexsort
+from numpy import memmap
+from numpy import minimum
+from numpy import ndarray
+from numpy import sqrt
+from numpy import uint32
+from numpy import uint64
+from numpy import zeros
+
+from compas import _iotools
+
+
+STL_BINARY_DTYPE = dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attributes", "<u2"),
+    ]
+)
+"""The record of a facet in a binary STL file."""
+
+
+def stl_read_binary_numpy(filepath):
+    """Read all facets of a binary STL file at once.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+
+    Returns
+    -------
+    bytes
+        The header of the file.
+    ndarray
+        The facets as a structured array with fields ``normal``, ``vertices`` and ``attributes``.
+        For paths to local files, the array is memory-mapped,
+        such that files that do not fit in memory can be processed in chunks.
+
+    Raises
+    ------
+    ValueError
+        If the file is shorter than specified in its header.
+
+    """
+    with _iotools.open_file(filepath, "rb") as file:
+        file.seek(0)
+        header, count = _read_header(file)
+        if not _is_local_file(filepath):
+            data = file.read(count * STL_BINARY_DTYPE.itemsize)
+            if len(data) < count * STL_BINARY_DTYPE.itemsize:
+                raise ValueError("The file contains fewer facets than specified in its header.")
+            return header, frombuffer(data, dtype=STL_BINARY_DTYPE)
+    if os.path.getsize(filepath) < 84 + count * STL_BINARY_DTYPE.itemsize:
+        raise ValueError("The file contains fewer facets than specified in its header.")
+    if not count:
+        return header, zeros(0, dtype=STL_BINARY_DTYPE)
+    return header, memmap(filepath, dtype=STL_BINARY_DTYPE, mode="r", offset=84, shape=(count,))
+
+
+def stl_iter_binary_numpy(filepath, chunksize=1048576):
+    """Iterate over the facets of a binary STL file in chunks.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+    chunksize : int, optional
+        The maximum number of facets per chunk.
+
+    Yields
+    ------
+    ndarray
+        The facets of a chunk as a structured array with fields ``normal``, ``vertices`` and ``attributes``.
+
+    Notes
+    -----
+    The file is read sequentially, one chunk at a time.
+    Only one chunk is kept in memory.
+
+    """
+    with _iotools.open_file(filepath, "rb") as file:
+        file.seek(0)
+        _, count = _read_header(file)
+        while count > 0:
+            n = min(count, chunksize)
+            data = file.read(n * STL_BINARY_DTYPE.itemsize)
+            n = len(data) // STL_BINARY_DTYPE.itemsize
+            if not n:
+                break
+            yield frombuffer(data[: n * STL_BINARY_DTYPE.itemsize], dtype=STL_BINARY_DTYPE)
+            count -= n
+
+
+def stl_weld_numpy(facets, chunksize=1048576):
+    """Identify the vertices of the facets of an STL file with identical coordinates.
+
+    Parameters
+    ----------
+    facets : ndarray | iterable[ndarray]
+        The facets as a structured array with a field ``vertices``, or as an iterable of chunks of facets,
+        as returned by :func:`stl_read_binary_numpy` and :func:`stl_iter_binary_numpy`.
+    chunksize : int, optional
+        The maximum number of facets processed at once, if the facets are provided as one array.
+
+    Returns
+    -------
+    ndarray
+        The XYZ coordinates of the vertices, as a ``(V, 3)`` array.
+    ndarray
+        The vertex indices of the faces, as an ``(F, 3)`` array.
+
+    Notes
+    -----
+    Vertices are identified if the bytes of their coordinates are identical,
+    and are numbered in the order in which they appear in the facets.
+    The coordinates of the vertices of every chunk are reduced to the unique coordinates of that chunk,
+    before the unique coordinates of all chunks are identified.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> facets = np.zeros(2, dtype=STL_BINARY_DTYPE)
+    >>> facets["vertices"][0] = [[0, 0, 0], [1, 0, 0], [1, 1, 0]]
+    >>> facets["vertices"][1] = [[0, 0, 0], [1, 1, 0], [0, 1, 0]]
+    >>> vertices, faces = stl_weld_numpy(facets)
+    >>> faces.tolist()
+    [[0, 1, 2], [0, 2, 3]]
+
+    """
+    if isinstance(facets, ndarray):
+        chunks = [facets[start : start + chunksize] for start in range(0, len(facets), chunksize)]
+    else:
+        chunks = facets
+    keys = []
+    faces = []
+    offset = 0
+    for chunk in chunks:
+        corners = ascontiguousarray(chunk["vertices"], dtype="<f4").reshape((-1, 3))
+        first, inverse = _unique_rows(corners.view(uint32))
+        keys.append(corners[first])
+        faces.append(inverse + offset)
+        offset += len(first)
+    if not keys:
+        return zeros((0, 3)), zeros((0, 3), dtype=int64)
+    keys = concatenate(keys)
+    first, inverse = _unique_rows(keys.view(uint32))
+    return keys[first].astype(float64), inverse[concatenate(faces)].reshape((-1, 3))
+
+
+def stl_write_binary_numpy(file, triangles, normals=None, chunksize=1048576):
+    """Write the facets of a binary STL file.
+
+    Parameters
+    ----------
+    file : file-like object
+        A file opened in binary mode, positioned after the header and the number of facets.
+    triangles : array_like[float]
+        The XYZ coordinates of the corners of the facets, as an ``(F, 3, 3)`` array.
+    normals : array_like[float], optional
+        The normals of the facets, as an ``(F, 3)`` array.
+        Default is to compute the normals from the corners.
+    chunksize : int, optional
+        The maximum number of facets written at once.
+
+    Returns
+    -------
+    None
+
+    """
+    triangles = asarray(triangles, dtype=float64).reshape((-1, 3, 3))
+    if normals is not None:
+        normals = asarray(normals, dtype=float64).reshape((-1, 3))
+    for start in range(0, len(triangles), chunksize):
+        corners = triangles[start : start + chunksize]
+        if normals is None:
+            n = cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+            lengths = sqrt((n**2).sum(axis=1))
+            lengths[lengths == 0] = 1.0
+            n /= lengths[:, None]
+        else:
+            n = normals[start : start + chunksize]
+        chunk = zeros(len(corners), dtype=STL_BINARY_DTYPE)
+        chunk["normal"] = n
+        chunk["vertices"] = corners
+        file.write(chunk.tobytes())
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _is_local_file(filepath):
+    return isinstance(filepath, str) and not filepath.startswith("http") and os.path.isfile(filepath)
+
+
+def _read_header(file):
+    header = file.read(80)
+    data = file.read(4)
+    if len(data) < 4:
+        raise ValueError("The file is not a binary STL file.")
+    return header, struct.unpack("<I", data)[0]
+
+
+def _unique_rows(bits):
+    # the indices of the first occurrences of the unique rows of an integer array in order of appearance,
+    # and the index of every row in the unique rows
+    # the rows are sorted by a hash, and by their values in case of a collision
+    m = len(bits)
+    if not m:
+        return zeros(0, dtype=int64), zeros(0, dtype=int64)
+    wide = bits.astype(uint64)
+    h = wide[:, 0] * uint64(0x9E3779B97F4A7C15)
+    h ^= wide[:, 1] * uint64(0xC2B2AE3D27D4EB4F)
+    h ^= wide[:, 2] * uint64(0x165667B19E3779F9)
+    order = argsort(h)
+    sorted_bits = bits[order]
+    changed = npany(sorted_bits[1:] != sorted_bits[:-1], axis=1)
+    hashed = h[order]
+    if npany(changed & (hashed[1:] == hashed[:-1])):
+        order = lexsort((bits[:, 2], bits[:, 1], bits[:, 0]))
+        sorted_bits = bits[order]
+        changed = npany(sorted_bits[1:] != sorted_bits[:-1], axis=1)
+    start = concatenate(([True], changed))
+    group = cumsum(start) - 1
+    first = minimum.reduceat(order, flatnonzero(start))
+    appearance = argsort(first)
+    index = empty(len(first), dtype=int64)
+    index[appearance] = arange(len(first))
+    inverse = empty(m, dtype=int64)
+    inverse[order] = index[group]
+    return first[appearance], inverse
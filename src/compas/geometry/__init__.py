@@ -117,6 +117,7 @@ from ._core.size import area_polygon, area_polygon_xy, area_triangle, area_trian
 from ._core.tangent import tangent_points_to_circle_xy
 
 from ._core.kdtree import KDTree
+from ._core.bvh import MeshBVH
 
 from ._core.matrices import (
     axis_and_angle_from_matrix,
@@ -181,6 +182,7 @@ from ._core.transformations import reflect_line_plane, reflect_line_triangle, ro
 from ._core.transformations import scale_points, scale_points_xy
 from ._core.transformations import (
     transform_frames,
+    transform_objects,
     transform_points,
     transform_vectors,
     translate_points_xy,
@@ -340,6 +342,12 @@ from .point import Point
 from .quaternion import Quaternion
 from .frame import Frame
 from .plane import Plane
+from .pointarray import PointArray
+from .pointarray import VectorArray
+from .pointarray import FrameArray
+from .pointarray import transform_coordinates
+from .pointarray import transform_coordinates_batch
+from .transformationarray import TransformationArray
 
 # not sure what to do with line and polyline
 # the required changes are drastic
@@ -628,6 +636,7 @@ __all__ = [
     "transform_points",
     "transform_vectors",
     "transform_frames",
+    "transform_objects",
     "local_to_world_coordinates",
     "world_to_local_coordinates",
     "translate_points",
@@ -699,8 +708,15 @@ __all__ = [
     "Polyhedron",
     "Sphere",
     "Torus",
+    "PointArray",
+    "VectorArray",
+    "FrameArray",
+    "transform_coordinates",
+    "transform_coordinates_batch",
+    "TransformationArray",
     "Pointcloud",
     "KDTree",
+    "MeshBVH",
     "Projection",
     "Reflection",
     "Rotation",
@@ -0,0 +1,605 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+from math import sqrt
+
+import compas
+
+
+# fixed directions for the ray parity tests of point containment
+# chosen such that they are unlikely to be aligned with edges of the mesh
+CONTAINMENT_DIRECTIONS = [
+    (0.2831, 0.5157, 0.8090),
+    (-0.6543, 0.3216, 0.6844),
+    (0.4129, -0.8361, 0.3612),
+]
+
+
+class MeshBVH(object):
+    """A bounding volume hierarchy of axis-aligned bounding boxes around the triangles of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh` | tuple[sequence[[float, float, float]], sequence[sequence[int]]]
+        A mesh object, or a mesh represented by a list of vertices and a list of faces.
+    leafsize : int, optional
+        The maximum number of triangles in a leaf of the hierarchy.
+    use_numpy : bool, optional
+        If True, build and query the hierarchy with NumPy.
+        Default is to use NumPy if it is available.
+
+    Attributes
+    ----------
+    leafsize : int
+        The maximum number of triangles in a leaf of the hierarchy.
+    use_numpy : bool
+        True if the hierarchy is built and queried with NumPy.
+
+    Notes
+    -----
+    Faces with more than three vertices are triangulated.
+    Quads are split along their first diagonal, other polygons are split into a fan of triangles around their centroid.
+    All queries report the faces of the mesh, identified by their key for mesh objects,
+    and by their index for lists of vertices and faces.
+
+    The hierarchy is stored in flat arrays, in the same way as :class:`~compas.geometry.KDTree`.
+    The triangles are reordered such that every node of the hierarchy corresponds to a contiguous range of triangles,
+    which is split at the median of the centroids of the triangles along the axis with the largest extent.
+    The bounding boxes of the two children of a node are stored at the index of the median.
+
+    The queries for many rays or points at once
+    (:meth:`intersect_rays`, :meth:`closest_points`, :meth:`contains_points`)
+    process all rays or points simultaneously if NumPy is used.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas.geometry import MeshBVH
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> bvh = MeshBVH(mesh)
+    >>> hits = bvh.intersect_ray(([0, 0, 0], [0, 0, 1]))
+    >>> len(hits)
+    1
+    >>> bvh.contains_point([0, 0, 0])
+    True
+    >>> bvh.contains_point([2, 2, 2])
+    False
+
+    """
+
+    def __init__(self, mesh, leafsize=8, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = not compas.IPY and _has_numpy()
+        self.leafsize = max(1, int(leafsize))
+        self.use_numpy = use_numpy
+        self._faces = []
+        self._xyz = array("d")
+        self._bounds = array("d")
+        self._root = None
+        self.build(mesh)
+
+    def __len__(self):
+        return len(self._faces)
+
+    def build(self, mesh):
+        """Build the hierarchy around the triangles of a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`~compas.datastructures.Mesh` | tuple[sequence[[float, float, float]], sequence[sequence[int]]]
+            A mesh object, or a mesh represented by a list of vertices and a list of faces.
+
+        Returns
+        -------
+        None
+
+        """
+        faces, triangles = _mesh_triangles(mesh)
+        if not triangles:
+            self._faces = []
+            self._xyz = array("d")
+            self._bounds = array("d")
+            self._root = None
+            return
+        if self.use_numpy:
+            from .bvh_numpy import bvh_build_numpy
+
+            order, xyz, bounds, root = bvh_build_numpy(triangles, self.leafsize)
+        else:
+            order, xyz, bounds, root = self._build(triangles)
+        self._faces = [faces[i] for i in order]
+        self._xyz = xyz
+        self._bounds = bounds
+        self._root = root
+
+    def _build(self, triangles):
+        n = len(triangles)
+        centroids = [[(t[axis] + t[axis + 3] + t[axis + 6]) / 3.0 for t in triangles] for axis in range(3)]
+        lower = [[min(t[axis], t[axis + 3], t[axis + 6]) for t in triangles] for axis in range(3)]
+        upper = [[max(t[axis], t[axis + 3], t[axis + 6]) for t in triangles] for axis in range(3)]
+        order = list(range(n))
+        bounds = array("d", [0.0]) * (12 * n)
+        stack = [(0, n)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= self.leafsize:
+                continue
+            indices = order[lo:hi]
+            extents = []
+            for c in centroids:
+                values = [c[i] for i in indices]
+                extents.append(max(values) - min(values))
+            axis = extents.index(max(extents))
+            indices.sort(key=centroids[axis].__getitem__)
+            order[lo:hi] = indices
+            mid = (lo + hi) // 2
+            k = 12 * mid
+            bounds[k : k + 6] = array("d", _box(indices[: mid - lo], lower, upper))
+            bounds[k + 6 : k + 12] = array("d", _box(indices[mid - lo :], lower, upper))
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+        xyz = array("d")
+        for i in order:
+            xyz.extend(triangles[i])
+        return order, xyz, bounds, _box(order, lower, upper)
+
+    # ==========================================================================
+    # Rays
+    # ==========================================================================
+
+    def _intersect(self, origin, direction, first=False):
+        # returns the distances, tree positions, and barycentric coordinates of the hits
+        # sorted by distance
+        if self._root is None:
+            return []
+        o = (float(origin[0]), float(origin[1]), float(origin[2]))
+        length = sqrt(direction[0] ** 2 + direction[1] ** 2 + direction[2] ** 2)
+        if not length:
+            return []
+        d = (direction[0] / length, direction[1] / length, direction[2] / length)
+        inv = tuple(1.0 / x if x else None for x in d)
+        xyz = self._xyz
+        bounds = self._bounds
+        leafsize = self.leafsize
+        tmax = float("inf")
+        hits = []
+        tnear = _slab(self._root, 0, o, inv, tmax)
+        if tnear is None:
+            return []
+        stack = [(0, len(self._faces), tnear)]
+        while stack:
+            lo, hi, tnear = stack.pop()
+            if tnear > tmax:
+                continue
+            if hi - lo > leafsize:
+                mid = (lo + hi) // 2
+                k = 12 * mid
+                tl = _slab(bounds, k, o, inv, tmax)
+                tr = _slab(bounds, k + 6, o, inv, tmax)
+                if tl is None:
+                    if tr is not None:
+                        stack.append((mid, hi, tr))
+                elif tr is None:
+                    stack.append((lo, mid, tl))
+                elif tl <= tr:
+                    stack.append((mid, hi, tr))
+                    stack.append((lo, mid, tl))
+                else:
+                    stack.append((lo, mid, tl))
+                    stack.append((mid, hi, tr))
+                continue
+            for i in range(lo, hi):
+                hit = _intersection_ray_triangle(xyz, 9 * i, o, d)
+                if hit is None:
+                    continue
+                u, v, t = hit
+                if first:
+                    if t < tmax or (t == tmax and i < hits[0][1]):
+                        hits = [(t, i, u, v)]
+                        tmax = t
+                else:
+                    hits.append((t, i, u, v))
+        hits.sort()
+        return hits
+
+    def _hits(self, found):
+        # one hit per face and distance
+        # to avoid reporting the hits on the diagonals of triangulated faces twice
+        faces = self._faces
+        hits = []
+        for t, i, u, v in found:
+            face = faces[i]
+            if hits and hits[-1][0] == face and t - hits[-1][3] <= 1e-9 * max(1.0, t):
+                continue
+            hits.append((face, u, v, t))
+        return hits
+
+    def intersect_ray(self, ray, first=False):
+        """Compute the intersections of a ray with the mesh.
+
+        Parameters
+        ----------
+        ray : tuple[[float, float, float], [float, float, float]] | :class:`~compas.geometry.Line`
+            A ray represented by a point and a direction vector.
+        first : bool, optional
+            If True, only compute the intersection closest to the origin of the ray.
+
+        Returns
+        -------
+        list[tuple[int, float, float, float]]
+            Per intersection, sorted by distance:
+
+            0. the intersected face,
+            1. the u coordinate of the intersection in the barycentric coordinates of the intersected triangle,
+            2. the v coordinate of the intersection in the barycentric coordinates of the intersected triangle,
+            3. the distance between the ray origin and the intersection.
+
+        """
+        origin, direction = _ray(ray)
+        return self._hits(self._intersect(origin, direction, first=first))
+
+    def intersect_rays(self, rays, first=False):
+        """Compute the intersections of many rays with the mesh at once.
+
+        Parameters
+        ----------
+        rays : sequence[tuple[[float, float, float], [float, float, float]] | :class:`~compas.geometry.Line`]
+            The rays represented by a point and a direction vector.
+        first : bool, optional
+            If True, only compute the intersection closest to the origin of every ray.
+
+        Returns
+        -------
+        list[list[tuple[int, float, float, float]]]
+            Per ray, the intersections as described in :meth:`intersect_ray`.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> from compas.geometry import MeshBVH
+        >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+        >>> bvh = MeshBVH(mesh)
+        >>> hits = bvh.intersect_rays([([0.5, 0.5, 1], [0, 0, -1]), ([20, 0.5, 1], [0, 0, -1])])
+        >>> [len(h) for h in hits]
+        [1, 0]
+
+        """
+        rays = [_ray(ray) for ray in rays]
+        if not self.use_numpy or self._root is None:
+            return [self._hits(self._intersect(origin, direction, first=first)) for origin, direction in rays]
+        from .bvh_numpy import bvh_intersect_rays_numpy
+
+        found = bvh_intersect_rays_numpy(
+            self._xyz,
+            self._bounds,
+            self._root,
+            self.leafsize,
+            [origin for origin, _ in rays],
+            [direction for _, direction in rays],
+            first=first,
+        )
+        return [self._hits(hits) for hits in found]
+
+    # ==========================================================================
+    # Points
+    # ==========================================================================
+
+    def _closest(self, point):
+        # returns the closest point, tree position, and squared distance
+        if self._root is None:
+            return None
+        p = (float(point[0]), float(point[1]), float(point[2]))
+        xyz = self._xyz
+        bounds = self._bounds
+        leafsize = self.leafsize
+        best = float("inf")
+        found = None
+        stack = [(0, len(self._faces), _box_distance_sqrd(self._root, 0, p))]
+        while stack:
+            lo, hi, d2min = stack.pop()
+            if d2min >= best:
+                continue
+            if hi - lo > leafsize:
+                mid = (lo + hi) // 2
+                k = 12 * mid
+                dl = _box_distance_sqrd(bounds, k, p)
+                dr = _box_distance_sqrd(bounds, k + 6, p)
+                if dl <= dr:
+                    stack.append((mid, hi, dr))
+                    stack.append((lo, mid, dl))
+                else:
+                    stack.append((lo, mid, dl))
+                    stack.append((mid, hi, dr))
+                continue
+            for i in range(lo, hi):
+                x, y, z = _closest_point_on_triangle(xyz, 9 * i, p)
+                d2 = (x - p[0]) ** 2 + (y - p[1]) ** 2 + (z - p[2]) ** 2
+                if d2 < best:
+                    best = d2
+                    found = [x, y, z], i, d2
+        return found
+
+    def closest_point(self, point):
+        """Compute the closest point on the mesh to a given point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            XYZ coordinates of the base point.
+
+        Returns
+        -------
+        [[float, float, float], int, float]
+            XYZ coordinates of the closest point.
+            The face on which the closest point lies.
+            Distance to the base point.
+            If the mesh has no faces, the closest point and the face are None and the distance is infinite.
+
+        """
+        found = self._closest(point)
+        if found is None:
+            return [None, None, float("inf")]
+        xyz, i, d2 = found
+        return [xyz, self._faces[i], sqrt(d2)]
+
+    def closest_points(self, points):
+        """Compute the closest points on the mesh to many points at once.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            XYZ coordinates of the base points.
+
+        Returns
+        -------
+        list[[float, float, float]]
+            XYZ coordinates of the closest points.
+        list[int]
+            The faces on which the closest points lie.
+        list[float]
+            The distances to the base points.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> from compas.geometry import MeshBVH
+        >>> mesh = Mesh.from_meshgrid(dx=10, nx=10)
+        >>> bvh = MeshBVH(mesh)
+        >>> points, faces, distances = bvh.closest_points([[0.5, 0.5, 1.0], [-1.0, 0.5, 0.0]])
+        >>> distances
+        [1.0, 1.0]
+
+        """
+        if self._root is None:
+            n = len(points)
+            return [None] * n, [None] * n, [float("inf")] * n
+        if not self.use_numpy:
+            closest = [self._closest(point) for point in points]
+            return (
+                [xyz for xyz, _, _ in closest],
+                [self._faces[i] for _, i, _ in closest],
+                [sqrt(d2) for _, _, d2 in closest],
+            )
+        from .bvh_numpy import bvh_closest_points_numpy
+
+        xyz, indices, d2 = bvh_closest_points_numpy(self._xyz, self._bounds, self._root, self.leafsize, points)
+        return xyz, [self._faces[i] for i in indices], [sqrt(x) for x in d2]
+
+    def contains_point(self, point):
+        """Verify if the mesh contains a given point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            XYZ coordinates of the point.
+
+        Returns
+        -------
+        bool
+            True if the point is inside the mesh.
+            False otherwise.
+
+        Notes
+        -----
+        The mesh should be closed.
+        The number of intersections with the mesh is computed for three rays starting at the point,
+        and the point is considered inside if that number is odd for at least two of the rays.
+        The result is undefined for points on the mesh.
+
+        """
+        votes = 0
+        for direction in CONTAINMENT_DIRECTIONS:
+            if len(self._hits(self._intersect(point, direction))) % 2:
+                votes += 1
+        return votes >= 2
+
+    def contains_points(self, points):
+        """Verify if the mesh contains many points at once.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            XYZ coordinates of the points.
+
+        Returns
+        -------
+        list[bool]
+            For every point, True if the point is inside the mesh, and False otherwise.
+
+        See Also
+        --------
+        :meth:`contains_point`
+
+        """
+        votes = [0] * len(points)
+        for direction in CONTAINMENT_DIRECTIONS:
+            hits = self.intersect_rays([(point, direction) for point in points])
+            for i, h in enumerate(hits):
+                if len(h) % 2:
+                    votes[i] += 1
+        return [vote >= 2 for vote in votes]
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _has_numpy():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _mesh_triangles(mesh):
+    # the triangles of the faces of a mesh, as lists of nine coordinates
+    if hasattr(mesh, "to_vertices_and_faces"):
+        vertices, faces = mesh.to_vertices_and_faces()
+        keys = list(mesh.faces())
+    else:
+        vertices, faces = mesh
+        keys = list(range(len(faces)))
+    vertices = [[float(x) for x in vertex[:3]] for vertex in vertices]
+    labels = []
+    triangles = []
+    for key, face in zip(keys, faces):
+        if len(face) < 3:
+            continue
+        points = [vertices[index] for index in face]
+        if len(points) == 3:
+            polygon = [points]
+        elif len(points) == 4:
+            a, b, c, d = points
+            polygon = [[a, b, c], [a, c, d]]
+        else:
+            n = len(points)
+            o = [sum(point[axis] for point in points) / n for axis in range(3)]
+            polygon = [[o, points[i], points[(i + 1) % n]] for i in range(n)]
+        for a, b, c in polygon:
+            labels.append(key)
+            triangles.append(a + b + c)
+    return labels, triangles
+
+
+def _ray(ray):
+    origin, direction = ray[0], ray[1]
+    if hasattr(ray, "direction"):
+        direction = ray.direction
+    return origin, direction
+
+
+def _box(indices, lower, upper):
+    return [min(lower[axis][i] for i in indices) for axis in range(3)] + [
+        max(upper[axis][i] for i in indices) for axis in range(3)
+    ]
+
+
+def _slab(box, k, o, inv, tmax):
+    # the entry distance of a ray into a box, or None if the ray misses the box
+    tnear = 0.0
+    tfar = tmax
+    for axis in range(3):
+        lo = box[k + axis]
+        hi = box[k + axis + 3]
+        if inv[axis] is None:
+            if o[axis] < lo or o[axis] > hi:
+                return None
+            continue
+        t0 = (lo - o[axis]) * inv[axis]
+        t1 = (hi - o[axis]) * inv[axis]
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > tnear:
+            tnear = t0
+        if t1 < tfar:
+            tfar = t1
+        if tnear > tfar:
+            return None
+    return tnear
+
+
+def _box_distance_sqrd(box, k, p):
+    d2 = 0.0
+    for axis in range(3):
+        x = p[axis]
+        lo = box[k + axis]
+        hi = box[k + axis + 3]
+        if x < lo:
+            d2 += (lo - x) ** 2
+        elif x > hi:
+            d2 += (x - hi) ** 2
+    return d2
+
+
+def _intersection_ray_triangle(xyz, j, o, d):
+    # Moller-Trumbore
+    ax, ay, az = xyz[j], xyz[j + 1], xyz[j + 2]
+    e1x, e1y, e1z = xyz[j + 3] - ax, xyz[j + 4] - ay, xyz[j + 5] - az
+    e2x, e2y, e2z = xyz[j + 6] - ax, xyz[j + 7] - ay, xyz[j + 8] - az
+    px = d[1] * e2z - d[2] * e2y
+    py = d[2] * e2x - d[0] * e2z
+    pz = d[0] * e2y - d[1] * e2x
+    det = e1x * px + e1y * py + e1z * pz
+    if not det:
+        return None
+    inv = 1.0 / det
+    sx, sy, sz = o[0] - ax, o[1] - ay, o[2] - az
+    u = (sx * px + sy * py + sz * pz) * inv
+    if u < 0.0 or u > 1.0:
+        return None
+    qx = sy * e1z - sz * e1y
+    qy = sz * e1x - sx * e1z
+    qz = sx * e1y - sy * e1x
+    v = (d[0] * qx + d[1] * qy + d[2] * qz) * inv
+    if v < 0.0 or u + v > 1.0:
+        return None
+    t = (e2x * qx + e2y * qy + e2z * qz) * inv
+    if t < 0.0:
+        return None
+    return u, v, t
+
+
+def _closest_point_on_triangle(xyz, j, p):
+    # Ericson, Real-Time Collision Detection, 5.1.5
+    a = xyz[j], xyz[j + 1], xyz[j + 2]
+    b = xyz[j + 3], xyz[j + 4], xyz[j + 5]
+    c = xyz[j + 6], xyz[j + 7], xyz[j + 8]
+    ab = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    ac = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    ap = p[0] - a[0], p[1] - a[1], p[2] - a[2]
+    d1 = ab[0] * ap[0] + ab[1] * ap[1] + ab[2] * ap[2]
+    d2 = ac[0] * ap[0] + ac[1] * ap[1] + ac[2] * ap[2]
+    if d1 <= 0 and d2 <= 0:
+        return a
+    bp = p[0] - b[0], p[1] - b[1], p[2] - b[2]
+    d3 = ab[0] * bp[0] + ab[1] * bp[1] + ab[2] * bp[2]
+    d4 = ac[0] * bp[0] + ac[1] * bp[1] + ac[2] * bp[2]
+    if d3 >= 0 and d4 <= d3:
+        return b
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        v = d1 / (d1 - d3)
+        return a[0] + v * ab[0], a[1] + v * ab[1], a[2] + v * ab[2]
+    cp = p[0] - c[0], p[1] - c[1], p[2] - c[2]
+    d5 = ab[0] * cp[0] + ab[1] * cp[1] + ab[2] * cp[2]
+    d6 = ac[0] * cp[0] + ac[1] * cp[1] + ac[2] * cp[2]
+    if d6 >= 0 and d5 <= d6:
+        return c
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        w = d2 / (d2 - d6)
+        return a[0] + w * ac[0], a[1] + w * ac[1], a[2] + w * ac[2]
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and d4 - d3 >= 0 and d5 - d6 >= 0:
+        w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        return b[0] + w * (c[0] - b[0]), b[1] + w * (c[1] - b[1]), b[2] + w * (c[2] - b[2])
+    denom = va + vb + vc
+    if not denom:
+        return a
+    v = vb / denom
+    w = vc / denom
+    return a[0] + v * ab[0] + w * ac[0], a[1] + v * ab[1] + w * ac[1], a[2] + v * ab[2] + w * ac[2]
@@ -0,0 +1,373 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+
+from numpy import arange
+from numpy import argpartition
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import einsum
+from numpy import errstate
+from numpy import float64
+from numpy import frombuffer
+from numpy import full
+from numpy import inf
+from numpy import int64
+from numpy import lexsort
+from numpy import maximum
+from numpy import minimum
+from numpy import sqrt
+from numpy import where
+from numpy import zeros
+
+from .kdtree_numpy import _expand
+
+
+def bvh_build_numpy(triangles, leafsize):
+    """Build the flat arrays of a bounding volume hierarchy with median partitioning.
+
+    Parameters
+    ----------
+    triangles : array_like[float]
+        The XYZ coordinates of the corners of the triangles, as an ``(N, 9)`` array.
+    leafsize : int
+        The maximum number of triangles in a leaf.
+
+    Returns
+    -------
+    list[int]
+        The order of the triangles in the hierarchy.
+    array.array
+        The interleaved coordinates of the triangles, in the order of the hierarchy.
+    array.array
+        The bounding boxes of the children of the nodes, stored at the index of the median.
+    list[float]
+        The bounding box of all triangles.
+
+    """
+    xyz = asarray(triangles, dtype=float64).reshape((-1, 9))
+    n = len(xyz)
+    corners = xyz.reshape((-1, 3, 3))
+    order = arange(n)
+    nodes = []
+    stack = [(0, n, corners.mean(axis=1))]
+    while stack:
+        lo, hi, centroids = stack.pop()
+        if hi - lo <= leafsize:
+            continue
+        axis = int((centroids.max(axis=0) - centroids.min(axis=0)).argmax())
+        mid = (lo + hi) // 2
+        partition = argpartition(centroids[:, axis], mid - lo)
+        centroids = centroids[partition]
+        order[lo:hi] = order[lo:hi][partition]
+        nodes.append((lo, mid, hi))
+        stack.append((lo, mid, centroids[: mid - lo]))
+        stack.append((mid, hi, centroids[mid - lo :]))
+    # the boxes of the children of all nodes at once
+    # with a row appended to the boxes of the triangles such that the upper end of a range is a valid index
+    lower = concatenate((corners.min(axis=1)[order], zeros((1, 3))))
+    upper = concatenate((corners.max(axis=1)[order], zeros((1, 3))))
+    bounds = zeros((n, 12))
+    if nodes:
+        nodes = asarray(nodes, dtype=int64)
+        mid = nodes[:, 1]
+        ranges = nodes[:, [0, 1, 1, 2]].ravel()
+        bounds[mid, 0:3] = minimum.reduceat(lower, ranges)[0::4]
+        bounds[mid, 3:6] = maximum.reduceat(upper, ranges)[0::4]
+        bounds[mid, 6:9] = minimum.reduceat(lower, ranges)[2::4]
+        bounds[mid, 9:12] = maximum.reduceat(upper, ranges)[2::4]
+    root = lower[:-1].min(axis=0).tolist() + upper[:-1].max(axis=0).tolist()
+    return order.tolist(), array("d", xyz[order].tobytes()), array("d", bounds.tobytes()), root
+
+
+def bvh_intersect_rays_numpy(xyz, bounds, root, leafsize, origins, directions, first=False, chunksize=1024):
+    """Intersect many rays with the triangles of a bounding volume hierarchy at once.
+
+    Parameters
+    ----------
+    xyz : array.array
+        The interleaved coordinates of the triangles, in the order of the hierarchy.
+    bounds : array.array
+        The bounding boxes of the children of the nodes of the hierarchy.
+    root : list[float]
+        The bounding box of all triangles.
+    leafsize : int
+        The maximum number of triangles in a leaf of the hierarchy.
+    origins : array_like[float]
+        The XYZ coordinates of the origins of the rays.
+    directions : array_like[float]
+        The direction vectors of the rays.
+    first : bool, optional
+        If True, only compute the intersection closest to the origin of every ray.
+    chunksize : int, optional
+        The number of rays processed at once.
+
+    Returns
+    -------
+    list[list[tuple[float, int, float, float]]]
+        Per ray, the distance to the intersection, the index of the triangle in the hierarchy,
+        and the barycentric coordinates of the intersection in the triangle, sorted by distance.
+
+    """
+    triangles = frombuffer(xyz, dtype=float64).reshape((-1, 9))
+    bounds = frombuffer(bounds, dtype=float64).reshape((-1, 12))
+    root = asarray(root, dtype=float64)
+    origins = asarray(origins, dtype=float64).reshape((-1, 3))
+    directions = asarray(directions, dtype=float64).reshape((-1, 3))
+    lengths = sqrt((directions**2).sum(axis=1))
+    directions = directions / where(lengths > 0, lengths, 1.0)[:, None]
+    found = []
+    for start in range(0, len(origins), chunksize):
+        stop = start + chunksize
+        found += _intersect(
+            triangles, bounds, root, leafsize, origins[start:stop], directions[start:stop], lengths[start:stop], first
+        )
+    return found
+
+
+def bvh_closest_points_numpy(xyz, bounds, root, leafsize, points, chunksize=4096):
+    """Compute the closest points on the triangles of a bounding volume hierarchy to many points at once.
+
+    Parameters
+    ----------
+    xyz : array.array
+        The interleaved coordinates of the triangles, in the order of the hierarchy.
+    bounds : array.array
+        The bounding boxes of the children of the nodes of the hierarchy.
+    root : list[float]
+        The bounding box of all triangles.
+    leafsize : int
+        The maximum number of triangles in a leaf of the hierarchy.
+    points : array_like[float]
+        The XYZ coordinates of the query points.
+    chunksize : int, optional
+        The number of query points processed at once.
+
+    Returns
+    -------
+    list[[float, float, float]]
+        The XYZ coordinates of the closest points.
+    list[int]
+        The indices in the hierarchy of the triangles on which the closest points lie.
+    list[float]
+        The squared distances to the query points.
+
+    """
+    triangles = frombuffer(xyz, dtype=float64).reshape((-1, 9))
+    bounds = frombuffer(bounds, dtype=float64).reshape((-1, 12))
+    points = asarray(points, dtype=float64).reshape((-1, 3))
+    closest = []
+    indices = []
+    distances = []
+    for start in range(0, len(points), chunksize):
+        c, i, d2 = _closest(triangles, bounds, leafsize, points[start : start + chunksize])
+        closest += c.tolist()
+        indices += i.tolist()
+        distances += d2.tolist()
+    return closest, indices, distances
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _slab(boxes, o, d):
+    # the entry distances of rays into boxes, and whether the rays hit the boxes
+    with errstate(divide="ignore", invalid="ignore"):
+        inv = 1.0 / d
+        t0 = (boxes[:, :3] - o) * inv
+        t1 = (boxes[:, 3:] - o) * inv
+    parallel = d == 0
+    inside = (o >= boxes[:, :3]) & (o <= boxes[:, 3:])
+    tmin = where(parallel, where(inside, -inf, inf), minimum(t0, t1))
+    tmax = where(parallel, where(inside, inf, -inf), maximum(t0, t1))
+    tnear = maximum(tmin.max(axis=1), 0.0)
+    tfar = tmax.min(axis=1)
+    return tnear, tnear <= tfar
+
+
+def _intersect(triangles, bounds, root, leafsize, origins, directions, lengths, first):
+    n = len(triangles)
+    q = len(origins)
+
+    _, hit = _slab(root[None, :], origins, directions)
+    frontier_q = arange(q)[hit & (lengths > 0)]
+    frontier_lo = zeros(len(frontier_q), dtype=int64)
+    frontier_hi = full(len(frontier_q), n, dtype=int64)
+    leaves_q = []
+    leaves_lo = []
+    leaves_hi = []
+    while len(frontier_q):
+        leaf = frontier_hi - frontier_lo <= leafsize
+        leaves_q.append(frontier_q[leaf])
+        leaves_lo.append(frontier_lo[leaf])
+        leaves_hi.append(frontier_hi[leaf])
+        fq = frontier_q[~leaf]
+        flo = frontier_lo[~leaf]
+        fhi = frontier_hi[~leaf]
+        mid = (flo + fhi) // 2
+        o = origins[fq]
+        d = directions[fq]
+        _, left = _slab(bounds[mid, :6], o, d)
+        _, right = _slab(bounds[mid, 6:], o, d)
+        frontier_q = concatenate((fq[left], fq[right]))
+        frontier_lo = concatenate((flo[left], mid[right]))
+        frontier_hi = concatenate((mid[left], fhi[right]))
+
+    if not leaves_q:
+        return [[] for _ in range(q)]
+
+    qq, ii = _expand(concatenate(leaves_q), concatenate(leaves_lo), concatenate(leaves_hi))
+
+    # Moller-Trumbore
+    t = triangles[ii]
+    a = t[:, 0:3]
+    e1 = t[:, 3:6] - a
+    e2 = t[:, 6:9] - a
+    d = directions[qq]
+    p = cross(d, e2)
+    det = einsum("ij,ij->i", e1, p)
+    with errstate(divide="ignore", invalid="ignore"):
+        inv = 1.0 / det
+        s = origins[qq] - a
+        u = einsum("ij,ij->i", s, p) * inv
+        c = cross(s, e1)
+        v = einsum("ij,ij->i", d, c) * inv
+        t = einsum("ij,ij->i", e2, c) * inv
+        valid = (det != 0) & (u >= 0) & (u <= 1) & (v >= 0) & (u + v <= 1) & (t >= 0)
+    qq = qq[valid]
+    ii = ii[valid]
+    u = u[valid]
+    v = v[valid]
+    t = t[valid]
+
+    order = lexsort((ii, t, qq))
+    qq = qq[order]
+    ii = ii[order]
+    u = u[order]
+    v = v[order]
+    t = t[order]
+    if first:
+        keep = concatenate(([True], qq[1:] != qq[:-1]))
+        qq = qq[keep]
+        ii = ii[keep]
+        u = u[keep]
+        v = v[keep]
+        t = t[keep]
+
+    offsets = concatenate(([0], cumsum(bincount(qq, minlength=q)))).tolist()
+    hits = list(zip(t.tolist(), ii.tolist(), u.tolist(), v.tolist()))
+    return [hits[i:j] for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+def _box_distance_sqrd(boxes, p):
+    return (maximum(maximum(boxes[:, :3] - p, p - boxes[:, 3:]), 0.0) ** 2).sum(axis=1)
+
+
+def _closest(triangles, bounds, leafsize, points):
+    n = len(triangles)
+    q = len(points)
+
+    # find an initial bound on the distance
+    # from the triangles in the leaf reached by descending into the closest child
+    lo = zeros(q, dtype=int64)
+    hi = full(q, n, dtype=int64)
+    while True:
+        active = hi - lo > leafsize
+        if not active.any():
+            break
+        aq = arange(q)[active]
+        mid = (lo[active] + hi[active]) // 2
+        p = points[aq]
+        left = _box_distance_sqrd(bounds[mid, :6], p) <= _box_distance_sqrd(bounds[mid, 6:], p)
+        hi[aq[left]] = mid[left]
+        lo[aq[~left]] = mid[~left]
+    qq, ii = _expand(arange(q), lo, hi)
+    _, d2 = _closest_points_on_triangles(points[qq], triangles[ii])
+    bound = full(q, inf)
+    minimum.at(bound, qq, d2)
+
+    # traverse the hierarchy for all query points simultaneously
+    # and collect the leaves that are closer than the bound
+    frontier_q = arange(q)
+    frontier_lo = zeros(q, dtype=int64)
+    frontier_hi = full(q, n, dtype=int64)
+    leaves_q = []
+    leaves_lo = []
+    leaves_hi = []
+    while len(frontier_q):
+        leaf = frontier_hi - frontier_lo <= leafsize
+        leaves_q.append(frontier_q[leaf])
+        leaves_lo.append(frontier_lo[leaf])
+        leaves_hi.append(frontier_hi[leaf])
+        fq = frontier_q[~leaf]
+        flo = frontier_lo[~leaf]
+        fhi = frontier_hi[~leaf]
+        mid = (flo + fhi) // 2
+        p = points[fq]
+        left = _box_distance_sqrd(bounds[mid, :6], p) <= bound[fq]
+        right = _box_distance_sqrd(bounds[mid, 6:], p) <= bound[fq]
+        frontier_q = concatenate((fq[left], fq[right]))
+        frontier_lo = concatenate((flo[left], mid[right]))
+        frontier_hi = concatenate((mid[left], fhi[right]))
+
+    qq, ii = _expand(concatenate(leaves_q), concatenate(leaves_lo), concatenate(leaves_hi))
+    closest, d2 = _closest_points_on_triangles(points[qq], triangles[ii])
+    order = lexsort((ii, d2, qq))
+    first = order[concatenate(([True], qq[order][1:] != qq[order][:-1]))]
+    return closest[first], ii[first], d2[first]
+
+
+def _closest_points_on_triangles(p, triangles):
+    # Ericson, Real-Time Collision Detection, 5.1.5
+    # the barycentric coordinates are set per region, from the lowest to the highest priority
+    a = triangles[:, 0:3]
+    b = triangles[:, 3:6]
+    c = triangles[:, 6:9]
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    bp = p - b
+    cp = p - c
+    d1 = einsum("ij,ij->i", ab, ap)
+    d2 = einsum("ij,ij->i", ac, ap)
+    d3 = einsum("ij,ij->i", ab, bp)
+    d4 = einsum("ij,ij->i", ac, bp)
+    d5 = einsum("ij,ij->i", ab, cp)
+    d6 = einsum("ij,ij->i", ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+    with errstate(divide="ignore", invalid="ignore"):
+        denom = va + vb + vc
+        v = where(denom != 0, vb / denom, 0.0)
+        w = where(denom != 0, vc / denom, 0.0)
+        region = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        x = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        v = where(region, 1 - x, v)
+        w = where(region, x, w)
+        region = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        x = d2 / (d2 - d6)
+        v = where(region, 0.0, v)
+        w = where(region, x, w)
+        region = (d6 >= 0) & (d5 <= d6)
+        v = where(region, 0.0, v)
+        w = where(region, 1.0, w)
+        region = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        x = d1 / (d1 - d3)
+        v = where(region, x, v)
+        w = where(region, 0.0, w)
+        region = (d3 >= 0) & (d4 <= d3)
+        v = where(region, 1.0, v)
+        w = where(region, 0.0, w)
+        region = (d1 <= 0) & (d2 <= 0)
+        v = where(region, 0.0, v)
+        w = where(region, 0.0, w)
+    closest = a + v[:, None] * ab + w[:, None] * ac
+    return closest, ((closest - p) ** 2).sum(axis=1)
@@ -102,7 +102,7 @@ def centroid_points(points):
 
     Parameters
     ----------
-    points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+    points : sequence[[float, float, float] | :class:`~compas.geometry.Point`] | :class:`~compas.geometry.PointArray`
         A sequence of XYZ coordinates.
 
     Returns
@@ -121,6 +121,13 @@ def centroid_points(points):
     >>> centroid_points(points)
     [0.5, 0.5, 0.0]
     """
+    if not isinstance(points, (list, tuple)):
+        from compas.geometry.pointarray import PointArray
+
+        if isinstance(points, PointArray):
+            xyz = points.buffer
+            p = len(points)
+            return [sum(xyz[0::3]) / p, sum(xyz[1::3]) / p, sum(xyz[2::3]) / p]
     p = len(points)
     x, y, z = zip(*points)
     return [sum(x) / p, sum(y) / p, sum(z) / p]
@@ -2,12 +2,12 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-import collections
+from array import array
+from heapq import heappush
+from heapq import heapreplace
+from math import sqrt
 
-from .distance import distance_point_point_sqrd
-
-
-Node = collections.namedtuple("Node", "point axis label left right")
+import compas
 
 
 class KDTree(object):
@@ -19,15 +19,29 @@ class KDTree(object):
         A list of objects to populate the tree with.
         If objects are provided, the tree is built automatically.
         Otherwise, use :meth:`build`.
+    leafsize : int, optional
+        The maximum number of points in a leaf of the tree.
+    use_numpy : bool, optional
+        If True, build and query the tree with NumPy.
+        Default is to use NumPy if it is available.
 
     Attributes
     ----------
-    root : Node
-        The root node of the built tree.
-        This is the median with respect to the different dimensions of the tree.
+    leafsize : int
+        The maximum number of points in a leaf of the tree.
+    use_numpy : bool
+        True if the tree is built and queried with NumPy.
 
     Notes
     -----
+    The tree is stored in flat arrays.
+    The points are reordered such that every node of the tree corresponds to a contiguous range of points,
+    which is split at the median along the axis with the largest extent of the points in the range.
+    The split axis and split value of a node are stored at the index of the median.
+
+    The queries for many points at once (:meth:`nearest_neighbors_bulk`, :meth:`radius_neighbors_bulk`)
+    process all points simultaneously if NumPy is used.
+
     For more info, see [1]_ and [2]_.
 
     References
@@ -39,46 +53,161 @@ class KDTree(object):
 
     Examples
     --------
-    >>>
+    >>> from compas.geometry import KDTree
+    >>> tree = KDTree([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]])
+    >>> xyz, label, distance = tree.nearest_neighbor([0.9, 0.8, 0.0])
+    >>> label
+    3
+    >>> [label for xyz, label, distance in tree.radius_neighbors([0, 0, 0], 1.0)]
+    [0, 1, 2]
 
     """
 
-    def __init__(self, objects=None):
-        self.root = None
+    def __init__(self, objects=None, leafsize=16, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = not compas.IPY and _has_numpy()
+        self.leafsize = max(1, int(leafsize))
+        self.use_numpy = use_numpy
+        self._objects = []
+        self._labels = []
+        self._xyz = array("d")
+        self._axis = array("b")
+        self._split = array("d")
         if objects:
-            self.root = self.build([(o, i) for i, o in enumerate(objects)])
+            self.build([(o, i) for i, o in enumerate(objects)])
+
+    def __len__(self):
+        return len(self._objects)
 
-    def build(self, objects, axis=0):
+    def build(self, objects):
         """Populate a kd-tree with given objects.
 
         Parameters
         ----------
         objects : sequence[tuple[[float, float, float] | :class:`~compas.geometry.Point`, int or str]]
             The tree objects as a sequence of point-label tuples.
-        axis : int, optional
-            The axis along which to build.
 
         Returns
         -------
-        Node or None
-            The root node, or None if the sequence of objects is empty.
+        None
 
         """
+        objects = list(objects)
         if not objects:
+            self._objects = []
+            self._labels = []
+            self._xyz = array("d")
+            self._axis = array("b")
+            self._split = array("d")
             return
-
-        objects.sort(key=lambda o: o[0][axis])
-        median_idx = len(objects) // 2
-        median_point, median_label = objects[median_idx]
-        next_axis = (axis + 1) % 3
-
-        return Node(
-            median_point,
-            axis,
-            median_label,
-            self.build(objects[:median_idx], next_axis),
-            self.build(objects[median_idx + 1 :], next_axis),
-        )
+        if self.use_numpy:
+            from .kdtree_numpy import kdtree_build_numpy
+
+            order, xyz, axis, split = kdtree_build_numpy([o[0] for o in objects], self.leafsize)
+        else:
+            order, xyz, axis, split = self._build([o[0] for o in objects])
+        self._objects = [objects[i][0] for i in order]
+        self._labels = [objects[i][1] for i in order]
+        self._xyz = xyz
+        self._axis = axis
+        self._split = split
+
+    def _build(self, points):
+        # the points are sorted once along every axis
+        # every node is split at the median of its range in the order of the split axis,
+        # and the ranges in the orders of the other axes are split stably,
+        # such that the ranges of the child nodes remain sorted along every axis
+        n = len(points)
+        coords = [[point[axis] for point in points] for axis in range(3)]
+        orders = [sorted(range(n), key=c.__getitem__) for c in coords]
+        left = bytearray(n)
+        axes = array("b", [-1]) * n
+        split = array("d", [0.0]) * n
+        stack = [(0, n)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= self.leafsize:
+                continue
+            extents = [c[o[hi - 1]] - c[o[lo]] for c, o in zip(coords, orders)]
+            axis = extents.index(max(extents))
+            order = orders[axis]
+            mid = (lo + hi) // 2
+            for i in order[lo:mid]:
+                left[i] = 1
+            for i in order[mid:hi]:
+                left[i] = 0
+            for other in orders:
+                if other is not order:
+                    items = other[lo:hi]
+                    other[lo:hi] = [i for i in items if left[i]] + [i for i in items if not left[i]]
+            axes[mid] = axis
+            split[mid] = coords[axis][order[mid]]
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+        order = orders[0]
+        xyz = array("d")
+        for i in order:
+            xyz.extend((coords[0][i], coords[1][i], coords[2][i]))
+        return order, xyz, axes, split
+
+    def _search(self, point, number=None, radius=None, exclude=None):
+        # returns the squared distances and positions of the found points
+        # sorted by distance
+        n = len(self._objects)
+        if not n:
+            return []
+        xyz = self._xyz
+        axes = self._axis
+        split = self._split
+        labels = self._labels
+        leafsize = self.leafsize
+        px, py, pz = point[0], point[1], point[2]
+        p = (px, py, pz)
+        bound = float("inf") if radius is None else radius ** 2
+        heap = []
+        found = []
+        stack = [(0, n, 0.0)]
+        while stack:
+            lo, hi, d2min = stack.pop()
+            if d2min > bound:
+                continue
+            if hi - lo > leafsize:
+                mid = (lo + hi) // 2
+                d = p[axes[mid]] - split[mid]
+                if d < 0:
+                    stack.append((mid, hi, d * d))
+                    stack.append((lo, mid, d2min))
+                else:
+                    stack.append((lo, mid, d * d))
+                    stack.append((mid, hi, d2min))
+                continue
+            for i in range(lo, hi):
+                j = 3 * i
+                dx = xyz[j] - px
+                dy = xyz[j + 1] - py
+                dz = xyz[j + 2] - pz
+                d2 = dx * dx + dy * dy + dz * dz
+                if d2 > bound:
+                    continue
+                if exclude and labels[i] in exclude:
+                    continue
+                if number is None:
+                    found.append((d2, i))
+                elif len(heap) < number:
+                    heappush(heap, (-d2, -i))
+                    if len(heap) == number:
+                        bound = -heap[0][0]
+                elif d2 < bound or i < -heap[0][1]:
+                    # ties are resolved in favour of the lowest index
+                    heapreplace(heap, (-d2, -i))
+                    bound = -heap[0][0]
+        if number is not None:
+            found = [(-d2, -i) for d2, i in heap]
+        found.sort()
+        return found
+
+    def _result(self, found):
+        return [[self._objects[i], self._labels[i], sqrt(d2)] for d2, i in found]
 
     def nearest_neighbor(self, point, exclude=None):
         """Find the nearest neighbor to a given point,
@@ -99,31 +228,10 @@ class KDTree(object):
             Distance to the base point.
 
         """
-
-        def search(node):
-            if node is None:
-                return
-
-            d2 = distance_point_point_sqrd(point, node.point)
-            if d2 < best[2]:
-                if node.label not in exclude:
-                    best[:] = node.point, node.label, d2
-
-            d = point[node.axis] - node.point[node.axis]
-            if d <= 0:
-                close, far = node.left, node.right
-            else:
-                close, far = node.right, node.left
-
-            search(close)
-            if d**2 < best[2]:
-                search(far)
-
-        exclude = set(exclude or [])
-        best = [None, None, float("inf")]
-        search(self.root)
-        best[2] **= 0.5
-        return best
+        found = self._search(point, number=1, exclude=set(exclude or []))
+        if not found:
+            return [None, None, float("inf")]
+        return self._result(found)[0]
 
     def nearest_neighbors(self, point, number, distance_sort=False):
         """Find the N nearest neighbors to a given point.
@@ -136,6 +244,8 @@ class KDTree(object):
             The number of nearest neighbors.
         distance_sort : bool, optional
             Sort the nearest neighbors by distance to the base point.
+            The neighbors are always sorted by distance.
+            This parameter is only kept for backwards compatibility.
 
         Returns
         -------
@@ -143,12 +253,103 @@ class KDTree(object):
             A list of N nearest neighbors.
 
         """
-        nnbrs = []
-        exclude = set()
-        for i in range(number):
-            nnbr = self.nearest_neighbor(point, exclude)
-            nnbrs.append(nnbr)
-            exclude.add(nnbr[1])
-        if distance_sort:
-            return sorted(nnbrs, key=lambda nnbr: nnbr[2])
-        return nnbrs
+        return self._result(self._search(point, number=number))
+
+    def radius_neighbors(self, point, radius, distance_sort=True):
+        """Find all neighbors within a distance from a given point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`~compas.geometry.Point`
+            XYZ coordinates of the base point.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            If False, the neighbors are returned in the order of the tree.
+
+        Returns
+        -------
+        list[[[float, float, float], int or str, float]]
+            The neighbors with a distance to the base point smaller than or equal to the radius.
+
+        """
+        found = self._search(point, radius=radius)
+        if not distance_sort:
+            found.sort(key=lambda item: item[1])
+        return self._result(found)
+
+    def nearest_neighbors_bulk(self, points, number=1):
+        """Find the N nearest neighbors of many points at once.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            XYZ coordinates of the base points.
+        number : int, optional
+            The number of nearest neighbors per point.
+
+        Returns
+        -------
+        list[list[int or str]]
+            The labels of the nearest neighbors per point, sorted by distance.
+        list[list[float]]
+            The distances to the nearest neighbors per point.
+
+        Examples
+        --------
+        >>> from compas.geometry import KDTree
+        >>> tree = KDTree([[0, 0, 0], [1, 0, 0], [3, 0, 0]])
+        >>> labels, distances = tree.nearest_neighbors_bulk([[0.1, 0, 0], [2.9, 0, 0]], 2)
+        >>> labels
+        [[0, 1], [2, 1]]
+
+        """
+        number = min(number, len(self._objects))
+        if self.use_numpy:
+            from .kdtree_numpy import kdtree_search_numpy
+
+            found = kdtree_search_numpy(self._xyz, self._axis, self._split, self.leafsize, points, number=number)
+        else:
+            found = [self._search(point, number=number) for point in points]
+        return self._bulk_result(found)
+
+    def radius_neighbors_bulk(self, points, radius):
+        """Find all neighbors within a distance of many points at once.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`~compas.geometry.Point`]
+            XYZ coordinates of the base points.
+        radius : float
+            The search radius.
+
+        Returns
+        -------
+        list[list[int or str]]
+            The labels of the neighbors per point, sorted by distance.
+        list[list[float]]
+            The distances to the neighbors per point.
+
+        """
+        if self.use_numpy:
+            from .kdtree_numpy import kdtree_search_numpy
+
+            found = kdtree_search_numpy(self._xyz, self._axis, self._split, self.leafsize, points, radius=radius)
+        else:
+            found = [self._search(point, radius=radius) for point in points]
+        return self._bulk_result(found)
+
+    def _bulk_result(self, found):
+        labels = self._labels
+        return (
+            [[labels[i] for _, i in items] for items in found],
+            [[sqrt(d2) for d2, _ in items] for items in found],
+        )
+
+
+def _has_numpy():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
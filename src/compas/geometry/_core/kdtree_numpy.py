@@ -0,0 +1,207 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+
+from numpy import arange
+from numpy import argpartition
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import empty
+from numpy import float64
+from numpy import frombuffer
+from numpy import full
+from numpy import int8
+from numpy import int64
+from numpy import lexsort
+from numpy import maximum
+from numpy import minimum
+from numpy import repeat
+from numpy import where
+from numpy import zeros
+
+
+def kdtree_build_numpy(points, leafsize):
+    """Build the flat arrays of a kd-tree with median partitioning.
+
+    Parameters
+    ----------
+    points : array_like[float]
+        The XYZ coordinates of the points, as a ``(N, 3)`` array.
+    leafsize : int
+        The maximum number of points in a leaf.
+
+    Returns
+    -------
+    list[int]
+        The order of the points in the tree.
+    array.array
+        The interleaved XYZ coordinates of the points, in the order of the tree.
+    array.array
+        The split axis of the nodes, stored at the index of the median.
+    array.array
+        The split value of the nodes, stored at the index of the median.
+
+    """
+    xyz = asarray(points, dtype=float64).reshape((-1, 3))
+    n = len(xyz)
+    order = arange(n)
+    axes = full(n, -1, dtype=int8)
+    split = zeros(n)
+    stack = [(0, n, xyz)]
+    while stack:
+        lo, hi, block = stack.pop()
+        if hi - lo <= leafsize:
+            continue
+        axis = int((block.max(axis=0) - block.min(axis=0)).argmax())
+        mid = (lo + hi) // 2
+        partition = argpartition(block[:, axis], mid - lo)
+        block = block[partition]
+        order[lo:hi] = order[lo:hi][partition]
+        axes[mid] = axis
+        split[mid] = block[mid - lo, axis]
+        stack.append((lo, mid, block[: mid - lo]))
+        stack.append((mid, hi, block[mid - lo :]))
+    return order.tolist(), array("d", xyz[order].tobytes()), array("b", axes.tobytes()), array("d", split.tobytes())
+
+
+def kdtree_search_numpy(xyz, axes, split, leafsize, points, number=None, radius=None, chunksize=4096):
+    """Search a kd-tree for the nearest neighbors of many points at once.
+
+    Parameters
+    ----------
+    xyz : array.array
+        The interleaved XYZ coordinates of the points of the tree, in the order of the tree.
+    axes : array.array
+        The split axis of the nodes of the tree.
+    split : array.array
+        The split value of the nodes of the tree.
+    leafsize : int
+        The maximum number of points in a leaf of the tree.
+    points : array_like[float]
+        The XYZ coordinates of the query points.
+    number : int, optional
+        The number of nearest neighbors per point.
+    radius : float, optional
+        The search radius.
+        If no number is provided, all neighbors within the radius are found.
+    chunksize : int, optional
+        The number of query points processed at once.
+
+    Returns
+    -------
+    list[list[tuple[float, int]]]
+        Per query point, the squared distances and the tree indices of the neighbors,
+        sorted by distance.
+
+    """
+    tree = frombuffer(xyz, dtype=float64).reshape((-1, 3))
+    axes = frombuffer(axes, dtype=int8).astype(int64)
+    split = frombuffer(split, dtype=float64)
+    points = asarray(points, dtype=float64).reshape((-1, 3))
+    found = []
+    for start in range(0, len(points), chunksize):
+        found += _search(tree, axes, split, leafsize, points[start : start + chunksize], number, radius)
+    return found
+
+
+def _search(tree, axes, split, leafsize, points, number, radius):
+    n = len(tree)
+    q = len(points)
+    if not n or not q or number == 0:
+        return [[] for _ in range(q)]
+
+    bound = full(q, float("inf") if radius is None else radius ** 2)
+
+    if number is not None:
+        # find an initial search radius
+        # from the points in the smallest node around each query point
+        # that contains at least the requested number of points
+        lo = zeros(q, dtype=int64)
+        hi = full(q, n, dtype=int64)
+        while True:
+            mid = (lo + hi) // 2
+            d = points[arange(q), axes[mid] % 3] - split[mid]
+            left = d < 0
+            size = where(left, mid - lo, hi - mid)
+            active = (hi - lo > leafsize) & (size >= number)
+            if not active.any():
+                break
+            hi = where(active & left, mid, hi)
+            lo = where(active & ~left, mid, lo)
+        qq, ii = _expand(arange(q), lo, hi)
+        d2 = ((tree[ii] - points[qq]) ** 2).sum(axis=1)
+        qq, d2, _ = _smallest(qq, d2, ii, number)
+        last = concatenate((qq[1:] != qq[:-1], [True]))
+        kth = empty(q)
+        kth[qq[last]] = d2[last]
+        bound = minimum(bound, kth)
+
+    # traverse the tree for all query points simultaneously
+    # and collect the leaves that intersect the search sphere
+    frontier_q = arange(q)
+    frontier_lo = zeros(q, dtype=int64)
+    frontier_hi = full(q, n, dtype=int64)
+    leaves_q = []
+    leaves_lo = []
+    leaves_hi = []
+    while len(frontier_q):
+        leaf = frontier_hi - frontier_lo <= leafsize
+        leaves_q.append(frontier_q[leaf])
+        leaves_lo.append(frontier_lo[leaf])
+        leaves_hi.append(frontier_hi[leaf])
+        fq = frontier_q[~leaf]
+        flo = frontier_lo[~leaf]
+        fhi = frontier_hi[~leaf]
+        mid = (flo + fhi) // 2
+        d = points[fq, axes[mid]] - split[mid]
+        keep_left = (d < 0) | (d * d <= bound[fq])
+        keep_right = (d >= 0) | (d * d <= bound[fq])
+        frontier_q = concatenate((fq[keep_left], fq[keep_right]))
+        frontier_lo = concatenate((flo[keep_left], mid[keep_right]))
+        frontier_hi = concatenate((mid[keep_left], fhi[keep_right]))
+
+    qq, ii = _expand(concatenate(leaves_q), concatenate(leaves_lo), concatenate(leaves_hi))
+    d2 = ((tree[ii] - points[qq]) ** 2).sum(axis=1)
+    inside = d2 <= bound[qq]
+    qq = qq[inside]
+    ii = ii[inside]
+    d2 = d2[inside]
+
+    if number is not None:
+        qq, d2, ii = _smallest(qq, d2, ii, number)
+    else:
+        order = lexsort((ii, d2, qq))
+        qq = qq[order]
+        d2 = d2[order]
+        ii = ii[order]
+
+    offsets = concatenate(([0], cumsum(bincount(qq, minlength=q)))).tolist()
+    d2 = d2.tolist()
+    ii = ii.tolist()
+    return [list(zip(d2[i:j], ii[i:j])) for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+def _expand(q, lo, hi):
+    # all pairs of query points and tree indices in the given ranges
+    sizes = hi - lo
+    total = sizes.sum()
+    qq = repeat(q, sizes)
+    starts = repeat(lo - (cumsum(sizes) - sizes), sizes)
+    return qq, starts + arange(total)
+
+
+def _smallest(qq, d2, ii, number):
+    # the `number` smallest distances per query point, sorted by query point and distance
+    order = lexsort((ii, d2, qq))
+    qq = qq[order]
+    d2 = d2[order]
+    ii = ii[order]
+    index = arange(len(qq))
+    first = concatenate(([True], qq[1:] != qq[:-1]))
+    rank = index - maximum.accumulate(where(first, index, 0))
+    keep = rank < number
+    return qq[keep], d2[keep], ii[keep]
@@ -3,6 +3,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 import math
+from array import array
 
 from ._algebra import scale_vector
 from ._algebra import scale_vector_xy
@@ -16,8 +17,6 @@ from ._algebra import cross_vectors
 from ._algebra import vector_component
 from ._algebra import vector_component_xy
 from ._algebra import multiply_matrix_vector
-from ._algebra import multiply_matrices
-from ._algebra import transpose_matrix
 from ._algebra import norm_vector
 from .angles import angle_vectors
 from .distance import closest_point_on_plane
@@ -202,8 +201,9 @@ def transform_points(points, T):
 
     Returns
     -------
-    list[[float, float, float]]
+    list[[float, float, float]] | :class:`~compas.geometry.PointArray`
         Transformed points.
+        If the points are a :class:`~compas.geometry.PointArray`, a transformed copy of the array.
 
     Examples
     --------
@@ -212,7 +212,14 @@ def transform_points(points, T):
     >>> points_transformed = transform_points(points, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(T)))
+    from compas.geometry.pointarray import PointArray
+
+    if isinstance(points, PointArray):
+        return points.transformed(T)
+    # the points are transformed in a flat buffer of coordinates by the shared kernel
+    points = PointArray(points)
+    points.transform(T)
+    return points.tolist()
 
 
 def transform_vectors(vectors, T):
@@ -227,8 +234,9 @@ def transform_vectors(vectors, T):
 
     Returns
     -------
-    list[[float, float, float]]
+    list[[float, float, float]] | :class:`~compas.geometry.VectorArray`
         Transformed vectors.
+        If the vectors are a :class:`~compas.geometry.VectorArray`, a transformed copy of the array.
 
     Examples
     --------
@@ -237,7 +245,13 @@ def transform_vectors(vectors, T):
     >>> vectors_transformed = transform_vectors(vectors, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(vectors, w=0.0), transpose_matrix(T)))
+    from compas.geometry.pointarray import VectorArray
+
+    if isinstance(vectors, VectorArray):
+        return vectors.transformed(T)
+    vectors = VectorArray(vectors)
+    vectors.transform(T)
+    return vectors.tolist()
 
 
 def transform_frames(frames, T):
@@ -263,8 +277,92 @@ def transform_frames(frames, T):
     >>> transformed_frames = transform_frames(frames, T)
 
     """
-    points_and_vectors = homogenize_and_flatten_frames(frames)
-    return dehomogenize_and_unflatten_frames(multiply_matrices(points_and_vectors, transpose_matrix(T)))
+    from compas.geometry.pointarray import transform_coordinates
+
+    values = array("d", [value for frame in frames for item in frame for value in item])
+    if len(values) % 9:
+        raise ValueError("Expected a point and two vectors per frame.")
+    transform_coordinates(values, T, 9, 0, 1.0)
+    transform_coordinates(values, T, 9, 3, 0.0)
+    transform_coordinates(values, T, 9, 6, 0.0)
+    return [
+        [
+            values[start : start + 3].tolist(),
+            values[start + 3 : start + 6].tolist(),
+            values[start + 6 : start + 9].tolist(),
+        ]
+        for start in range(0, len(values), 9)
+    ]
+
+
+def transform_objects(objects, transformations):
+    """Transform multiple objects, each with its own transformation, in a single batch.
+
+    Parameters
+    ----------
+    objects : sequence[:class:`~compas.geometry.Geometry` | :class:`~compas.datastructures.Datastructure`]
+        The objects.
+    transformations : sequence[list[list[float]] | :class:`~compas.geometry.Transformation`]
+        The transformations, one per object.
+
+    Returns
+    -------
+    None
+        The objects are modified in place.
+
+    Raises
+    ------
+    ValueError
+        If the number of transformations is not the same as the number of objects.
+
+    Notes
+    -----
+    The coordinates of meshes, volmeshes, networks, point clouds and point arrays are collected in a single buffer,
+    and transformed at once by :func:`transform_coordinates_batch`.
+    All other objects are transformed one by one, with their own ``transform`` method.
+    This includes the objects with lazy transformations, which only compose the transformation with their pending one.
+
+    The objects should be distinct.
+    To place many instances of the same object, transform copies of it.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> from compas.geometry import Translation
+    >>> part = Mesh.from_polyhedron(6)
+    >>> transformations = [Translation.from_vector([i, 0, 0]) for i in range(10)]
+    >>> parts = [part.copy() for _ in transformations]
+    >>> transform_objects(parts, transformations)
+    >>> parts[3].vertex_coordinates(0) == part.transformed(transformations[3]).vertex_coordinates(0)
+    True
+
+    """
+    from compas.geometry.pointarray import transform_coordinates_batch
+
+    objects = list(objects)
+    transformations = list(transformations)
+    if len(objects) != len(transformations):
+        raise ValueError("Expected one transformation per object.")
+
+    batch = []
+    for obj, T in zip(objects, transformations):
+        if hasattr(obj, "__coordinates__") and not getattr(obj, "lazy_transform", False):
+            batch.append((obj, T, obj.__coordinates__()))
+        else:
+            obj.transform(T)
+    if not batch:
+        return
+
+    values = array("d")
+    for _, _, xyz in batch:
+        values.extend(xyz)
+    transform_coordinates_batch(values, [T for _, T, _ in batch], [len(xyz) // 3 for _, _, xyz in batch])
+
+    start = 0
+    for obj, _, xyz in batch:
+        stop = start + len(xyz)
+        obj.__set_coordinates__(values[start:stop])
+        start = stop
 
 
 def world_to_local_coordinates(frame, xyz):
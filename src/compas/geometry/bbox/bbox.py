@@ -10,7 +10,7 @@ def bounding_box(points):
 
     Parameters
     ----------
-    points : sequence[point]
+    points : sequence[point] | :class:`~compas.geometry.PointArray`
         XYZ coordinates of the points.
 
     Returns
@@ -24,7 +24,16 @@ def bounding_box(points):
     :func:`compas.geometry.bounding_box_xy`
 
     """
-    x, y, z = zip(*points)
+    if not isinstance(points, (list, tuple)):
+        from compas.geometry.pointarray import PointArray
+
+        if isinstance(points, PointArray):
+            xyz = points.buffer
+            x, y, z = xyz[0::3], xyz[1::3], xyz[2::3]
+        else:
+            x, y, z = zip(*points)
+    else:
+        x, y, z = zip(*points)
     min_x = min(x)
     max_x = max(x)
     min_y = min(y)
@@ -274,11 +274,13 @@ class Bezier(Curve):
 
         """
         n = self.degree
-        point = Point(0, 0, 0)
-        for i, p in enumerate(self.points):
+        x = y = z = 0.0
+        for i, (px, py, pz) in enumerate(self.points):
             b = bernstein_polynomial(n, i, t)
-            point += p * b
-        return point
+            x += px * b
+            y += py * b
+            z += pz * b
+        return Point.fast(x, y, z)
 
     def tangent_at(self, t):
         """Compute the tangent vector to the curve at the point at the given parameter.
@@ -305,9 +307,13 @@ class Bezier(Curve):
 
         """
         n = self.degree
-        vector = Vector(0, 0, 0)
-        for i, point in enumerate(self.points):
-            vector += point * bernstein_derivative(n, i, t, 1)
+        x = y = z = 0.0
+        for i, (px, py, pz) in enumerate(self.points):
+            b = bernstein_derivative(n, i, t, 1)
+            x += px * b
+            y += py * b
+            z += pz * b
+        vector = Vector.fast(x, y, z)
         vector.unitize()
         return vector
 
@@ -126,6 +126,13 @@ class Circle(Conic):
     def from_data(cls, data):
         return cls(radius=data["radius"], frame=Frame.from_data(data["frame"]))
 
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        if self._frame is not None:
+            other._frame = self._frame.__copy_fast__()
+        other._transformation = None
+        return other
+
     # ==========================================================================
     # Properties
     # ==========================================================================
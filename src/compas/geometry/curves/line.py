@@ -131,6 +131,13 @@ class Line(Curve):
     def data(self):
         return {"start": self.start.data, "end": self.end.data}
 
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._point = self._point.__copy_fast__()
+        other._vector = self._vector.__copy_fast__()
+        other._direction = None
+        return other
+
     # ==========================================================================
     # properties
     # ==========================================================================
@@ -321,8 +328,9 @@ class Line(Curve):
         Point(0.500, 0.500, 0.500)
 
         """
-        point = self.point + self.vector * t
-        return point
+        point = self.point
+        vector = self.vector
+        return Point.fast(point._x + vector._x * t, point._y + vector._y * t, point._z + vector._z * t)
 
     def closest_point(self, point, return_parameter=False):
         """Compute the closest point on the line to a given point.
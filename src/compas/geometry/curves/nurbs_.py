@@ -234,7 +234,7 @@ class DefaultNurbsCurve(NurbsCurve):
             Z += z * b
             W += b
 
-        return Point(X / W, Y / W, Z / W)
+        return Point.fast(X / W, Y / W, Z / W)
 
     def tangent_at(self, t, unitized=True):
         """Compute the tangent of the curve for a given parameter value.
@@ -268,7 +268,7 @@ class DefaultNurbsCurve(NurbsCurve):
                 CK[k][1] += deriv * y
                 CK[k][2] += deriv * z
 
-        tangent = Vector(*CK[1])
+        tangent = Vector.fast(*CK[1])
         if unitized:
             tangent.unitize()
 
@@ -121,6 +121,12 @@ class Polyline(Curve):
     def data(self):
         return {"points": [point.data for point in self.points]}
 
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._points = [point.__copy_fast__() for point in self._points]
+        other._lines = None
+        return other
+
     # ==========================================================================
     # properties
     # ==========================================================================
@@ -197,6 +203,7 @@ class Polyline(Curve):
             self.points[index].x = point[0]
             self.points[index].y = point[1]
             self.points[index].z = point[2]
+        self._lines = None
 
     # ==========================================================================
     # Methods
@@ -261,21 +268,21 @@ class Polyline(Curve):
 
         polyline_length = self.length
 
+        # the segments are the cached lines of the polyline,
+        # and only the resulting point is allocated
         x = 0
-        i = 0
-        while x <= t:
-            line = Line(points[i], points[i + 1])
+        for line in self.lines:
             line_length = line.length
             dx = line_length / polyline_length
             if x + dx > t:
                 if snap:
                     if t - x < x + dx - t:
-                        return line.start
+                        return line.start.copy()
                     else:
                         return line.end
                 return line.point_at((t - x) * polyline_length / line_length)
             x += dx
-            i += 1
+        return points[-1]
 
     def tangent_at(self, t):
         """Tangent vector at a specific normalized parameter.
@@ -309,15 +316,12 @@ class Polyline(Curve):
         polyline_length = self.length
 
         x = 0
-        i = 0
-        while x <= t:
-            line = Line(points[i], points[i + 1])
-            line_length = line.length
-            dx = line_length / polyline_length
+        for line in self.lines:
+            dx = line.length / polyline_length
             if x + dx > t:
-                return line.direction
+                return line.direction.copy()
             x += dx
-            i += 1
+        return points[-1] - points[-2]
 
     def tangent_at_point(self, point):
         """Calculates the tangent vector of a point on a polyline
@@ -140,6 +140,14 @@ class Frame(Geometry):
             "yaxis": self.yaxis.data,
         }
 
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._point = self._point.__copy_fast__()
+        other._xaxis = self._xaxis.__copy_fast__()
+        other._yaxis = self._yaxis.__copy_fast__()
+        other._zaxis = None
+        return other
+
     # ==========================================================================
     # Properties
     # ==========================================================================
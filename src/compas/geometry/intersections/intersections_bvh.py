@@ -0,0 +1,41 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from compas.plugins import plugin
+
+from compas.geometry import MeshBVH
+
+
+@plugin(category="intersections", requires=None, trylast=True)
+def intersection_ray_mesh(ray, mesh):
+    """Compute the intersection(s) between a ray and a mesh.
+
+    This is the default implementation of :func:`compas.geometry.intersection_ray_mesh`,
+    which is used if no other plugin is available.
+
+    Parameters
+    ----------
+    ray : tuple of point and vector
+        A ray represented by a point and a direction vector.
+    mesh : tuple of vertices and faces | :class:`~compas.datastructures.Mesh`
+        A mesh represented by a list of vertices and a list of faces, or a mesh object.
+
+    Returns
+    -------
+    list of tuple
+        Per intersection of the ray with the mesh:
+
+        0. the index of the intersected face
+        1. the u coordinate of the intersection in the barycentric coordinates of the face
+        2. the v coordinate of the intersection in the barycentric coordinates of the face
+        3. the distance between the ray origin and the hit
+
+    Notes
+    -----
+    A :class:`~compas.geometry.MeshBVH` is built for every call.
+    To intersect many rays with the same mesh, build the hierarchy once and use
+    :meth:`~compas.geometry.MeshBVH.intersect_rays` instead.
+
+    """
+    return MeshBVH(mesh).intersect_ray(ray)
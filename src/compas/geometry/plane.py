@@ -101,6 +101,12 @@ class Plane(Geometry):
             "normal": self.normal.data,
         }
 
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._point = self._point.__copy_fast__()
+        other._normal = self._normal.__copy_fast__()
+        return other
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -15,6 +15,7 @@ from compas.geometry import is_point_in_polygon_xy
 from compas.geometry import is_point_in_convex_polygon_xy
 from compas.geometry import is_point_behind_plane
 from compas.geometry import transform_points
+from compas.data.data import _decode_guid
 
 from .geometry import Geometry
 from .vector import Vector
@@ -108,12 +109,9 @@ class Point(Geometry):
 
     def __init__(self, x, y, z=0.0, **kwargs):
         super(Point, self).__init__(**kwargs)
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
 
     def __repr__(self):
         return "{0}({1}, {2}, z={3})".format(
@@ -131,11 +129,11 @@ class Point(Geometry):
             return [self[i] for i in range(*key.indices(len(self)))]
         i = key % 3
         if i == 0:
-            return self.x
+            return self._x
         if i == 1:
-            return self.y
+            return self._y
         if i == 2:
-            return self.z
+            return self._z
         raise KeyError
 
     def __setitem__(self, key, value):
@@ -152,57 +150,54 @@ class Point(Geometry):
         raise KeyError
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter([self._x, self._y, self._z])
 
     def __eq__(self, other):
-        return self.x == other[0] and self.y == other[1] and self.z == other[2]
+        return self._x == other[0] and self._y == other[1] and self._z == other[2]
 
     def __add__(self, other):
-        return Point(self.x + other[0], self.y + other[1], self.z + other[2])
+        return Point.fast(self._x + other[0], self._y + other[1], self._z + other[2])
 
     def __sub__(self, other):
-        x = self.x - other[0]
-        y = self.y - other[1]
-        z = self.z - other[2]
-        return Vector(x, y, z)
+        return Vector.fast(self._x - other[0], self._y - other[1], self._z - other[2])
 
     def __mul__(self, n):
-        return Point(n * self.x, n * self.y, n * self.z)
+        return Point.fast(n * self._x, n * self._y, n * self._z)
 
     def __truediv__(self, n):
-        return Point(self.x / n, self.y / n, self.z / n)
+        return Point.fast(self._x / n, self._y / n, self._z / n)
 
     def __pow__(self, n):
-        return Point(self.x**n, self.y**n, self.z**n)
+        return Point.fast(self._x**n, self._y**n, self._z**n)
 
     def __iadd__(self, other):
-        self.x += other[0]
-        self.y += other[1]
-        self.z += other[2]
+        self._x += other[0]
+        self._y += other[1]
+        self._z += other[2]
         return self
 
     def __isub__(self, other):
-        self.x -= other[0]
-        self.y -= other[1]
-        self.z -= other[2]
+        self._x -= other[0]
+        self._y -= other[1]
+        self._z -= other[2]
         return self
 
     def __imul__(self, n):
-        self.x *= n
-        self.y *= n
-        self.z *= n
+        self._x *= n
+        self._y *= n
+        self._z *= n
         return self
 
     def __itruediv__(self, n):
-        self.x /= n
-        self.y /= n
-        self.z /= n
+        self._x /= n
+        self._y /= n
+        self._z /= n
         return self
 
     def __ipow__(self, n):
-        self.x **= n
-        self.y **= n
-        self.z **= n
+        self._x **= n
+        self._y **= n
+        self._z **= n
         return self
 
     # ==========================================================================
@@ -217,6 +212,18 @@ class Point(Geometry):
     def from_data(cls, data):
         return cls(*data)
 
+    @classmethod
+    def __jsonload__(cls, data, guid=None):
+        # points are reconstructed directly from their coordinates
+        if cls is not Point or len(data) != 3:
+            return super(Point, cls).__jsonload__(data, guid)
+        point = cls.fast(float(data[0]), float(data[1]), float(data[2]))
+        point._guid = _decode_guid(guid)
+        return point
+
+    def __copy_fast__(self):
+        return self._copy_shallow()
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -245,6 +252,50 @@ class Point(Geometry):
     def z(self, z):
         self._z = float(z)
 
+    # ==========================================================================
+    # Constructors
+    # ==========================================================================
+
+    @classmethod
+    def fast(cls, x, y, z=0.0):
+        """Construct a point directly from its coordinates.
+
+        Parameters
+        ----------
+        x : float
+            The X coordinate of the point.
+        y : float
+            The Y coordinate of the point.
+        z : float, optional
+            The Z coordinate of the point.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Point`
+
+        Notes
+        -----
+        Unlike the constructor, this factory doesn't convert the coordinates to floats,
+        and doesn't accept a name or other keyword arguments.
+        It is meant for the many intermediate points produced by geometric algorithms in hot loops,
+        where the coordinates are already floats.
+        The result is a regular point that can be used anywhere a point can.
+
+        Examples
+        --------
+        >>> point = Point.fast(1.0, 2.0, 3.0)
+        >>> point == Point(1.0, 2.0, 3.0)
+        True
+
+        """
+        point = object.__new__(cls)
+        point._guid = None
+        point._name = None
+        point._x = x
+        point._y = y
+        point._z = z
+        return point
+
     # ==========================================================================
     # Methods
     # ==========================================================================
@@ -647,7 +698,4 @@ class Point(Geometry):
         True
 
         """
-        point = transform_points([self], T)[0]
-        self.x = point[0]
-        self.y = point[1]
-        self.z = point[2]
+        self._x, self._y, self._z = transform_points([self], T)[0]
@@ -0,0 +1,1049 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import operator
+from array import array
+from itertools import chain
+from math import sqrt
+
+import compas
+
+from compas.geometry import Geometry
+from compas.geometry import Transformation
+
+from .point import Point
+from .vector import Vector
+from .frame import Frame
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    _USE_NUMPY = False
+else:
+    _USE_NUMPY = not compas.IPY
+
+# the minimum number of items for which the transformations are computed with NumPy
+_NUMPY_THRESHOLD = 64
+
+
+# ==============================================================================
+# Kernels
+# ==============================================================================
+
+
+def _flatten(items, stride):
+    # the coordinates of a sequence of items as a flat buffer of floats
+    if isinstance(items, _CoordinateArray):
+        if items._stride != stride:
+            raise ValueError("Expected {} values per item, got {}.".format(stride, items._stride))
+        return items._xyz[:]
+    if hasattr(items, "__array_interface__"):
+        from .pointarray_numpy import coordinates_from_numpy
+
+        shape = (3,) if stride == 3 else (3, 3)
+        if len(items) and tuple(items.shape[1:]) != shape:
+            raise ValueError(
+                "Expected an array of shape (N, {}), got {}.".format(", ".join(map(str, shape)), items.shape)
+            )
+        return coordinates_from_numpy(items)
+    items = list(items)
+    values = chain.from_iterable(items)
+    if stride == 9:
+        values = chain.from_iterable(values)
+    values = array("d", values)
+    if len(values) != stride * len(items):
+        raise ValueError("Expected {} values per item.".format(stride))
+    return values
+
+
+def transform_coordinates(values, T, stride=3, offset=0, w=1.0):
+    """Transform XYZ coordinates stored in a flat buffer of floats in place.
+
+    Parameters
+    ----------
+    values : array.array
+        The buffer, with the coordinates of an item every `stride` values.
+    T : :class:`~compas.geometry.Transformation` | list[list[float]]
+        The transformation matrix.
+    stride : int, optional
+        The number of values per item.
+    offset : int, optional
+        The position of the XYZ coordinates in the values of an item.
+    w : float, optional
+        The homogeneous coordinate.
+        Use ``1.0`` for points, and ``0.0`` for vectors.
+
+    Returns
+    -------
+    None
+        The buffer is modified in place.
+
+    Notes
+    -----
+    This is the kernel shared by the transformations of points, vectors and frames,
+    of point and vector arrays, and of the vertices of meshes, volmeshes and networks.
+    If NumPy is available, large buffers are transformed with NumPy, without copying the buffer.
+    The result of a projective transformation is divided by its homogeneous coordinate,
+    unless that coordinate is zero.
+
+    Examples
+    --------
+    >>> from array import array
+    >>> from compas.geometry import Translation
+    >>> values = array("d", [0.0, 0.0, 0.0, 1.0, 0.0, 0.0])
+    >>> transform_coordinates(values, Translation.from_vector([0.0, 0.0, 1.0]))
+    >>> values.tolist()
+    [0.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+
+    """
+    if not values:
+        return
+    M = T.matrix if isinstance(T, Transformation) else T
+    if _USE_NUMPY and len(values) >= _NUMPY_THRESHOLD * stride:
+        from .pointarray_numpy import transform_coordinates_numpy
+
+        transform_coordinates_numpy(values, M, stride, offset, w)
+        return
+    _transform_range(values, M, offset, len(values), stride, w)
+
+
+def transform_coordinates_batch(values, transformations, counts=None, stride=3, offset=0, w=1.0):
+    """Transform consecutive blocks of XYZ coordinates stored in a flat buffer of floats, each with its own transformation.
+
+    Parameters
+    ----------
+    values : array.array
+        The buffer, with the coordinates of an item every `stride` values.
+    transformations : sequence[:class:`~compas.geometry.Transformation` | list[list[float]]]
+        The transformation matrices, one per block.
+    counts : sequence[int], optional
+        The number of items per block.
+        Default is blocks of equal size.
+    stride : int, optional
+        The number of values per item.
+    offset : int, optional
+        The position of the XYZ coordinates in the values of an item.
+    w : float, optional
+        The homogeneous coordinate.
+        Use ``1.0`` for points, and ``0.0`` for vectors.
+
+    Returns
+    -------
+    None
+        The buffer is modified in place.
+
+    Raises
+    ------
+    ValueError
+        If the blocks don't cover the items of the buffer.
+
+    Notes
+    -----
+    With NumPy, blocks of equal size are transformed in a single vectorized operation.
+    This is the typical case of many instances of the same object, such as the parts of an assembly.
+
+    Examples
+    --------
+    >>> from array import array
+    >>> from compas.geometry import Translation
+    >>> values = array("d", [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+    >>> X = Translation.from_vector([1.0, 0.0, 0.0])
+    >>> Z = Translation.from_vector([0.0, 0.0, 1.0])
+    >>> transform_coordinates_batch(values, [X, Z], counts=[2, 1])
+    >>> values.tolist()
+    [1.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+    """
+    matrices = [T.matrix if isinstance(T, Transformation) else T for T in transformations]
+    total = len(values) // stride
+    if counts is None:
+        if total and (not matrices or total % len(matrices)):
+            raise ValueError("The number of items is not a multiple of the number of transformations.")
+        counts = [total // len(matrices)] * len(matrices) if matrices else []
+    else:
+        counts = list(counts)
+        if len(counts) != len(matrices) or sum(counts) != total:
+            raise ValueError("Expected one count per transformation, for a total of {} items.".format(total))
+    if not values:
+        return
+    if _USE_NUMPY and total >= _NUMPY_THRESHOLD:
+        from .pointarray_numpy import transform_coordinates_batch_numpy
+
+        transform_coordinates_batch_numpy(values, matrices, counts, stride, offset, w)
+        return
+    start = 0
+    for M, count in zip(matrices, counts):
+        stop = start + count * stride
+        _transform_range(values, M, start + offset, stop, stride, w)
+        start = stop
+
+
+def _transform_range(values, M, start, stop, stride, w):
+    # transform the XYZ coordinates of the items from start to stop in place
+    (a, b, c, d), (e, f, g, h), (i, j, k, l_), (m, n, o, p) = [[float(value) for value in row] for row in M]
+    projective = m or n or o or p != 1.0
+    for index in range(start, stop, stride):
+        x = values[index]
+        y = values[index + 1]
+        z = values[index + 2]
+        X = a * x + b * y + c * z + d * w
+        Y = e * x + f * y + g * z + h * w
+        Z = i * x + j * y + k * z + l_ * w
+        if projective:
+            W = m * x + n * y + o * z + p * w
+            if W:
+                X /= W
+                Y /= W
+                Z /= W
+        values[index] = X
+        values[index + 1] = Y
+        values[index + 2] = Z
+
+
+def _orthonormalize(values):
+    # orthonormalize the axes of the frames in place, the same way as the constructor of a frame
+    if not values:
+        return
+    if _USE_NUMPY:
+        from .pointarray_numpy import orthonormalize_frames_numpy
+
+        orthonormalize_frames_numpy(values)
+        return
+    for start in range(0, len(values), 9):
+        ux, uy, uz, vx, vy, vz = values[start + 3 : start + 9]
+        length = sqrt(ux * ux + uy * uy + uz * uz)
+        ux /= length
+        uy /= length
+        uz /= length
+        wx = uy * vz - uz * vy
+        wy = uz * vx - ux * vz
+        wz = ux * vy - uy * vx
+        length = sqrt(wx * wx + wy * wy + wz * wz)
+        wx /= length
+        wy /= length
+        wz /= length
+        values[start + 3 : start + 9] = array(
+            "d", [ux, uy, uz, wy * uz - wz * uy, wz * ux - wx * uz, wx * uy - wy * ux]
+        )
+
+
+def _combine(op, a, b):
+    # combine coordinates with a scalar, with the coordinates of a single item, or with the coordinates of every item
+    if _USE_NUMPY:
+        from .pointarray_numpy import combine_coordinates_numpy
+
+        return combine_coordinates_numpy(op, a, b)
+    if isinstance(b, float):
+        return array("d", [op(x, b) for x in a])
+    if len(b) == 3 and len(a) != 3:
+        result = a[:]
+        for k in range(3):
+            result[k::3] = array("d", [op(x, b[k]) for x in a[k::3]])
+        return result
+    return array("d", map(op, a, b))
+
+
+def _column(values, stride, offset):
+    # the XYZ coordinates at the given offset of every item
+    result = array("d", [0.0]) * (len(values) // stride * 3)
+    for k in range(3):
+        result[k::3] = values[offset + k :: stride]
+    return result
+
+
+# ==============================================================================
+# Views
+# ==============================================================================
+
+
+class _PointView(Point):
+    # a point that reads and writes its coordinates from and to the buffer of an array
+
+    __slots__ = ("_buffer", "_offset")
+
+    _guid = None
+    _name = None
+
+    def __init__(self, buffer, offset):
+        self._buffer = buffer
+        self._offset = offset
+
+    def __repr__(self):
+        return "Point({0}, {1}, z={2})".format(self.x, self.y, self.z)
+
+    def __iter__(self):
+        return iter(self._buffer[self._offset : self._offset + 3])
+
+    def __reduce__(self):
+        return Point, tuple(self)
+
+    def __copy_fast__(self):
+        return Point(*self)
+
+    @property
+    def dtype(self):
+        return "compas.geometry/Point"
+
+    @property
+    def _x(self):
+        return self._buffer[self._offset]
+
+    @_x.setter
+    def _x(self, x):
+        self._buffer[self._offset] = x
+
+    @property
+    def _y(self):
+        return self._buffer[self._offset + 1]
+
+    @_y.setter
+    def _y(self, y):
+        self._buffer[self._offset + 1] = y
+
+    @property
+    def _z(self):
+        return self._buffer[self._offset + 2]
+
+    @_z.setter
+    def _z(self, z):
+        self._buffer[self._offset + 2] = z
+
+
+class _VectorView(Vector):
+    # a vector that reads and writes its components from and to the buffer of an array
+
+    __slots__ = ("_buffer", "_offset")
+
+    _guid = None
+    _name = None
+
+    def __init__(self, buffer, offset):
+        self._buffer = buffer
+        self._offset = offset
+
+    def __repr__(self):
+        return "Vector(x={0}, y={1}, z={2})".format(self.x, self.y, self.z)
+
+    def __iter__(self):
+        return iter(self._buffer[self._offset : self._offset + 3])
+
+    def __reduce__(self):
+        return Vector, tuple(self)
+
+    def __copy_fast__(self):
+        return Vector(*self)
+
+    @property
+    def dtype(self):
+        return "compas.geometry/Vector"
+
+    @property
+    def _x(self):
+        return self._buffer[self._offset]
+
+    @_x.setter
+    def _x(self, x):
+        self._buffer[self._offset] = x
+
+    @property
+    def _y(self):
+        return self._buffer[self._offset + 1]
+
+    @_y.setter
+    def _y(self, y):
+        self._buffer[self._offset + 1] = y
+
+    @property
+    def _z(self):
+        return self._buffer[self._offset + 2]
+
+    @_z.setter
+    def _z(self, z):
+        self._buffer[self._offset + 2] = z
+
+
+class _FrameView(Frame):
+    # a frame that reads and writes its point and axes from and to the buffer of an array
+
+    __slots__ = ("_buffer", "_offset")
+
+    _guid = None
+    _name = None
+
+    def __init__(self, buffer, offset):
+        self._buffer = buffer
+        self._offset = offset
+
+    def __repr__(self):
+        return "Frame(point={0!r}, xaxis={1!r}, yaxis={2!r})".format(self.point, self.xaxis, self.yaxis)
+
+    def __reduce__(self):
+        return Frame, (list(self.point), list(self.xaxis), list(self.yaxis))
+
+    def __copy_fast__(self):
+        return Frame(list(self.point), list(self.xaxis), list(self.yaxis))
+
+    @property
+    def dtype(self):
+        return "compas.geometry/Frame"
+
+    @property
+    def point(self):
+        return _PointView(self._buffer, self._offset)
+
+    @point.setter
+    def point(self, point):
+        self._buffer[self._offset : self._offset + 3] = array("d", Point(*point))
+
+    @property
+    def xaxis(self):
+        return _VectorView(self._buffer, self._offset + 3)
+
+    @xaxis.setter
+    def xaxis(self, vector):
+        xaxis = Vector(*vector)
+        xaxis.unitize()
+        self._buffer[self._offset + 3 : self._offset + 6] = array("d", xaxis)
+
+    @property
+    def yaxis(self):
+        return _VectorView(self._buffer, self._offset + 6)
+
+    @yaxis.setter
+    def yaxis(self, vector):
+        yaxis = Vector(*vector)
+        yaxis.unitize()
+        zaxis = self.xaxis.cross(yaxis)
+        zaxis.unitize()
+        self._buffer[self._offset + 6 : self._offset + 9] = array("d", zaxis.cross(self.xaxis))
+
+    @property
+    def zaxis(self):
+        return self.xaxis.cross(self.yaxis)
+
+
+# ==============================================================================
+# Arrays
+# ==============================================================================
+
+
+class _CoordinateArray(Geometry):
+    """Base class for homogeneous collections of geometric objects stored in a single buffer of floats."""
+
+    _stride = 3
+    _key = None
+    _view = None
+
+    def __init__(self, items=None, **kwargs):
+        super(_CoordinateArray, self).__init__(**kwargs)
+        self._xyz = _flatten(items, self._stride) if items is not None else array("d")
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, self.tolist())
+
+    def __len__(self):
+        return len(self._xyz) // self._stride
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            other = type(self)()
+            stride = self._stride
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                other._xyz = self._xyz[start * stride : max(start, stop) * stride]
+                return other
+            for index in range(start, stop, step):
+                other._xyz.extend(self._xyz[index * stride : (index + 1) * stride])
+            return other
+        count = len(self)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("Index out of range.")
+        return self._view(self._xyz, key * self._stride)
+
+    def __setitem__(self, key, value):
+        count = len(self)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("Index out of range.")
+        start = key * self._stride
+        self._xyz[start : start + self._stride] = self._item(value)
+
+    def __iter__(self):
+        view = self._view
+        xyz = self._xyz
+        for start in range(0, len(xyz), self._stride):
+            yield view(xyz, start)
+
+    def __eq__(self, other):
+        try:
+            values = _flatten(other, self._stride)
+        except (TypeError, ValueError):
+            return False
+        return self._xyz == values
+
+    # ==========================================================================
+    # Data
+    # ==========================================================================
+
+    @property
+    def data(self):
+        return {self._key: self.tolist()}
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data[cls._key])
+
+    def __jsondump__(self, minimal=False):
+        # the coordinates are dumped as one array,
+        # which the binary format stores as a single buffer of numbers
+        if _USE_NUMPY:
+            from numpy import frombuffer
+
+            items = frombuffer(self._xyz, dtype=float).reshape((-1,) + self._shape)
+        else:
+            items = self.tolist()
+        state = {"dtype": self.dtype, "data": {self._key: items}}
+        if minimal:
+            return state
+        state["guid"] = str(self.guid)
+        return state
+
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._xyz = self._xyz[:]
+        return other
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def buffer(self):
+        return self._xyz
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def _item(self, item):
+        values = array("d", chain.from_iterable(item) if self._stride == 9 else item)
+        if len(values) != self._stride:
+            raise ValueError("Expected {} values per item, got {}.".format(self._stride, len(values)))
+        return values
+
+    def _operand(self, other):
+        # the coordinates of a single item or of one item per item of the array
+        if isinstance(other, (int, float)):
+            raise TypeError("Expected points or vectors, got a number.")
+        if not isinstance(other, _CoordinateArray) and len(other) == 3 and not hasattr(other[0], "__len__"):
+            values = array("d", other)
+        else:
+            values = _flatten(other, 3)
+        if len(values) != 3 and len(values) != len(self._xyz):
+            raise ValueError("Expected a single item or {} items, got {}.".format(len(self), len(values) // 3))
+        return values
+
+    @classmethod
+    def _from_buffer(cls, values):
+        items = cls()
+        items._xyz = values
+        return items
+
+    def _combined(self, cls, op, other):
+        return cls._from_buffer(_combine(op, self._xyz, other))
+
+    def tolist(self):
+        """Convert the array to a list of nested lists of coordinates.
+
+        Returns
+        -------
+        list
+
+        """
+        if _USE_NUMPY:
+            from numpy import frombuffer
+
+            return frombuffer(self._xyz, dtype=float).reshape((-1,) + self._shape).tolist()
+        xyz = self._xyz
+        items = [list(xyz[start : start + 3]) for start in range(0, len(xyz), 3)]
+        if self._stride == 9:
+            items = [items[index : index + 3] for index in range(0, len(items), 3)]
+        return items
+
+    def append(self, item):
+        """Add an item at the end of the array.
+
+        Parameters
+        ----------
+        item : sequence
+            The coordinates of the item.
+
+        Returns
+        -------
+        None
+
+        """
+        self._xyz.extend(self._item(item))
+
+    def extend(self, items):
+        """Add a sequence of items at the end of the array.
+
+        Parameters
+        ----------
+        items : sequence
+            The items.
+
+        Returns
+        -------
+        None
+
+        """
+        self._xyz.extend(_flatten(items, self._stride))
+
+
+class PointArray(_CoordinateArray):
+    """An array of points, stored in a single, contiguous buffer of XYZ coordinates.
+
+    Parameters
+    ----------
+    points : sequence[[float, float, float] | :class:`~compas.geometry.Point`] | :class:`~compas.geometry.PointArray` | numpy.ndarray, optional
+        The points.
+        NumPy arrays should have shape ``(N, 3)``.
+
+    Attributes
+    ----------
+    buffer : array.array, read-only
+        The interleaved XYZ coordinates of the points, as ``float64`` values.
+
+    Notes
+    -----
+    Unlike a list of :class:`~compas.geometry.Point` objects,
+    the array stores only the coordinates of the points.
+    Indexing the array returns a view of one point,
+    which is a :class:`~compas.geometry.Point` that reads and writes its coordinates from and to the buffer of the array.
+    Slicing the array returns a new array.
+
+    The array is transformed, and combined with other points and vectors, all at once.
+    If NumPy is available, the operations are vectorized.
+
+    The buffer supports the buffer protocol.
+    For example, ``numpy.frombuffer(points.buffer).reshape(-1, 3)`` is a view of the coordinates without a copy.
+    The array can't grow while such a view exists.
+
+    The array is serialized as a single array of coordinates.
+
+    Examples
+    --------
+    >>> from compas.geometry import Translation
+    >>> points = PointArray([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    >>> points[1]
+    Point(1.0, 0.0, z=0.0)
+    >>> points.transform(Translation.from_vector([0, 0, 1]))
+    >>> points.tolist()
+    [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [1.0, 1.0, 1.0]]
+    >>> (points - [1, 0, 0]).tolist()
+    [[-1.0, 0.0, 1.0], [0.0, 0.0, 1.0], [0.0, 1.0, 1.0]]
+
+    """
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "points": {"type": "array", "items": Point.DATASCHEMA},
+        },
+        "required": ["points"],
+    }
+
+    _key = "points"
+    _shape = (3,)
+    _view = _PointView
+
+    def __init__(self, points=None, **kwargs):
+        super(PointArray, self).__init__(points, **kwargs)
+
+    def __add__(self, other):
+        return self._combined(PointArray, operator.add, self._operand(other))
+
+    def __sub__(self, other):
+        return self._combined(VectorArray, operator.sub, self._operand(other))
+
+    def __mul__(self, n):
+        return self._combined(PointArray, operator.mul, float(n))
+
+    def __truediv__(self, n):
+        return self._combined(PointArray, operator.truediv, float(n))
+
+    def __iadd__(self, other):
+        self._xyz[:] = _combine(operator.add, self._xyz, self._operand(other))
+        return self
+
+    def __isub__(self, other):
+        self._xyz[:] = _combine(operator.sub, self._xyz, self._operand(other))
+        return self
+
+    def __imul__(self, n):
+        self._xyz[:] = _combine(operator.mul, self._xyz, float(n))
+        return self
+
+    def __itruediv__(self, n):
+        self._xyz[:] = _combine(operator.truediv, self._xyz, float(n))
+        return self
+
+    # ==========================================================================
+    # Transformations
+    # ==========================================================================
+
+    def transform(self, T):
+        """Transform the points.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation matrix.
+
+        Returns
+        -------
+        None
+            The points are modified in place.
+
+        """
+        transform_coordinates(self._xyz, T, w=1.0)
+
+    def __coordinates__(self):
+        # the buffer itself, for the batched transformations of :func:`compas.geometry.transform_objects`
+        return self._xyz
+
+    def __set_coordinates__(self, values):
+        if values is not self._xyz:
+            self._xyz[:] = values
+
+
+class VectorArray(_CoordinateArray):
+    """An array of vectors, stored in a single, contiguous buffer of XYZ components.
+
+    Parameters
+    ----------
+    vectors : sequence[[float, float, float] | :class:`~compas.geometry.Vector`] | :class:`~compas.geometry.VectorArray` | numpy.ndarray, optional
+        The vectors.
+        NumPy arrays should have shape ``(N, 3)``.
+
+    Attributes
+    ----------
+    buffer : array.array, read-only
+        The interleaved XYZ components of the vectors, as ``float64`` values.
+
+    Notes
+    -----
+    Indexing the array returns a view of one vector,
+    which is a :class:`~compas.geometry.Vector` that reads and writes its components from and to the buffer of the array.
+    See :class:`~compas.geometry.PointArray` for more information.
+
+    Examples
+    --------
+    >>> vectors = VectorArray([[1, 0, 0], [0, 2, 0]])
+    >>> vectors.lengths()
+    [1.0, 2.0]
+    >>> vectors.cross([0, 0, 1]).tolist()
+    [[0.0, -1.0, 0.0], [2.0, 0.0, 0.0]]
+
+    """
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "vectors": {"type": "array", "items": Vector.DATASCHEMA},
+        },
+        "required": ["vectors"],
+    }
+
+    _key = "vectors"
+    _shape = (3,)
+    _view = _VectorView
+
+    def __init__(self, vectors=None, **kwargs):
+        super(VectorArray, self).__init__(vectors, **kwargs)
+
+    def __add__(self, other):
+        return self._combined(VectorArray, operator.add, self._operand(other))
+
+    def __sub__(self, other):
+        return self._combined(VectorArray, operator.sub, self._operand(other))
+
+    def __mul__(self, n):
+        return self._combined(VectorArray, operator.mul, float(n))
+
+    def __truediv__(self, n):
+        return self._combined(VectorArray, operator.truediv, float(n))
+
+    def __neg__(self):
+        return self._combined(VectorArray, operator.mul, -1.0)
+
+    def __iadd__(self, other):
+        self._xyz[:] = _combine(operator.add, self._xyz, self._operand(other))
+        return self
+
+    def __isub__(self, other):
+        self._xyz[:] = _combine(operator.sub, self._xyz, self._operand(other))
+        return self
+
+    def __imul__(self, n):
+        self._xyz[:] = _combine(operator.mul, self._xyz, float(n))
+        return self
+
+    def __itruediv__(self, n):
+        self._xyz[:] = _combine(operator.truediv, self._xyz, float(n))
+        return self
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def lengths(self):
+        """Compute the lengths of the vectors.
+
+        Returns
+        -------
+        list[float]
+
+        """
+        return [sqrt(d) for d in self.dot(self)]
+
+    def dot(self, other):
+        """Compute the dot products of the vectors with another vector, or with one vector per vector.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`~compas.geometry.Vector` | sequence[[float, float, float] | :class:`~compas.geometry.Vector`]
+            The other vector(s).
+
+        Returns
+        -------
+        list[float]
+
+        """
+        values = self._operand(other)
+        if _USE_NUMPY:
+            from .pointarray_numpy import dot_coordinates_numpy
+
+            return dot_coordinates_numpy(self._xyz, values)
+        products = _combine(operator.mul, self._xyz, values)
+        return [products[i] + products[i + 1] + products[i + 2] for i in range(0, len(products), 3)]
+
+    def cross(self, other):
+        """Compute the cross products of the vectors with another vector, or with one vector per vector.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`~compas.geometry.Vector` | sequence[[float, float, float] | :class:`~compas.geometry.Vector`]
+            The other vector(s).
+
+        Returns
+        -------
+        :class:`~compas.geometry.VectorArray`
+
+        """
+        values = self._operand(other)
+        if _USE_NUMPY:
+            from .pointarray_numpy import cross_coordinates_numpy
+
+            return VectorArray._from_buffer(cross_coordinates_numpy(self._xyz, values))
+        xyz = self._xyz
+        stride = 3 if len(values) == len(xyz) else 0
+        cross = array("d", [0.0]) * len(xyz)
+        for i in range(0, len(xyz), 3):
+            j = i if stride else 0
+            ux, uy, uz = xyz[i], xyz[i + 1], xyz[i + 2]
+            vx, vy, vz = values[j], values[j + 1], values[j + 2]
+            cross[i] = uy * vz - uz * vy
+            cross[i + 1] = uz * vx - ux * vz
+            cross[i + 2] = ux * vy - uy * vx
+        return VectorArray._from_buffer(cross)
+
+    def unitize(self):
+        """Scale all vectors to unit length.
+
+        Returns
+        -------
+        None
+
+        """
+        if _USE_NUMPY:
+            from .pointarray_numpy import unitize_coordinates_numpy
+
+            unitize_coordinates_numpy(self._xyz)
+            return
+        xyz = self._xyz
+        for i, length in enumerate(self.lengths()):
+            start = 3 * i
+            xyz[start] /= length
+            xyz[start + 1] /= length
+            xyz[start + 2] /= length
+
+    def unitized(self):
+        """Returns a copy of the array with all vectors scaled to unit length.
+
+        Returns
+        -------
+        :class:`~compas.geometry.VectorArray`
+
+        """
+        vectors = self.copy()
+        vectors.unitize()
+        return vectors
+
+    # ==========================================================================
+    # Transformations
+    # ==========================================================================
+
+    def transform(self, T):
+        """Transform the vectors.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation matrix.
+
+        Returns
+        -------
+        None
+            The vectors are modified in place.
+
+        """
+        transform_coordinates(self._xyz, T, w=0.0)
+
+
+class FrameArray(_CoordinateArray):
+    """An array of frames, stored in a single, contiguous buffer with the point, X axis and Y axis of every frame.
+
+    Parameters
+    ----------
+    frames : sequence[[point, vector, vector] | :class:`~compas.geometry.Frame`] | :class:`~compas.geometry.FrameArray` | numpy.ndarray, optional
+        The frames.
+        NumPy arrays should have shape ``(N, 3, 3)``.
+
+    Attributes
+    ----------
+    buffer : array.array, read-only
+        The interleaved XYZ coordinates of the points, X axes and Y axes of the frames, as ``float64`` values.
+    points : :class:`~compas.geometry.PointArray`, read-only
+        A copy of the points of the frames.
+    xaxes : :class:`~compas.geometry.VectorArray`, read-only
+        A copy of the X axes of the frames.
+    yaxes : :class:`~compas.geometry.VectorArray`, read-only
+        A copy of the Y axes of the frames.
+    zaxes : :class:`~compas.geometry.VectorArray`, read-only
+        The Z axes of the frames.
+
+    Notes
+    -----
+    The axes of the frames are orthonormalized when the frames are added to the array,
+    and after every transformation, in the same way as for :class:`~compas.geometry.Frame`.
+
+    Indexing the array returns a view of one frame,
+    which is a :class:`~compas.geometry.Frame` that reads and writes its point and axes from and to the buffer of the array.
+    See :class:`~compas.geometry.PointArray` for more information.
+
+    Examples
+    --------
+    >>> from compas.geometry import Translation
+    >>> frames = FrameArray([Frame.worldXY(), Frame([1, 0, 0], [0, 2, 0], [-1, 0, 0])])
+    >>> frames.transform(Translation.from_vector([0, 0, 1]))
+    >>> frames.points.tolist()
+    [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]]
+    >>> frames[1].xaxis
+    Vector(x=0.0, y=1.0, z=0.0)
+
+    """
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "frames": {
+                "type": "array",
+                "items": {"type": "array", "items": Point.DATASCHEMA, "minItems": 3, "maxItems": 3},
+            },
+        },
+        "required": ["frames"],
+    }
+
+    _stride = 9
+    _key = "frames"
+    _shape = (3, 3)
+    _view = _FrameView
+
+    def __init__(self, frames=None, **kwargs):
+        super(FrameArray, self).__init__(frames, **kwargs)
+        if frames is not None and not isinstance(frames, FrameArray):
+            _orthonormalize(self._xyz)
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def points(self):
+        return PointArray._from_buffer(_column(self._xyz, 9, 0))
+
+    @property
+    def xaxes(self):
+        return VectorArray._from_buffer(_column(self._xyz, 9, 3))
+
+    @property
+    def yaxes(self):
+        return VectorArray._from_buffer(_column(self._xyz, 9, 6))
+
+    @property
+    def zaxes(self):
+        return self.xaxes.cross(self.yaxes)
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def _item(self, item):
+        values = super(FrameArray, self)._item(item)
+        _orthonormalize(values)
+        return values
+
+    def extend(self, items):
+        """Add a sequence of frames at the end of the array.
+
+        Parameters
+        ----------
+        items : sequence[[point, vector, vector] | :class:`~compas.geometry.Frame`]
+            The frames.
+
+        Returns
+        -------
+        None
+
+        """
+        self._xyz.extend(FrameArray(items)._xyz)
+
+    # ==========================================================================
+    # Transformations
+    # ==========================================================================
+
+    def transform(self, T):
+        """Transform the frames.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation matrix.
+
+        Returns
+        -------
+        None
+            The frames are modified in place.
+
+        """
+        xyz = self._xyz
+        transform_coordinates(xyz, T, 9, 0, 1.0)
+        transform_coordinates(xyz, T, 9, 3, 0.0)
+        transform_coordinates(xyz, T, 9, 6, 0.0)
+        _orthonormalize(xyz)
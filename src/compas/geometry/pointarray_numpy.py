@@ -0,0 +1,220 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+
+from numpy import ascontiguousarray
+from numpy import asarray
+from numpy import cross
+from numpy import einsum
+from numpy import float64
+from numpy import frombuffer
+from numpy import matmul
+from numpy import sqrt
+
+
+def _view(values, stride=3):
+    # a writable (N, stride) view of a flat buffer of floats
+    return frombuffer(values, dtype=float64).reshape(-1, stride)
+
+
+def coordinates_from_numpy(a):
+    """Copy the values of a NumPy array into a flat buffer of floats.
+
+    Parameters
+    ----------
+    a : array_like
+        An array of numbers.
+
+    Returns
+    -------
+    array.array
+        The values of the array in row-major order, as ``float64`` values.
+
+    """
+    values = array("d")
+    values.frombytes(ascontiguousarray(a, dtype=float64).tobytes())
+    return values
+
+
+def transform_coordinates_numpy(values, matrix, stride=3, offset=0, w=1.0):
+    """Transform XYZ coordinates stored in a flat buffer of floats in place.
+
+    Parameters
+    ----------
+    values : array.array
+        The buffer, with the coordinates of an item every `stride` values.
+    matrix : list[list[float]]
+        The 4x4 transformation matrix.
+    stride : int, optional
+        The number of values per item.
+    offset : int, optional
+        The position of the XYZ coordinates in the values of an item.
+    w : float, optional
+        The homogeneous coordinate.
+        Use ``1.0`` for points, and ``0.0`` for vectors.
+
+    Returns
+    -------
+    None
+
+    """
+    xyz = _view(values, stride)[:, offset : offset + 3]
+    M = asarray(matrix, dtype=float64)
+    xyz[:] = _transformed(xyz, M, w)
+
+
+def transform_coordinates_batch_numpy(values, matrices, counts, stride=3, offset=0, w=1.0):
+    """Transform consecutive blocks of XYZ coordinates stored in a flat buffer of floats in place.
+
+    Parameters
+    ----------
+    values : array.array
+        The buffer, with the coordinates of an item every `stride` values.
+    matrices : list[list[list[float]]]
+        The 4x4 transformation matrices, one per block.
+    counts : list[int]
+        The number of items per block.
+    stride : int, optional
+        The number of values per item.
+    offset : int, optional
+        The position of the XYZ coordinates in the values of an item.
+    w : float, optional
+        The homogeneous coordinate.
+        Use ``1.0`` for points, and ``0.0`` for vectors.
+
+    Returns
+    -------
+    None
+
+    """
+    xyz = _view(values, stride)[:, offset : offset + 3]
+    M = asarray(matrices, dtype=float64).reshape(-1, 4, 4)
+    if len(set(counts)) == 1:
+        # blocks of equal size are transformed all at once
+        blocks = xyz.reshape(len(M), counts[0], 3)
+        result = matmul(blocks, M[:, :3, :3].transpose(0, 2, 1))
+        if w:
+            result += w * M[:, None, :3, 3]
+        if M[:, 3, :3].any() or (M[:, 3, 3] != 1.0).any():
+            h = matmul(blocks, M[:, 3, :3, None])[..., 0] + w * M[:, 3, 3, None]
+            h[h == 0] = 1.0
+            result /= h[..., None]
+        xyz[:] = result.reshape(-1, 3)
+        return
+    start = 0
+    for matrix, count in zip(M, counts):
+        block = xyz[start : start + count]
+        block[:] = _transformed(block, matrix, w)
+        start += count
+
+
+def _transformed(xyz, M, w):
+    # the transformed coordinates of an (N, 3) array
+    result = xyz.dot(M[:3, :3].T)
+    if w:
+        result += w * M[:3, 3]
+    if M[3, :3].any() or M[3, 3] != 1.0:
+        h = xyz.dot(M[3, :3]) + w * M[3, 3]
+        h[h == 0] = 1.0
+        result /= h[:, None]
+    return result
+
+
+def orthonormalize_frames_numpy(values):
+    """Orthonormalize the axes of frames stored in a flat buffer of floats in place.
+
+    Parameters
+    ----------
+    values : array.array
+        The buffer, with the point, X axis and Y axis of a frame every 9 values.
+
+    Returns
+    -------
+    None
+
+    """
+    frames = _view(values, 9)
+    xaxis = frames[:, 3:6]
+    yaxis = frames[:, 6:9]
+    xaxis /= sqrt(einsum("ij,ij->i", xaxis, xaxis))[:, None]
+    zaxis = cross(xaxis, yaxis)
+    zaxis /= sqrt(einsum("ij,ij->i", zaxis, zaxis))[:, None]
+    yaxis[:] = cross(zaxis, xaxis)
+
+
+def combine_coordinates_numpy(op, a, b):
+    """Combine the XYZ coordinates of a flat buffer of floats with a scalar or with other coordinates.
+
+    Parameters
+    ----------
+    op : callable
+        A binary operator, such as :func:`operator.add`.
+    a : array.array
+        The coordinates.
+    b : float | array.array
+        A scalar, the coordinates of a single item, or the coordinates of as many items as `a`.
+
+    Returns
+    -------
+    array.array
+        The result.
+
+    """
+    if not isinstance(b, float):
+        b = _view(b)
+    return coordinates_from_numpy(op(_view(a), b))
+
+
+def dot_coordinates_numpy(a, b):
+    """Compute the dot products of the items of two flat buffers of XYZ coordinates.
+
+    Parameters
+    ----------
+    a : array.array
+        The first coordinates.
+    b : array.array
+        The second coordinates, of a single item or of as many items as `a`.
+
+    Returns
+    -------
+    list[float]
+
+    """
+    return (_view(a) * _view(b)).sum(axis=1).tolist()
+
+
+def cross_coordinates_numpy(a, b):
+    """Compute the cross products of the items of two flat buffers of XYZ coordinates.
+
+    Parameters
+    ----------
+    a : array.array
+        The first coordinates.
+    b : array.array
+        The second coordinates, of a single item or of as many items as `a`.
+
+    Returns
+    -------
+    array.array
+
+    """
+    return coordinates_from_numpy(cross(_view(a), _view(b)))
+
+
+def unitize_coordinates_numpy(values):
+    """Scale the vectors of a flat buffer of XYZ coordinates to unit length in place.
+
+    Parameters
+    ----------
+    values : array.array
+        The coordinates.
+
+    Returns
+    -------
+    None
+
+    """
+    xyz = _view(values)
+    xyz /= sqrt(einsum("ij,ij->i", xyz, xyz))[:, None]
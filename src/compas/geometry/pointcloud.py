@@ -4,12 +4,15 @@ from __future__ import division
 
 from random import uniform
 
-from compas.geometry import transform_points
+from compas.geometry import multiply_matrices
+from compas.geometry import transform_coordinates
 from compas.geometry import centroid_points
 from compas.geometry import bounding_box
-from compas.geometry import closest_point_in_cloud
+from compas.geometry import KDTree
 from compas.geometry import Geometry
 from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import Transformation
 
 
 class Pointcloud(Geometry):
@@ -17,15 +20,31 @@ class Pointcloud(Geometry):
 
     Parameters
     ----------
-    points : sequence[point]
+    points : sequence[point] | :class:`~compas.geometry.PointArray`
         A sequence of points to add to the cloud.
+        The points of a :class:`~compas.geometry.PointArray` are stored in a copy of the array.
     **kwargs : dict[str, Any], optional
         Additional keyword arguments collected in a dict.
 
     Attributes
     ----------
-    points : list[:class:`~compas.geometry.Point`]
+    points : list[:class:`~compas.geometry.Point`] | :class:`~compas.geometry.PointArray`
         The points of the cloud.
+        If the cloud was created from a :class:`~compas.geometry.PointArray`, the points are stored in an array,
+        and the cloud is transformed with a single vectorized operation.
+    tree : :class:`~compas.geometry.KDTree`, read-only
+        A spatial index of the points of the cloud, for repeated queries.
+        The index is built on first use, and rebuilt when the points are replaced or transformed.
+        It is not updated when points are added or modified in place,
+        in which case the points should be set again.
+        The methods of the cloud, such as :meth:`closest_point`, don't use this index.
+    lazy_transform : bool
+        If True, :meth:`transform` composes the transformation with the pending transformation of the cloud,
+        instead of transforming the points.
+        The pending transformation is applied when the points are accessed, and when lazy transformations are turned off.
+        Default is False.
+    pending_transformation : :class:`~compas.geometry.Transformation` | None, read-only
+        The transformation that is not yet applied to the points.
 
     Examples
     --------
@@ -44,6 +63,9 @@ class Pointcloud(Geometry):
     def __init__(self, points, **kwargs):
         super(Pointcloud, self).__init__(**kwargs)
         self._points = None
+        self._tree = None
+        self._lazy_transform = False
+        self._pending_transformation = None
         self.points = points
 
     def __repr__(self):
@@ -61,6 +83,7 @@ class Pointcloud(Geometry):
         if key > len(self) - 1:
             raise KeyError
         self.points[key] = value
+        self._tree = None
 
     def __iter__(self):
         return iter(self.points)
@@ -78,6 +101,8 @@ class Pointcloud(Geometry):
 
     @property
     def data(self):
+        if isinstance(self.points, PointArray):
+            return {"points": self.points.tolist()}
         return {"points": [point.data for point in self.points]}
 
     # ==========================================================================
@@ -86,13 +111,40 @@ class Pointcloud(Geometry):
 
     @property
     def points(self):
+        if self._pending_transformation is not None:
+            self.flush_transformation()
         if self._points is None:
             self._points = []
         return self._points
 
     @points.setter
     def points(self, points):
-        self._points = [Point(*point) for point in points]
+        if isinstance(points, PointArray):
+            self._points = points.copy()
+        else:
+            self._points = [Point(*point) for point in points]
+        self._pending_transformation = None
+        self._tree = None
+
+    @property
+    def lazy_transform(self):
+        return self._lazy_transform
+
+    @lazy_transform.setter
+    def lazy_transform(self, value):
+        if not value:
+            self.flush_transformation()
+        self._lazy_transform = bool(value)
+
+    @property
+    def pending_transformation(self):
+        return self._pending_transformation
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self._tree = KDTree(self.points)
+        return self._tree
 
     @property
     def centroid(self):
@@ -131,13 +183,50 @@ class Pointcloud(Geometry):
         """
         from compas.files import PLY
 
-        points = []
         ply = PLY(filepath)
+        if ply.parser.arrays is not None:  # type: ignore
+            return cls(PointArray(ply.parser.arrays[0]))  # type: ignore
+        points = []
         for vertex in ply.reader.vertices:  # type: ignore
             points.append([vertex["x"], vertex["y"], vertex["z"]])
         cloud = cls(points)
         return cloud
 
+    @classmethod
+    def from_las(cls, filepath, box=None, classification=None, chunksize=1048576):
+        """Construct a pointcloud from a LAS file.
+
+        Parameters
+        ----------
+        filepath : str | bytes | os.PathLike
+            Path of the LAS file.
+        box : tuple[[float, float, float], [float, float, float]], optional
+            The minimum and maximum corners of an axis-aligned box.
+            Only the points inside the box are included.
+        classification : int | sequence[int], optional
+            Only the points of the given classes are included.
+        chunksize : int, optional
+            The maximum number of point records that is read and filtered at once.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Pointcloud`
+
+        Notes
+        -----
+        The points are filtered with NumPy while the file is read,
+        using :func:`compas.files.las_iter_numpy`,
+        and stored in a :class:`~compas.geometry.PointArray`, without creating a point object per point.
+
+        """
+        from numpy import concatenate
+        from compas.files.las_numpy import las_iter_numpy
+
+        chunks = [xyz for xyz, _ in las_iter_numpy(filepath, chunksize, box=box, classification=classification)]
+        if not chunks:
+            return cls([])
+        return cls(PointArray(concatenate(chunks)))
+
     @classmethod
     def from_pcd(cls, filepath):
         """Construct a pointcloud from a PCD file.
@@ -264,11 +353,66 @@ class Pointcloud(Geometry):
         -------
         None
             The cloud is modified in place.
+
+        """
+        if self._lazy_transform:
+            self.defer_transformation(T)
+            return
+        xyz = self.__coordinates__()
+        transform_coordinates(xyz, T)
+        self.__set_coordinates__(xyz)
+
+    def defer_transformation(self, T):
+        """Compose a transformation with the pending transformation of the pointcloud.
+
+        Parameters
+        ----------
+        T : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+
         """
-        for index, point in enumerate(transform_points(self.points, T)):
-            self.points[index].x = point[0]
-            self.points[index].y = point[1]
-            self.points[index].z = point[2]
+        pending = self._pending_transformation
+        if pending is None:
+            matrix = [list(row) for row in T]
+        else:
+            matrix = multiply_matrices(T, pending.matrix)
+        self._pending_transformation = Transformation(matrix)
+
+    def flush_transformation(self):
+        """Apply the pending transformation to the points of the pointcloud.
+
+        Returns
+        -------
+        None
+
+        """
+        T = self._pending_transformation
+        if T is None:
+            return
+        self._pending_transformation = None
+        xyz = self.__coordinates__()
+        transform_coordinates(xyz, T)
+        self.__set_coordinates__(xyz)
+
+    def __coordinates__(self):
+        # the coordinates of the points as a flat buffer of floats,
+        # for the batched transformations of :func:`compas.geometry.transform_objects`
+        if isinstance(self.points, PointArray):
+            return self.points.buffer
+        return PointArray(self.points).buffer
+
+    def __set_coordinates__(self, values):
+        if isinstance(self.points, PointArray):
+            if values is not self.points.buffer:
+                self.points.buffer[:] = values
+        else:
+            for point, start in zip(self.points, range(0, len(values), 3)):
+                point.x, point.y, point.z = values[start : start + 3]
+        self._tree = None
 
     # ==========================================================================
     # Methods
@@ -288,5 +432,34 @@ class Pointcloud(Geometry):
             The closest point on the pointcloud.
 
         """
-        distance, point, index = closest_point_in_cloud(point, self.points)
-        return point
+        x, y, z = point[0], point[1], point[2]
+        xyz = self.__coordinates__()
+        if not len(xyz):
+            return None
+        index = min(
+            range(0, len(xyz), 3),
+            key=lambda i: (xyz[i] - x) ** 2 + (xyz[i + 1] - y) ** 2 + (xyz[i + 2] - z) ** 2,
+        )
+        return self.points[index // 3]
+
+    def closest_points(self, points):
+        """Compute the closest points on the pointcloud to many points at once.
+
+        Parameters
+        ----------
+        points : sequence[:class:`~compas.geometry.Point`]
+            The points.
+
+        Returns
+        -------
+        list[:class:`~compas.geometry.Point`]
+            The closest point on the pointcloud per point.
+
+        Notes
+        -----
+        The search uses a spatial index of the points, which is built for every call.
+        For many queries with the same points, use :attr:`tree` directly.
+
+        """
+        indices, _ = KDTree(self.points).nearest_neighbors_bulk(points, 1)
+        return [self.points[index[0]] for index in indices]
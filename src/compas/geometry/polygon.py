@@ -123,6 +123,14 @@ class Polygon(Geometry):
     def data(self):
         return {"points": [point.data for point in self.points]}
 
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._points = [point.__copy_fast__() for point in self._points]
+        other._lines = None
+        other._vertices = []
+        other._faces = []
+        return other
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -181,6 +181,9 @@ class Quaternion(Geometry):
     def data(self):
         return {"w": self.w, "x": self.x, "y": self.y, "z": self.z}
 
+    def __copy_fast__(self):
+        return self._copy_shallow()
+
     # ==========================================================================
     # Properties
     # ==========================================================================
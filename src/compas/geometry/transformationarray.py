@@ -0,0 +1,694 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from array import array
+from itertools import chain
+from math import acos
+from math import sin
+from math import sqrt
+
+import compas
+
+from compas.data import Data
+from compas.geometry import matrix_inverse
+from compas.geometry import quaternion_from_matrix
+
+from .transformation import Transformation
+from .pointarray import FrameArray
+from .pointarray import PointArray
+from .pointarray import VectorArray
+from .pointarray import transform_coordinates_batch
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    _USE_NUMPY = False
+else:
+    _USE_NUMPY = not compas.IPY
+
+# the minimum number of matrices for which the operations are computed with NumPy
+_NUMPY_THRESHOLD = 16
+
+
+# ==============================================================================
+# Kernels
+# ==============================================================================
+
+
+def _flatten(transformations):
+    # the matrices of a sequence of transformations as a flat buffer of floats
+    if isinstance(transformations, TransformationArray):
+        return transformations._matrices[:]
+    if hasattr(transformations, "__array_interface__"):
+        from .pointarray_numpy import coordinates_from_numpy
+
+        if len(transformations) and tuple(transformations.shape[1:]) != (4, 4):
+            raise ValueError("Expected an array of shape (N, 4, 4), got {}.".format(transformations.shape))
+        return coordinates_from_numpy(transformations)
+    values = array("d")
+    for T in transformations:
+        values.extend(_matrix(T))
+    return values
+
+
+def _matrix(T):
+    # the 16 values of a single transformation
+    values = array("d", chain.from_iterable(T.matrix if isinstance(T, Transformation) else T))
+    if len(values) != 16:
+        raise ValueError("Expected a 4x4 matrix.")
+    return values
+
+
+def _use_numpy(count):
+    return _USE_NUMPY and count >= _NUMPY_THRESHOLD
+
+
+def _concatenate(a, b):
+    # the products of the matrices of two buffers, one of which may contain a single matrix
+    count = max(len(a), len(b)) // 16
+    if _use_numpy(count):
+        from .transformationarray_numpy import concatenate_matrices_numpy
+
+        return concatenate_matrices_numpy(a, b)
+    step_a = 16 if len(a) > 16 else 0
+    step_b = 16 if len(b) > 16 else 0
+    result = array("d", [0.0]) * (16 * count)
+    for k in range(count):
+        A = a[k * step_a : k * step_a + 16]
+        B = b[k * step_b : k * step_b + 16]
+        for i in range(0, 16, 4):
+            a0, a1, a2, a3 = A[i : i + 4]
+            for j in range(4):
+                result[16 * k + i + j] = a0 * B[j] + a1 * B[4 + j] + a2 * B[8 + j] + a3 * B[12 + j]
+    return result
+
+
+def _invert(values):
+    # the inverses of the matrices of a buffer
+    if _use_numpy(len(values) // 16):
+        from .transformationarray_numpy import invert_matrices_numpy
+
+        return invert_matrices_numpy(values)
+    result = array("d")
+    for start in range(0, len(values), 16):
+        M = values[start : start + 16]
+        if M[12] or M[13] or M[14] or M[15] != 1.0:
+            result.extend(chain.from_iterable(matrix_inverse([M[0:4], M[4:8], M[8:12], M[12:16]])))
+            continue
+        # affine transformations are inverted by inverting the 3x3 part
+        a, b, c, x, d, e, f, y, g, h, i, z = M[:12]
+        A = e * i - f * h
+        B = f * g - d * i
+        C = d * h - e * g
+        det = a * A + b * B + c * C
+        if not det:
+            raise ValueError("The matrix is singular.")
+        R = [
+            A / det,
+            (c * h - b * i) / det,
+            (b * f - c * e) / det,
+            B / det,
+            (a * i - c * g) / det,
+            (c * d - a * f) / det,
+            C / det,
+            (b * g - a * h) / det,
+            (a * e - b * d) / det,
+        ]
+        result.extend(R[0:3])
+        result.append(-(R[0] * x + R[1] * y + R[2] * z))
+        result.extend(R[3:6])
+        result.append(-(R[3] * x + R[4] * y + R[5] * z))
+        result.extend(R[6:9])
+        result.append(-(R[6] * x + R[7] * y + R[8] * z))
+        result.extend([0.0, 0.0, 0.0, 1.0])
+    return result
+
+
+def _decompose(values):
+    # the scale factors, quaternions and translations of the matrices of a buffer
+    if _use_numpy(len(values) // 16):
+        from .transformationarray_numpy import decompose_matrices_numpy
+
+        return decompose_matrices_numpy(values)
+    scales = array("d")
+    quaternions = array("d")
+    translations = array("d")
+    for start in range(0, len(values), 16):
+        M = values[start : start + 16]
+        u, v, w = M[0:9:4], M[1:10:4], M[2:11:4]
+        scale = [sqrt(u[0] ** 2 + u[1] ** 2 + u[2] ** 2), sqrt(v[0] ** 2 + v[1] ** 2 + v[2] ** 2)]
+        scale.append(sqrt(w[0] ** 2 + w[1] ** 2 + w[2] ** 2))
+        det = (
+            u[0] * (v[1] * w[2] - v[2] * w[1]) + u[1] * (v[2] * w[0] - v[0] * w[2]) + u[2] * (v[0] * w[1] - v[1] * w[0])
+        )
+        if det < 0:
+            scale = [-s for s in scale]
+        R = [[M[4 * i + j] / scale[j] for j in range(3)] for i in range(3)]
+        scales.extend(scale)
+        quaternions.extend(quaternion_from_matrix(R))
+        translations.extend([M[3], M[7], M[11]])
+    return scales, quaternions, translations
+
+
+def _compose(scales, quaternions, translations):
+    # the matrices of scale factors, quaternions and translations
+    if _use_numpy(len(quaternions) // 4):
+        from .transformationarray_numpy import compose_matrices_numpy
+
+        return compose_matrices_numpy(scales, quaternions, translations)
+    result = array("d")
+    for k in range(len(quaternions) // 4):
+        sx, sy, sz = scales[3 * k : 3 * k + 3]
+        w, x, y, z = quaternions[4 * k : 4 * k + 4]
+        tx, ty, tz = translations[3 * k : 3 * k + 3]
+        n = sqrt(w * w + x * x + y * y + z * z)
+        w, x, y, z = w / n, x / n, y / n, z / n
+        result.extend(
+            [
+                (1.0 - 2.0 * (y * y + z * z)) * sx,
+                2.0 * (x * y - z * w) * sy,
+                2.0 * (x * z + y * w) * sz,
+                tx,
+                2.0 * (x * y + z * w) * sx,
+                (1.0 - 2.0 * (x * x + z * z)) * sy,
+                2.0 * (y * z - x * w) * sz,
+                ty,
+                2.0 * (x * z - y * w) * sx,
+                2.0 * (y * z + x * w) * sy,
+                (1.0 - 2.0 * (x * x + y * y)) * sz,
+                tz,
+                0.0,
+                0.0,
+                0.0,
+                1.0,
+            ]
+        )
+    return result
+
+
+def _slerp(q0, q1, t):
+    # the spherical linear interpolation of two unit quaternions
+    d = sum(a * b for a, b in zip(q0, q1))
+    if d < 0:
+        q1 = [-b for b in q1]
+        d = -d
+    if d > 0.9995:
+        w0, w1 = 1.0 - t, t
+    else:
+        theta = acos(min(d, 1.0))
+        w0 = sin((1.0 - t) * theta) / sin(theta)
+        w1 = sin(t * theta) / sin(theta)
+    q = [w0 * a + w1 * b for a, b in zip(q0, q1)]
+    n = sqrt(sum(a * a for a in q))
+    return [a / n for a in q]
+
+
+def _interpolate(a, b, t):
+    # the interpolated matrices of two buffers
+    if _use_numpy(len(a) // 16):
+        from .transformationarray_numpy import interpolate_matrices_numpy
+
+        return interpolate_matrices_numpy(a, b, t)
+    S0, Q0, T0 = _decompose(a)
+    S1, Q1, T1 = _decompose(b)
+    count = len(a) // 16
+    t = [float(t)] * count if isinstance(t, (int, float)) else list(t)
+    S = array("d", [s0 + t[k // 3] * (s1 - s0) for k, (s0, s1) in enumerate(zip(S0, S1))])
+    T = array("d", [t0 + t[k // 3] * (t1 - t0) for k, (t0, t1) in enumerate(zip(T0, T1))])
+    Q = array("d")
+    for k in range(count):
+        Q.extend(_slerp(Q0[4 * k : 4 * k + 4], Q1[4 * k : 4 * k + 4], t[k]))
+    return _compose(S, Q, T)
+
+
+# ==============================================================================
+# Array
+# ==============================================================================
+
+
+class TransformationArray(Data):
+    """An array of transformations, stored in a single, contiguous buffer of 4x4 matrices.
+
+    Parameters
+    ----------
+    transformations : sequence[:class:`~compas.geometry.Transformation` | list[list[float]]], optional
+        The transformations.
+        A NumPy array of shape (N, 4, 4) is also accepted.
+
+    Attributes
+    ----------
+    buffer : array.array, read-only
+        The matrices of the transformations, in row-major order, as a flat buffer of 16 floats per transformation.
+
+    Notes
+    -----
+    The operations on the array are applied to all transformations at once,
+    with NumPy if it is available and the array is large enough.
+    Combining an array with a single transformation, or with an array of a single transformation,
+    combines the single transformation with every transformation of the array.
+
+    The rotations of :meth:`decomposed` and :meth:`interpolated` are computed from the 3x3 part of the matrices,
+    after removing the scale factors.
+    Shear and perspective are not taken into account.
+
+    Examples
+    --------
+    >>> from compas.geometry import Rotation, Translation
+    >>> R = TransformationArray([Rotation.from_axis_and_angle([0, 0, 1], 0.1 * i) for i in range(10)])
+    >>> T = Translation.from_vector([1, 0, 0])
+    >>> X = R * T
+    >>> points = X.transformed_points([[0, 0, 0]] * 10)
+    >>> I = X * X.inverse()
+
+    """
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "matrices": {
+                "type": "array",
+                "items": Transformation.DATASCHEMA["properties"]["matrix"],
+            },
+        },
+        "required": ["matrices"],
+    }
+
+    def __init__(self, transformations=None, **kwargs):
+        super(TransformationArray, self).__init__(**kwargs)
+        self._matrices = _flatten(transformations) if transformations is not None else array("d")
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, self.tolist())
+
+    def __len__(self):
+        return len(self._matrices) // 16
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._from_buffer(self._matrices[start * 16 : max(start, stop) * 16])
+            values = array("d")
+            for index in range(start, stop, step):
+                values.extend(self._matrices[index * 16 : (index + 1) * 16])
+            return self._from_buffer(values)
+        count = len(self)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("Index out of range.")
+        M = self._matrices[key * 16 : (key + 1) * 16].tolist()
+        return Transformation([M[0:4], M[4:8], M[8:12], M[12:16]])
+
+    def __setitem__(self, key, value):
+        count = len(self)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("Index out of range.")
+        self._matrices[key * 16 : (key + 1) * 16] = _matrix(value)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other, tol=1e-05):
+        try:
+            values = _flatten(other)
+        except (TypeError, ValueError):
+            return False
+        if len(values) != len(self._matrices):
+            return False
+        return all(abs(a - b) <= tol for a, b in zip(self._matrices, values))
+
+    def __ne__(self, other):
+        # this is not obvious to ironpython
+        return not self.__eq__(other)
+
+    def __mul__(self, other):
+        return self.concatenated(other)
+
+    # ==========================================================================
+    # Data
+    # ==========================================================================
+
+    @property
+    def data(self):
+        return {"matrices": self.tolist()}
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data["matrices"])
+
+    def __copy_fast__(self):
+        other = self._copy_shallow()
+        other._matrices = self._matrices[:]
+        return other
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def buffer(self):
+        return self._matrices
+
+    # ==========================================================================
+    # Constructors
+    # ==========================================================================
+
+    @classmethod
+    def _from_buffer(cls, values):
+        transformations = cls()
+        transformations._matrices = values
+        return transformations
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Construct the transformations from the world coordinate system to frames.
+
+        Parameters
+        ----------
+        frames : sequence[:class:`~compas.geometry.Frame`] | :class:`~compas.geometry.FrameArray`
+            The frames.
+
+        Returns
+        -------
+        :class:`~compas.geometry.TransformationArray`
+
+        See Also
+        --------
+        :meth:`compas.geometry.Transformation.from_frame`
+
+        """
+        frames = frames if isinstance(frames, FrameArray) else FrameArray(frames)
+        xyz = frames.buffer
+        zaxes = frames.zaxes.buffer
+        values = array("d", [0.0]) * (16 * len(frames))
+        for k in range(3):
+            values[k * 4 + 3 :: 16] = xyz[k::9]
+            values[k * 4 :: 16] = xyz[k + 3 :: 9]
+            values[k * 4 + 1 :: 16] = xyz[k + 6 :: 9]
+            values[k * 4 + 2 :: 16] = zaxes[k::3]
+        values[15::16] = array("d", [1.0]) * len(frames)
+        return cls._from_buffer(values)
+
+    @classmethod
+    def from_decomposition(cls, scales, quaternions, translations):
+        """Construct the transformations from scale factors, rotations and translations.
+
+        Parameters
+        ----------
+        scales : sequence[[float, float, float]]
+            The scale factors along the X, Y and Z axes.
+        quaternions : sequence[[float, float, float, float]]
+            The rotations as quaternions (W, X, Y, Z).
+        translations : sequence[[float, float, float]]
+            The translation vectors.
+
+        Returns
+        -------
+        :class:`~compas.geometry.TransformationArray`
+
+        Raises
+        ------
+        ValueError
+            If the numbers of scale factors, rotations and translations are not the same.
+
+        See Also
+        --------
+        :meth:`decomposed`
+
+        """
+        S = array("d", chain.from_iterable(scales))
+        Q = array("d", chain.from_iterable(quaternions))
+        T = array("d", chain.from_iterable(translations))
+        if not len(S) // 3 == len(Q) // 4 == len(T) // 3:
+            raise ValueError("Expected the same number of scale factors, rotations and translations.")
+        return cls._from_buffer(_compose(S, Q, T))
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def _operand(self, other):
+        # the matrices of a single transformation or of one transformation per transformation of the array
+        if isinstance(other, TransformationArray):
+            values = other._matrices
+        elif isinstance(other, Transformation) or not (
+            isinstance(other[0], Transformation) or hasattr(other[0][0], "__len__")
+        ):
+            values = _matrix(other)
+        else:
+            values = _flatten(other)
+        if len(values) != 16 and len(self._matrices) != 16 and len(values) != len(self._matrices):
+            raise ValueError("Expected a single transformation or {} transformations.".format(len(self)))
+        return values
+
+    def tolist(self):
+        """Convert the array to a list of 4x4 matrices.
+
+        Returns
+        -------
+        list[list[list[float]]]
+
+        """
+        if _USE_NUMPY:
+            from numpy import frombuffer
+
+            return frombuffer(self._matrices, dtype=float).reshape(-1, 4, 4).tolist()
+        M = self._matrices.tolist()
+        return [[M[start : start + 4] for start in range(row, row + 16, 4)] for row in range(0, len(M), 16)]
+
+    def append(self, transformation):
+        """Add a transformation at the end of the array.
+
+        Parameters
+        ----------
+        transformation : :class:`~compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        self._matrices.extend(_matrix(transformation))
+
+    def extend(self, transformations):
+        """Add a sequence of transformations at the end of the array.
+
+        Parameters
+        ----------
+        transformations : sequence[:class:`~compas.geometry.Transformation` | list[list[float]]]
+            The transformations.
+
+        Returns
+        -------
+        None
+
+        """
+        self._matrices.extend(_flatten(transformations))
+
+    def concatenate(self, other):
+        """Concatenate other transformations to the transformations of this array.
+
+        Parameters
+        ----------
+        other : :class:`~compas.geometry.TransformationArray` | :class:`~compas.geometry.Transformation`
+            A single transformation, or one transformation per transformation of the array.
+
+        Returns
+        -------
+        None
+            The array is modified in place.
+
+        Raises
+        ------
+        ValueError
+            If the number of transformations does not match.
+
+        Notes
+        -----
+        As for :meth:`compas.geometry.Transformation.concatenate`,
+        the other transformations are applied first.
+
+        """
+        self._matrices = _concatenate(self._matrices, self._operand(other))
+
+    def concatenated(self, other):
+        """Concatenate other transformations to the transformations of this array.
+
+        Parameters
+        ----------
+        other : :class:`~compas.geometry.TransformationArray` | :class:`~compas.geometry.Transformation`
+            A single transformation, or one transformation per transformation of the array.
+
+        Returns
+        -------
+        :class:`~compas.geometry.TransformationArray`
+            The products of the transformations.
+
+        Raises
+        ------
+        ValueError
+            If the number of transformations does not match.
+
+        """
+        return self._from_buffer(_concatenate(self._matrices, self._operand(other)))
+
+    def invert(self):
+        """Invert the transformations.
+
+        Returns
+        -------
+        None
+            The array is modified in place.
+
+        Raises
+        ------
+        ValueError
+            If one of the transformations is singular.
+
+        """
+        self._matrices = _invert(self._matrices)
+
+    def inverse(self):
+        """Returns the inverse transformations.
+
+        Returns
+        -------
+        :class:`~compas.geometry.TransformationArray`
+            The inverse transformations.
+
+        Raises
+        ------
+        ValueError
+            If one of the transformations is singular.
+
+        """
+        return self._from_buffer(_invert(self._matrices))
+
+    inverted = inverse
+
+    def decomposed(self):
+        """Decompose the transformations into scale factors, rotations and translations.
+
+        Returns
+        -------
+        list[[float, float, float]]
+            The scale factors along the X, Y and Z axes.
+            The scale factors are negative for transformations that include a reflection.
+        list[[float, float, float, float]]
+            The rotations as unit quaternions (W, X, Y, Z).
+        list[[float, float, float]]
+            The translation vectors.
+
+        See Also
+        --------
+        :meth:`from_decomposition`
+
+        """
+        S, Q, T = _decompose(self._matrices)
+        return (
+            [S[k : k + 3].tolist() for k in range(0, len(S), 3)],
+            [Q[k : k + 4].tolist() for k in range(0, len(Q), 4)],
+            [T[k : k + 3].tolist() for k in range(0, len(T), 3)],
+        )
+
+    def interpolated(self, other, t):
+        """Interpolate between the transformations of this array and other transformations.
+
+        Parameters
+        ----------
+        other : :class:`~compas.geometry.TransformationArray` | :class:`~compas.geometry.Transformation`
+            A single transformation, or one transformation per transformation of the array.
+        t : float | sequence[float]
+            The interpolation parameter, or one parameter per transformation.
+            The parameter ``0.0`` corresponds to the transformations of this array,
+            and ``1.0`` to the other transformations.
+
+        Returns
+        -------
+        :class:`~compas.geometry.TransformationArray`
+            The interpolated transformations.
+
+        Raises
+        ------
+        ValueError
+            If the number of transformations or parameters does not match.
+
+        Notes
+        -----
+        The scale factors and translations are interpolated linearly,
+        and the rotations with a spherical linear interpolation (slerp) of their quaternions.
+
+        """
+        values = self._operand(other)
+        a = self._matrices
+        count = max(len(a), len(values)) // 16
+        if len(a) != len(values):
+            a = a * count if len(a) == 16 else a
+            values = values * count if len(values) == 16 else values
+        if not isinstance(t, (int, float)):
+            t = [float(value) for value in t]
+            if len(t) != count:
+                raise ValueError("Expected a single parameter or {} parameters.".format(count))
+        return self._from_buffer(_interpolate(a, values, t))
+
+    def transformed_points(self, points, counts=None):
+        """Transform blocks of points, each with its own transformation.
+
+        Parameters
+        ----------
+        points : sequence[point] | :class:`~compas.geometry.PointArray`
+            The points, in consecutive blocks, one per transformation.
+        counts : sequence[int], optional
+            The number of points per block.
+            Default is blocks of equal size.
+
+        Returns
+        -------
+        :class:`~compas.geometry.PointArray`
+            The transformed points.
+
+        Raises
+        ------
+        ValueError
+            If the blocks don't cover the points.
+
+        See Also
+        --------
+        :func:`compas.geometry.transform_coordinates_batch`
+
+        """
+        points = PointArray(points)
+        transform_coordinates_batch(points.buffer, self.tolist(), counts)
+        return points
+
+    def transformed_vectors(self, vectors, counts=None):
+        """Transform blocks of vectors, each with its own transformation.
+
+        Parameters
+        ----------
+        vectors : sequence[vector] | :class:`~compas.geometry.VectorArray`
+            The vectors, in consecutive blocks, one per transformation.
+        counts : sequence[int], optional
+            The number of vectors per block.
+            Default is blocks of equal size.
+
+        Returns
+        -------
+        :class:`~compas.geometry.VectorArray`
+            The transformed vectors.
+
+        Raises
+        ------
+        ValueError
+            If the blocks don't cover the vectors.
+
+        """
+        vectors = VectorArray(vectors)
+        transform_coordinates_batch(vectors.buffer, self.tolist(), counts, w=0.0)
+        return vectors
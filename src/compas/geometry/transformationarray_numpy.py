@@ -0,0 +1,222 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arccos
+from numpy import asarray
+from numpy import clip
+from numpy import column_stack
+from numpy import einsum
+from numpy import empty
+from numpy import errstate
+from numpy import float64
+from numpy import frombuffer
+from numpy import matmul
+from numpy import sin
+from numpy import sqrt
+from numpy import where
+from numpy.linalg import LinAlgError
+from numpy.linalg import det
+from numpy.linalg import inv
+
+from .pointarray_numpy import coordinates_from_numpy
+
+
+def _matrices(values):
+    # a writable (N, 4, 4) view of a flat buffer of matrices
+    return frombuffer(values, dtype=float64).reshape(-1, 4, 4)
+
+
+def concatenate_matrices_numpy(a, b):
+    """Multiply the 4x4 matrices of two flat buffers of floats.
+
+    Parameters
+    ----------
+    a : array.array
+        The first matrices, in row-major order.
+    b : array.array
+        The second matrices, in row-major order.
+        One of the buffers may contain a single matrix, which is combined with all matrices of the other.
+
+    Returns
+    -------
+    array.array
+        The products ``a[i] * b[i]``.
+
+    """
+    return coordinates_from_numpy(matmul(_matrices(a), _matrices(b)))
+
+
+def invert_matrices_numpy(values):
+    """Invert the 4x4 matrices of a flat buffer of floats.
+
+    Parameters
+    ----------
+    values : array.array
+        The matrices, in row-major order.
+
+    Returns
+    -------
+    array.array
+        The inverse matrices.
+
+    Raises
+    ------
+    ValueError
+        If one of the matrices is singular.
+
+    """
+    try:
+        return coordinates_from_numpy(inv(_matrices(values)))
+    except LinAlgError:
+        raise ValueError("The matrix is singular.")
+
+
+def decompose_matrices_numpy(values):
+    """Decompose the 4x4 matrices of a flat buffer of floats into scale factors, rotations and translations.
+
+    Parameters
+    ----------
+    values : array.array
+        The matrices, in row-major order.
+
+    Returns
+    -------
+    tuple[array.array, array.array, array.array]
+        The scale factors along the X, Y and Z axes of every matrix,
+        the rotations as unit quaternions (W, X, Y, Z),
+        and the translation vectors.
+
+    """
+    scales, quaternions, translations = _decomposed(_matrices(values))
+    return coordinates_from_numpy(scales), coordinates_from_numpy(quaternions), coordinates_from_numpy(translations)
+
+
+def compose_matrices_numpy(scales, quaternions, translations):
+    """Compose 4x4 matrices from scale factors, rotations and translations.
+
+    Parameters
+    ----------
+    scales : array.array
+        The scale factors along the X, Y and Z axes of every matrix.
+    quaternions : array.array
+        The rotations as quaternions (W, X, Y, Z).
+    translations : array.array
+        The translation vectors.
+
+    Returns
+    -------
+    array.array
+        The matrices, in row-major order.
+
+    """
+    S = frombuffer(scales, dtype=float64).reshape(-1, 3)
+    Q = frombuffer(quaternions, dtype=float64).reshape(-1, 4)
+    T = frombuffer(translations, dtype=float64).reshape(-1, 3)
+    return coordinates_from_numpy(_composed(S, Q, T))
+
+
+def interpolate_matrices_numpy(a, b, t):
+    """Interpolate between the 4x4 matrices of two flat buffers of floats.
+
+    Parameters
+    ----------
+    a : array.array
+        The matrices at the start, in row-major order.
+    b : array.array
+        The matrices at the end, in row-major order.
+    t : float | list[float]
+        The interpolation parameter, or one parameter per matrix.
+
+    Returns
+    -------
+    array.array
+        The interpolated matrices.
+
+    Notes
+    -----
+    The scale factors and translations are interpolated linearly,
+    and the rotations with a spherical linear interpolation of their quaternions.
+
+    """
+    S0, Q0, T0 = _decomposed(_matrices(a))
+    S1, Q1, T1 = _decomposed(_matrices(b))
+    t = asarray(t, dtype=float64).reshape(-1, 1)
+    S = S0 + t * (S1 - S0)
+    T = T0 + t * (T1 - T0)
+    return coordinates_from_numpy(_composed(S, _slerp(Q0, Q1, t), T))
+
+
+def _decomposed(M):
+    # the scale factors, quaternions and translations of an (N, 4, 4) array of matrices
+    R = M[:, :3, :3]
+    S = sqrt(einsum("nij,nij->nj", R, R))
+    S[det(R) < 0] *= -1
+    R = R / S[:, None, :]
+    return S, _quaternions(R), M[:, :3, 3].copy()
+
+
+def _quaternions(R):
+    # the quaternions of an (N, 3, 3) array of rotation matrices,
+    # with the same case distinction as quaternion_from_matrix
+    r00, r01, r02 = R[:, 0, 0], R[:, 0, 1], R[:, 0, 2]
+    r10, r11, r12 = R[:, 1, 0], R[:, 1, 1], R[:, 1, 2]
+    r20, r21, r22 = R[:, 2, 0], R[:, 2, 1], R[:, 2, 2]
+    trace = r00 + r11 + r22
+    Q = empty((len(R), 4))
+    cases = empty(len(R), dtype=int)
+    cases[:] = 3
+    cases[r11 > r22] = 2
+    cases[(r00 > r11) & (r00 > r22)] = 1
+    cases[trace > 0.0] = 0
+    with errstate(divide="ignore", invalid="ignore"):
+        m = cases == 0
+        s = 2.0 * sqrt(trace[m] + 1.0)
+        Q[m] = column_stack([0.25 * s, (r21 - r12)[m] / s, (r02 - r20)[m] / s, (r10 - r01)[m] / s])
+        m = cases == 1
+        s = 2.0 * sqrt(1.0 + r00[m] - r11[m] - r22[m])
+        Q[m] = column_stack([(r21 - r12)[m] / s, 0.25 * s, (r01 + r10)[m] / s, (r02 + r20)[m] / s])
+        m = cases == 2
+        s = 2.0 * sqrt(1.0 + r11[m] - r00[m] - r22[m])
+        Q[m] = column_stack([(r02 - r20)[m] / s, (r01 + r10)[m] / s, 0.25 * s, (r12 + r21)[m] / s])
+        m = cases == 3
+        s = 2.0 * sqrt(1.0 + r22[m] - r00[m] - r11[m])
+        Q[m] = column_stack([(r10 - r01)[m] / s, (r02 + r20)[m] / s, (r12 + r21)[m] / s, 0.25 * s])
+    return Q
+
+
+def _composed(S, Q, T):
+    # the (N, 4, 4) matrices of scale factors, quaternions and translations
+    Q = Q / sqrt(einsum("ij,ij->i", Q, Q))[:, None]
+    w, x, y, z = Q.T
+    M = empty((len(Q), 4, 4))
+    M[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    M[:, 0, 1] = 2.0 * (x * y - z * w)
+    M[:, 0, 2] = 2.0 * (x * z + y * w)
+    M[:, 1, 0] = 2.0 * (x * y + z * w)
+    M[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    M[:, 1, 2] = 2.0 * (y * z - x * w)
+    M[:, 2, 0] = 2.0 * (x * z - y * w)
+    M[:, 2, 1] = 2.0 * (y * z + x * w)
+    M[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    M[:, :3, :3] *= S[:, None, :]
+    M[:, :3, 3] = T
+    M[:, 3, :3] = 0.0
+    M[:, 3, 3] = 1.0
+    return M
+
+
+def _slerp(Q0, Q1, t):
+    # the spherical linear interpolation of two (N, 4) arrays of unit quaternions
+    d = einsum("ij,ij->i", Q0, Q1)
+    Q1 = where((d < 0)[:, None], -Q1, Q1)
+    d = clip(abs(d), 0.0, 1.0)[:, None]
+    theta = arccos(d)
+    with errstate(divide="ignore", invalid="ignore"):
+        w0 = sin((1.0 - t) * theta) / sin(theta)
+        w1 = sin(t * theta) / sin(theta)
+    linear = d > 0.9995
+    w0 = where(linear, 1.0 - t, w0)
+    w1 = where(linear, t, w1)
+    Q = w0 * Q0 + w1 * Q1
+    return Q / sqrt(einsum("ij,ij->i", Q, Q))[:, None]
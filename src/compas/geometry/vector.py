@@ -2,6 +2,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from math import sqrt
+
 from compas.geometry import length_vector
 from compas.geometry import cross_vectors
 from compas.geometry import subtract_vectors
@@ -11,6 +13,7 @@ from compas.geometry import angle_vectors_signed
 from compas.geometry import angles_vectors
 from compas.geometry import transform_vectors
 from compas.geometry import Geometry
+from compas.data.data import _decode_guid
 
 
 class Vector(Geometry):
@@ -72,12 +75,9 @@ class Vector(Geometry):
 
     def __init__(self, x, y, z=0.0, **kwargs):
         super(Vector, self).__init__(**kwargs)
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
 
     def __repr__(self):
         return "{0}(x={1}, y={2}, z={3})".format(
@@ -95,11 +95,11 @@ class Vector(Geometry):
             return [self[i] for i in range(*key.indices(len(self)))]
         i = key % 3
         if i == 0:
-            return self.x
+            return self._x
         if i == 1:
-            return self.y
+            return self._y
         if i == 2:
-            return self.z
+            return self._z
         raise KeyError
 
     def __setitem__(self, key, value):
@@ -116,57 +116,57 @@ class Vector(Geometry):
         raise KeyError
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter([self._x, self._y, self._z])
 
     def __eq__(self, other):
-        return self.x == other[0] and self.y == other[1] and self.z == other[2]
+        return self._x == other[0] and self._y == other[1] and self._z == other[2]
 
     def __add__(self, other):
-        return Vector(self.x + other[0], self.y + other[1], self.z + other[2])
+        return Vector.fast(self._x + other[0], self._y + other[1], self._z + other[2])
 
     def __sub__(self, other):
-        return Vector(self.x - other[0], self.y - other[1], self.z - other[2])
+        return Vector.fast(self._x - other[0], self._y - other[1], self._z - other[2])
 
     def __mul__(self, n):
-        return Vector(self.x * n, self.y * n, self.z * n)
+        return Vector.fast(self._x * n, self._y * n, self._z * n)
 
     def __truediv__(self, n):
-        return Vector(self.x / n, self.y / n, self.z / n)
+        return Vector.fast(self._x / n, self._y / n, self._z / n)
 
     def __pow__(self, n):
-        return Vector(self.x**n, self.y**n, self.z**n)
+        return Vector.fast(self._x**n, self._y**n, self._z**n)
 
     def __neg__(self):
-        return self.scaled(-1.0)
+        return Vector.fast(-self._x, -self._y, -self._z)
 
     def __iadd__(self, other):
-        self.x += other[0]
-        self.y += other[1]
-        self.z += other[2]
+        self._x += other[0]
+        self._y += other[1]
+        self._z += other[2]
         return self
 
     def __isub__(self, other):
-        self.x -= other[0]
-        self.y -= other[1]
-        self.z -= other[2]
+        self._x -= other[0]
+        self._y -= other[1]
+        self._z -= other[2]
         return self
 
     def __imul__(self, n):
-        self.x *= n
-        self.y *= n
-        self.z *= n
+        self._x *= n
+        self._y *= n
+        self._z *= n
         return self
 
     def __itruediv__(self, n):
-        self.x /= n
-        self.y /= n
-        self.z /= n
+        self._x /= n
+        self._y /= n
+        self._z /= n
         return self
 
     def __ipow__(self, n):
-        self.x **= n
-        self.y **= n
-        self.z **= n
+        self._x **= n
+        self._y **= n
+        self._z **= n
         return self
 
     # ==========================================================================
@@ -181,6 +181,18 @@ class Vector(Geometry):
     def from_data(cls, data):
         return cls(*data)
 
+    @classmethod
+    def __jsonload__(cls, data, guid=None):
+        # vectors are reconstructed directly from their coordinates
+        if cls is not Vector or len(data) != 3:
+            return super(Vector, cls).__jsonload__(data, guid)
+        vector = cls.fast(float(data[0]), float(data[1]), float(data[2]))
+        vector._guid = _decode_guid(guid)
+        return vector
+
+    def __copy_fast__(self):
+        return self._copy_shallow()
+
     # ==========================================================================
     # Properties
     # ==========================================================================
@@ -211,12 +223,52 @@ class Vector(Geometry):
 
     @property
     def length(self):
-        return length_vector(self)
+        return sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
 
     # ==========================================================================
     # Constructors
     # ==========================================================================
 
+    @classmethod
+    def fast(cls, x, y, z=0.0):
+        """Construct a vector directly from its components.
+
+        Parameters
+        ----------
+        x : float
+            The X component of the vector.
+        y : float
+            The Y component of the vector.
+        z : float, optional
+            The Z component of the vector.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Vector`
+
+        Notes
+        -----
+        Unlike the constructor, this factory doesn't convert the components to floats,
+        and doesn't accept a name or other keyword arguments.
+        It is meant for the many intermediate vectors produced by geometric algorithms in hot loops,
+        where the components are already floats.
+        The result is a regular vector that can be used anywhere a vector can.
+
+        Examples
+        --------
+        >>> vector = Vector.fast(1.0, 2.0, 3.0)
+        >>> vector == Vector(1.0, 2.0, 3.0)
+        True
+
+        """
+        vector = object.__new__(cls)
+        vector._guid = None
+        vector._name = None
+        vector._x = x
+        vector._y = y
+        vector._z = z
+        return vector
+
     @classmethod
     def Xaxis(cls):
         """Construct a unit vector along the X axis.
@@ -428,7 +480,7 @@ class Vector(Geometry):
         [1.0, 4.0]
 
         """
-        return [Vector.dot(u, v) for u, v in zip(left, right)]
+        return [dot_vectors(u, v) for u, v in zip(left, right)]
 
     @staticmethod
     def cross_vectors(left, right):
@@ -525,8 +577,7 @@ class Vector(Geometry):
         False
 
         """
-        cls = type(self)
-        return cls(self.x, self.y, self.z)
+        return self.__copy_fast__()
 
     # ==========================================================================
     # Methods
@@ -548,9 +599,9 @@ class Vector(Geometry):
 
         """
         length = self.length
-        self.x = self.x / length
-        self.y = self.y / length
-        self.z = self.z / length
+        self._x /= length
+        self._y /= length
+        self._z /= length
 
     def unitized(self):
         """Returns a unitized copy of this vector.
@@ -639,9 +690,9 @@ class Vector(Geometry):
         3.0
 
         """
-        self.x *= n
-        self.y *= n
-        self.z *= n
+        self._x *= n
+        self._y *= n
+        self._z *= n
 
     def scaled(self, n):
         """Returns a scaled copy of this vector.
@@ -691,7 +742,7 @@ class Vector(Geometry):
         0.0
 
         """
-        return dot_vectors(self, other)
+        return self._x * other[0] + self._y * other[1] + self._z * other[2]
 
     def cross(self, other):
         """The cross product of this vector and another vector.
@@ -714,7 +765,8 @@ class Vector(Geometry):
         Vector(0.000, 0.000, 1.000)
 
         """
-        return Vector(*cross_vectors(self, other))
+        x, y, z = other[0], other[1], other[2]
+        return Vector.fast(self._y * z - self._z * y, self._z * x - self._x * z, self._x * y - self._y * x)
 
     def angle(self, other):
         """Compute the smallest angle between this vector and another vector.
@@ -811,10 +863,7 @@ class Vector(Geometry):
         Vector(0.000, 1.000, 0.000)
 
         """
-        point = transform_vectors([self], T)[0]
-        self.x = point[0]
-        self.y = point[1]
-        self.z = point[2]
+        self._x, self._y, self._z = transform_vectors([self], T)[0]
 
     def transformed(self, T):
         """Return a transformed copy of this vector.
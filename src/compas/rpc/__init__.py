@@ -2,9 +2,24 @@ from __future__ import absolute_import
 
 from .errors import RPCClientError, RPCServerError
 from .proxy import Proxy
+from .proxy import AsyncProxy
 from .server import Server
+from .server import BinaryServer
+from .server import ThreadingServer
 from .dispatcher import Dispatcher
+from .pool import WorkerPool
 from .xfunc import XFunc
 
 
-__all__ = ["RPCClientError", "RPCServerError", "Proxy", "Server", "Dispatcher", "XFunc"]
+__all__ = [
+    "RPCClientError",
+    "RPCServerError",
+    "Proxy",
+    "AsyncProxy",
+    "Server",
+    "BinaryServer",
+    "ThreadingServer",
+    "Dispatcher",
+    "WorkerPool",
+    "XFunc",
+]
@@ -1,6 +1,7 @@
 import time
 
 from compas.rpc.services.default import start_service
+from compas.rpc.transport import BinaryServerProxy
 
 try:
     from xmlrpclib import ServerProxy
@@ -8,13 +9,16 @@ except ImportError:
     from xmlrpc.client import ServerProxy
 
 
-def start(port, autoreload, **kwargs):
-    start_service(port, autoreload)
+def start(port, autoreload, transport="xmlrpc", workers=1, **kwargs):
+    start_service(port, autoreload, transport, workers)
 
 
-def stop(port, **kwargs):
+def stop(port, transport="xmlrpc", **kwargs):
     print("Trying to stop remote RPC proxy...")
-    server = ServerProxy("http://127.0.0.1:{}".format(port))
+    if transport == "socket":
+        server = BinaryServerProxy(("127.0.0.1", port))
+    else:
+        server = ServerProxy("http://127.0.0.1:{}".format(port))
 
     success = False
     count = 5
@@ -58,11 +62,30 @@ def main():
         action="store_false",
         help="Do not autoreload modules",
     )
+    start_command.add_argument(
+        "--transport",
+        choices=["xmlrpc", "socket"],
+        default="xmlrpc",
+        help="Transport of the RPC calls",
+    )
+    start_command.add_argument(
+        "--workers",
+        action="store",
+        default=1,
+        type=int,
+        help="Number of worker processes",
+    )
     start_command.set_defaults(autoreload=True, func=start)
 
     # Command: stop
     stop_command = commands.add_parser("stop", help="Try to stop a remote RPC server")
     stop_command.add_argument("--port", "-p", action="store", default=1753, type=int, help="RPC port number")
+    stop_command.add_argument(
+        "--transport",
+        choices=["xmlrpc", "socket"],
+        default="xmlrpc",
+        help="Transport of the RPC calls",
+    )
     stop_command.set_defaults(func=stop)
 
     # Invoke
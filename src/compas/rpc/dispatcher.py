@@ -10,6 +10,11 @@ import traceback
 
 from compas.data import DataDecoder
 from compas.data import DataEncoder
+from compas.rpc.profiling import PROFILERS
+from compas.rpc.profiling import SamplingProfiler
+from compas.rpc.profiling import clock
+from compas.rpc.profiling import timing_record
+from compas.rpc.transport import loads
 
 try:
     from cStringIO import StringIO
@@ -35,13 +40,35 @@ class Dispatcher(object):
     message strings assigned to the `'error'` key of the output dictionary
     such that the errors can be rethrown on the client side.
 
+    The functions are resolved from their fully qualified names once,
+    and cached for subsequent calls.
+    Services that unload modules, for example to reload them after changes,
+    should clear the cache with :meth:`clear_cache`.
+
+    Every call is timed, and the timing record of the call is assigned to the `'timing'` key of the output dictionary
+    (see :mod:`compas.rpc.profiling`).
+    On request, the function is also profiled with :mod:`cProfile` or with a sampling profiler,
+    and the profile is assigned to the `'profile'` key.
+
     """
 
+    def clear_cache(self):
+        """Clear the cache of resolved functions.
+
+        Returns
+        -------
+        None
+
+        """
+        self.__dict__.pop("_functions", None)
+
     def on_module_imported(self, module, newly_loaded_modules):
         """Event triggered when a module is successfully imported.
 
         Override this method when subclassing in order to handle the what happens
         after a module has been imported.
+        The event is triggered when a function is resolved for the first time,
+        or for the first time after the cache was cleared.
 
         Parameters
         ----------
@@ -57,7 +84,7 @@ class Dispatcher(object):
         """
         pass
 
-    def _dispatch(self, name, args):
+    def _dispatch(self, name, args, received=None):
         """Dispatcher method for XMLRPC API calls.
 
         This method is automatically called by the XMLRPC server if an instance
@@ -74,6 +101,10 @@ class Dispatcher(object):
             The first argument in the list should be the JSON serialized string
             representation of the input dictionary. The structure of the input
             dictionary is defined by the caller.
+            The optional second and third arguments are a path that should be added to ``sys.path``,
+            and the name of the profiler that should be used (``'cprofile'`` or ``'sample'``).
+        received : float, optional
+            The time at which the request was received, if it was queued before it was dispatched.
 
         Returns
         -------
@@ -83,15 +114,118 @@ class Dispatcher(object):
 
             * `'data'`    : The returned result of the function call.
             * `'error'`   : The error message of any error that may have been thrown in the processes of dispatching to or execution of the API function.
-            * `'profile'` : A profile of the function execution.
+            * `'profile'` : A profile of the function execution, if requested.
+            * `'timing'`  : The timing record of the call.
 
         """
-        odict = {"data": None, "error": None, "profile": None}
+        odict = {"data": None, "error": None, "profile": None, "timing": timing_record(received)}
 
         if len(args) > 1:
             if args[1] not in sys.path:
                 sys.path.insert(0, args[1])
 
+        profiler = args[2] if len(args) > 2 else None
+
+        function = self._function(name, odict)
+
+        if function is not None:
+            start = clock()
+            try:
+                idict = json.loads(args[0], cls=DataDecoder)
+            except (IndexError, TypeError):
+                odict["error"] = (
+                    "API methods require a single JSON encoded dictionary as input.\n"
+                    "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
+                )
+
+            else:
+                odict["timing"]["decode"] = clock() - start
+                odict["timing"]["request_bytes"] = len(args[0])
+                self._execute(function, idict, odict, profiler)
+
+        # the result is encoded separately,
+        # such that the time it takes to encode the result is part of the output
+        start = clock()
+        data = json.dumps(odict.pop("data"), cls=DataEncoder)
+        odict["timing"]["encode"] = clock() - start
+        odict["timing"]["response_bytes"] = len(data)
+        return json.dumps(odict, cls=DataEncoder)[:-1] + ', "data": ' + data + "}"
+
+    def _dispatch_binary(self, name, payload, path=None, received=None, profiler=None):
+        """Dispatcher method for API calls through the socket transport.
+
+        This method is called by :class:`~compas.rpc.BinaryServer` if an instance
+        of the dispatcher is registered with the server and the API call does not
+        correspond to an explicitly registered function.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        payload : bytes
+            The input dictionary, with the positional (``'args'``) and named (``'kwargs'``) arguments of the call,
+            encoded in the COMPAS binary format.
+        path : str, optional
+            A path that should be added to ``sys.path`` before the function is imported.
+        received : float, optional
+            The time at which the request was received, if it was queued before it was dispatched.
+        profiler : Literal['cprofile', 'sample'], optional
+            The profiler that should be used.
+
+        Returns
+        -------
+        dict
+            The output dictionary, with the same structure as the output dictionary of :meth:`_dispatch`.
+            The encoding time and response size of the timing record are set when the output is encoded.
+
+        Notes
+        -----
+        The input is decoded after the function is imported,
+        such that the data classes of the arguments can be found on the added path.
+
+        """
+        odict = {"data": None, "error": None, "profile": None, "timing": timing_record(received)}
+
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+        function = self._function(name, odict)
+
+        if function is not None:
+            start = clock()
+            try:
+                idict = loads(payload)
+            except Exception:
+                odict["error"] = traceback.format_exc()
+            else:
+                odict["timing"]["decode"] = clock() - start
+                odict["timing"]["request_bytes"] = len(payload)
+                self._execute(function, idict, odict, profiler)
+
+        return odict
+
+    def _function(self, name, odict):
+        """Find the function corresponding to an API call.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        odict : dict
+            The output dictionary.
+
+        Returns
+        -------
+        callable | None
+            The function, or None if the function can't be found.
+            In that case, the error is stored in the output dictionary.
+
+        """
+        functions = self.__dict__.setdefault("_functions", {})
+        function = functions.get(name)
+        if function is not None:
+            return function
+
         parts = name.split(".")
 
         functionname = parts[-1]
@@ -111,26 +245,45 @@ class Dispatcher(object):
                 module = self
         except Exception:
             odict["error"] = traceback.format_exc()
+            return None
 
-        else:
-            try:
-                function = getattr(module, functionname)
-            except AttributeError:
-                odict["error"] = "This function is not part of the API: {0}".format(functionname)
+        try:
+            function = functions[name] = getattr(module, functionname)
+        except AttributeError:
+            odict["error"] = "This function is not part of the API: {0}".format(functionname)
+            return None
+        return function
 
-            else:
-                try:
-                    idict = json.loads(args[0], cls=DataDecoder)
-                except (IndexError, TypeError):
-                    odict["error"] = (
-                        "API methods require a single JSON encoded dictionary as input.\n"
-                        "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
-                    )
+    def _execute(self, function, idict, odict, profiler=None):
+        """Call the function corresponding to the API call, with the requested profiler, and time the call.
 
-                else:
-                    self._call(function, idict, odict)
+        Parameters
+        ----------
+        function : callable
+            The callable object corresponding to the requested API call.
+        idict : dict
+            The input dictionary.
+        odict : dict
+            The output dictionary.
+        profiler : Literal['cprofile', 'sample'], optional
+            The profiler.
 
-        return json.dumps(odict, cls=DataEncoder)
+        Notes
+        -----
+        The output dictionary will be modified in place.
+
+        """
+        if profiler and profiler not in PROFILERS:
+            odict["error"] = "Unknown profiler: {0}. Use one of {1}.".format(profiler, ", ".join(PROFILERS))
+            return
+        start = clock()
+        if profiler == "cprofile":
+            self._call_wrapped(function, idict, odict)
+        elif profiler == "sample":
+            self._call_sampled(function, idict, odict)
+        else:
+            self._call(function, idict, odict)
+        odict["timing"]["call"] = clock() - start
 
     def _call(self, function, idict, odict):
         """Method that handles the actual call to the function corresponding to the API call.
@@ -182,3 +335,14 @@ class Dispatcher(object):
         else:
             odict["data"] = data
             odict["profile"] = stream.getvalue()
+
+    def _call_sampled(self, function, idict, odict):
+        """Does the same as _call, but with the sampling profiler enabled."""
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            self._call(function, idict, odict)
+        finally:
+            profiler.stop()
+        if odict["error"] is None:
+            odict["profile"] = profiler.folded()
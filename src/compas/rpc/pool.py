@@ -0,0 +1,169 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import time
+
+from compas.rpc.transport import encode_response
+from compas.rpc.transport import loads
+
+# the dispatcher of a worker process
+_SERVICE = None
+
+
+def _init_worker(service):
+    global _SERVICE
+    _SERVICE = service()
+
+
+def _dispatch(name, args, received):
+    return _SERVICE._dispatch(name, args, received)
+
+
+def _dispatch_binary(name, payload, path, received, profiler):
+    return encode_response(_SERVICE._dispatch_binary(name, payload, path, received, profiler))
+
+
+class WorkerPool(object):
+    """Dispatcher that distributes the calls of an RPC server over a pool of worker processes.
+
+    Parameters
+    ----------
+    service : Type[:class:`~compas.rpc.Dispatcher`]
+        The type of dispatcher used by the workers.
+        Every worker process creates its own instance.
+    workers : int, optional
+        The number of worker processes.
+        Defaults to the number of CPUs.
+
+    Attributes
+    ----------
+    workers : int, read-only
+        The number of worker processes.
+
+    Notes
+    -----
+    The pool can be registered as the instance of a :class:`~compas.rpc.ThreadingServer`
+    or a :class:`~compas.rpc.BinaryServer`.
+    Calls received by the server at the same time, from different clients
+    or from a client that sends requests without waiting for the responses,
+    are executed in parallel in the worker processes.
+
+    Every worker imports the requested modules and resolves the requested functions once,
+    and reuses them for all subsequent calls.
+    The time a call waits for a free worker is the queue time of the timing record of the call.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import BinaryServer
+        from compas.rpc import Dispatcher
+        from compas.rpc import WorkerPool
+
+
+        class DefaultService(Dispatcher):
+            pass
+
+
+        if __name__ == '__main__':
+
+            server = BinaryServer(("localhost", 8888))
+
+            server.register_function(server.ping)
+            server.register_function(server.remote_shutdown)
+            server.register_instance(WorkerPool(DefaultService, 4))
+            server.serve_forever()
+
+    """
+
+    def __init__(self, service, workers=None):
+        import multiprocessing
+
+        self._workers = workers or multiprocessing.cpu_count()
+        self._pool = multiprocessing.Pool(self._workers, _init_worker, (service,))
+
+    @property
+    def workers(self):
+        return self._workers
+
+    def close(self):
+        """Stop the worker processes.
+
+        Returns
+        -------
+        None
+
+        """
+        self._pool.terminate()
+        self._pool.join()
+
+    def _dispatch(self, name, args):
+        """Execute a call of the XML-RPC transport in one of the workers.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        args : tuple
+            The encoded arguments of the call.
+
+        Returns
+        -------
+        str
+            The encoded result dict of the call.
+
+        """
+        return self._pool.apply(_dispatch, (name, args, time.time()))
+
+    def _dispatch_binary(self, name, payload, path=None, received=None, profiler=None):
+        """Execute a call of the socket transport in one of the workers.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        payload : bytes | bytearray
+            The encoded arguments of the call.
+        path : str, optional
+            A path that should be added to ``sys.path`` before the function is called.
+        received : float, optional
+            The time at which the request was received.
+        profiler : Literal['cprofile', 'sample'], optional
+            The profiler that should be used.
+
+        Returns
+        -------
+        dict
+            The result dict of the call.
+
+        """
+        head, body = self._submit_binary(name, payload, path, received, profiler).get()
+        odict = loads(head)
+        odict["data"] = loads(body)
+        return odict
+
+    def _submit_binary(self, name, payload, path=None, received=None, profiler=None):
+        """Submit a call of the socket transport to the workers, without waiting for the result.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        payload : bytes | bytearray
+            The encoded arguments of the call.
+        path : str, optional
+            A path that should be added to ``sys.path`` before the function is called.
+        received : float, optional
+            The time at which the request was received.
+        profiler : Literal['cprofile', 'sample'], optional
+            The profiler that should be used.
+
+        Returns
+        -------
+        object
+            An asynchronous result.
+            The encoded head and body of the response are available through its method ``get``.
+
+        """
+        return self._pool.apply_async(_dispatch_binary, (name, bytes(payload), path, received or time.time(), profiler))
@@ -0,0 +1,276 @@
+"""
+Timing and profiling of remote calls.
+
+Every call through the RPC server returns a timing record in the ``'timing'`` field of the result dict ::
+
+    {
+        'received'       : ...,  # The time at which the request was received by the server, in seconds since the epoch.
+        'queue'          : ...,  # The time the request waited for a worker.
+        'decode'         : ...,  # The time spent decoding the arguments.
+        'call'           : ...,  # The time spent in the function.
+        'encode'         : ...,  # The time spent encoding the result.
+        'request_bytes'  : ...,  # The size of the encoded arguments.
+        'response_bytes' : ...,  # The size of the encoded result.
+    }
+
+The durations are in seconds.
+On the client side, the proxy adds the name of the function (``'name'``),
+the time at which the call was made (``'start'``), and the duration of the round trip (``'roundtrip'``).
+
+The records can be exported in the Trace Event Format,
+which can be viewed with ``chrome://tracing`` or https://ui.perfetto.dev.
+
+Optionally, the server profiles the function with :mod:`cProfile` (``'cprofile'``),
+or with a low-overhead sampling profiler (``'sample'``, see :class:`SamplingProfiler`).
+The profile is returned in the ``'profile'`` field of the result dict.
+
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    clock = time.perf_counter
+except AttributeError:
+    clock = time.time
+
+PROFILERS = ("cprofile", "sample")
+
+
+def timing_record(received=None):
+    """Create the timing record of a call on the server.
+
+    Parameters
+    ----------
+    received : float, optional
+        The time at which the request was received, in seconds since the epoch.
+        If the request was queued before the record is created, the waiting time is the queue time of the call.
+        Default is the current time.
+
+    Returns
+    -------
+    dict
+
+    """
+    now = time.time()
+    if received is None:
+        received = now
+    return {
+        "received": received,
+        "queue": max(now - received, 0.0),
+        "decode": None,
+        "call": None,
+        "encode": None,
+        "request_bytes": None,
+        "response_bytes": None,
+    }
+
+
+class SamplingProfiler(object):
+    """Statistical profiler that samples the call stack of a thread at regular intervals.
+
+    Parameters
+    ----------
+    interval : float, optional
+        The time between two samples, in seconds.
+
+    Attributes
+    ----------
+    samples : dict[str, int]
+        The number of samples per call stack.
+        The call stacks are strings of frames separated by semicolons, starting with the outermost frame.
+
+    Notes
+    -----
+    The samples are collected by a background thread.
+    Unlike a deterministic profiler such as :mod:`cProfile`,
+    the profiled code is not slowed down by the profiler, other than by the background thread itself.
+    Only the frames below the frame in which the profiler was started are included in the call stacks.
+
+    The profiler requires :func:`sys._current_frames`, which is available in CPython.
+
+    Examples
+    --------
+    >>> from compas.rpc.profiling import SamplingProfiler
+    >>> with SamplingProfiler() as profiler:
+    ...     total = sum(i * i for i in range(100000))
+    ...
+    >>> text = profiler.folded()
+
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.samples = {}
+        self._thread = None
+        self._ident = None
+        self._root = None
+        self._stopped = threading.Event()
+
+    def __enter__(self):
+        self._start(sys._getframe(1))
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """Start sampling the call stack of the current thread.
+
+        Returns
+        -------
+        None
+
+        """
+        self._start(sys._getframe(1))
+
+    def _start(self, root):
+        self._ident = threading.current_thread().ident
+        self._root = root
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling.
+
+        Returns
+        -------
+        None
+
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._root = None
+
+    def folded(self):
+        """Format the samples as folded stacks.
+
+        Returns
+        -------
+        str
+            One line per call stack, with the call stack and the number of samples separated by a space.
+            This is the input format of flame graph tools, such as https://www.speedscope.app.
+
+        """
+        return "\n".join("{} {}".format(stack, count) for stack, count in sorted(self.samples.items()))
+
+    def _run(self):
+        samples = self.samples
+        # the frames of the profiler itself, when it is being stopped
+        exclude = (SamplingProfiler.__exit__.__code__, SamplingProfiler.stop.__code__)
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._ident)
+            stack = []
+            while frame is not None and frame is not self._root:
+                code = frame.f_code
+                if code in exclude:
+                    stack = None
+                    break
+                stack.append("{} ({}:{})".format(code.co_name, os.path.basename(code.co_filename), code.co_firstlineno))
+                frame = frame.f_back
+            if not stack:
+                continue
+            stack.reverse()
+            key = ";".join(stack)
+            samples[key] = samples.get(key, 0) + 1
+
+
+def trace_events(timings):
+    """Convert the timing records of calls to events of the Trace Event Format.
+
+    Parameters
+    ----------
+    timings : sequence[dict]
+        The timing records collected by a proxy.
+
+    Returns
+    -------
+    list[dict]
+        One complete event per call on the client side,
+        and one complete event per phase of the call on the server side.
+
+    Notes
+    -----
+    Calls that overlap in time are placed on different threads of the trace.
+    The timestamps of the client and the server are only comparable if both run on the same machine.
+
+    """
+    events = []
+    client = []
+    server = []
+    for timing in sorted(timings, key=lambda timing: timing["start"]):
+        name = timing.get("name") or "call"
+        start = timing["start"] * 1e6
+        duration = timing["roundtrip"] * 1e6
+        args = {"request_bytes": timing.get("request_bytes"), "response_bytes": timing.get("response_bytes")}
+        events.append(
+            {
+                "name": name,
+                "cat": "client",
+                "ph": "X",
+                "ts": start,
+                "dur": duration,
+                "pid": "client",
+                "tid": _lane(client, start, start + duration),
+                "args": args,
+            }
+        )
+        if timing.get("received") is None:
+            continue
+        phases = [(phase, timing.get(phase)) for phase in ("queue", "decode", "call", "encode")]
+        phases = [(phase, duration * 1e6) for phase, duration in phases if duration is not None]
+        start = timing["received"] * 1e6
+        lane = _lane(server, start, start + sum(duration for _, duration in phases))
+        for phase, duration in phases:
+            events.append(
+                {
+                    "name": name if phase == "call" else phase,
+                    "cat": phase,
+                    "ph": "X",
+                    "ts": start,
+                    "dur": duration,
+                    "pid": "server",
+                    "tid": lane,
+                }
+            )
+            start += duration
+    return events
+
+
+def _lane(lanes, start, end):
+    # the first lane that is free at the start of the interval
+    for index, last in enumerate(lanes):
+        if last <= start:
+            lanes[index] = end
+            return index
+    lanes.append(end)
+    return len(lanes) - 1
+
+
+def write_trace(timings, filepath):
+    """Write the timing records of calls to a file in the Trace Event Format.
+
+    Parameters
+    ----------
+    timings : sequence[dict]
+        The timing records collected by a proxy.
+    filepath : str
+        The path of the file.
+
+    Returns
+    -------
+    None
+
+    """
+    with open(filepath, "w") as f:
+        json.dump({"traceEvents": trace_events(timings), "displayTimeUnit": "ms"}, f)
@@ -3,17 +3,31 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import threading
 import time
+from collections import deque
+from functools import partial
+from itertools import islice
 
 import compas
 import compas._os
 from compas.rpc import RPCServerError
+from compas.rpc.profiling import write_trace
 from compas.data import DataDecoder
 from compas.data import DataEncoder
+from compas.rpc.transport import BinaryServerProxy
+from compas.rpc.transport import Future
 
 try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+try:
+    from xmlrpclib import MultiCall
     from xmlrpclib import ServerProxy
 except ImportError:
+    from xmlrpc.client import MultiCall
     from xmlrpc.client import ServerProxy
 
 try:
@@ -56,13 +70,37 @@ class Proxy(object):
     capture_output : bool, optional
         If True, capture the stdout/stderr output of the remote process.
         In general, `capture_output` should be True when using a `pythonw` as executable (default).
+    path : str, optional
+        A path that should be added to ``sys.path`` on the server.
+    transport : Literal['xmlrpc', 'socket'], optional
+        The transport of the calls to the server.
+        With ``'xmlrpc'`` (default), the arguments and results are JSON encoded and sent as XML-RPC requests over HTTP.
+        With ``'socket'``, the arguments and results are encoded in the COMPAS binary format,
+        and sent over a persistent socket connection. See :mod:`compas.rpc.transport`.
+    workers : int, optional
+        The number of worker processes of the server.
+        With more than one worker, calls received at the same time are executed in parallel.
+        Default is a single worker, the server process itself.
+    profiler : Literal['cprofile', 'sample'], optional
+        The profiler the server should use for every call.
+        With ``'cprofile'``, the calls are profiled with :mod:`cProfile`.
+        With ``'sample'``, the calls are profiled with a low-overhead sampling profiler.
+        Default is None, in which case the calls are not profiled.
+    max_timings : int, optional
+        The maximum number of timing records that are kept in :attr:`timings`.
 
     Attributes
     ----------
     address : str, read-only
         Address of the server as a combination of `url` and `port`.
     profile : str
-        A profile of the code executed by the server.
+        A profile of the code executed by the server, if a profiler is selected.
+        With the ``'sample'`` profiler, the profile consists of folded stacks.
+    profiler : str
+        The profiler the server should use for every call.
+    timings : collections.deque[dict], read-only
+        The timing records of the most recent calls, with the time spent on every phase of the call
+        and the size of the arguments and result. See :mod:`compas.rpc.profiling`.
     package : str
         Fully qualified name of the package or module
         from where functions should be imported on the server side.
@@ -70,6 +108,8 @@ class Proxy(object):
         Fully qualified package name required for starting the server/service.
     python : str
         The type of Python executable that should be used to execute the code.
+    transport : str, read-only
+        The transport of the calls to the server.
 
     Notes
     -----
@@ -84,6 +124,17 @@ class Proxy(object):
 
     If possible, the proxy will try to reconnect to an already existing service
 
+    The socket transport is a lot faster for large arguments and results, such as meshes and lists of numbers.
+    It requires a service that accepts the command-line argument ``--transport socket``
+    and starts a :class:`~compas.rpc.BinaryServer` accordingly, like the default service.
+
+    Use :meth:`export_trace` to view the timing records of the calls on a timeline.
+
+    Use :meth:`pipeline` or :meth:`map` to send several calls to the server at once,
+    and :meth:`submit` to call a function without waiting for the result.
+    With multiple workers, calls that are submitted at the same time are executed in parallel.
+    For use with :mod:`asyncio`, see :class:`AsyncProxy`.
+
     Examples
     --------
     Minimal example showing connection to the proxy server, and ensuring the
@@ -109,7 +160,15 @@ class Proxy(object):
         autoreload=True,
         capture_output=True,
         path=None,
+        transport=None,
+        workers=None,
+        profiler=None,
+        max_timings=1000,
     ):
+        transport = transport or "xmlrpc"
+        if transport not in ("xmlrpc", "socket"):
+            raise ValueError("Unknown transport: {}. Use 'xmlrpc' or 'socket'.".format(transport))
+        self._transport = transport
         self._package = None
         self._python = compas._os.select_python(python)
         self._url = url
@@ -118,8 +177,13 @@ class Proxy(object):
         self._service = None
         self._process = None
         self._function = None
+        self._name = None
         self._profile = None
+        self._profiler = profiler
+        self._timings = deque(maxlen=max_timings)
         self._path = path
+        self._workers = workers
+        self._queue = None
 
         self.service = service
         self.package = package
@@ -140,6 +204,10 @@ class Proxy(object):
     def address(self):
         return "{}:{}".format(self._url, self._port)
 
+    @property
+    def transport(self):
+        return self._transport
+
     @property
     def profile(self):
         return self._profile
@@ -148,6 +216,20 @@ class Proxy(object):
     def profile(self, profile):
         self._profile = profile
 
+    @property
+    def profiler(self):
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self._profiler = profiler
+        if self._transport == "socket":
+            self._server.profiler = profiler
+
+    @property
+    def timings(self):
+        return self._timings
+
     @property
     def package(self):
         return self._package
@@ -185,8 +267,11 @@ class Proxy(object):
     def __exit__(self, *args):
         # If we started the RPC server, we will try to clean up and stop it
         # otherwise we just disconnect from it
+        self._stop_threads()
         if self._implicitely_started_server:
             self.stop_server()
+        elif self._transport == "socket":
+            self._server.close()
         else:
             self._server.__close()
 
@@ -207,6 +292,7 @@ class Proxy(object):
             name = "{}.{}".format(self.package, name)
         try:
             self._function = getattr(self._server, name)
+            self._name = name
         except Exception:
             raise RPCServerError()
         return self._proxy
@@ -215,6 +301,18 @@ class Proxy(object):
     # methods
     # ==========================================================================
 
+    def _server_proxy(self):
+        """Create a client-side proxy of the server for the selected transport.
+
+        Returns
+        -------
+        ServerProxy | :class:`~compas.rpc.transport.BinaryServerProxy`
+
+        """
+        if self._transport == "socket":
+            return BinaryServerProxy(self.address, path=self._path, profiler=self._profiler)
+        return ServerProxy(self.address)
+
     def _try_reconnect(self):
         """Try and reconnect to an existing proxy server.
 
@@ -224,7 +322,7 @@ class Proxy(object):
             Instance of the proxy if reconnection succeeded, otherwise ``None``.
 
         """
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
         try:
             server.ping()
         except Exception:
@@ -277,6 +375,10 @@ class Proxy(object):
             self._process.StartInfo.Arguments = "-m {0} --port {1} --{2}autoreload".format(
                 self.service, self._port, "" if self.autoreload else "no-"
             )
+            if self._transport != "xmlrpc":
+                self._process.StartInfo.Arguments += " --transport {0}".format(self._transport)
+            if self._workers:
+                self._process.StartInfo.Arguments += " --workers {0}".format(self._workers)
             self._process.Start()
         else:
             args = [
@@ -287,6 +389,10 @@ class Proxy(object):
                 str(self._port),
                 "--{}autoreload".format("" if self.autoreload else "no-"),
             ]
+            if self._transport != "xmlrpc":
+                args += ["--transport", self._transport]
+            if self._workers:
+                args += ["--workers", str(self._workers)]
             kwargs = dict(env=env)
             if self.capture_output:
                 kwargs["stdout"] = PIPE
@@ -296,7 +402,7 @@ class Proxy(object):
         # this starts the client side
         # it creates a proxy for the server
         # and tries to connect the proxy to the actual server
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
         print("Starting a new proxy server...")
         success = False
         attempt_count = 0
@@ -331,10 +437,13 @@ class Proxy(object):
 
         """
         print("Stopping the server proxy.")
+        self._stop_threads()
         try:
             self._server.remote_shutdown()
         except Exception:
             pass
+        if self._transport == "socket":
+            self._server.close()
         self._terminate_process()
 
     def restart_server(self):
@@ -348,6 +457,188 @@ class Proxy(object):
         self.stop_server()
         self.start_server()
 
+    def pipeline(self, calls):
+        """Send several calls to the server at once, and wait for all results.
+
+        Parameters
+        ----------
+        calls : sequence[tuple[str, sequence] | tuple[str, sequence, dict]]
+            The name, the positional arguments, and optionally the named arguments of every call.
+            The names are relative to :attr:`package`, like the attributes of the proxy.
+
+        Returns
+        -------
+        list
+            The 'data' part of the result dicts of the calls, in the order of the calls.
+
+        Raises
+        ------
+        RPCServerError
+            If any of the calls raised an error on the server.
+
+        Notes
+        -----
+        With the socket transport, the calls are sent without waiting for the results of the previous calls,
+        and a server with multiple workers executes them in parallel.
+        With the XML-RPC transport, the calls are sent as a single request (``system.multicall``),
+        and executed one after the other.
+
+        After the calls, :attr:`profile` is the profile of the last call.
+
+        Examples
+        --------
+        >>> with Proxy('compas.numerical', transport='socket', workers=4) as numerical:  # doctest: +SKIP
+        ...     results = numerical.pipeline([('fd_numpy', args) for args in problems])   # doctest: +SKIP
+
+        """
+        requests = []
+        for call in calls:
+            name, args = call[0], call[1]
+            kwargs = call[2] if len(call) > 2 else {}
+            if self.package:
+                name = "{}.{}".format(self.package, name)
+            requests.append((name, args, kwargs))
+
+        start = time.time()
+        if self._transport == "socket":
+            results = self._server.pipeline(requests)
+        else:
+            multicall = MultiCall(self._server)
+            for name, args, kwargs in requests:
+                getattr(multicall, name)(*self._xmlrpc_args(args, kwargs))
+            results = []
+            for ostring in multicall():
+                if not ostring:
+                    raise RPCServerError("No output was generated.")
+                results.append(json.loads(ostring, cls=DataDecoder))
+
+        for (name, _, _), result in zip(requests, results):
+            self._record(result, name, start)
+        for result in results:
+            if result["error"]:
+                raise RPCServerError(result["error"])
+        if results:
+            self.profile = results[-1]["profile"]
+        return [result["data"] for result in results]
+
+    def submit(self, name, *args, **kwargs):
+        """Call a function on the server, without waiting for the result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *args : list
+            Positional arguments to be passed to the remote function.
+        **kwargs : dict, optional
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future of the 'data' part of the result dict returned by the remote function.
+            If the remote function raised an error, the future raises :class:`~compas.rpc.RPCServerError`.
+
+        Notes
+        -----
+        With the socket transport, the call is sent immediately over the connection of the proxy,
+        and the result is received in the background.
+        With the XML-RPC transport, the call is sent by a background thread,
+        or by one of several background threads if the server has multiple workers.
+
+        Examples
+        --------
+        >>> with Proxy('compas.numerical', transport='socket', workers=4) as numerical:  # doctest: +SKIP
+        ...     futures = [numerical.submit('fd_numpy', *args) for args in problems]      # doctest: +SKIP
+        ...     results = [future.result() for future in futures]                         # doctest: +SKIP
+
+        """
+        if self.package:
+            name = "{}.{}".format(self.package, name)
+        start = time.time()
+        if self._transport == "socket":
+            inner = self._server.submit(name, args, kwargs)
+        else:
+            inner = self._submit_xmlrpc(name, args, kwargs)
+        future = Future()
+        inner.add_done_callback(partial(self._resolve, future, name, start))
+        return future
+
+    def map(self, name, *iterables, **kwargs):
+        """Call a function on the server for every set of arguments taken from the iterables.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *iterables : list
+            Iterables of the positional arguments of the calls.
+        chunksize : int, optional
+            The number of calls that are sent to the server at once.
+            Default is ``100``.
+
+        Yields
+        ------
+        object
+            The 'data' part of the result dicts of the calls, in the order of the arguments.
+
+        Raises
+        ------
+        RPCServerError
+            If a call raised an error on the server.
+
+        Notes
+        -----
+        The results are yielded as soon as they are available,
+        while the next calls are being executed on the server.
+        With the socket transport, ``chunksize`` calls are waiting for a result at any time.
+        With the XML-RPC transport, the calls are sent in batches of ``chunksize`` calls (see :meth:`pipeline`).
+
+        Examples
+        --------
+        >>> with Proxy('numpy', transport='socket') as np:  # doctest: +SKIP
+        ...     for result in np.map('arange', range(1000)):  # doctest: +SKIP
+        ...         pass  # doctest: +SKIP
+
+        """
+        chunksize = kwargs.get("chunksize", 100)
+        calls = iter(zip(*iterables))
+        if self._transport == "socket":
+            futures = deque(self.submit(name, *args) for args in islice(calls, chunksize))
+            while futures:
+                future = futures.popleft()
+                for args in islice(calls, 1):
+                    futures.append(self.submit(name, *args))
+                yield future.result()
+        else:
+            while True:
+                chunk = [(name, args) for args in islice(calls, chunksize)]
+                if not chunk:
+                    break
+                for data in self.pipeline(chunk):
+                    yield data
+
+    def export_trace(self, filepath):
+        """Export the timing records of the most recent calls to a file in the Trace Event Format.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The file can be viewed with ``chrome://tracing`` or https://ui.perfetto.dev.
+        Every call is shown on the timeline of the client,
+        and its phases (queue, decode, call, encode) on the timeline of the server.
+
+        """
+        write_trace(list(self._timings), filepath)
+
     def _terminate_process(self):
         """Attempts to terminate the python process hosting the proxy server.
 
@@ -384,26 +675,129 @@ class Proxy(object):
                 {
                     'error'   : ...,  # A traceback of the error raised on the server, if any.
                     'profile' : ...,  # A profile of the code executed on the server, if there was no error.
+                    'timing'  : ...,  # The timing record of the call.
                     'data'    : ...,  # The result returned by the target function, if there was no error.
                 }
 
         Warnings
         --------
-        The `args` and `kwargs` have to be JSON-serializable.
+        The `args` and `kwargs` have to be JSON-serializable, also with the socket transport.
         This means that, currently, only COMPAS data objects (geometry, robots, data structures) and native Python objects are supported.
         The returned results will also always be in the form of COMPAS data objects and built-in Python objects.
         Numpy objects are automatically converted to their built-in Python equivalents.
 
         """
-        idict = {"args": args, "kwargs": kwargs}
-        istring = json.dumps(idict, cls=DataEncoder)
+        start = time.time()
+        if self._transport == "socket":
+            result = self._function(*args, **kwargs)
+        else:
+            result = self._call_xmlrpc(self._function, args, kwargs)
+        return self._result(result, self._name, start)
+
+    def _result(self, result, name=None, start=None):
+        """Process the result dict of a call.
+
+        Parameters
+        ----------
+        result : dict
+            The result dict.
+        name : str, optional
+            The fully qualified name of the function.
+        start : float, optional
+            The time at which the call was made.
+
+        Returns
+        -------
+        object
+            The 'data' part of the result dict.
+
+        Raises
+        ------
+        RPCServerError
+            If the remote function raised an error.
+
+        """
+        if start is not None:
+            self._record(result, name, start)
+        if result["error"]:
+            raise RPCServerError(result["error"])
+        self.profile = result["profile"]
+        return result["data"]
+
+    def _record(self, result, name, start):
+        """Add the timing record of a call to :attr:`timings`.
+
+        Parameters
+        ----------
+        result : dict
+            The result dict.
+        name : str
+            The fully qualified name of the function.
+        start : float
+            The time at which the call was made.
+
+        Returns
+        -------
+        None
+
+        """
+        timing = dict(result.get("timing") or {})
+        timing["name"] = name
+        timing["start"] = start
+        timing["roundtrip"] = time.time() - start
+        self._timings.append(timing)
+
+    def _resolve(self, future, name, start, inner):
+        """Resolve the future of a submitted call with the data of its result dict.
+
+        Parameters
+        ----------
+        future : :class:`concurrent.futures.Future`
+            The future of the data.
+        name : str
+            The fully qualified name of the function.
+        start : float
+            The time at which the call was made.
+        inner : :class:`concurrent.futures.Future`
+            The future of the result dict.
+
+        Returns
+        -------
+        None
+
+        """
+        try:
+            data = self._result(inner.result(), name, start)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(data)
+
+    def _call_xmlrpc(self, function, args, kwargs):
+        """Call a function through the XML-RPC transport.
+
+        Parameters
+        ----------
+        function : callable
+            The function of the XML-RPC server proxy.
+        args : list
+            Positional arguments to be passed to the remote function.
+        kwargs : dict
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        dict
+            The result dict of the call.
+
+        """
         # it makes sense that there is a broken pipe error
         # because the process is not the one receiving the feedback
         # when there is a print statement on the server side
         # this counts as output
         # it should be sent as part of RPC communication
         try:
-            ostring = self._function(istring, self._path or "")
+            ostring = function(*self._xmlrpc_args(args, kwargs))
         except Exception:
             # not clear what the point of this is
             # self.stop_server()
@@ -414,10 +808,163 @@ class Proxy(object):
         if not ostring:
             raise RPCServerError("No output was generated.")
 
-        result = json.loads(ostring, cls=DataDecoder)
+        return json.loads(ostring, cls=DataDecoder)
 
-        if result["error"]:
-            raise RPCServerError(result["error"])
+    def _xmlrpc_args(self, args, kwargs):
+        """Encode the arguments of a call through the XML-RPC transport.
 
-        self.profile = result["profile"]
-        return result["data"]
+        Parameters
+        ----------
+        args : list
+            Positional arguments to be passed to the remote function.
+        kwargs : dict
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        list
+            The JSON encoded input dictionary, the path that should be added to ``sys.path``,
+            and the profiler, if any.
+
+        """
+        idict = {"args": args, "kwargs": kwargs}
+        istring = json.dumps(idict, cls=DataEncoder)
+        if self._profiler:
+            return [istring, self._path or "", self._profiler]
+        return [istring, self._path or ""]
+
+    def _submit_xmlrpc(self, name, args, kwargs):
+        """Submit a call to the background threads of the XML-RPC transport.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        args : list
+            Positional arguments to be passed to the remote function.
+        kwargs : dict
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future of the result dict of the call.
+
+        """
+        if self._queue is None:
+            self._queue = Queue()
+            for _ in range(self._workers or 1):
+                thread = threading.Thread(target=self._xmlrpc_thread, args=(self._queue,))
+                thread.daemon = True
+                thread.start()
+        future = Future()
+        self._queue.put((future, name, args, kwargs))
+        return future
+
+    def _xmlrpc_thread(self, queue):
+        # every thread has its own connection to the server
+        server = ServerProxy(self.address)
+        while True:
+            item = queue.get()
+            if item is None:
+                return
+            future, name, args, kwargs = item
+            try:
+                result = self._call_xmlrpc(getattr(server, name), args, kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def _stop_threads(self):
+        """Stop the background threads of the XML-RPC transport, after the submitted calls are completed.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._queue is None:
+            return
+        for _ in range(self._workers or 1):
+            self._queue.put(None)
+        self._queue = None
+
+
+class AsyncProxy(Proxy):
+    """Version of :class:`Proxy` for use with :mod:`asyncio`.
+
+    The parameters are the same as the parameters of :class:`Proxy`.
+
+    Notes
+    -----
+    Calling a function of the proxy returns an awaitable of the result,
+    instead of the result itself.
+    Starting and stopping the server, and the methods :meth:`pipeline` and :meth:`map` are not asynchronous.
+    To wait for the results of a batch of calls without blocking the event loop, use :meth:`map_async`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import asyncio
+        from compas.rpc import AsyncProxy
+
+
+        async def main(problems):
+            with AsyncProxy('compas.numerical', transport='socket', workers=4) as numerical:
+                return await asyncio.gather(*[numerical.fd_numpy(*args) for args in problems])
+
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return partial(self.submit_async, name)
+
+    def submit_async(self, name, *args, **kwargs):
+        """Call a function on the server, and return an awaitable of the result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *args : list
+            Positional arguments to be passed to the remote function.
+        **kwargs : dict, optional
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`asyncio.Future`
+            A future of the 'data' part of the result dict returned by the remote function.
+
+        """
+        import asyncio
+
+        return asyncio.wrap_future(self.submit(name, *args, **kwargs))
+
+    def map_async(self, name, *iterables, **kwargs):
+        """Call a function on the server for every set of arguments taken from the iterables,
+        and return an awaitable of the list of results.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        *iterables : list
+            Iterables of the positional arguments of the calls.
+        chunksize : int, optional
+            The number of calls that are sent to the server at once.
+            Default is ``100``.
+
+        Returns
+        -------
+        :class:`asyncio.Future`
+            A future of the list of the 'data' parts of the result dicts of the calls.
+
+        """
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(None, lambda: list(self.map(name, *iterables, **kwargs)))
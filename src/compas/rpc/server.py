@@ -2,13 +2,35 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import socket
 import threading
+import time
+import traceback
 
 try:
     from SimpleXMLRPCServer import SimpleXMLRPCServer
 except ImportError:
     from xmlrpc.server import SimpleXMLRPCServer
 
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+try:
+    from SocketServer import BaseRequestHandler
+    from SocketServer import TCPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from socketserver import BaseRequestHandler
+    from socketserver import TCPServer
+    from socketserver import ThreadingMixIn
+
+from compas.rpc.transport import encode_response
+from compas.rpc.transport import loads
+from compas.rpc.transport import recv_message
+from compas.rpc.transport import send_message
+
 
 class Server(SimpleXMLRPCServer):
     """Version of a `SimpleXMLRPCServer` that can be cleanly terminated from the client side.
@@ -73,3 +95,218 @@ class Server(SimpleXMLRPCServer):
 
     def _shutdown_thread(self):
         self.shutdown()
+
+
+class ThreadingServer(ThreadingMixIn, Server):
+    """Version of :class:`Server` that handles every request in a separate thread.
+
+    Notes
+    -----
+    Use this server with a dispatcher that is safe to call from multiple threads,
+    such as a :class:`~compas.rpc.WorkerPool`.
+    Otherwise, concurrent requests don't provide any benefit over the requests handled by :class:`Server`.
+
+    """
+
+    daemon_threads = True
+
+
+class _Result(object):
+    # the result of a call that was handled synchronously,
+    # with the same interface as the asynchronous results of a worker pool
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _BinaryRequestHandler(BaseRequestHandler):
+    # every connection is served by its own handler (and thread)
+    # the handler answers requests until the client closes the connection
+    # requests are read and submitted without waiting for the responses of the previous requests,
+    # and the responses are sent in the order of the requests by a separate thread
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        results = Queue()
+        writer = threading.Thread(target=self._write, args=(results,))
+        writer.daemon = True
+        writer.start()
+        try:
+            while True:
+                try:
+                    message = recv_message(self.request)
+                except (IOError, OSError, socket.error):
+                    return
+                if message is None:
+                    return
+                head, body = message
+                results.put(self.server._submit_message(head, body, time.time()))
+        finally:
+            results.put(None)
+            writer.join()
+
+    def _write(self, results):
+        connected = True
+        while True:
+            result = results.get()
+            if result is None:
+                return
+            try:
+                head, body = result.get()
+            except Exception:
+                head, body = encode_response({"data": None, "error": traceback.format_exc(), "profile": None})
+            if not connected:
+                continue
+            try:
+                send_message(self.request, head, body)
+            except (IOError, OSError, socket.error):
+                connected = False
+
+
+class BinaryServer(ThreadingMixIn, TCPServer):
+    """Server for the socket transport of the RPC proxy, with persistent connections and binary messages.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host and port of the server.
+
+    Notes
+    -----
+    The server has the same interface as :class:`Server`,
+    and dispatches calls to registered functions or to a registered instance of :class:`~compas.rpc.Dispatcher`.
+    Every client connection is served in a separate thread, and is kept open until the client closes it.
+    Clients can send several requests without waiting for the responses.
+    The responses are sent in the order of the requests.
+    If the registered instance has a method ``_submit_binary``, such as :class:`~compas.rpc.WorkerPool`,
+    the requests of a client are executed concurrently.
+    See :mod:`compas.rpc.transport` for the format of the messages.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import BinaryServer
+        from compas.rpc import Dispatcher
+
+
+        class DefaultService(Dispatcher):
+            pass
+
+
+        if __name__ == '__main__':
+
+            server = BinaryServer(("localhost", 8888))
+
+            server.register_function(server.ping)
+            server.register_function(server.remote_shutdown)
+            server.register_instance(DefaultService())
+            server.serve_forever()
+
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address):
+        TCPServer.__init__(self, address, _BinaryRequestHandler)
+        self.funcs = {}
+        self.instance = None
+
+    def register_function(self, function, name=None):
+        """Register a function that can be called by the clients of the server.
+
+        Parameters
+        ----------
+        function : callable
+            The function.
+        name : str, optional
+            The name of the function on the server.
+            Defaults to the name of the function.
+
+        Returns
+        -------
+        None
+
+        """
+        self.funcs[name or function.__name__] = function
+
+    def register_instance(self, instance):
+        """Register a dispatcher for the calls that don't correspond to a registered function.
+
+        Parameters
+        ----------
+        instance : :class:`~compas.rpc.Dispatcher`
+            The dispatcher.
+
+        Returns
+        -------
+        None
+
+        """
+        self.instance = instance
+
+    def ping(self):
+        """Simple function used to check if a remote server can be reached.
+
+        Returns
+        -------
+        int
+            Always returns 1.
+
+        """
+        return 1
+
+    def remote_shutdown(self):
+        """Stop the server through a call from the client side.
+
+        Returns
+        -------
+        int
+            Always returns 1.
+
+        """
+        threading.Thread(target=self._shutdown_thread).start()
+        return 1
+
+    def _shutdown_thread(self):
+        self.shutdown()
+
+    def _submit_message(self, head, body, received=None):
+        # submit the request to the registered instance if it executes requests asynchronously
+        # otherwise, handle the request immediately
+        submit = getattr(self.instance, "_submit_binary", None)
+        if submit is not None:
+            try:
+                request = loads(head)
+                name = request["name"]
+            except Exception:
+                pass
+            else:
+                if name not in self.funcs:
+                    return submit(name, body, request.get("path"), received, request.get("profiler"))
+        return _Result(self._handle_message(head, body, received))
+
+    def _handle_message(self, head, body, received=None):
+        # decode the request, dispatch it, and encode the response
+        odict = {"data": None, "error": None, "profile": None}
+        try:
+            request = loads(head)
+            name = request["name"]
+            if name in self.funcs:
+                idict = loads(body)
+                odict["data"] = self.funcs[name](*idict["args"], **idict["kwargs"])
+            elif self.instance is not None:
+                odict = self.instance._dispatch_binary(
+                    name, body, request.get("path"), received, request.get("profiler")
+                )
+            else:
+                odict["error"] = "This function is not registered: {0}".format(name)
+        except Exception:
+            odict["error"] = traceback.format_exc()
+        return encode_response(odict)
@@ -2,6 +2,8 @@
 
 The server binds to all network interfaces (i.e. ``0.0.0.0``) and
 it listens to requests on port ``1753``.
+With ``--transport socket``, a :class:`~compas.rpc.BinaryServer` is started instead.
+With ``--workers N``, the calls are executed in parallel by a pool of ``N`` worker processes.
 
 """
 import os
@@ -10,8 +12,11 @@ import sys
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
+from compas.rpc import BinaryServer
 from compas.rpc import Dispatcher
 from compas.rpc import Server
+from compas.rpc import ThreadingServer
+from compas.rpc import WorkerPool
 
 
 class DefaultService(Dispatcher):
@@ -34,7 +39,7 @@ class FileWatcherService(Dispatcher):
             self.current_observer.stop()
 
         self.current_module = module
-        reload_event_handler = ModuleReloader(newly_loaded_modules)
+        reload_event_handler = ModuleReloader(newly_loaded_modules, self)
 
         print("Watching on {}".format(module_dir))
         self.current_observer = Observer()
@@ -43,9 +48,10 @@ class FileWatcherService(Dispatcher):
 
 
 class ModuleReloader(PatternMatchingEventHandler):
-    def __init__(self, module_names):
+    def __init__(self, module_names, dispatcher=None):
         super(ModuleReloader, self).__init__(ignore_patterns=["__pycache__"])
         self.module_names = module_names
+        self.dispatcher = dispatcher
 
     def on_any_event(self, event):
         if event.src_path.endswith(".py"):
@@ -53,18 +59,31 @@ class ModuleReloader(PatternMatchingEventHandler):
             for module in self.module_names:
                 if module in sys.modules:
                     sys.modules.pop(module)
+            if self.dispatcher:
+                self.dispatcher.clear_cache()
 
 
-def start_service(port, autoreload, **kwargs):
+def start_service(port, autoreload, transport="xmlrpc", workers=1, **kwargs):
     print("Starting default RPC service on port {0}...".format(port))
 
     # start the server on *localhost*
     # and listen to requests on port *1753*
-    server = Server(("0.0.0.0", port))
+    # with multiple workers, the server handles requests concurrently
+    # requests are not logged, because the output of the server is often captured but not read,
+    # and the server blocks when the pipe of the captured output is full
+    if transport == "socket":
+        server = BinaryServer(("0.0.0.0", port))
+    elif workers > 1:
+        server = ThreadingServer(("0.0.0.0", port), logRequests=False)
+    else:
+        server = Server(("0.0.0.0", port), logRequests=False)
 
     # register a few utility functions
     server.register_function(server.ping)
     server.register_function(server.remote_shutdown)
+    if transport != "socket":
+        # support batches of calls in a single request
+        server.register_multicall_functions()
 
     # register an instance of the default service
     # the default service extends the base service
@@ -72,12 +91,21 @@ def start_service(port, autoreload, **kwargs):
     # the dispatcher will intercept any calls to functionality of the service
     # and redirect either to an explicitly defined method of the service
     # or to a function that is available on the PYTHONPATH
-    service = DefaultService() if not autoreload else FileWatcherService()
+    # with multiple workers, every worker process has its own instance of the service
+    service_type = DefaultService if not autoreload else FileWatcherService
+    if workers > 1:
+        service = WorkerPool(service_type, workers)
+    else:
+        service = service_type()
     server.register_instance(service)
 
     print("Listening{}...".format(" with autoreload of modules enabled" if autoreload else ""))
     print("Press CTRL+C to abort")
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    finally:
+        if workers > 1:
+            service.close()
 
 
 # ==============================================================================
@@ -101,6 +129,19 @@ if __name__ == "__main__":
         action="store_false",
         help="Do not autoreload modules",
     )
+    parser.add_argument(
+        "--transport",
+        choices=["xmlrpc", "socket"],
+        default="xmlrpc",
+        help="Transport of the RPC calls",
+    )
+    parser.add_argument(
+        "--workers",
+        action="store",
+        default=1,
+        type=int,
+        help="Number of worker processes",
+    )
     parser.set_defaults(autoreload=True, func=start_service)
 
     args = parser.parse_args()
@@ -0,0 +1,478 @@
+"""
+Binary socket transport for the RPC server and proxy.
+
+Instead of JSON strings embedded in XML-RPC requests over HTTP,
+the socket transport sends length-prefixed messages over a persistent TCP connection.
+The contents of the messages are encoded in the COMPAS binary format (see :func:`compas.data.binary_dumps`),
+such that lists of numbers and NumPy arrays are sent as raw buffers.
+
+Every message consists of a fixed-size prefix, a head and a body ::
+
+    MAGIC | uint64 size of the head | uint64 size of the body | head | body
+
+The head of a request contains the name of the requested function and the path that should be added to ``sys.path``.
+The body contains the positional and named arguments of the call.
+The head of a request may also contain the name of the profiler that should be used.
+The head of a response contains the error message, the profile, and the timing record of the call.
+The body contains the result.
+
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import io
+import socket
+import struct
+import threading
+import traceback
+from collections import deque
+
+from compas.data import binary_dumps
+from compas.data.binary import _load
+from compas.rpc.errors import RPCClientError
+from compas.rpc.profiling import clock
+
+try:
+    from concurrent.futures import Future
+except ImportError:
+
+    class Future(object):
+        """Minimal version of :class:`concurrent.futures.Future` for environments without :mod:`concurrent.futures`."""
+
+        def __init__(self):
+            self._condition = threading.Condition()
+            self._done = False
+            self._result = None
+            self._exception = None
+            self._callbacks = []
+
+        def done(self):
+            return self._done
+
+        def result(self, timeout=None):
+            self._wait(timeout)
+            if self._exception is not None:
+                raise self._exception
+            return self._result
+
+        def exception(self, timeout=None):
+            self._wait(timeout)
+            return self._exception
+
+        def add_done_callback(self, fn):
+            with self._condition:
+                if not self._done:
+                    self._callbacks.append(fn)
+                    return
+            fn(self)
+
+        def set_result(self, result):
+            self._finish(result, None)
+
+        def set_exception(self, exception):
+            self._finish(None, exception)
+
+        def _wait(self, timeout):
+            with self._condition:
+                if not self._done:
+                    self._condition.wait(timeout)
+                if not self._done:
+                    raise RPCClientError("The result of the call is not available yet.")
+
+        def _finish(self, result, exception):
+            with self._condition:
+                self._result = result
+                self._exception = exception
+                self._done = True
+                self._condition.notify_all()
+                callbacks, self._callbacks = self._callbacks, []
+            for fn in callbacks:
+                fn(self)
+
+
+MAGIC = b"CRPC"
+
+PREFIX = struct.Struct("<4sQQ")
+
+
+def dumps(data):
+    """Encode the head or the body of a message.
+
+    Parameters
+    ----------
+    data : object
+        Any object that can be encoded in the COMPAS binary format.
+
+    Returns
+    -------
+    bytes
+
+    """
+    return binary_dumps(data)
+
+
+def loads(payload):
+    """Decode the head or the body of a message.
+
+    Parameters
+    ----------
+    payload : bytes | bytearray
+        The encoded data.
+
+    Returns
+    -------
+    object
+
+    Notes
+    -----
+    NumPy arrays are decoded as (nested) lists,
+    which is what the functions of existing services receive and return through the XML-RPC transport.
+
+    """
+    return _load(io.BytesIO(payload), arrays=False)
+
+
+def encode_response(odict):
+    """Encode the output dictionary of a call as the head and body of a response.
+
+    Parameters
+    ----------
+    odict : dict
+        The output dictionary, with the result (``'data'``), the error message (``'error'``),
+        the profile (``'profile'``), and optionally the timing record (``'timing'``) of the call.
+
+    Returns
+    -------
+    tuple[bytes, bytes]
+
+    """
+    start = clock()
+    try:
+        body = dumps(odict["data"])
+    except Exception:
+        odict["error"] = traceback.format_exc()
+        body = dumps(None)
+    timing = odict.get("timing")
+    if timing is not None:
+        timing["encode"] = clock() - start
+        timing["response_bytes"] = len(body)
+    return dumps({"error": odict["error"], "profile": odict["profile"], "timing": timing}), body
+
+
+def send_message(sock, head, body):
+    """Send an encoded message over a socket.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        A connected socket.
+    head : bytes
+        The encoded head of the message.
+    body : bytes
+        The encoded body of the message.
+
+    Returns
+    -------
+    None
+
+    """
+    sock.sendall(PREFIX.pack(MAGIC, len(head), len(body)) + head)
+    sock.sendall(body)
+
+
+def recv_message(sock):
+    """Receive an encoded message from a socket.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        A connected socket.
+
+    Returns
+    -------
+    tuple[bytearray, bytearray] | None
+        The encoded head and body of the message,
+        or None if the connection was closed before the start of a message.
+
+    Raises
+    ------
+    IOError
+        If the connection was closed in the middle of a message,
+        or if the data is not a message.
+
+    """
+    prefix = _recv_exactly(sock, PREFIX.size, eof=True)
+    if prefix is None:
+        return None
+    magic, headsize, bodysize = PREFIX.unpack(bytes(prefix))
+    if magic != MAGIC:
+        raise IOError("The data received over the socket is not an RPC message.")
+    head = _recv_exactly(sock, headsize)
+    body = _recv_exactly(sock, bodysize)
+    return head, body
+
+
+def _recv_exactly(sock, size, eof=False):
+    data = bytearray(size)
+    view = memoryview(data)
+    position = 0
+    while position < size:
+        count = sock.recv_into(view[position:], min(size - position, 1048576))
+        if not count:
+            if eof and position == 0:
+                return None
+            raise IOError("The connection was closed in the middle of a message.")
+        position += count
+    return data
+
+
+class _Method(object):
+    def __init__(self, proxy, name):
+        self._proxy = proxy
+        self._name = name
+
+    def __call__(self, *args, **kwargs):
+        return self._proxy.call(self._name, args, kwargs)
+
+
+class _Connection(object):
+    # a connection to the server, with the futures of the requests that are waiting for a response
+    # the responses are received by a separate thread, and assigned to the futures in the order of the requests
+
+    def __init__(self, address):
+        self.socket = socket.create_connection(address)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.closed = False
+        self.pending = deque()
+        self.lock = threading.Lock()
+        thread = threading.Thread(target=self._receive)
+        thread.daemon = True
+        thread.start()
+
+    def send(self, requests):
+        # if the first request can't be sent, the error is raised, such that the requests can be sent again
+        # otherwise, the errors are assigned to the futures
+        futures = []
+        for head, body in requests:
+            future = Future()
+            with self.lock:
+                if self.closed:
+                    future.set_exception(IOError("The connection is closed."))
+                else:
+                    self.pending.append(future)
+            futures.append(future)
+            try:
+                send_message(self.socket, head, body)
+            except (IOError, OSError, socket.error) as e:
+                if len(futures) == 1:
+                    raise
+                self.close(e)
+        return futures
+
+    def close(self, error=None):
+        with self.lock:
+            self.closed = True
+            futures = list(self.pending)
+            self.pending.clear()
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        try:
+            self.socket.close()
+        except Exception:
+            pass
+        for future in futures:
+            future.set_exception(error or IOError("The connection was closed."))
+
+    def _receive(self):
+        while True:
+            try:
+                message = recv_message(self.socket)
+                if message is None:
+                    raise IOError("The connection was closed by the server.")
+            except Exception as e:
+                self.close(e)
+                return
+            with self.lock:
+                future = self.pending.popleft() if self.pending else None
+            if future is None:
+                self.close(IOError("The server sent a response without a request."))
+                return
+            head, body = message
+            try:
+                result = loads(head)
+                result["data"] = loads(body)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+class BinaryServerProxy(object):
+    """Client side of the socket transport, with a persistent connection to a :class:`~compas.rpc.BinaryServer`.
+
+    Parameters
+    ----------
+    address : str | tuple[str, int]
+        The address of the server, as a ``(host, port)`` tuple,
+        or as a string of the form ``'http://host:port'`` or ``'host:port'``.
+    path : str, optional
+        A path that should be added to ``sys.path`` on the server before a function is called.
+    profiler : Literal['cprofile', 'sample'], optional
+        The profiler that should be used by the server.
+
+    Notes
+    -----
+    The proxy has the same interface as an XML-RPC server proxy:
+    every attribute of the proxy is a function on the server.
+    However, calling a function returns a result dict ::
+
+        {
+            'data'    : ...,  # The result of the function call.
+            'error'   : ...,  # The error message of the function call, if any.
+            'profile' : ...,  # The profile of the function call, if any.
+            'timing'  : ...,  # The timing record of the function call, if any.
+        }
+
+    The connection is made on the first call, and reused for all following calls.
+    If the connection was closed by the server in the meantime, the proxy reconnects.
+    The responses of the server are received by a background thread,
+    such that calls can be submitted without waiting for the results of previous calls (see :meth:`submit`).
+    The proxy should be closed when it is no longer needed.
+
+    """
+
+    def __init__(self, address, path=None, profiler=None):
+        if not isinstance(address, tuple):
+            host, port = address.split("://")[-1].rsplit(":", 1)
+            address = host, int(port)
+        self.address = address
+        self.path = path
+        self.profiler = profiler
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Method(self, name)
+
+    def close(self):
+        """Close the connection to the server.
+
+        Calls that are still waiting for a result fail with an :class:`IOError`.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+    def call(self, name, args=(), kwargs=None):
+        """Call a function on the server.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        args : sequence, optional
+            The positional arguments of the call.
+        kwargs : dict, optional
+            The named arguments of the call.
+
+        Returns
+        -------
+        dict
+            The result dict of the call.
+
+        Raises
+        ------
+        RPCClientError
+            If the arguments can't be encoded.
+
+        """
+        return self.submit(name, args, kwargs).result()
+
+    def submit(self, name, args=(), kwargs=None):
+        """Submit a call of a function on the server, without waiting for the result.
+
+        Parameters
+        ----------
+        name : str
+            The fully qualified name of the function.
+        args : sequence, optional
+            The positional arguments of the call.
+        kwargs : dict, optional
+            The named arguments of the call.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future of the result dict of the call.
+
+        Raises
+        ------
+        RPCClientError
+            If the arguments can't be encoded.
+
+        """
+        return self._send([self._encode(name, args, kwargs)])[0]
+
+    def pipeline(self, calls):
+        """Call several functions on the server, without waiting for the result of one call before sending the next.
+
+        Parameters
+        ----------
+        calls : sequence[tuple[str, sequence, dict]]
+            The fully qualified name, the positional arguments, and the named arguments of every call.
+
+        Returns
+        -------
+        list[dict]
+            The result dicts of the calls, in the order of the calls.
+
+        Raises
+        ------
+        RPCClientError
+            If the arguments can't be encoded.
+
+        Notes
+        -----
+        A server with a pool of workers executes the calls in parallel.
+        Otherwise, the calls are executed one after the other,
+        but the round trip time is paid only once.
+
+        """
+        requests = [self._encode(name, args, kwargs) for name, args, kwargs in calls]
+        if not requests:
+            return []
+        return [future.result() for future in self._send(requests)]
+
+    def _encode(self, name, args, kwargs):
+        try:
+            head = dumps({"name": name, "path": self.path, "profiler": self.profiler})
+            body = dumps({"args": list(args), "kwargs": kwargs or {}})
+        except Exception as e:
+            raise RPCClientError("The arguments can't be encoded: {}".format(e))
+        return head, body
+
+    def _send(self, requests):
+        with self._lock:
+            while True:
+                reused = self._connection is not None and not self._connection.closed
+                if not reused:
+                    self._connection = _Connection(self.address)
+                try:
+                    return self._connection.send(requests)
+                except (IOError, OSError, socket.error):
+                    # a connection that was idle may have been closed by the server in the meantime
+                    self._connection.close()
+                    self._connection = None
+                    if not reused:
+                        raise
@@ -3,8 +3,12 @@ from __future__ import absolute_import
 from __future__ import division
 
 import os
+import atexit
+import base64
 import json
 import tempfile
+import threading
+import time
 
 import compas
 import compas._os
@@ -20,6 +24,7 @@ except ImportError:
 try:
     from subprocess import Popen
     from subprocess import PIPE
+    from subprocess import STDOUT
 except ImportError:
     try:
         from System.Diagnostics import Process
@@ -50,27 +55,32 @@ import traceback
 
 from compas.data import DataEncoder
 from compas.data import DataDecoder
+from compas.rpc.profiling import SamplingProfiler
+from compas.rpc.profiling import clock
 
 basedir    = sys.argv[1]
 funcname   = sys.argv[2]
 ipath      = sys.argv[3]
 opath      = sys.argv[4]
 serializer = sys.argv[5]
+profiler   = sys.argv[6]
 
+timing = {}
+timing['request_bytes'] = os.path.getsize(ipath)
+
+start = clock()
 if serializer == 'json':
     with open(ipath, 'r') as fo:
         idict = json.load(fo, cls=DataDecoder)
 else:
     with open(ipath, 'rb') as fo:
         idict = pickle.load(fo)
+timing['decode'] = clock() - start
 
 try:
     args   = idict['args']
     kwargs = idict['kwargs']
 
-    profile = cProfile.Profile()
-    profile.enable()
-
     sys.path.insert(0, basedir)
     parts = funcname.split('.')
 
@@ -82,27 +92,45 @@ try:
     else:
         raise Exception('Cannot import the function because no module name is specified.')
 
-    r = f(*args, **kwargs)
+    if profiler == 'cprofile':
+        profile = cProfile.Profile()
+        profile.enable()
+    elif profiler == 'sample':
+        profile = SamplingProfiler()
+        profile.start()
 
-    profile.disable()
-
-    stream = StringIO()
-    stats  = pstats.Stats(profile, stream=stream)
-    # stats.strip_dirs()
-    stats.sort_stats(1)
-    stats.print_stats(20)
+    start = clock()
+    r = f(*args, **kwargs)
+    timing['call'] = clock() - start
+
+    if profiler == 'cprofile':
+        profile.disable()
+
+        stream = StringIO()
+        stats  = pstats.Stats(profile, stream=stream)
+        # stats.strip_dirs()
+        stats.sort_stats(1)
+        stats.print_stats(20)
+        output = stream.getvalue()
+    elif profiler == 'sample':
+        profile.stop()
+        output = profile.folded()
+    else:
+        output = None
 
 except Exception:
     odict = {}
     odict['error']      = traceback.format_exc()
     odict['data']       = None
     odict['profile']    = None
+    odict['timing']     = timing
 
 else:
     odict = {}
     odict['error']      = None
     odict['data']       = r
-    odict['profile']    = stream.getvalue()
+    odict['profile']    = output
+    odict['timing']     = timing
 
 if serializer == 'json':
     with open(opath, 'w+') as fo:
@@ -115,6 +143,310 @@ else:
 """
 
 
+WORKER = """
+import sys
+import base64
+import importlib
+
+import json
+
+try:
+    import cPickle as pickle
+except Exception:
+    import pickle
+
+try:
+    from cStringIO import StringIO
+except Exception:
+    from io import StringIO
+
+import cProfile
+import pstats
+import traceback
+
+from compas.data import DataEncoder
+from compas.data import DataDecoder
+from compas.rpc.profiling import SamplingProfiler
+from compas.rpc.profiling import clock
+
+marker = sys.argv[1]
+
+# the imported functions are reused by all following calls
+functions = {}
+
+
+def decode(serializer, payload):
+    if serializer == 'json':
+        return json.loads(payload, cls=DataDecoder)
+    return pickle.loads(base64.b64decode(payload))
+
+
+def encode(serializer, odict):
+    if serializer == 'json':
+        return json.dumps(odict, cls=DataEncoder)
+    return base64.b64encode(pickle.dumps(odict, protocol=2)).decode('ascii')
+
+
+def function(basedir, funcname):
+    key = basedir, funcname
+    if key not in functions:
+        if basedir not in sys.path:
+            sys.path.insert(0, basedir)
+        parts = funcname.split('.')
+        if len(parts) < 2:
+            raise Exception('Cannot import the function because no module name is specified.')
+        m = importlib.import_module('.'.join(parts[:-1]))
+        functions[key] = getattr(m, parts[-1])
+    return functions[key]
+
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    line = line.strip()
+    if not line:
+        continue
+
+    serializer, payload = line.split(' ', 1)
+
+    timing = {}
+    timing['request_bytes'] = len(payload)
+
+    odict = {}
+    odict['error']      = None
+    odict['data']       = None
+    odict['profile']    = None
+    odict['timing']     = timing
+
+    try:
+        start = clock()
+        idict = decode(serializer, payload)
+        timing['decode'] = clock() - start
+
+        f = function(idict['basedir'], idict['funcname'])
+        profiler = idict['profiler']
+
+        if profiler == 'cprofile':
+            profile = cProfile.Profile()
+            profile.enable()
+        elif profiler == 'sample':
+            profile = SamplingProfiler()
+            profile.start()
+
+        start = clock()
+        odict['data'] = f(*idict['args'], **idict['kwargs'])
+        timing['call'] = clock() - start
+
+        if profiler == 'cprofile':
+            profile.disable()
+            stream = StringIO()
+            stats  = pstats.Stats(profile, stream=stream)
+            stats.sort_stats(1)
+            stats.print_stats(20)
+            odict['profile'] = stream.getvalue()
+        elif profiler == 'sample':
+            profile.stop()
+            odict['profile'] = profile.folded()
+
+    except Exception:
+        odict['error'] = traceback.format_exc()
+
+    try:
+        output = encode(serializer, odict)
+    except Exception:
+        odict['data']  = None
+        odict['error'] = traceback.format_exc()
+        output = encode(serializer, odict)
+
+    # the result is written on a separate line,
+    # after anything the function may have printed
+    print('')
+    print(marker + output)
+    sys.stdout.flush()
+
+"""
+
+# prefix of the lines of the output of a worker that contain a result
+MARKER = "__compas_xfunc__"
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class _Worker(object):
+    # a Python process that executes calls of wrapped functions
+    # requests are sent over stdin and results are received over stdout, one line per message
+
+    def __init__(self, python):
+        env = compas._os.prepare_environment()
+        try:
+            Popen
+        except NameError:
+            process = Process()
+            for name in env:
+                if process.StartInfo.EnvironmentVariables.ContainsKey(name):
+                    process.StartInfo.EnvironmentVariables[name] = env[name]
+                else:
+                    process.StartInfo.EnvironmentVariables.Add(name, env[name])
+            process.StartInfo.UseShellExecute = False
+            process.StartInfo.RedirectStandardInput = True
+            process.StartInfo.RedirectStandardOutput = True
+            process.StartInfo.FileName = python
+            process.StartInfo.Arguments = '-u -c "{0}" {1}'.format(WORKER, MARKER)
+            process.Start()
+            self._dotnet = True
+        else:
+            process = Popen(
+                [python, "-u", "-c", WORKER, MARKER],
+                stdin=PIPE,
+                stdout=PIPE,
+                stderr=STDOUT,
+                env=env,
+                universal_newlines=True,
+            )
+            self._dotnet = False
+        self.process = process
+        self.last_used = time.time()
+
+    def write(self, line):
+        if self._dotnet:
+            self.process.StandardInput.WriteLine(line)
+            self.process.StandardInput.Flush()
+        else:
+            self.process.stdin.write(line + "\n")
+            self.process.stdin.flush()
+
+    def readline(self):
+        if self._dotnet:
+            return self.process.StandardOutput.ReadLine() or ""
+        return self.process.stdout.readline()
+
+    def close(self):
+        try:
+            if self._dotnet:
+                self.process.StandardInput.Close()
+                self.process.WaitForExit(1000)
+                if not self.process.HasExited:
+                    self.process.Kill()
+            else:
+                self.process.stdin.close()
+                self.process.wait()
+        except Exception:
+            pass
+
+    def kill(self):
+        # a broken worker may be blocked writing a result that is never read,
+        # so it is stopped without waiting for it to finish
+        try:
+            if self._dotnet:
+                self.process.Kill()
+                self.process.WaitForExit(1000)
+            else:
+                self.process.kill()
+                self.process.stdin.close()
+                self.process.stdout.close()
+                self.process.wait()
+        except Exception:
+            pass
+
+
+class _Pool(object):
+    # warm workers for one Python executable
+    # workers that are idle for longer than the idle timeout are stopped
+
+    def __init__(self, python, size, idle_timeout):
+        self.python = python
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = []
+        self._count = 0
+        self._condition = threading.Condition()
+        self._timer = None
+
+    def acquire(self):
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._count < self.size:
+                    self._count += 1
+                    break
+                self._condition.wait()
+        try:
+            return _Worker(self.python)
+        except Exception:
+            with self._condition:
+                self._count -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, worker, broken=False):
+        with self._condition:
+            if broken or self._count > self.size:
+                self._count -= 1
+                self._condition.notify()
+            else:
+                worker.last_used = time.time()
+                self._idle.append(worker)
+                self._condition.notify()
+                self._schedule()
+                return
+        if broken:
+            worker.kill()
+        else:
+            worker.close()
+
+    def close(self):
+        with self._condition:
+            workers, self._idle = self._idle, []
+            self._count -= len(workers)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for worker in workers:
+            worker.close()
+
+    def _schedule(self):
+        # schedule the stop of the worker that was idle for the longest time
+        if self._timer is not None or not self._idle or self.idle_timeout is None:
+            return
+        delay = min(worker.last_used for worker in self._idle) + self.idle_timeout - time.time()
+        self._timer = threading.Timer(max(delay, 0), self._stop_idle)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _stop_idle(self):
+        with self._condition:
+            self._timer = None
+            now = time.time()
+            expired = [worker for worker in self._idle if now - worker.last_used >= self.idle_timeout]
+            self._idle = [worker for worker in self._idle if now - worker.last_used < self.idle_timeout]
+            self._count -= len(expired)
+            self._schedule()
+        for worker in expired:
+            worker.close()
+
+
+def _get_pool(python, size, idle_timeout):
+    with _POOLS_LOCK:
+        pool = _POOLS.get(python)
+        if pool is None:
+            pool = _POOLS[python] = _Pool(python, size, idle_timeout)
+        else:
+            pool.size = size
+            pool.idle_timeout = idle_timeout
+        return pool
+
+
+@atexit.register
+def _close_pools():
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        pool.close()
+
+
 class XFunc(object):
     """Wrapper for functions that turns them into externally run processes.
 
@@ -146,13 +478,31 @@ class XFunc(object):
         A list of paths to be added to the `PYTHONPATH` by the subprocess.
     serializer : {'json', 'pickle'}, optional
         The serialization mechnanism to be used to pass data between the caller and the subprocess.
+    pooled : bool, optional
+        If True, the calls are executed by warm worker processes that are reused for subsequent calls,
+        instead of by a new process per call.
+    pool_size : int, optional
+        The maximum number of worker processes of the pool, which is shared by all pooled wrappers with the same `python`.
+    idle_timeout : float, optional
+        The number of seconds after which an idle worker process of the pool is stopped.
+        If None, the workers are stopped only when the calling process exits.
+    profiler : {'cprofile', 'sample'}, optional
+        The profiler that should be used for the call to the wrapped function.
+        With ``'cprofile'``, the call is profiled with :mod:`cProfile`.
+        With ``'sample'``, the call is profiled with a low-overhead sampling profiler.
+        Default is None, in which case the call is not profiled.
 
     Attributes
     ----------
     data : object
         The object returned by the wrapped function.
     profile : str
-        A profile of the call to the wrapped function.
+        A profile of the call to the wrapped function, if a profiler is selected.
+    timing : dict
+        The timing record of the call to the wrapped function,
+        with the time spent decoding the arguments (``'decode'``), in the function (``'call'``),
+        and on the entire call including the start of the process (``'roundtrip'``),
+        and the size of the input (``'request_bytes'``) and output (``'response_bytes'``) files.
     error : str
         A traceback of the exception raised during the wrapped function call.
 
@@ -170,6 +520,18 @@ class XFunc(object):
 
         fd_numpy = XFunc('compas.numerical.fd_numpy', python='/Users/brg/environments/py2/python')
 
+    By default, every call starts a new Python process,
+    which imports the module of the wrapped function before the function is called.
+    For short calls, the startup of the process and the imports take most of the time.
+    In pooled mode, the calls are executed by worker processes that stay alive between calls,
+    and keep the imported modules loaded.
+    The arguments and results are sent over the standard input and output of the workers,
+    instead of through files.
+
+    .. code-block:: python
+
+        fd_numpy = XFunc('compas.numerical.fd_numpy', pooled=True, pool_size=2, idle_timeout=300)
+
     Examples
     --------
     :mod:`compas.numerical` provides an implementation of the Force Density Method that
@@ -234,6 +596,10 @@ class XFunc(object):
         argtypes=None,
         kwargtypes=None,
         restypes=None,
+        profiler=None,
+        pooled=False,
+        pool_size=1,
+        idle_timeout=60.0,
     ):
         self._basedir = None
         self._tmpdir = None
@@ -254,7 +620,12 @@ class XFunc(object):
         self.kwargtypes = kwargtypes
         self.restypes = restypes
         self.data = None
+        self.profiler = profiler
+        self.pooled = pooled
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
         self.profile = None
+        self.timing = None
         self.error = None
 
     @property
@@ -344,6 +715,8 @@ class XFunc(object):
         # if self.kwargtypes:
         #     kwargs = {name: value for name, value in kwargs.items()}
 
+        start = time.time()
+
         idict = {
             "args": args,
             "kwargs": kwargs,
@@ -352,6 +725,9 @@ class XFunc(object):
             # 'restypes': self.restypes
         }
 
+        if self.pooled:
+            return self._call_pooled(idict, start)
+
         if self.serializer == "json":
             with open(self.ipath, "w+") as fo:
                 json.dump(idict, fo, cls=DataEncoder)
@@ -370,6 +746,7 @@ class XFunc(object):
             self.ipath,
             self.opath,
             self.serializer,
+            self.profiler or "none",
         ]
 
         try:
@@ -386,7 +763,7 @@ class XFunc(object):
             process.StartInfo.RedirectStandardOutput = True
             process.StartInfo.RedirectStandardError = True
             process.StartInfo.FileName = self.python
-            process.StartInfo.Arguments = '-u -c "{0}" {1} {2} {3} {4} {5}'.format(*args)
+            process.StartInfo.Arguments = '-u -c "{0}" {1} {2} {3} {4} {5} {6}'.format(*args)
             process.Start()
             process.WaitForExit()
 
@@ -423,6 +800,9 @@ class XFunc(object):
 
         self.data = odict["data"]
         self.profile = odict["profile"]
+        self.timing = odict.get("timing") or {}
+        self.timing["response_bytes"] = os.path.getsize(self.opath)
+        self.timing["roundtrip"] = time.time() - start
         self.error = odict["error"]
 
         if self.delete_files:
@@ -439,3 +819,80 @@ class XFunc(object):
             raise Exception(self.error)
 
         return self.data
+
+    def _call_pooled(self, idict, start):
+        """Make a call to the wrapped function in a worker process of the pool.
+
+        Parameters
+        ----------
+        idict : dict
+            The input dictionary, with the positional and named arguments.
+        start : float
+            The time at which the call was made.
+
+        Returns
+        -------
+        object or None
+            The data returned by the wrapped call.
+
+        """
+        idict["funcname"] = self.funcname
+        idict["basedir"] = self.basedir
+        idict["profiler"] = self.profiler
+
+        if self.serializer == "json":
+            payload = json.dumps(idict, cls=DataEncoder)
+        else:
+            payload = base64.b64encode(pickle.dumps(idict, protocol=2)).decode("ascii")
+
+        pool = _get_pool(self.python, self.pool_size, self.idle_timeout)
+        worker = pool.acquire()
+        broken = True
+        try:
+            worker.write("{} {}".format(self.serializer, payload))
+            while True:
+                line = worker.readline()
+                if not line:
+                    raise Exception("The worker process stopped unexpectedly.")
+                line = line.strip()
+                if line.startswith(MARKER):
+                    break
+                if not line:
+                    continue
+                if self.callback:
+                    self.callback(line, self.callback_args)
+                if self.verbose:
+                    print(line)
+            broken = False
+        finally:
+            pool.release(worker, broken)
+
+        output = line[len(MARKER) :]
+        if self.serializer == "json":
+            odict = json.loads(output, cls=DataDecoder)
+        else:
+            odict = pickle.loads(base64.b64decode(output))
+
+        self.data = odict["data"]
+        self.profile = odict["profile"]
+        self.timing = odict.get("timing") or {}
+        self.timing["response_bytes"] = len(output)
+        self.timing["roundtrip"] = time.time() - start
+        self.error = odict["error"]
+
+        if self.error:
+            raise Exception(self.error)
+
+        return self.data
+
+    def stop_workers(self):
+        """Stop the idle worker processes of the pool used by this wrapper.
+
+        Returns
+        -------
+        None
+
+        """
+        pool = _POOLS.get(self.python)
+        if pool is not None:
+            pool.close()
@@ -2,7 +2,12 @@ import pytest  # noqa: F401
 
 import compas
 from compas.artists import Artist
+from compas.artists import MeshArtist
 from compas.artists.artist import NoArtistContextError
+from compas.datastructures import Mesh
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas.geometry import allclose
 
 
 if not compas.IPY:
@@ -30,6 +35,20 @@ class FakeSubArtist(Artist):
         pass
 
 
+class FakeMeshArtist(MeshArtist):
+    def draw(self):
+        pass
+
+    def draw_vertices(self, vertices=None, color=None, text=None):
+        pass
+
+    def draw_edges(self, edges=None, color=None, text=None):
+        pass
+
+    def draw_faces(self, faces=None, color=None, text=None):
+        pass
+
+
 class FakeItem(object):
     pass
 
@@ -62,6 +81,27 @@ def test_get_artist_cls_with_out_of_order_registration():
     assert isinstance(artist, FakeSubArtist)
 
 
+def test_meshartist_pending_transformation():
+    Artist.register(Mesh, FakeMeshArtist, context="fake")
+    mesh = Mesh.from_polyhedron(6)
+    T = Rotation.from_axis_and_angle([0, 0, 1], 0.5)
+    X = Translation.from_vector([0, 0, 1])
+    expected = mesh.transformed(X * T)
+
+    mesh.lazy_transform = True
+    artist = Artist(mesh, context="fake")
+    artist.transformation = X
+    mesh.transform(T)
+    xyz = artist.vertex_xyz
+    assert mesh.pending_transformation is not None
+    assert allclose([xyz[vertex] for vertex in mesh.vertices()], expected.vertices_attributes("xyz"))
+
+    mesh.transform(T)
+    xyz = artist.vertex_xyz
+    assert mesh.pending_transformation is not None
+    assert allclose([xyz[vertex] for vertex in mesh.vertices()], expected.transformed(T).vertices_attributes("xyz"))
+
+
 if not compas.IPY:
 
     def test_artist_auto_context_discovery(mocker):
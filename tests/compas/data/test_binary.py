@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+import compas
+from compas.data import DecoderError
+from compas.data import binary_dump
+from compas.data import binary_dumps
+from compas.data import binary_load
+from compas.data import binary_loads
+from compas.datastructures import Mesh
+from compas.datastructures import Network
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+
+if not compas.IPY:
+    import numpy as np
+
+
+def test_binary_native():
+    before = [[], (), {}, "", "é", 1, 2**70, 1.0, True, None, {1: None}]
+    after = binary_loads(binary_dumps(before))
+    assert after == [[], [], {}, "", "é", 1, 2**70, 1.0, True, None, {"1": None}]
+
+
+def test_binary_packed():
+    before = {
+        "ints": list(range(-10, 10)),
+        "floats": [0.5, 1] * 10,
+        "rows": [[i, 2 * i, 3 * i] for i in range(20)],
+        "ragged": [[1, 2], [3]] * 10,
+        "mixed": [1, "a"] * 10,
+        "table": {str(i): {"x": i, "y": 0.5, "z": None} for i in range(20)},
+        "empty": {str(i): {} for i in range(20)},
+        "lists": {"k{}".format(i): [i] * i for i in range(20)},
+    }
+    after = binary_loads(binary_dumps(before))
+    assert after == before
+
+
+def test_binary_objects():
+    before = [Point(1, 2, 3), Box(xsize=1, ysize=2, zsize=3, frame=Frame.worldXY())]
+    after = binary_loads(binary_dumps(before))
+    assert after[0] == before[0]
+    assert after[1].vertices == before[1].vertices
+    assert [a.guid for a in after] == [b.guid for b in before]
+    after = binary_loads(binary_dumps(before, minimal=True))
+    assert after[0].guid != before[0].guid
+
+
+def test_binary_mesh(tmp_path):
+    before = Mesh.from_obj(compas.get("faces.obj"))
+    filepath = str(tmp_path / "mesh.bin")
+    binary_dump(before, filepath)
+    after = binary_load(filepath)
+    assert after.data == before.data
+    assert after.guid == before.guid
+
+
+def test_binary_network():
+    before = Network()
+    a = before.add_node(x=1.0)
+    b = before.add_node(x=2.0)
+    before.add_edge(a, b, weight=0.5)
+    after = binary_loads(binary_dumps(before))
+    assert after.data == before.data
+
+
+def test_binary_numpy(tmp_path):
+    if compas.IPY:
+        return
+    before = [np.arange(12.0).reshape(3, 4), np.arange(5, dtype=">i2"), np.array(True), np.float32(2.5)]
+    filepath = str(tmp_path / "arrays.bin")
+    binary_dump(before, filepath)
+    for mmap in (False, True):
+        after = binary_load(filepath, mmap=mmap)
+        assert isinstance(after[0], np.memmap) == mmap
+        assert after[0].tolist() == before[0].tolist()
+        assert after[1].tolist() == [0, 1, 2, 3, 4]
+        assert after[2].shape == ()
+        assert after[3] == 2.5
+
+
+def test_binary_invalid():
+    with pytest.raises(DecoderError):
+        binary_load(io.BytesIO(b"not a binary file at all"))
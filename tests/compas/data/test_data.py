@@ -1,4 +1,9 @@
+import binascii
+
 from compas.data import Data
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
 
 
 def test_string_casting():
@@ -11,3 +16,44 @@ def test_string_casting():
 
     test = TestClass(42)
     assert str(test) == "TestClass 42"
+
+
+def test_copy_geometry():
+    frame = Frame([1, 2, 3], [0, 1, 0], [-1, 0, 0])
+    frame.zaxis
+    other = frame.copy()
+    assert other.guid != frame.guid
+    assert other.data == frame.data
+    other.point.x = 10
+    other.xaxis = [1, 0, 0]
+    assert frame.point.x == 1
+    assert frame.zaxis == frame.xaxis.cross(frame.yaxis)
+    assert other.zaxis == other.xaxis.cross(other.yaxis)
+
+
+def test_copy_overridden_data():
+    class LabeledPoint(Point):
+        def __init__(self, x, y, z=0.0, label=None):
+            super(LabeledPoint, self).__init__(x, y, z)
+            self.label = label
+
+        @property
+        def data(self):
+            return [self.x, self.y, self.z, self.label]
+
+        @classmethod
+        def from_data(cls, data):
+            return cls(data[0], data[1], data[2], label="copy of {}".format(data[3]))
+
+    point = LabeledPoint(1, 2, 3, label="a")
+    assert point.copy().label == "copy of a"
+
+
+def test_sha256_ignores_guid():
+    a = Point(1, 2, 3)
+    b = Point(1, 2, 3)
+    assert a.guid != b.guid
+    assert a.sha256() == b.sha256()
+    assert a.sha256() != Point(1, 2, 4).sha256()
+    assert a.sha256() != Vector(1, 2, 3).sha256()
+    assert a.sha256(as_string=True) == binascii.hexlify(a.sha256()).decode("ascii")
@@ -1,4 +1,11 @@
+import io
+import uuid
+
+import pytest
+
 import compas
+from compas.data import json_iterload
+from compas.data import register_dtype
 from compas.datastructures import Mesh
 from compas.datastructures import Network
 from compas.datastructures import VolMesh
@@ -113,7 +120,80 @@ def test_json_pretty():
     assert result == """{\n"a": 12,\n"b": 6565\n}"""
 
 
+def test_json_iterload_array():
+    text = '[1, "a]", {"x": [1, {"y": 2}]}, null, true, 2.5e3, 12345, [], {}]'
+    after = list(json_iterload(io.StringIO(text), chunksize=1))
+    assert after == [1, "a]", {"x": [1, {"y": 2}]}, None, True, 2500.0, 12345, [], {}]
+    assert list(json_iterload(io.StringIO(" [ ] "))) == []
+
+
+def test_json_iterload_object():
+    meshes = [Mesh.from_polyhedron(4), Mesh.from_polyhedron(6)]
+    for mesh in meshes:
+        mesh.face_attribute(0, "color", "red")
+    text = compas.json_dumps({"a": meshes[0], "b": meshes[1]})
+    after = list(json_iterload(io.StringIO(text), skip=["facedata"], chunksize=16))
+    assert [key for key, _ in after] == ["a", "b"]
+    assert [mesh.number_of_faces() for _, mesh in after] == [4, 6]
+    assert all(mesh.face_attribute(0, "color") is None for _, mesh in after)
+    assert after[0][1].guid == meshes[0].guid
+
+
+@pytest.mark.parametrize("text", ["", "1", "[1, 2", "[1 2]", "[1, 2}"])
+def test_json_iterload_invalid(text):
+    with pytest.raises(ValueError):
+        list(json_iterload(io.StringIO(text), chunksize=1))
+
+
 # temporarily commented because folder does not exist yet on main
 # def test_json_url():
 #     data = compas.json_load('https://raw.githubusercontent.com/compas-dev/compas/main/src/compas/data/schemas/graph.json')
 #     assert data['$schema'] == 'http://json-schema.org/draft-07/schema#'
+
+
+def test_json_registered_dtype():
+    class MyPoint(Point):
+        pass
+
+    def decoder(data, guid=None):
+        point = MyPoint(*data)
+        point.name = "decoded"
+        return point
+
+    register_dtype(MyPoint, "test_json/MyPoint", decoder=decoder)
+    register_dtype(Point, "test_json/OldPoint")
+    data = '[{"dtype": "test_json/MyPoint", "data": [1, 2, 3]}, {"dtype": "test_json/OldPoint", "data": [4, 5, 6]}]'
+    a, b = compas.json_loads(data)
+    assert type(a) is MyPoint
+    assert a.name == "decoded"
+    assert type(b) is Point
+    assert b == [4, 5, 6]
+
+
+def test_json_point_subclass():
+    class LabeledPoint(Point):
+        def __init__(self, x, y, z=0.0):
+            super(LabeledPoint, self).__init__(x, y, z)
+            self.label = "label"
+
+    register_dtype(LabeledPoint, "test_json/LabeledPoint")
+    point = compas.json_loads('{"dtype": "test_json/LabeledPoint", "data": [1, 2, 3], "guid": "%s"}' % Point(0, 0).guid)
+    assert point.label == "label"
+    assert isinstance(point.guid, uuid.UUID)
+
+
+@pytest.mark.parametrize("dtype", ["compas.geometry/Point", "compas.geometry/Vector", "compas.geometry/Frame"])
+def test_json_guid(dtype):
+    data = (
+        "[1, 0, 0]"
+        if dtype != "compas.geometry/Frame"
+        else '{"point": [0, 0, 0], "xaxis": [1, 0, 0], "yaxis": [0, 1, 0]}'
+    )
+    guid = uuid.uuid4()
+    text = '{"dtype": "%s", "data": %s, "guid": "%s"}'
+    assert compas.json_loads(text % (dtype, data, guid)).guid == guid
+    assert compas.json_loads(text % (dtype, data, guid.hex)).guid == guid
+    with pytest.raises(ValueError):
+        compas.json_loads(text % (dtype, data, "not-a-guid"))
+    with pytest.raises(ValueError):
+        compas.json_loads(text % (dtype, data, str(guid)[:-1] + "x"))
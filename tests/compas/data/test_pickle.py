@@ -1,4 +1,9 @@
 import pickle
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
 from compas.geometry import Frame
 
 
@@ -11,3 +16,48 @@ def test_pickling():
     assert all(a == b for a, b in zip(f1.yaxis, f2.yaxis))
     assert all(a == b for a, b in zip(f1.zaxis, f2.zaxis))
     assert f1.guid == f2.guid
+
+
+def test_pickle_state_is_not_duplicated():
+    mesh = Mesh.from_meshgrid(dx=1, nx=10)
+    state = mesh.__getstate__()
+    assert "data" not in state
+    assert state["_guid"] == mesh.guid
+    other = pickle.loads(pickle.dumps(mesh, protocol=2))
+    assert other.data == mesh.data
+    assert other.guid == mesh.guid
+
+
+def test_unpickle_legacy_state():
+    frame = Frame.worldXY()
+    state = frame.__jsondump__()
+    state["__dict__"] = dict(frame.__dict__, _guid=None)
+    other = Frame.__new__(Frame)
+    other.__setstate__(state)
+    assert other.data == frame.data
+    assert other.guid == frame.guid
+
+
+@pytest.mark.skipif(compas.IPY, reason="Pickle protocol 5 is not available")
+def test_pickle_array_storage_out_of_band():
+    if pickle.HIGHEST_PROTOCOL < 5:
+        return
+    mesh = Mesh.from_meshgrid(dx=1, nx=10)
+    other = Mesh(storage="array")
+    for vertex in mesh.vertices():
+        other.add_vertex(vertex, attr_dict=mesh.vertex_attributes(vertex))
+    for face in mesh.faces():
+        other.add_face(mesh.face_vertices(face), fkey=face)
+    other.update_default_vertex_attributes(tag=None)
+    other.vertex_attribute(3, "tag", "a")
+    other.cache_topology = True
+    list(other.edges())
+    buffers = []
+    dump = pickle.dumps(other, protocol=5, buffer_callback=buffers.append)
+    assert buffers
+    result = pickle.loads(dump, buffers=buffers)
+    assert result.data == other.data
+    assert result.vertex_attribute(0, "tag") is None
+    assert result.cache_topology
+    result.delete_face(0)
+    assert other.number_of_faces() == mesh.number_of_faces()
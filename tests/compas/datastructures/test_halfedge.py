@@ -477,3 +477,54 @@ def test_strip_faces_open(grid):
 
     assert grid.is_face_on_boundary(faces[0])
     assert grid.is_face_on_boundary(faces[-1])
+
+
+# ==============================================================================
+# Topology cache
+# ==============================================================================
+
+
+def test_cache_topology_flag(grid):
+    assert not grid.cache_topology
+    grid.cache_topology = True
+    assert grid.cache_topology
+    edges = list(grid.edges())
+    assert grid._topology.edges == edges
+    grid.cache_topology = False
+    assert grid._topology is None
+    assert list(grid.edges()) == edges
+
+
+def test_cache_topology_add_delete(grid):
+    grid.cache_topology = True
+    face = grid.face_sample()[0]
+    nbrs = grid.face_neighbors(face)
+    vertex = grid.face_vertices(face)[0]
+    ring = grid.vertex_neighbors(vertex, ordered=True)
+    number_of_edges = grid.number_of_edges()
+    vertices = grid.face_vertices(face)
+    grid.delete_face(face)
+    for nbr in nbrs:
+        assert face not in grid.face_neighbors(nbr)
+    assert grid.number_of_edges() <= number_of_edges
+    grid.add_face(vertices, fkey=face)
+    for nbr in nbrs:
+        assert face in grid.face_neighbors(nbr)
+    assert grid.vertex_neighbors(vertex, ordered=True) == ring
+    assert grid.number_of_edges() == number_of_edges
+    grid.delete_vertex(vertex)
+    assert all(vertex not in edge for edge in grid.edges())
+    assert all(vertex not in grid.vertex_neighbors(nbr, ordered=True) for nbr in ring)
+
+
+def test_cache_topology_operations(grid):
+    grid.cache_topology = True
+    boundaries = grid.vertices_on_boundaries()
+    edge = grid.edges_on_boundary()[0]
+    w = grid.split_edge(edge, allow_boundary=True)
+    assert w in grid.vertices_on_boundaries()[0]
+    assert len(grid.vertices_on_boundaries()[0]) == len(boundaries[0]) + 1
+    assert w in grid.vertex_neighbors(edge[0], ordered=True)
+    grid.invalidate_topology()
+    assert grid._topology.edges is None
+    assert not grid._topology.vertex
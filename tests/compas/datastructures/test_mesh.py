@@ -9,6 +9,7 @@ from compas.datastructures import meshes_join_and_weld
 from compas.geometry import Box
 from compas.geometry import Polygon
 from compas.geometry import Polyhedron
+from compas.geometry import Rotation
 from compas.geometry import Translation
 from compas.geometry import allclose
 
@@ -296,6 +297,66 @@ def test_copy():
     assert mesh1.number_of_edges() == mesh2.number_of_edges()
 
 
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_copy_is_independent(storage):
+    mesh1 = Mesh(storage=storage)
+    mesh1.update_default_vertex_attributes(tags=None)
+    vertices, faces = Mesh.from_obj(compas.get("faces.obj")).to_vertices_and_faces()
+    for x, y, z in vertices:
+        mesh1.add_vertex(x=x, y=y, z=z)
+    for face in faces:
+        mesh1.add_face(face)
+    mesh1.vertex_attribute(0, "tags", ["a"])
+    mesh2 = mesh1.copy()
+    assert mesh2.guid != mesh1.guid
+    assert mesh2.storage == storage
+    assert mesh2.data == mesh1.data
+    mesh2.vertex_attribute(0, "tags").append("b")
+    mesh2.vertex_attribute(0, "x", 100.0)
+    mesh2.delete_face(0)
+    assert mesh1.vertex_attribute(0, "tags") == ["a"]
+    assert mesh1.vertex_attribute(0, "x") != 100.0
+    assert mesh1.number_of_faces() == len(faces)
+
+
+def test_sha256_direct_writes():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    digest = mesh.sha256()
+    mesh.vertex[0]["x"] = 100.0
+    assert mesh.sha256() != digest
+    digest = mesh.sha256()
+    mesh.attributes["name"] = "other"
+    assert mesh.sha256() != digest
+    mesh.vertex_attribute(0, "loads", [0, 0, 0])
+    digest = mesh.sha256()
+    mesh.vertex_attribute(0, "loads").append(1)
+    assert mesh.sha256() != digest
+
+
+def test_sha256_cache():
+    mesh1 = Mesh.from_obj(compas.get("faces.obj"))
+    assert not mesh1.cache_sha256
+    mesh1.cache_sha256 = True
+    digest = mesh1.sha256()
+    x = mesh1.vertex[0]["x"]
+    mesh1.vertex[0]["x"] = 100.0
+    assert mesh1.sha256() == digest
+    mesh1._sha256 = None
+    assert mesh1.sha256() != digest
+    mesh1.vertex[0]["x"] = x
+    mesh1._sha256 = None
+    assert mesh1.sha256() == digest
+    mesh2 = mesh1.copy()
+    assert mesh2.sha256() == digest
+    mesh2.vertex_attribute(0, "z", 1.0)
+    assert mesh2.sha256() != digest
+    mesh2.vertex_attribute(0, "z", mesh1.vertex_attribute(0, "z"))
+    assert mesh2.sha256() == digest
+    mesh2.name = "other"
+    assert mesh2.sha256() != digest
+    assert mesh1.sha256() == Mesh.from_data(mesh1.data).sha256()
+
+
 def test_clear():
     mesh = Mesh.from_obj(compas.get("faces.obj"))
     mesh.clear()
@@ -844,3 +905,246 @@ def test_face_attributes_includes_all_defaults(box):
     ]
 
     assert box.face_attribute(random_fkey, "attr3") == "value3"
+
+
+# --------------------------------------------------------------------------
+# storage
+# --------------------------------------------------------------------------
+
+
+def test_array_storage_constructor():
+    mesh = Mesh(storage="array")
+    a = mesh.add_vertex()
+    b = mesh.add_vertex(x=1.0)
+    c = mesh.add_vertex(x=1.0, y=1.0, name="c")
+    mesh.add_face([a, b, c])
+    assert mesh.storage == "array"
+    assert mesh.vertex_coordinates(c) == [1.0, 1.0, 0.0]
+    assert mesh.vertex_attribute(c, "name") == "c"
+    assert mesh.vertex_attribute(a, "name") is None
+    assert mesh.face_vertices(0) == [a, b, c]
+    assert mesh.halfedge[a][b] == 0
+    assert mesh.halfedge[b][a] is None
+    assert mesh.is_valid()
+
+
+def test_array_storage_invalid():
+    with pytest.raises(ValueError):
+        Mesh(storage="list")
+
+
+def test_array_storage_topology(box):
+    mesh = Mesh(storage="array")
+    mesh.join(box)
+    assert mesh.number_of_vertices() == box.number_of_vertices()
+    assert mesh.number_of_edges() == box.number_of_edges()
+    assert mesh.number_of_faces() == box.number_of_faces()
+    assert mesh.is_closed()
+    assert mesh.is_manifold()
+    for vertex in mesh.vertices():
+        assert mesh.vertex_neighbors(vertex, ordered=True) == box.vertex_neighbors(vertex, ordered=True)
+        assert mesh.vertex_faces(vertex, ordered=True) == box.vertex_faces(vertex, ordered=True)
+    assert allclose(mesh.centroid(), box.centroid())
+
+
+def test_array_storage_modifiers(box):
+    mesh = Mesh(storage="array")
+    mesh.join(box)
+    mesh.insert_vertex(0)
+    mesh.split_edge((1, 2), allow_boundary=True)
+    mesh.unify_cycles()
+    assert mesh.is_valid()
+    mesh.delete_vertex(0)
+    mesh.cull_vertices()
+    assert 0 not in mesh.vertex
+    assert mesh.is_valid()
+    mesh.clear()
+    assert mesh.storage == "array"
+    assert mesh.is_empty()
+
+
+def test_array_storage_data(box):
+    mesh = Mesh(storage="array")
+    mesh.join(box)
+    mesh.face_attribute(0, "color", "red")
+    other = compas.json_loads(compas.json_dumps(mesh))
+    assert other.storage == "dict"
+    assert other.face_attribute(0, "color") == "red"
+    assert other.number_of_faces() == mesh.number_of_faces()
+    for vertex in mesh.vertices():
+        assert other.vertex_coordinates(vertex) == mesh.vertex_coordinates(vertex)
+
+
+# --------------------------------------------------------------------------
+# arrays
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_from_arrays(hexagongrid, storage):
+    vertices, faces = hexagongrid.to_vertices_and_faces()
+    mesh = Mesh.from_arrays(vertices, faces, storage=storage)
+    other = Mesh.from_vertices_and_faces(vertices, faces)
+    assert mesh.storage == storage
+    assert mesh.is_valid()
+    assert mesh.data == other.data
+    assert list(mesh.edges()) == list(other.edges())
+    for vertex in other.vertices():
+        assert list(mesh.halfedge[vertex].items()) == list(other.halfedge[vertex].items())
+
+
+def test_from_arrays_offsets():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+    mesh = Mesh.from_arrays(vertices, [0, 1, 2, 3, 1, 4, 2], [0, 4, 7], storage="array")
+    assert mesh.face_vertices(0) == [0, 1, 2, 3]
+    assert mesh.face_vertices(1) == [1, 4, 2]
+    assert mesh.halfedge[1][2] == 0
+    assert mesh.halfedge[2][1] == 1
+    with pytest.raises(ValueError):
+        Mesh.from_arrays(vertices, [0, 1, 2, 3], [0, 5])
+    with pytest.raises(ValueError):
+        Mesh.from_arrays(vertices, [[0, 1, 5]])
+
+
+def test_from_arrays_degenerate():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0]]
+    mesh = Mesh.from_arrays(vertices, [[0, 1, 1, 2], [0, 1, 2, 0]], storage="array")
+    assert mesh.face_vertices(0) == [0, 1, 2]
+    assert mesh.face_vertices(1) == [0, 1, 2]
+
+
+def test_from_vertices_and_faces_numpy(hexagon):
+    import numpy as np
+
+    vertices, faces = hexagon.to_vertices_and_faces()
+    mesh = Mesh.from_vertices_and_faces(np.array(vertices), np.array(faces))
+    assert mesh.data == hexagon.data
+
+
+def test_from_arrays_subclass(hexagon):
+    import numpy as np
+
+    class MyMesh(Mesh):
+        def __init__(self, name=None):
+            super(MyMesh, self).__init__(name=name)
+            self.label = "label"
+
+    vertices, faces = hexagon.to_vertices_and_faces()
+    mesh = MyMesh.from_vertices_and_faces(np.array(vertices), np.array(faces))
+    assert type(mesh) is MyMesh
+    assert mesh.label == "label"
+    assert mesh.data == hexagon.data
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_to_arrays(box, storage):
+    import numpy as np
+
+    vertices, faces = box.to_vertices_and_faces()
+    mesh = Mesh.from_arrays(vertices, faces, storage=storage)
+    xyz, indices, offsets = mesh.to_arrays()
+    assert np.allclose(xyz, vertices)
+    assert indices.tolist() == [vertex for face in faces for vertex in face]
+    assert offsets.tolist() == [4 * i for i in range(7)]
+    if storage == "array":
+        assert np.shares_memory(xyz, np.frombuffer(mesh.vertex.floats))
+
+
+def test_to_arrays_modified():
+    mesh = Mesh.from_meshgrid(dx=3, nx=3)
+    compact = Mesh(storage="array")
+    compact.join(mesh)
+    compact.delete_face(0)
+    compact.delete_vertex(0)
+    compact.insert_vertex(4)
+    xyz, indices, offsets = compact.to_arrays()
+    vertices, faces = compact.to_vertices_and_faces()
+    assert xyz.tolist() == vertices
+    assert [indices[i:j].tolist() for i, j in zip(offsets[:-1], offsets[1:])] == faces
+
+
+# --------------------------------------------------------------------------
+# geometry arrays
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_geometry_arrays(hexagongrid, storage):
+    import numpy as np
+
+    mesh = Mesh(storage=storage)
+    mesh.join(hexagongrid)
+    for vertex in mesh.vertices():
+        mesh.vertex_attribute(vertex, "z", 0.1 * (vertex % 7))
+    faces = list(mesh.faces())
+    assert np.allclose(mesh.face_normals_array(), [mesh.face_normal(face) for face in faces])
+    assert np.allclose(mesh.face_normals_array(unitized=False), [mesh.face_normal(face, False) for face in faces])
+    assert np.allclose(mesh.face_areas_array(), [mesh.face_area(face) for face in faces])
+    assert np.allclose(mesh.face_centroids_array(), [mesh.face_centroid(face) for face in faces])
+    assert np.allclose(mesh.vertex_normals_array(), [mesh.vertex_normal(vertex) for vertex in mesh.vertices()])
+    assert np.allclose(mesh.edge_lengths_array(), [mesh.edge_length(edge) for edge in mesh.edges()])
+
+
+def test_vertex_normals_array_weighting(box):
+    import numpy as np
+
+    for weighting in ("area", "uniform", "angle"):
+        normals = box.vertex_normals_array(weighting=weighting)
+        assert np.allclose(np.abs(normals), 1 / np.sqrt(3))
+    with pytest.raises(ValueError):
+        box.vertex_normals_array(weighting="cotangent")
+    assert Mesh().vertex_normals_array().shape == (0, 3)
+
+
+# --------------------------------------------------------------------------
+# lazy transformations
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_lazy_transform(storage):
+    mesh = Mesh(storage=storage)
+    mesh.join(Mesh.from_polyhedron(12))
+    T = Rotation.from_axis_and_angle([1, 2, 3], 0.4) * Translation.from_vector([1, 2, 3])
+    expected = mesh.transformed(T).transformed(T)
+    points = mesh.vertices_attributes("xyz")
+    sha256 = mesh.sha256()
+
+    mesh.lazy_transform = True
+    mesh.transform(T)
+    mesh.transform(T)
+    assert mesh.pending_transformation == T * T
+    assert allclose(mesh.__coordinates__(), [value for point in points for value in point])
+    assert mesh.lazy_transform
+
+    assert mesh.sha256() != sha256
+    assert mesh.pending_transformation is None
+    assert allclose(mesh.vertices_attributes("xyz"), expected.vertices_attributes("xyz"))
+
+    mesh.transform(T)
+    other = mesh.copy()
+    assert mesh.pending_transformation is None
+    assert allclose(other.vertex_coordinates(0), expected.transformed(T).vertex_coordinates(0))
+
+    mesh.transform(T)
+    key = mesh.add_vertex(x=1, y=2, z=3)
+    assert mesh.vertex_coordinates(key) == [1, 2, 3]
+
+    mesh.transform(T)
+    mesh.lazy_transform = False
+    assert mesh.pending_transformation is None
+    mesh.transform(T)
+    assert mesh.pending_transformation is None
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_lazy_transform_arrays(storage):
+    from compas.datastructures import mesh_face_centroids_numpy
+
+    mesh = Mesh(storage=storage)
+    mesh.join(Mesh.from_meshgrid(4, 3))
+    mesh.lazy_transform = True
+    mesh.transform(Translation.from_vector([10, 0, 0]))
+    assert allclose(mesh_face_centroids_numpy(mesh)[0], mesh.face_centroid(0))
+    assert mesh.pending_transformation is None
+    assert mesh.face_centroid(0)[0] > 10
@@ -1,6 +1,7 @@
 import pytest
 
 from compas.datastructures import Mesh
+from compas.datastructures import mesh_collapse_edge
 from compas.datastructures import mesh_insert_vertex_on_edge
 from compas.datastructures import mesh_substitute_vertex_in_faces
 
@@ -72,3 +73,15 @@ def test__split_face_vertex_not_in_face(mesh_quads):
 def test_mesh_split_face_vertex_nbors(mesh_quads):
     with pytest.raises(ValueError):
         mesh_quads.split_face(0, 0, 1)
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_mesh_collapse_edge(storage):
+    mesh = Mesh(storage=storage)
+    mesh.join(Mesh.from_meshgrid(3, 3))
+    mesh_collapse_edge(mesh, (5, 6))
+    assert 6 not in list(mesh.vertices())
+    assert all(6 not in mesh.face_vertices(face) for face in mesh.faces())
+    assert mesh.face_vertices(1) == [1, 5, 2]
+    assert mesh.face_vertices(5) == [5, 10, 11, 7]
+    assert mesh.is_valid()
@@ -153,3 +153,18 @@ def test_planar(k5_network, planar_network):
     k5_network.delete_edge(("a", "b"))  # Delete (a, b) edge to make K5 planar
     assert k5_network.is_planar() is True
     assert planar_network.is_planar() is True
+
+
+def test_network_lazy_transform(planar_network):
+    from compas.geometry import Scale
+    from compas.geometry import Translation
+
+    T = Translation.from_vector([1, 0, 0]) * Scale.from_factors([2, 2, 2])
+    expected = planar_network.transformed(T).transformed(T)
+    planar_network.lazy_transform = True
+    planar_network.transform(T)
+    planar_network.transform(T)
+    assert planar_network.pending_transformation is not None
+    for node in planar_network.nodes():
+        assert planar_network.node_coordinates(node) == expected.node_coordinates(node)
+    assert planar_network.pending_transformation is None
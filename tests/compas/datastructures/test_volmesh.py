@@ -65,3 +65,43 @@ def test_volmesh_data():
 # ==============================================================================
 # Methods
 # ==============================================================================
+
+
+def test_volmesh_transform():
+    from compas.geometry import Translation
+    from compas.geometry import transform_objects
+
+    volmesh = VolMesh.from_obj(compas.get("boxes.obj"))
+    points = volmesh.vertices_attributes("xyz")
+    T = Translation.from_vector([1, 1, 1])
+
+    other = volmesh.transformed(T)
+    assert other.vertices_attributes("xyz") == [[x + 1, y + 1, z + 1] for x, y, z in points]
+    assert volmesh.vertices_attributes("xyz") == points
+
+    volmesh.transform(T)
+    assert volmesh.vertices_attributes("xyz") == other.vertices_attributes("xyz")
+
+    volmeshes = [VolMesh.from_obj(compas.get("boxes.obj")) for _ in range(3)]
+    transform_objects(volmeshes, [Translation.from_vector([i, 0, 0]) for i in range(3)])
+    for i, volmesh in enumerate(volmeshes):
+        assert volmesh.vertices_attributes("xyz") == [[x + i, y, z] for x, y, z in points]
+
+
+def test_volmesh_lazy_transform():
+    from compas.geometry import Scale
+    from compas.geometry import Translation
+
+    volmesh = VolMesh.from_obj(compas.get("boxes.obj"))
+    T = Translation.from_vector([1, 0, 0]) * Scale.from_factors([2, 2, 2])
+    expected = volmesh.transformed(T).transformed(T)
+    volmesh.lazy_transform = True
+    volmesh.transform(T)
+    volmesh.transform(T)
+    assert volmesh.pending_transformation is not None
+    for vertex in volmesh.vertices():
+        assert volmesh.vertex_coordinates(vertex) == expected.vertex_coordinates(vertex)
+    assert volmesh.pending_transformation is None
+
+    volmesh.transform(T)
+    assert volmesh.vertices_attributes("xyz") == expected.transformed(T).vertices_attributes("xyz")
@@ -0,0 +1,98 @@
+import struct
+
+import pytest
+
+import compas
+from compas.files import LAS
+from compas.geometry import PointArray
+from compas.geometry import Pointcloud
+
+if not compas.IPY:
+    import numpy as np
+
+    from compas.files import las_iter_numpy
+    from compas.files import las_point_dtype
+    from compas.files import las_read_numpy
+
+
+SCALE = (0.01, 0.01, 0.001)
+OFFSET = (100.0, 200.0, 0.0)
+
+
+def write_las(filepath, xyz, classification, version=(1, 2), point_format=3, extra=0):
+    # a minimal LAS file with one variable length record
+    records = np.zeros(len(xyz), dtype=las_point_dtype(point_format, las_point_dtype(point_format).itemsize + extra))
+    for axis, name in enumerate("XYZ"):
+        records[name] = np.rint((xyz[:, axis] - OFFSET[axis]) / SCALE[axis])
+    records["classification"] = classification
+    records["intensity"] = np.arange(len(xyz))
+    size = 375 if version >= (1, 4) else 227
+    vlr = struct.pack("<H16sHH32s", 0, b"test", 1, 4, b"a record") + b"data"
+    header = bytearray(size)
+    header[:4] = b"LASF"
+    struct.pack_into("<BB", header, 24, *version)
+    struct.pack_into("<HIIBHI", header, 94, size, size + len(vlr), 1, point_format, records.itemsize, len(xyz))
+    struct.pack_into("<3d", header, 131, *SCALE)
+    struct.pack_into("<3d", header, 155, *OFFSET)
+    bounds = [value for axis in range(3) for value in (xyz[:, axis].max(), xyz[:, axis].min())]
+    struct.pack_into("<6d", header, 179, *bounds)
+    if version >= (1, 4):
+        struct.pack_into("<I", header, 107, 0)
+        struct.pack_into("<Q", header, 247, len(xyz))
+    with open(filepath, "wb") as f:
+        f.write(bytes(header) + vlr + records.tobytes())
+
+
+@pytest.fixture
+def cloud():
+    np.random.seed(0)
+    xyz = np.random.rand(1000, 3) * [10, 20, 5] + [100, 200, 0]
+    xyz = np.rint((xyz - OFFSET) / SCALE) * SCALE + OFFSET
+    classification = np.random.randint(0, 5, 1000)
+    return xyz, classification
+
+
+@pytest.mark.parametrize("version, point_format, extra", [((1, 2), 3, 0), ((1, 3), 1, 0), ((1, 4), 6, 4)])
+def test_las_read(tmp_path, cloud, version, point_format, extra):
+    if compas.IPY:
+        return
+    xyz, classification = cloud
+    filepath = str(tmp_path / "cloud.las")
+    write_las(filepath, xyz, classification, version, point_format, extra)
+    las = LAS(filepath)
+    assert las.reader.header["version"] == version
+    assert las.reader.header["number_of_points"] == 1000
+    assert las.reader.vlrs[0]["user_id"] == "test"
+    assert las.reader.vlrs[0]["data"] == b"data"
+    assert np.allclose(las.parser.xyz, xyz)
+    assert las.parser.points[10] == pytest.approx(xyz[10].tolist())
+    header, records = las_read_numpy(filepath)
+    assert isinstance(records, np.memmap)
+    assert records["intensity"].tolist() == list(range(1000))
+
+
+def test_las_iter_filter(tmp_path, cloud):
+    if compas.IPY:
+        return
+    xyz, classification = cloud
+    filepath = str(tmp_path / "cloud.las")
+    write_las(filepath, xyz, classification)
+    box = ([102, 205, 1], [106, 215, 3])
+    chunks = list(las_iter_numpy(filepath, chunksize=300, box=box, classification=[1, 2]))
+    assert len(chunks) == 4
+    result = np.concatenate([points for points, _ in chunks])
+    inside = np.all((xyz >= box[0]) & (xyz <= box[1]), axis=1) & np.isin(classification, [1, 2])
+    assert np.allclose(result, xyz[inside])
+    assert not list(las_iter_numpy(filepath, box=([0, 0, 0], [1, 1, 1])))
+    cloud = Pointcloud.from_las(filepath, box=box, classification=[1, 2])
+    assert len(cloud) == inside.sum()
+    assert isinstance(cloud.points, PointArray)
+    assert np.allclose(cloud.points.tolist(), xyz[inside])
+
+
+def test_las_invalid(tmp_path):
+    filepath = str(tmp_path / "invalid.las")
+    with open(filepath, "wb") as f:
+        f.write(b"LASX" + bytes(300))
+    with pytest.raises(ValueError):
+        LAS(filepath).read()
@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+
+if not compas.IPY:
+    from compas.files import obj_read_numpy
+    from compas.files import obj_weld_numpy
+
+
+OBJ_STATEMENTS = b"""# comment
+v 0 0 0
+v 1 0 0 1.0
+vt 0 0
+vn 0 0 1
+  v 1 1 0
+o first object
+g a
+f 1/1/1 2//1 3/1
+v 0 1 \\
+ 0
+g b
+f -4 -2 -1
+\tf\t1 2
+o second
+l 1 2
+g a
+f 1 2 4
+"""
+
+
+@pytest.mark.parametrize("name", ["faces.obj", "hypar.obj", "lines.obj", "butt_model.obj", "tubemesh.obj"])
+@pytest.mark.parametrize("precision", [None, "1f", "d"])
+def test_from_obj_fast(name, precision):
+    if compas.IPY:
+        return
+    mesh = Mesh.from_obj(compas.get(name), precision=precision)
+    fast = Mesh.from_obj(compas.get(name), precision=precision, engine="fast")
+    vertices, faces = mesh.to_vertices_and_faces()
+    assert fast.to_vertices_and_faces() == (vertices, faces)
+    assert fast.number_of_edges() == mesh.number_of_edges()
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 1 << 20])
+def test_obj_read_numpy(chunksize):
+    if compas.IPY:
+        return
+    vertices, (faces, offsets), (lines, starts), objects, groups = obj_read_numpy(
+        io.BytesIO(OBJ_STATEMENTS.replace(b"\n", b"\r\n")), chunksize=chunksize
+    )
+    assert vertices.tolist() == [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    assert faces.tolist() == [0, 1, 2, 0, 2, 3, 0, 1, 3]
+    assert offsets.tolist() == [0, 3, 6, 9]
+    assert lines.tolist() == [0, 1]
+    assert starts.tolist() == [0, 2]
+    assert {name: value.tolist() for name, value in objects.items()} == {"first object": [0, 1], "second": [2]}
+    assert {name: value.tolist() for name, value in groups.items()} == {"a": [0, 2], "b": [1]}
+
+
+def test_obj_read_numpy_invalid():
+    if compas.IPY:
+        return
+    with pytest.raises(ValueError):
+        obj_read_numpy(io.BytesIO(b"v 0 x 0\n"))
+
+
+def test_obj_weld_numpy():
+    if compas.IPY:
+        return
+    vertices, index = obj_weld_numpy([[-0.0001, 0, 0], [0, 0, 0], [0.4, 0, 0]], "3f")
+    assert vertices.tolist() == [[0, 0, 0], [0.4, 0, 0]]
+    assert index.tolist() == [0, 0, 1]
+    with pytest.raises(ValueError):
+        obj_weld_numpy(vertices, "3e")
+    with pytest.raises(ValueError):
+        Mesh.from_obj(compas.get("faces.obj"), engine="unknown")
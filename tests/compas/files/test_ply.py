@@ -0,0 +1,93 @@
+import io
+import os
+import struct
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.files import PLY
+
+if not compas.IPY:
+    from compas.files import PLYStreamWriter
+    from compas.files import ply_read_binary_numpy
+
+BASE_FOLDER = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh.from_vertices_and_faces(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]],
+        [[0, 1, 2, 3], [1, 4, 2]],
+    )
+    mesh.update_default_vertex_attributes(color=None)
+    for vertex in mesh.vertices():
+        mesh.vertex_attribute(vertex, "color", (10 * vertex, 20, 30))
+    return mesh
+
+
+def test_read_binary_with_carriage_returns():
+    mesh = Mesh.from_ply(os.path.join(BASE_FOLDER, "fixtures", "triangle_binary.ply"))
+    assert mesh.number_of_vertices() == 3
+    assert mesh.number_of_faces() == 1
+
+
+def test_read_binary_pointcloud():
+    from compas.geometry import PointArray
+    from compas.geometry import Pointcloud
+
+    cloud = Pointcloud.from_ply(os.path.join(BASE_FOLDER, "fixtures", "triangle_binary.ply"))
+    if not compas.IPY:
+        assert isinstance(cloud.points, PointArray)
+    assert cloud.points == [[0, 0, 0], [10, 0, 0], [5, 10, 0]]
+
+
+def test_read_ascii():
+    mesh = Mesh.from_ply(os.path.join(BASE_FOLDER, "fixtures", "bigX_sphere.ply"))
+    assert mesh.number_of_vertices() == 7876
+    assert mesh.number_of_faces() == 15712
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_write_normals_and_colors(tmp_path, mesh, binary):
+    filepath = str(tmp_path / "mesh.ply")
+    mesh.to_ply(filepath, binary=binary, normals=True, color="color")
+    reader = PLY(filepath).reader
+    assert reader.format == ("binary_little_endian" if binary else "ascii")
+    assert [name for name, _ in reader.vertex_properties] == ["x", "y", "z", "nx", "ny", "nz", "red", "green", "blue"]
+    vertex = reader.vertices[4]
+    assert [vertex["red"], vertex["green"], vertex["blue"]] == [40, 20, 30]
+    assert [vertex["nx"], vertex["ny"], vertex["nz"]] == pytest.approx([0, 0, 1])
+    other = Mesh.from_ply(filepath)
+    assert other.to_vertices_and_faces() == mesh.to_vertices_and_faces()
+
+
+def test_stream_writer(tmp_path):
+    if compas.IPY:
+        return
+    filepath = str(tmp_path / "stream.ply")
+    grid = Mesh.from_meshgrid(dx=2, nx=2)
+    with PLYStreamWriter(filepath, normals=True) as writer:
+        for i in range(3):
+            grid.transform([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 1], [0, 0, 0, 1]])
+            writer.append_mesh(grid)
+    mesh = Mesh.from_ply(filepath)
+    assert mesh.number_of_vertices() == 27
+    assert mesh.number_of_faces() == 12
+    assert sorted(set(mesh.vertices_attribute("z"))) == [1, 2, 3]
+    assert max(max(face) for face in mesh.to_vertices_and_faces()[1]) == 26
+
+
+def test_read_binary_numpy_variable_lists():
+    if compas.IPY:
+        return
+    data = struct.pack(">f3Bi", 1.5, 2, 7, 8, 100)
+    data += struct.pack(">fBi", 2.5, 0, 200)
+    elements = [("face", 2, [("quality", "float"), ("indices", "uchar", "uchar"), ("id", "int")])]
+    records, lists = ply_read_binary_numpy(io.BytesIO(data + b"rest"), elements, ">")["face"]
+    assert records["quality"].tolist() == [1.5, 2.5]
+    assert records["id"].tolist() == [100, 200]
+    indices, offsets = lists["indices"]
+    assert indices.tolist() == [7, 8]
+    assert offsets.tolist() == [0, 2, 2]
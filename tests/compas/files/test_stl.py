@@ -44,3 +44,43 @@ def test_binary_read_write_fidelity():
     mesh_2 = Mesh.from_stl(fp)
     assert mesh.adjacency == mesh_2.adjacency
     assert mesh.vertex == mesh_2.vertex
+
+
+def test_binary_weld_chunks(binary_stl):
+    if compas.IPY:
+        return
+    from compas.files import stl_iter_binary_numpy
+    from compas.files import stl_read_binary_numpy
+    from compas.files import stl_weld_numpy
+
+    stl = STL(binary_stl)
+    header, facets = stl_read_binary_numpy(binary_stl)
+    assert header == stl.reader.header
+    assert len(facets) == len(stl.reader.facets) == len(stl.parser.faces)
+
+    vertices, faces = stl_weld_numpy(stl_iter_binary_numpy(binary_stl, chunksize=1000))
+    assert vertices.tolist() == stl.parser.vertices
+    assert faces.tolist() == stl.parser.faces
+
+    vertices, faces = stl_weld_numpy(facets, chunksize=333)
+    assert vertices.tolist() == stl.parser.vertices
+    assert faces.tolist() == stl.parser.faces
+
+
+def test_binary_facets(binary_stl):
+    stl = STL(binary_stl)
+    facet = stl.reader.facets[0]
+    face = stl.parser.faces[0]
+    for xyz, key, vertex in zip(facet["vertices"], facet["keys"], face):
+        assert len(key) == 12
+        assert list(xyz) == list(stl.parser.vertices[vertex])
+
+
+def test_binary_write_normals(tmpdir):
+    mesh = Mesh.from_polyhedron(20)
+    filepath = str(tmpdir.join("icosahedron.stl"))
+    mesh.to_stl(filepath, binary=True)
+    stl = STL(filepath)
+    assert len(stl.parser.vertices) == mesh.number_of_vertices()
+    for facet, face in zip(stl.reader.facets, mesh.faces()):
+        assert list(facet["normal"]) == pytest.approx(mesh.face_normal(face), abs=1e-6)
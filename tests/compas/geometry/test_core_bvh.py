@@ -0,0 +1,128 @@
+import pytest
+import compas
+from random import random, seed
+
+from compas.datastructures import Mesh
+from compas.geometry import MeshBVH
+from compas.geometry import distance_point_point
+from compas.geometry import intersection_ray_mesh
+
+
+@pytest.fixture
+def mesh():
+    return Mesh.from_polyhedron(20)
+
+
+@pytest.fixture
+def points():
+    seed(0)
+    return [[4 * random() - 2, 4 * random() - 2, 4 * random() - 2] for i in range(50)]
+
+
+def _brute_closest(mesh, point):
+    # the faces of the icosahedron are triangles
+    from compas.geometry._core.bvh import _closest_point_on_triangle
+
+    distances = []
+    for face in mesh.faces():
+        xyz = [x for vertex in mesh.face_vertices(face) for x in mesh.vertex_coordinates(vertex)]
+        distances.append(distance_point_point(point, _closest_point_on_triangle(xyz, 0, point)))
+    return min(distances)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_bvh_closest_point(mesh, points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    bvh = MeshBVH(mesh, leafsize=2, use_numpy=use_numpy)
+    closest, faces, distances = bvh.closest_points(points)
+    for point, xyz, face, distance in zip(points, closest, faces, distances):
+        assert distance == pytest.approx(_brute_closest(mesh, point))
+        assert distance_point_point(point, xyz) == pytest.approx(distance)
+        assert face in mesh.face
+        other, _, d = bvh.closest_point(point)
+        assert d == pytest.approx(distance)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_bvh_intersect_rays(mesh, points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    bvh = MeshBVH(mesh, leafsize=2, use_numpy=use_numpy)
+    rays = [(point, [-x for x in point]) for point in points]
+    hits = bvh.intersect_rays(rays)
+    first = bvh.intersect_rays(rays, first=True)
+    for ray, h, f in zip(rays, hits, first):
+        assert [hit[0] for hit in h] == [hit[0] for hit in bvh.intersect_ray(ray)]
+        assert h == sorted(h, key=lambda hit: hit[3])
+        if h:
+            assert f[0][3] == pytest.approx(h[0][3])
+        else:
+            assert not f
+
+
+def test_bvh_intersect_ray_quad():
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    bvh = MeshBVH(mesh)
+    hits = bvh.intersect_ray(([2.5, 3.5, 2.0], [0, 0, -1]))
+    assert len(hits) == 1
+    face, u, v, t = hits[0]
+    assert mesh.face_centroid(face)[:2] == pytest.approx([2.5, 3.5])
+    assert t == pytest.approx(2.0)
+    assert not bvh.intersect_ray(([2.5, 3.5, 2.0], [0, 0, 1]))
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_bvh_contains_points(mesh, points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    bvh = MeshBVH(mesh, use_numpy=use_numpy)
+    assert bvh.contains_point([0, 0, 0])
+    # the icosahedron has an insphere radius of 1.4377 and a circumsphere radius of 1.9021
+    for point, inside in zip(points, bvh.contains_points(points)):
+        radius = sum(x**2 for x in point) ** 0.5
+        if radius < 1.43:
+            assert inside
+        elif radius > 1.91:
+            assert not inside
+
+
+def test_bvh_axis_aligned_rays():
+    import warnings
+    from compas.geometry import Box
+
+    if compas.IPY:
+        return
+    bvh = MeshBVH(Mesh.from_shape(Box(2)), use_numpy=True)
+    rays = [([0.3, 0.2, 5], [0, 0, -1]), ([5, 0.1, 0], [-1, 0, 0]), ([0, 0, 0], [0, 1, 0])]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        hits = bvh.intersect_rays(rays)
+        first = bvh.intersect_rays(rays, first=True)
+    assert [len(h) for h in hits] == [2, 2, 1]
+    assert [f[0][3] for f in first] == pytest.approx([4.0, 4.0, 1.0])
+
+
+def test_bvh_vertices_and_faces():
+    vertices, faces = Mesh.from_polyhedron(6).to_vertices_and_faces()
+    bvh = MeshBVH((vertices, faces))
+    assert len(bvh) == 12
+    hits = bvh.intersect_ray(([0, 0, 0], [1, 0, 0]))
+    assert len(hits) == 1
+    assert 0 <= hits[0][0] < len(faces)
+
+
+def test_bvh_empty():
+    bvh = MeshBVH(([], []))
+    assert len(bvh) == 0
+    assert bvh.intersect_ray(([0, 0, 0], [1, 0, 0])) == []
+    assert bvh.closest_point([0, 0, 0]) == [None, None, float("inf")]
+    assert not bvh.contains_point([0, 0, 0])
+
+
+def test_intersection_ray_mesh_default_plugin():
+    vertices, faces = Mesh.from_polyhedron(6).to_vertices_and_faces()
+    hits = intersection_ray_mesh(([0, 0, 0], [0, 0, 1]), (vertices, faces))
+    assert len(hits) == 1
+    index, u, v, t = hits[0]
+    assert t == pytest.approx(2 / 3**0.5)
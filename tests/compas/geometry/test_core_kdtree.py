@@ -0,0 +1,105 @@
+import pytest
+import compas
+from random import random, seed
+
+from compas.geometry import KDTree
+from compas.geometry import distance_point_point_sqrd
+
+
+def _brute(cloud, point, number=None, radius=None):
+    found = sorted((distance_point_point_sqrd(point, xyz), index) for index, xyz in enumerate(cloud))
+    if radius is not None:
+        found = [item for item in found if item[0] <= radius**2]
+    if number is not None:
+        found = found[:number]
+    return [index for _, index in found]
+
+
+@pytest.fixture
+def cloud():
+    seed(0)
+    return [[random(), random(), random()] for i in range(500)]
+
+
+@pytest.fixture
+def points():
+    seed(1)
+    return [[random(), random(), random()] for i in range(50)]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_kdtree_nearest_neighbor(cloud, points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    tree = KDTree(cloud, use_numpy=use_numpy)
+    for point in points:
+        xyz, label, distance = tree.nearest_neighbor(point)
+        assert label == _brute(cloud, point, 1)[0]
+        assert xyz == cloud[label]
+        xyz, other, distance = tree.nearest_neighbor(point, exclude=[label])
+        assert other == _brute(cloud, point, 2)[1]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_kdtree_nearest_neighbors(cloud, points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    tree = KDTree(cloud, leafsize=4, use_numpy=use_numpy)
+    for point in points:
+        assert [label for _, label, _ in tree.nearest_neighbors(point, 7)] == _brute(cloud, point, 7)
+    labels, distances = tree.nearest_neighbors_bulk(points, 7)
+    for point, nbrs, dists in zip(points, labels, distances):
+        assert nbrs == _brute(cloud, point, 7)
+        assert dists == sorted(dists)
+    labels, _ = tree.nearest_neighbors_bulk(points, 1000)
+    assert all(len(nbrs) == len(cloud) for nbrs in labels)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_kdtree_radius_neighbors(cloud, points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    tree = KDTree(cloud, use_numpy=use_numpy)
+    for point in points:
+        assert [label for _, label, _ in tree.radius_neighbors(point, 0.2)] == _brute(cloud, point, radius=0.2)
+    labels, distances = tree.radius_neighbors_bulk(points, 0.2)
+    for point, nbrs, dists in zip(points, labels, distances):
+        assert nbrs == _brute(cloud, point, radius=0.2)
+        assert all(d <= 0.2 for d in dists)
+
+
+def test_kdtree_duplicates():
+    cloud = [[0, 0, 0]] * 10 + [[1, 0, 0]] * 10
+    for use_numpy in [False] if compas.IPY else [False, True]:
+        tree = KDTree(cloud, leafsize=2, use_numpy=use_numpy)
+        nbrs = tree.nearest_neighbors([0.1, 0, 0], 3)
+        assert all(label < 10 for _, label, _ in nbrs)
+        assert len(set(label for _, label, _ in nbrs)) == 3
+        labels, distances = tree.nearest_neighbors_bulk([[0.9, 0, 0]], 3)
+        assert all(label >= 10 for label in labels[0])
+        assert distances[0] == pytest.approx([0.1, 0.1, 0.1])
+        assert len(tree.radius_neighbors([0.5, 0, 0], 0.5)) == 20
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_kdtree_grid(points, use_numpy):
+    if use_numpy and compas.IPY:
+        return
+    grid = [[0.1 * (i % 7), 0.1 * ((i // 7) % 5), 0.5 * (i // 35)] for i in range(70)]
+    tree = KDTree(grid, leafsize=1, use_numpy=use_numpy)
+    for point in points:
+        nbrs = tree.nearest_neighbors(point, 5)
+        assert [distance for _, _, distance in nbrs] == pytest.approx(
+            [distance_point_point_sqrd(point, grid[i]) ** 0.5 for i in _brute(grid, point, 5)]
+        )
+        assert sorted(label for _, label, _ in tree.radius_neighbors(point, 0.25)) == sorted(
+            _brute(grid, point, radius=0.25)
+        )
+
+
+def test_kdtree_empty():
+    tree = KDTree()
+    assert len(tree) == 0
+    assert tree.nearest_neighbor([0, 0, 0])[1] is None
+    assert tree.nearest_neighbors([0, 0, 0], 3) == []
+    assert tree.radius_neighbors_bulk([[0, 0, 0]], 1.0) == ([[]], [[]])
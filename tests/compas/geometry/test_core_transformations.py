@@ -2,6 +2,11 @@ import pytest
 
 # from compas.geometry import homogenize
 # from compas.geometry import dehomogenize
+from compas.datastructures import Mesh
+from compas.datastructures import Network
+from compas.geometry import Frame
+from compas.geometry import PointArray
+from compas.geometry import Pointcloud
 from compas.geometry import Rotation
 from compas.geometry import Translation
 from compas.geometry import allclose
@@ -25,6 +30,8 @@ from compas.geometry import rotate_points
 from compas.geometry import rotate_points_xy
 from compas.geometry import scale_points
 from compas.geometry import scale_points_xy
+from compas.geometry import transform_frames
+from compas.geometry import transform_objects
 from compas.geometry import transform_points
 from compas.geometry import transform_vectors
 from compas.geometry import translate_points
@@ -55,6 +62,46 @@ def test_transform_vectors(R):
     ]
 
 
+def test_transform_frames(R):
+    frames = [Frame([1, 2, 3], [1, 1, 0], [0, 1, 1]), Frame.worldYZ()]
+    for frame, (point, xaxis, yaxis) in zip(frames, transform_frames(frames, R)):
+        other = frame.transformed(R)
+        assert allclose(point, other.point)
+        assert allclose(xaxis, other.xaxis)
+        assert allclose(yaxis, other.yaxis)
+
+
+@pytest.mark.parametrize("storage", ["dict", "array"])
+def test_transform_objects(storage):
+    mesh = Mesh.from_polyhedron(8)
+    if storage == "array":
+        compact = Mesh(storage="array")
+        compact.join(mesh)
+        mesh = compact
+    network = Network.from_lines([[[0, 0, 0], [1, 0, 0]], [[1, 0, 0], [1, 1, 0]]])
+    cloud = Pointcloud.from_bounds(1, 2, 3, 10)
+    points = PointArray(cloud.points)
+    frame = Frame([1, 2, 3], [1, 1, 0], [0, 1, 1])
+    objects = [mesh, network, cloud, points, frame]
+    transformations = [
+        Rotation.from_axis_and_angle([0, 0, 1], i) * Translation.from_vector([i, 0, 0]) for i in range(1, 6)
+    ]
+    expected = [obj.transformed(T) for obj, T in zip(objects, transformations)]
+    sha256 = mesh.sha256()
+
+    transform_objects(objects, transformations)
+
+    assert allclose(mesh.vertices_attributes("xyz"), expected[0].vertices_attributes("xyz"))
+    assert mesh.sha256() != sha256
+    assert allclose(network.nodes_attributes("xyz"), expected[1].nodes_attributes("xyz"))
+    assert allclose(cloud.points, expected[2].points)
+    assert allclose(points.tolist(), expected[3].tolist())
+    assert frame == expected[4]
+
+    with pytest.raises(ValueError):
+        transform_objects(objects, transformations[:2])
+
+
 # def test_homogenize():
 #     assert homogenize([[1, 2, 3]], 0.5) == [[0.5, 1.0, 1.5, 0.5]]
 
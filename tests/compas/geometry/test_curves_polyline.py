@@ -5,6 +5,7 @@ import compas
 
 from compas.geometry import Frame
 from compas.geometry import Polyline
+from compas.geometry import Scale
 
 
 @pytest.mark.parametrize(
@@ -483,3 +484,16 @@ def test_polyline_extend(coords, input, expected):
 )
 def test_polyline_shortened(coords, input, expected):
     assert expected == Polyline(coords).shortened(input)
+
+
+def test_polyline_point_at_after_transform():
+    polyline = Polyline([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    assert polyline.point_at(0.75) == [1.0, 0.5, 0.0]
+    assert polyline.point_at(0.75, snap=True) == [1.0, 1.0, 0.0]
+    assert polyline.point_at(0.4, snap=True) == [1.0, 0.0, 0.0]
+    assert polyline.point_at(0.4, snap=True) is not polyline.points[1]
+    assert polyline.tangent_at(0.75) == [0.0, 1.0, 0.0]
+
+    polyline.transform(Scale.from_factors([2, 2, 2]))
+    assert polyline.length == 4.0
+    assert polyline.point_at(0.75) == [2.0, 1.0, 0.0]
@@ -54,6 +54,23 @@ def test_point_operators():
     assert a**3 == [a.x**3, a.y**3, a.z**3]
 
 
+def test_point_fast():
+    a = Point.fast(1.0, 2.0, 3.0)
+    assert type(a) is Point
+    assert a == Point(1, 2, 3)
+    assert a.guid != Point.fast(1.0, 2.0, 3.0).guid
+    assert Point.fast(1.0, 2.0).z == 0.0
+    assert Point.from_data(a.data) == a
+
+    b = Point(random(), random(), random())
+    assert type(a + b) is Point
+    assert type(a - b).__name__ == "Vector"
+    a += b
+    a *= 2
+    assert a == [(1.0 + b.x) * 2, (2.0 + b.y) * 2, (3.0 + b.z) * 2]
+    assert json.loads(json.dumps(a.data)) == a
+
+
 def test_point_equality():
     p1 = Point(1, 1, 1)
     p2 = Point(1, 1, 1)
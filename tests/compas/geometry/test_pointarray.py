@@ -0,0 +1,192 @@
+import pickle
+import pytest
+import compas
+from random import random
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.data import binary_dumps
+from compas.data import binary_loads
+from compas.geometry import allclose
+from compas.geometry import bounding_box
+from compas.geometry import centroid_points
+from compas.geometry import transform_points
+from compas.geometry import transform_vectors
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import Pointcloud
+from compas.geometry import PointArray
+from compas.geometry import VectorArray
+from compas.geometry import FrameArray
+from compas.geometry import Rotation
+from compas.geometry import Transformation
+from compas.geometry import Translation
+from compas.geometry import transform_coordinates_batch
+from compas.geometry import pointarray
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def use_numpy(request, monkeypatch):
+    if request.param and not pointarray._USE_NUMPY:
+        pytest.skip("NumPy is not available.")
+    monkeypatch.setattr(pointarray, "_USE_NUMPY", request.param)
+    monkeypatch.setattr(pointarray, "_NUMPY_THRESHOLD", 0)
+    return request.param
+
+
+@pytest.fixture
+def points():
+    return [[random(), random(), random()] for i in range(20)]
+
+
+@pytest.fixture
+def T():
+    return Rotation.from_axis_and_angle([1, 2, 3], 0.7, point=[1, 0, 0]) * Translation.from_vector([0, 0, 3])
+
+
+def test_pointarray_views(use_numpy, points):
+    array = PointArray(points)
+    assert len(array) == len(points)
+    assert array.tolist() == points
+    assert array == points
+    assert isinstance(array[0], Point)
+    assert array[-1] == points[-1]
+    assert [list(point) for point in array] == points
+
+    point = array[3]
+    point.x = 10
+    point += [0, 0, 1]
+    assert array[3] == [10, points[3][1], points[3][2] + 1]
+    assert type(point.copy()) is Point
+
+    array[0] = [1, 2, 3]
+    assert array.tolist()[0] == [1.0, 2.0, 3.0]
+    assert array[2:5].tolist() == array.tolist()[2:5]
+    assert array[::-3].tolist() == array.tolist()[::-3]
+
+    with pytest.raises(IndexError):
+        array[len(points)]
+    with pytest.raises(ValueError):
+        PointArray([[1, 2]])
+
+
+def test_pointarray_transform(use_numpy, points, T):
+    array = PointArray(points)
+    result = transform_points(array, T)
+    assert isinstance(result, PointArray)
+    assert allclose(result.tolist(), transform_points(points, T))
+    assert array == points
+
+    array.transform(T)
+    assert allclose(array.tolist(), [Point(*point).transformed(T) for point in points])
+
+    P = Transformation([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0.5, 1]])
+    assert allclose(PointArray(points).transformed(P).tolist(), transform_points(points, P))
+
+
+def test_pointarray_arithmetic(use_numpy, points):
+    array = PointArray(points)
+    vectors = array - [1, 2, 3]
+    assert isinstance(vectors, VectorArray)
+    assert allclose(vectors.tolist(), [Point(*point) - [1, 2, 3] for point in points])
+    assert allclose((array + vectors).tolist(), [Point(*a) + b for a, b in zip(points, vectors)])
+    assert allclose((array * 2).tolist(), [Point(*point) * 2 for point in points])
+    assert allclose((array / 2).tolist(), [Point(*point) / 2 for point in points])
+
+    array += [1, 0, 0]
+    array *= 3
+    assert allclose(array.tolist(), [(Point(*point) + [1, 0, 0]) * 3 for point in points])
+
+    with pytest.raises(ValueError):
+        array + [[1, 0, 0], [0, 1, 0]]
+
+
+@pytest.mark.parametrize("counts", [None, [5, 10, 0, 5]])
+def test_transform_coordinates_batch(use_numpy, points, T, counts):
+    transformations = [T, Translation.from_vector([1, 2, 3]), T.inverse(), Transformation()]
+    transformations[3][3, 2] = 0.5
+    values = PointArray(points).buffer
+    transform_coordinates_batch(values, transformations, counts)
+
+    start = 0
+    for X, count in zip(transformations, counts or [5] * 4):
+        expected = transform_points(points[start : start + count], X)
+        assert allclose(values[3 * start : 3 * (start + count)], [value for point in expected for value in point])
+        start += count
+
+    with pytest.raises(ValueError):
+        transform_coordinates_batch(values, transformations[:3])
+    with pytest.raises(ValueError):
+        transform_coordinates_batch(values, transformations, [5, 5, 5, 4])
+
+
+def test_vectorarray(use_numpy, points):
+    vectors = VectorArray(points)
+    others = [Vector(*point).cross([1, 2, 3]) for point in points]
+    assert allclose(vectors.lengths(), [Vector(*point).length for point in points])
+    assert allclose(vectors.dot([1, 2, 3]), [Vector(*point).dot([1, 2, 3]) for point in points])
+    assert allclose(vectors.dot(others), [Vector(*a).dot(b) for a, b in zip(points, others)])
+    assert allclose(vectors.cross([1, 2, 3]).tolist(), others)
+    assert allclose(vectors.cross(others).tolist(), [Vector(*a).cross(b) for a, b in zip(points, others)])
+    assert allclose((-vectors).tolist(), [Vector(*point).scaled(-1) for point in points])
+    assert allclose(vectors.unitized().lengths(), [1.0] * len(points))
+
+    T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([0, 0, 1], 0.3)
+    assert allclose(transform_vectors(vectors, T).tolist(), transform_vectors(points, T))
+
+    vector = vectors[0]
+    assert type(vector.copy()) is Vector
+    assert vector.cross([1, 2, 3]) == others[0]
+    vector.unitize()
+    assert allclose(vectors.lengths()[:1], [1.0])
+
+
+def test_framearray(use_numpy, T):
+    frames = [Frame([random(), random(), random()], [1, random(), 0], [random(), 1, random()]) for i in range(10)]
+    array = FrameArray([[list(frame.point), list(frame.xaxis * 2), list(frame.yaxis)] for frame in frames])
+    assert allclose(array.tolist(), [[frame.point, frame.xaxis, frame.yaxis] for frame in frames])
+    assert isinstance(array[0], Frame)
+    assert allclose(array[0].zaxis, frames[0].zaxis)
+    assert allclose(array.zaxes.tolist(), [frame.zaxis for frame in frames])
+    assert array.points.tolist() == [list(frame.point) for frame in frames]
+
+    array.transform(T)
+    assert all(a == frame.transformed(T) for a, frame in zip(array, frames))
+
+    array.append([[0, 0, 0], [2, 0, 0], [1, 1, 0]])
+    assert array[-1] == Frame.worldXY()
+
+
+@pytest.mark.parametrize("cls", [PointArray, VectorArray, FrameArray])
+def test_pointarray_data(use_numpy, cls):
+    if cls is FrameArray:
+        array = FrameArray([Frame.worldXY(), Frame([1, 2, 3], [0, 1, 0], [0, 0, 1])])
+    else:
+        array = cls([[random(), random(), random()] for i in range(10)])
+
+    for other in (
+        json_loads(json_dumps(array)),
+        binary_loads(binary_dumps(array)),
+        pickle.loads(pickle.dumps(array)),
+        array.copy(),
+    ):
+        assert type(other) is cls
+        assert other == array
+        assert other.buffer is not array.buffer
+
+    assert array.sha256() == array.copy().sha256()
+    if not compas.IPY:
+        assert cls.validate_data(array.data)
+
+
+def test_pointarray_functions(use_numpy, points, T):
+    array = PointArray(points)
+    assert allclose(centroid_points(array), centroid_points(points))
+    assert bounding_box(array) == bounding_box(points)
+
+    cloud = Pointcloud(array)
+    assert cloud.points is not array
+    cloud.transform(T)
+    assert allclose(cloud.points.tolist(), transform_points(points, T))
+    assert allclose(cloud.centroid, centroid_points(transform_points(points, T)))
+    assert Pointcloud.from_data(cloud.data) == cloud
@@ -54,3 +54,48 @@ def test_pointcloud__neq__():
     assert a != b
     b = Pointcloud.from_bounds(10, 10, 10, 10)
     assert a != b
+
+
+def test_pointcloud_closest_point():
+    from compas.geometry import Translation
+
+    pointcloud = Pointcloud.from_bounds(10, 10, 10, 100)
+    point = [1.0, 2.0, 3.0]
+    closest = min(pointcloud.points, key=lambda xyz: xyz.distance_to_point(point))
+    assert pointcloud.closest_point(point) == closest
+    assert pointcloud.closest_points([point, closest]) == [closest, closest]
+    pointcloud.transform(Translation.from_vector([100, 0, 0]))
+    closest = min(pointcloud.points, key=lambda xyz: xyz.distance_to_point(point))
+    assert pointcloud.closest_point(point) == closest
+
+
+@pytest.mark.parametrize("array", [False, True])
+def test_pointcloud_closest_point_modified(array):
+    from compas.geometry import PointArray
+
+    points = [[0, 0, 0], [10, 0, 0]]
+    pointcloud = Pointcloud(PointArray(points) if array else points)
+    assert pointcloud.closest_point([9, 0, 0]) == [10, 0, 0]
+    assert pointcloud.closest_points([[9, 0, 0]]) == [[10, 0, 0]]
+    pointcloud.points.append(Point(9, 0, 0))
+    assert pointcloud.closest_point([9, 0, 0]) == [9, 0, 0]
+    assert pointcloud.closest_points([[9, 0, 0]]) == [[9, 0, 0]]
+    pointcloud.points[0].x = 8
+    assert pointcloud.closest_point([8, 0, 0]) == [8, 0, 0]
+    assert pointcloud.closest_points([[8, 0, 0]]) == [[8, 0, 0]]
+
+
+def test_pointcloud_lazy_transform():
+    from compas.geometry import Rotation
+    from compas.geometry import Translation
+    from compas.geometry import allclose
+
+    points = [[random(), random(), random()] for i in range(10)]
+    T = Rotation.from_axis_and_angle([0, 0, 1], 0.3) * Translation.from_vector([1, 2, 3])
+    pointcloud = Pointcloud(points)
+    pointcloud.lazy_transform = True
+    pointcloud.transform(T)
+    pointcloud.transform(T)
+    assert pointcloud.pending_transformation == T * T
+    assert allclose(pointcloud.points, Pointcloud(points).transformed(T).transformed(T).points)
+    assert pointcloud.pending_transformation is None
@@ -0,0 +1,148 @@
+import pickle
+import pytest
+import compas
+from random import random
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.geometry import allclose
+from compas.geometry import transform_points
+from compas.geometry import transform_vectors
+from compas.geometry import Frame
+from compas.geometry import Reflection
+from compas.geometry import Rotation
+from compas.geometry import Scale
+from compas.geometry import Transformation
+from compas.geometry import TransformationArray
+from compas.geometry import Translation
+from compas.geometry import transformationarray
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def use_numpy(request, monkeypatch):
+    if request.param and not transformationarray._USE_NUMPY:
+        pytest.skip("NumPy is not available.")
+    monkeypatch.setattr(transformationarray, "_USE_NUMPY", request.param)
+    monkeypatch.setattr(transformationarray, "_NUMPY_THRESHOLD", 0)
+    return request.param
+
+
+def _trs(reflect=False):
+    T = Translation.from_vector([random(), random(), random()])
+    R = Rotation.from_axis_and_angle([random() - 0.5, random() - 0.5, random() - 0.5], 6 * random())
+    S = Scale.from_factors([1 + random(), 1 + random(), 1 + random()])
+    if reflect:
+        return T * R * S * Reflection.from_plane(([0, 0, 0], [0, 0, 1]))
+    return T * R * S
+
+
+@pytest.fixture
+def transformations():
+    return [_trs(reflect=i % 5 == 0) for i in range(20)]
+
+
+def test_transformationarray_items(use_numpy, transformations):
+    array = TransformationArray(transformations)
+    assert len(array) == len(transformations)
+    assert array == transformations
+    assert array[3] == transformations[3]
+    assert array[-1] == transformations[-1]
+    assert array[2:5] == transformations[2:5]
+    assert array[::-3] == transformations[::-3]
+    assert all(a == b for a, b in zip(array, transformations))
+
+    array[0] = Transformation()
+    array.append(Translation.from_vector([1, 2, 3]).matrix)
+    assert array[0] == Transformation()
+    assert array[-1] == Translation.from_vector([1, 2, 3])
+
+    with pytest.raises(IndexError):
+        array[len(array)]
+    with pytest.raises(ValueError):
+        TransformationArray([[[1, 0, 0], [0, 1, 0], [0, 0, 1]]])
+
+
+def test_transformationarray_concatenated(use_numpy, transformations):
+    array = TransformationArray(transformations)
+    others = [_trs() for _ in transformations]
+    assert array * others == [a * b for a, b in zip(transformations, others)]
+    assert array * others[0] == [a * others[0] for a in transformations]
+    assert TransformationArray(others[:1]) * array == [others[0] * a for a in transformations]
+
+    array.concatenate(TransformationArray(others))
+    assert array == [a * b for a, b in zip(transformations, others)]
+
+    with pytest.raises(ValueError):
+        array * others[:3]
+
+
+def test_transformationarray_inverse(use_numpy, transformations):
+    P = Transformation([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0.5, 1]])
+    array = TransformationArray(transformations + [P])
+    inverse = array.inverse()
+    assert inverse == [T.inverse() for T in transformations + [P]]
+    assert array * inverse == [Transformation()] * len(array)
+
+    array.invert()
+    assert array == inverse
+
+    with pytest.raises(ValueError):
+        TransformationArray([Scale.from_factors([1, 1, 0])] * 20).inverse()
+
+
+def test_transformationarray_decomposed(use_numpy, transformations):
+    array = TransformationArray(transformations)
+    scales, quaternions, translations = array.decomposed()
+    for T, scale, quaternion, translation in zip(transformations, scales, quaternions, translations):
+        S, _, R, X, _ = T.decomposed()
+        assert allclose(scale, [S[0, 0], S[1, 1], S[2, 2]])
+        assert Rotation.from_quaternion(quaternion) == R
+        assert allclose(translation, X.translation_vector)
+    assert allclose([sum(q * q for q in quaternion) for quaternion in quaternions], [1.0] * len(array))
+    assert TransformationArray.from_decomposition(scales, quaternions, translations) == array
+
+    with pytest.raises(ValueError):
+        TransformationArray.from_decomposition(scales, quaternions[1:], translations)
+
+
+def test_transformationarray_interpolated(use_numpy, transformations):
+    start = TransformationArray(transformations)
+    end = TransformationArray([_trs(reflect=i % 5 == 0) for i in range(len(transformations))])
+    assert start.interpolated(end, 0.0) == start
+    assert start.interpolated(end, 1.0) == end
+    assert start.interpolated(end, [0.25] * len(start)) == start.interpolated(end, 0.25)
+
+    R = TransformationArray([Rotation.from_axis_and_angle([0, 0, 1], 0.2)] * 3)
+    X = Translation.from_vector([2, 0, 0]) * Rotation.from_axis_and_angle([0, 0, 1], 1.0)
+    result = R.interpolated(X, [0.0, 0.5, 1.0])
+    assert result[1] == Translation.from_vector([1, 0, 0]) * Rotation.from_axis_and_angle([0, 0, 1], 0.6)
+    assert result[2] == X
+
+    with pytest.raises(ValueError):
+        R.interpolated(X, [0.5, 0.5])
+
+
+def test_transformationarray_points(use_numpy, transformations):
+    array = TransformationArray(transformations)
+    points = [[random(), random(), random()] for _ in range(2 * len(array))]
+    result = array.transformed_points(points)
+    expected = [transform_points(points[2 * i : 2 * i + 2], T) for i, T in enumerate(transformations)]
+    assert allclose(result.tolist(), [point for block in expected for point in block])
+
+    vectors = array.transformed_vectors(points[: len(array)])
+    expected = [transform_vectors(points[i : i + 1], T)[0] for i, T in enumerate(transformations)]
+    assert allclose(vectors.tolist(), expected)
+
+
+def test_transformationarray_from_frames(use_numpy):
+    frames = [Frame([random(), random(), random()], [1, random(), 0], [random(), 1, random()]) for i in range(10)]
+    assert TransformationArray.from_frames(frames) == [Transformation.from_frame(frame) for frame in frames]
+
+
+def test_transformationarray_data(use_numpy, transformations):
+    array = TransformationArray(transformations)
+    for other in (json_loads(json_dumps(array)), pickle.loads(pickle.dumps(array)), array.copy()):
+        assert type(other) is TransformationArray
+        assert other == array
+        assert other.buffer is not array.buffer
+    if not compas.IPY:
+        assert TransformationArray.validate_data(array.data)
@@ -96,3 +96,14 @@ def test_cross():
     result = vec1.cross(vec2)
     assert result == (-4, 8, -4)
     assert result == Vector(-4, 8, -4)
+
+
+def test_vector_fast():
+    a = Vector.fast(1.0, 2.0, 2.0)
+    assert type(a) is Vector
+    assert a == Vector(1, 2, 2)
+    assert a.length == 3.0
+    assert a.dot([1, 0, 1]) == 3.0
+    assert -a == [-1.0, -2.0, -2.0]
+    assert a.unitized() == [1.0 / 3, 2.0 / 3, 2.0 / 3]
+    assert Vector.dot_vectors([[1, 2, 3]], [[1, 1, 1]]) == [6]
@@ -1,7 +1,25 @@
-# import os
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
 
+import pytest
+
+from compas.datastructures import Mesh
 from compas.geometry import allclose
+from compas.rpc import AsyncProxy
+from compas.rpc import BinaryServer
+from compas.rpc import Dispatcher
 from compas.rpc import Proxy
+from compas.rpc import RPCServerError
+from compas.rpc import WorkerPool
+from compas.rpc import XFunc
+from compas.rpc.profiling import SamplingProfiler
+from compas.rpc.profiling import trace_events
+from compas.rpc.transport import BinaryServerProxy
 
 
 def test_basic_rpc_call():
@@ -11,10 +29,259 @@ def test_basic_rpc_call():
 
 def test_switch_package():
     with Proxy("numpy", python="python") as proxy:
-
         A = proxy.array([[1, 2], [3, 4]])
 
         proxy.package = "scipy.linalg"
         r = proxy.inv(A)
 
     assert allclose(r, [[-2, 1], [1.5, -0.5]])
+
+
+def test_socket_transport():
+    with Proxy("numpy", python="python", transport="socket", port=1754) as proxy:
+        assert proxy.arange(20) == list(range(20))
+        proxy.package = "scipy.linalg"
+        r = proxy.inv([[1, 2], [3, 4]])
+
+    assert allclose(r, [[-2, 1], [1.5, -0.5]])
+
+
+@pytest.mark.parametrize("transport, port", [("xmlrpc", 1760), ("socket", 1761)])
+def test_timings_and_profiler(transport, port, tmpdir):
+    with Proxy("numpy", python="python", transport=transport, port=port, max_timings=3) as proxy:
+        for i in range(5):
+            proxy.arange(i)
+        assert len(proxy.timings) == 3
+        timing = proxy.timings[-1]
+        assert timing["name"] == "numpy.arange"
+        assert timing["request_bytes"] > 0 and timing["response_bytes"] > 0
+        assert timing["roundtrip"] >= timing["call"] >= 0
+        assert proxy.profile is None
+
+        proxy.profiler = "cprofile"
+        proxy.arange(10)
+        assert "function calls" in proxy.profile
+
+        proxy.profiler = "unknown"
+        with pytest.raises(RPCServerError):
+            proxy.arange(10)
+
+        filepath = str(tmpdir.join("trace.json"))
+        proxy.export_trace(filepath)
+        with open(filepath) as f:
+            trace = json.load(f)
+        assert {event["pid"] for event in trace["traceEvents"]} == {"client", "server"}
+
+
+@pytest.mark.parametrize("transport, workers, port", [("xmlrpc", None, 1755), ("socket", 2, 1756)])
+def test_pipeline(transport, workers, port):
+    with Proxy("numpy", python="python", transport=transport, workers=workers, port=port) as proxy:
+        results = proxy.pipeline([("arange", [i]) for i in range(10)] + [("full", [2], {"fill_value": 1})])
+        assert results == [list(range(i)) for i in range(10)] + [[1, 1]]
+        with pytest.raises(RPCServerError):
+            proxy.pipeline([("arange", [3]), ("nothing", [])])
+
+
+@pytest.mark.parametrize("transport, workers, port", [("xmlrpc", 2, 1757), ("socket", None, 1758)])
+def test_submit_and_map(transport, workers, port):
+    with Proxy("numpy", python="python", transport=transport, workers=workers, port=port) as proxy:
+        futures = [proxy.submit("arange", i) for i in range(10)]
+        assert [future.result() for future in futures] == [list(range(i)) for i in range(10)]
+        with pytest.raises(RPCServerError):
+            proxy.submit("nothing").result()
+        results = proxy.map("arange", range(25), chunksize=10)
+        assert list(results) == [list(range(i)) for i in range(25)]
+        assert list(proxy.map("full", [1, 2], [0, 1])) == [[0], [1, 1]]
+
+
+def test_async_proxy():
+    async def main(proxy):
+        results = await asyncio.gather(*[proxy.arange(i) for i in range(5)])
+        mapped = await proxy.map_async("arange", range(5))
+        return results, mapped
+
+    with AsyncProxy("numpy", python="python", transport="socket", port=1759) as proxy:
+        results, mapped = asyncio.run(main(proxy))
+
+    assert results == mapped == [list(range(i)) for i in range(5)]
+
+
+def test_dispatcher_timing():
+    dispatcher = Dispatcher()
+    result = json.loads(dispatcher._dispatch("math.sqrt", [json.dumps({"args": [4.0], "kwargs": {}}), "", "sample"]))
+    assert result["data"] == 2.0
+    assert result["error"] is None
+    assert result["profile"] is not None
+    timing = result["timing"]
+    assert set(timing) == {"received", "queue", "decode", "call", "encode", "request_bytes", "response_bytes"}
+    assert timing["response_bytes"] == 3
+
+
+def test_sampling_profiler():
+    def work():
+        return sum(i * i for i in range(300000))
+
+    with SamplingProfiler(interval=0.0005) as profiler:
+        work()
+    assert profiler.samples
+    assert all(stack.startswith("work") for stack in profiler.samples)
+    assert profiler.folded().count("\n") == len(profiler.samples) - 1
+
+
+def test_trace_events():
+    timings = [
+        {"name": "a", "start": 0.0, "roundtrip": 1.0, "received": 0.1, "queue": 0.1, "decode": 0.1, "call": 0.5},
+        {"name": "b", "start": 0.5, "roundtrip": 1.0},
+        {"name": "c", "start": 1.5, "roundtrip": 1.0},
+    ]
+    events = trace_events(timings)
+    client = [event for event in events if event["pid"] == "client"]
+    server = [event for event in events if event["pid"] == "server"]
+    assert [event["tid"] for event in client] == [0, 1, 0]
+    assert [event["name"] for event in server] == ["queue", "decode", "a"]
+    assert server[1]["ts"] == pytest.approx(0.2e6)
+
+
+def test_dispatcher_cache():
+    dispatcher = Dispatcher()
+    odict = {}
+    function = dispatcher._function("math.sqrt", odict)
+    assert dispatcher._function("math.sqrt", odict) is function
+    dispatcher.clear_cache()
+    assert "_functions" not in dispatcher.__dict__
+    assert dispatcher._function("math.sqrt", odict) is function
+
+
+@pytest.fixture
+def server():
+    server = BinaryServer(("127.0.0.1", 0))
+    server.register_function(server.ping)
+    server.register_instance(Dispatcher())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_binary_server_dispatch(server):
+    client = BinaryServerProxy(server.server_address)
+    assert client.ping()["data"] == 1
+    mesh = Mesh.from_meshgrid(dx=1, nx=3)
+    result = client.call("copy.deepcopy", [mesh])
+    assert result["error"] is None
+    assert result["data"].to_vertices_and_faces() == mesh.to_vertices_and_faces()
+    result = client.call("math.nothing", [])
+    assert "not part of the API" in result["error"]
+    result = client.call("numpy.arange", [3])
+    assert result["data"] == [0, 1, 2]
+    assert result["timing"]["response_bytes"] > 0
+    client.close()
+
+
+def test_binary_server_reconnect(server):
+    client = BinaryServerProxy(server.server_address)
+    assert client.call("math.sqrt", [4.0])["data"] == 2.0
+    # simulate a connection that was closed by the server while the client was idle
+    client._connection.socket.shutdown(socket.SHUT_RDWR)
+    assert client.call("math.sqrt", [9.0])["data"] == 3.0
+    client.close()
+
+
+def test_binary_server_pipeline(server):
+    client = BinaryServerProxy(server.server_address)
+    calls = [("math.sqrt", [float(i * i)], {}) for i in range(100)]
+    calls[50] = ("math.nothing", [], {})
+    results = client.pipeline(calls)
+    assert len(results) == 100
+    assert "not part of the API" in results[50]["error"]
+    assert [result["data"] for i, result in enumerate(results) if i != 50] == [float(i) for i in range(100) if i != 50]
+    assert client.pipeline([]) == []
+    client.close()
+
+
+def test_binary_server_submit(server):
+    client = BinaryServerProxy(server.server_address)
+    futures = [client.submit("math.sqrt", [float(i * i)]) for i in range(50)]
+    assert [future.result()["data"] for future in futures] == [float(i) for i in range(50)]
+    future = client.submit("time.sleep", [0.5])
+    client.close()
+    with pytest.raises(IOError):
+        future.result()
+    assert client.call("math.sqrt", [4.0])["data"] == 2.0
+    client.close()
+
+
+def test_worker_pool():
+    pool = WorkerPool(Dispatcher, 2)
+    server = BinaryServer(("127.0.0.1", 0))
+    server.register_instance(pool)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        client = BinaryServerProxy(server.server_address)
+        results = client.pipeline([("os.getpid", [], {})] * 20 + [("math.sqrt", [4.0], {})])
+        assert all(result["error"] is None for result in results)
+        assert os.getpid() not in [result["data"] for result in results]
+        assert results[-1]["data"] == 2.0
+        assert "not part of the API" in client.call("math.nothing")["error"]
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        pool.close()
+
+
+@pytest.mark.parametrize("serializer", ["json", "pickle"])
+def test_xfunc_pooled(serializer):
+    sqrt = XFunc("math.sqrt", pooled=True, serializer=serializer, verbose=False)
+    assert sqrt(4.0) == 2.0
+    pid = XFunc("os.getpid", pooled=True, serializer=serializer, verbose=False)
+    assert pid() == pid() != os.getpid()
+    with pytest.raises(Exception):
+        XFunc("math.nothing", pooled=True, verbose=False)()
+    assert sqrt(9.0) == 3.0
+    assert sqrt.timing["call"] >= 0
+
+
+def test_xfunc_pool_idle_timeout():
+    lines = []
+    echo = XFunc(
+        "builtins.print",
+        python=sys.executable,
+        pooled=True,
+        pool_size=2,
+        idle_timeout=0.5,
+        verbose=False,
+        callback=lambda line, args: lines.append(line),
+    )
+    threads = [threading.Thread(target=echo, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(lines) == ["0", "1", "2", "3"]
+    pool = sys.modules["compas.rpc.xfunc"]._POOLS[sys.executable]
+    assert 1 <= len(pool._idle) <= 2
+    time.sleep(1.5)
+    assert len(pool._idle) == 0
+    echo.stop_workers()
+
+
+def test_xfunc_pool_release_broken():
+    xfunc = sys.modules["compas.rpc.xfunc"]
+    pool = xfunc._Pool(sys.executable, 1, None)
+    worker = pool.acquire()
+    request = {"funcname": "operator.mul", "basedir": ".", "profiler": None, "args": ["x", 10**7], "kwargs": {}}
+    worker.write("json " + json.dumps(request))
+    worker.readline()
+    # the worker is now blocked writing a result that is never read
+    thread = threading.Thread(target=pool.release, args=(worker, True))
+    thread.daemon = True
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert worker.process.poll() is not None
+    assert pool._count == 0